@@ -1,7 +1,8 @@
-from typing import Any, AsyncGenerator, List, Optional, Union
+from typing import Any, AsyncGenerator, List, Optional, Sequence, Union
 from ....domain.chat.types import ChatMessage, ChatMode
 from ....domain.chat.protocols import ChatConfig
 from ....infrastructure.llm.base import BaseLlm
+from ....infrastructure.llm.instrumentation import BaseStreamSink
 from ....infrastructure.prompt.repositories.base import BasePromptRepository
 
 
@@ -9,13 +10,20 @@ class BaseChatService:
     """Base class for managing chat conversations with memory and flexible execution.
 
     This service orchestrates prompt retrieval, LLM interaction, and history management.
+
+    Attributes:
+        sinks: Sinks receiving one ``StreamEvent`` per streamed response.
+            Assign ``BaseChatService.sinks`` to instrument every service.
     """
 
+    sinks: Sequence[BaseStreamSink] = ()
+
     def __init__(
         self,
         llm: BaseLlm,
         repository: BasePromptRepository,
         config: Optional[ChatConfig] = None,
+        sinks: Optional[Sequence[BaseStreamSink]] = None,
         **kwargs: Any,
     ) -> None:
         """Initializes the chat service with dependencies and configuration.
@@ -24,10 +32,14 @@ class BaseChatService:
             llm: The LLM wrapper instance.
             repository: The prompt repository instance.
             config: A configuration object.
+            sinks: Streaming metrics sinks; defaults to the class-level
+                ``sinks``.
             **kwargs: Explicit configuration overrides.
         """
         self.llm = llm
         self.repository = repository
+        if sinks is not None:
+            self.sinks = tuple(sinks)
         self.history: List[ChatMessage] = []
         self.params = self._resolve_config(config, **kwargs)
 
@@ -42,14 +54,17 @@ class BaseChatService:
         return base
 
     async def chat(
-        self, prompt_path: str, variables: dict[str, Any]
+        self,
+        prompt_path: str,
+        variables: Union[dict[str, Any], Sequence[dict[str, Any]]],
     ) -> Union[ChatMessage, AsyncGenerator[ChatMessage, None], List[ChatMessage]]:
         """
         Main entry point to execute the chat based on the configured mode.
 
         Args:
             prompt_path: The path to the prompt template.
-            variables: Variables to inject into the prompt template.
+            variables: Variables to inject into the prompt template. In BATCH
+                mode, a sequence of variable sets renders one request each.
 
         Returns:
             Depending on the mode, returns a ChatMessage, an async generator of ChatMessages,
@@ -74,3 +89,9 @@ class BaseChatService:
     ) -> AsyncGenerator[ChatMessage, None]:
         """Internal method for streaming response."""
         raise NotImplementedError
+
+    async def _chat_batch(
+        self, prompt_path: str, variables: Union[dict[str, Any], Sequence[dict[str, Any]]]
+    ) -> List[ChatMessage]:
+        """Internal method for batch response."""
+        raise NotImplementedError
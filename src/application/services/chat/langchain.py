@@ -1,6 +1,10 @@
-from typing import Any, AsyncGenerator, List
+import asyncio
+from typing import Any, AsyncGenerator, List, Optional, Sequence, Union
 from .base import BaseChatService
 from ....domain.chat.types import ChatMessage
+from ....infrastructure.llm.batch import BatchRequest, BatchResult
+from ....infrastructure.llm.instrumentation import StreamTimer, llm_identity
+from ....infrastructure.llm.prompt_cache import cache_usage
 
 
 class LangChainChatService(BaseChatService):
@@ -11,18 +15,124 @@ class LangChainChatService(BaseChatService):
     ) -> ChatMessage:
         """Executes a direct call using LangChain's ainvoke."""
         prompt_entity = self.repository.get_prompt(prompt_path, variables)
+        prompt_input, options = self.llm.format_prompt(prompt_entity)
 
-        response = await self.llm.client.ainvoke(prompt_entity.content)
+        response = await self.llm.client.ainvoke(prompt_input, **options)
 
-        message = ChatMessage(role="assistant", content=response.content)
+        usage = cache_usage(response)
+        message = ChatMessage(
+            role="assistant",
+            content=response.content,
+            metadata={"usage": usage} if usage else {},
+        )
         self.history.append(message)
         return message
 
     async def _chat_stream(
         self, prompt_path: str, variables: dict[str, Any]
     ) -> AsyncGenerator[ChatMessage, None]:
-        """Executes a streaming call using LangChain's astream."""
+        """Executes a streaming call using LangChain's astream.
+
+        After the content chunks, a final empty message carries the
+        stream's latency profile under ``metadata["stream_metrics"]`` (time
+        to first token, inter-token latency, tokens per second, duration and
+        output tokens) and the token usage, if reported. The same figures
+        are emitted to the service's sinks, even when the stream fails.
+        """
         prompt_entity = self.repository.get_prompt(prompt_path, variables)
+        prompt_input, options = self.llm.format_prompt(prompt_entity)
+
+        timer = StreamTimer()
+        usage: dict[str, int] = {}
+        error: Optional[BaseException] = None
+        try:
+            async for chunk in self.llm.client.astream(prompt_input, **options):
+                timer.tick()
+                chunk_usage = cache_usage(chunk)
+                if chunk_usage:
+                    usage = chunk_usage
+                yield ChatMessage(
+                    role="assistant",
+                    content=chunk.content,
+                    metadata={"usage": chunk_usage} if chunk_usage else {},
+                )
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            event = timer.finish(*llm_identity(self.llm), usage.get("output_tokens"), error)
+            for sink in self.sinks:
+                sink.emit(event)
+
+        metadata: dict[str, Any] = {"stream_metrics": event.as_metadata()}
+        if usage:
+            metadata["usage"] = usage
+        yield ChatMessage(role="assistant", content="", metadata=metadata)
+
+    async def _chat_batch(
+        self, prompt_path: str, variables: Union[dict[str, Any], Sequence[dict[str, Any]]]
+    ) -> List[ChatMessage]:
+        """Executes a bulk job through the provider's asynchronous batch API.
+
+        Each variable set renders one request, identified as ``"<index>"``.
+        The batch is submitted, polled every ``batch_poll_interval`` seconds
+        (default 30) for at most ``batch_timeout`` seconds (default: no
+        limit), and results are mapped back to input order. Providers
+        without a batch API fall back to concurrent ``ainvoke`` calls,
+        at most ``batch_max_concurrency`` (default 8) at a time.
+
+        A failed request does not fail the job: its message is empty and
+        carries ``metadata["error"]``. Batch messages are not added to the
+        history.
+        """
+        variable_sets = [variables] if isinstance(variables, dict) else list(variables)
+        requests = []
+        for index, values in enumerate(variable_sets):
+            prompt_entity = self.repository.get_prompt(prompt_path, values)
+            _, options = self.llm.format_prompt(prompt_entity)
+            requests.append(BatchRequest(str(index), prompt_entity, options=options))
+        if not requests:
+            return []
+
+        batch = self.llm.batch_client()
+        if batch is not None:
+            results = await batch.run(
+                requests,
+                poll_interval=self.params.get("batch_poll_interval", 30.0),
+                timeout=self.params.get("batch_timeout"),
+            )
+        else:
+            results = await self._invoke_concurrently(requests)
+
+        messages = []
+        for request in requests:
+            result = results[request.custom_id]
+            metadata: dict[str, Any] = {"custom_id": result.custom_id}
+            if result.usage:
+                metadata["usage"] = result.usage
+            if result.error is not None:
+                metadata["error"] = result.error
+            messages.append(
+                ChatMessage(role="assistant", content=result.content, metadata=metadata)
+            )
+        return messages
+
+    async def _invoke_concurrently(
+        self, requests: List[BatchRequest]
+    ) -> dict[str, BatchResult]:
+        """Runs batch requests as bounded concurrent ``ainvoke`` calls."""
+        semaphore = asyncio.Semaphore(self.params.get("batch_max_concurrency", 8))
+
+        async def invoke(request: BatchRequest) -> BatchResult:
+            prompt_input, _ = self.llm.format_prompt(request.prompt)
+            async with semaphore:
+                try:
+                    response = await self.llm.client.ainvoke(prompt_input, **request.options)
+                except Exception as exc:
+                    return BatchResult(request.custom_id, error=str(exc) or type(exc).__name__)
+            return BatchResult(
+                request.custom_id, content=response.content, usage=cache_usage(response)
+            )
 
-        async for chunk in self.llm.client.astream(prompt_entity.content):
-            yield ChatMessage(role="assistant", content=chunk.content)
+        results = await asyncio.gather(*(invoke(request) for request in requests))
+        return {result.custom_id: result for result in results}
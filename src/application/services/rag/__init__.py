@@ -1,7 +1,28 @@
-from .base import BaseRagService, RagAnswer, RagIngestionResult
+from .base import (
+    BaseRagService,
+    DocumentUpload,
+    EmbeddingMigrationProgress,
+    RagAnswer,
+    RagIngestionResult,
+)
+from .conversion_cache import CachedReader, ConversionCache
+from .sources import (
+    BaseDocumentSource,
+    DocumentRef,
+    LocalDocumentSource,
+    LocalObjectStoreSource,
+)
 
 __all__: list[str] = [
     "BaseRagService",
     "RagIngestionResult",
     "RagAnswer",
+    "EmbeddingMigrationProgress",
+    "DocumentUpload",
+    "CachedReader",
+    "ConversionCache",
+    "BaseDocumentSource",
+    "DocumentRef",
+    "LocalDocumentSource",
+    "LocalObjectStoreSource",
 ]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from types import SimpleNamespace
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ....domain.vector import (
     CollectionConfigDTO,
@@ -11,8 +15,12 @@ from ....domain.vector import (
     VectorSearchResultDTO,
 )
 from ....infrastructure.embedding.base import BaseEmbedding
+from ....infrastructure.embedding.coalescer import QueryCoalescer
 from ....infrastructure.vector.base import BaseVectorDatabase
 from ..chat.base import BaseChatService
+from .conversion_cache import CachedReader, ConversionCache
+from .sources import BaseDocumentSource, DocumentRef
+from .stream_reader import DocumentData, read_from_stream
 
 
 @dataclass
@@ -25,6 +33,21 @@ class RagIngestionResult:
     record_ids: list[str]
 
 
+@dataclass
+class DocumentUpload:
+    """In-memory document handed to the RAG service for ingestion.
+
+    Attributes:
+        data: Raw bytes or a binary file-like object.
+        filename: Original file name, used for format detection.
+        mimetype: MIME type hint for data without a file extension.
+    """
+
+    data: DocumentData
+    filename: Optional[str] = None
+    mimetype: Optional[str] = None
+
+
 @dataclass
 class RagAnswer:
     """Grounded answer returned by the RAG service."""
@@ -34,6 +57,45 @@ class RagAnswer:
     context: str
 
 
+@dataclass
+class EmbeddingMigrationProgress:
+    """Progress snapshot of an embedding-model migration job."""
+
+    source_collection: str
+    target_collection: str
+    total_records: Optional[int] = None
+    processed_records: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the migration completed and the collection was swapped."""
+        return self.finished_at is not None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds spent migrating so far."""
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return max(end - self.started_at, 0.0)
+
+    @property
+    def throughput(self) -> float:
+        """Migrated records per second."""
+        elapsed = self.elapsed_seconds
+        return self.processed_records / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until completion, if the total is known."""
+        if self.finished:
+            return 0.0
+        if self.total_records is None or self.throughput <= 0:
+            return None
+        remaining = max(self.total_records - self.processed_records, 0)
+        return remaining / self.throughput
+
+
 class BaseRagService:
     """Base application service orchestrating a RAG pipeline."""
 
@@ -58,6 +120,9 @@ class BaseRagService:
         self.embedding_model = embedding_model
         self.chat_service = chat_service
         self.params = self._resolve_config(config, **kwargs)
+        self.migration: Optional[EmbeddingMigrationProgress] = None
+        self._collection_lock = threading.Lock()
+        self._query_coalescer: Optional[QueryCoalescer] = None
 
     def _resolve_config(
         self,
@@ -70,10 +135,15 @@ class BaseRagService:
             "top_k": 4,
             "prompt_path": "prompts/rag/default.md",
             "reader_method": "markitdown",
+            "conversion_cache_dir": None,
             "splitter_method": "recursive",
             "chunk_size": 1000,
             "chunk_overlap": 100,
             "distance_metric": DistanceMetric.COSINE,
+            "quantization": None,
+            "quantization_oversampling": None,
+            "query_batch_window": None,
+            "query_batch_size": 64,
         }
         if config:
             base.update({k: v for k, v in config.items() if v is not None})
@@ -81,14 +151,22 @@ class BaseRagService:
         return base
 
     def _create_reader(self) -> Any:
-        """Create the configured SplitterMR reader instance."""
+        """Create the configured SplitterMR reader instance.
+
+        When ``conversion_cache_dir`` is configured, the reader is wrapped in
+        a ``CachedReader`` so unchanged documents skip conversion.
+        """
         reader_method = str(self.params.get("reader_method", "markitdown")).lower()
         if reader_method != "markitdown":
             raise ValueError(f"Unsupported reader method: {reader_method}")
 
         from splitter_mr.reader import MarkItDownReader
 
-        return MarkItDownReader()
+        reader = MarkItDownReader()
+        cache_dir = self.params.get("conversion_cache_dir")
+        if cache_dir:
+            return CachedReader(reader, ConversionCache(cache_dir))
+        return reader
 
     def _create_splitter(self) -> Any:
         """Create the configured SplitterMR splitter instance."""
@@ -112,27 +190,111 @@ class BaseRagService:
         ]
         return "\n\n".join(context_chunks)
 
+    @staticmethod
+    def _build_splitter_output(
+        chunks: list[str],
+        chunk_ids: list[str],
+        **fields: Any,
+    ) -> Any:
+        """Build a SplitterMR-like output for text that bypassed the splitter."""
+        defaults: dict[str, Any] = {
+            "document_name": None,
+            "document_path": "",
+            "document_id": None,
+            "conversion_method": None,
+            "reader_method": None,
+            "ocr_method": None,
+            "split_method": "",
+            "split_params": {},
+            "metadata": {},
+        }
+        defaults.update(fields)
+        return SimpleNamespace(chunks=chunks, chunk_id=chunk_ids, **defaults)
+
+    @staticmethod
+    def _vector_dimension(vectors: Any, embedding_model: Any) -> Optional[int]:
+        """Return the dimension of ``vectors``, or the model's when empty."""
+        if len(vectors):
+            return len(vectors[0])
+        return getattr(embedding_model, "dimensions", None)
+
+    def _ensure_collection(self, collection_name: str, dimension: Optional[int]) -> bool:
+        """Create ``collection_name`` with the configured metric if missing.
+
+        Returns:
+            True if the collection was created by this call.
+        """
+        with self._collection_lock:
+            if self.vector_db.has_collection(collection_name):
+                return False
+            distance_metric = self.params["distance_metric"]
+            metric_value = (
+                distance_metric.value
+                if isinstance(distance_metric, DistanceMetric)
+                else str(distance_metric)
+            )
+            self.vector_db.create_collection(
+                CollectionConfigDTO(
+                    name=collection_name,
+                    dimension=dimension,
+                    metric=metric_value,
+                    quantization=self.params["quantization"],
+                    oversampling=self.params["quantization_oversampling"],
+                )
+            )
+            return True
+
     def _embed_query(self, query: str) -> list[float]:
         """Embed a query string using the configured embedding adapter."""
+        if hasattr(self.embedding_model, "embed_query"):
+            return self.embedding_model.embed_query(query)
         if hasattr(self.embedding_model.client, "embed_query"):
             return self.embedding_model.client.embed_query(query)
 
-        splitter_output = SimpleNamespace(
-            chunks=[query],
-            chunk_id=["query-0"],
+        splitter_output = self._build_splitter_output(
+            [query],
+            ["query-0"],
             document_name="query",
-            document_path="",
             document_id="query",
-            conversion_method=None,
-            reader_method=None,
-            ocr_method=None,
             split_method="query",
-            split_params={},
-            metadata={},
         )
         output = self.embedding_model.embed(splitter_output)
         return output.embeddings[0] if output.embeddings else []
 
+    async def _aembed_query(self, query: str) -> list[float]:
+        """Embed a query without blocking the event loop when possible."""
+        if hasattr(self.embedding_model, "aembed_query"):
+            return await self.embedding_model.aembed_query(query)
+        return self._embed_query(query)
+
+    def _get_query_coalescer(self) -> Optional[QueryCoalescer]:
+        """Return the query coalescer for the current model, if enabled.
+
+        Coalescing is enabled by setting ``query_batch_window`` (seconds).
+        A new coalescer is created whenever the embedding model changes.
+
+        Batches are embedded through the document path (``_embed_texts``),
+        so coalescing is skipped for adapters flagged with
+        ``_SYMMETRIC_QUERIES = False`` (Cohere, Gemini, Voyage, Bedrock),
+        whose query vectors differ from their document vectors.
+        """
+        window = self.params.get("query_batch_window")
+        if (
+            window is None
+            or not hasattr(self.embedding_model, "_embed_texts")
+            or not getattr(self.embedding_model, "_SYMMETRIC_QUERIES", True)
+        ):
+            return None
+        coalescer = self._query_coalescer
+        if coalescer is None or coalescer.embedding is not self.embedding_model:
+            coalescer = QueryCoalescer(
+                self.embedding_model,
+                window=float(window),
+                max_batch_size=int(self.params.get("query_batch_size", 64)),
+            )
+            self._query_coalescer = coalescer
+        return coalescer
+
     def ingest_document(
         self,
         document_path: str,
@@ -148,65 +310,207 @@ class BaseRagService:
             ensure_collection: Create the collection if missing.
             **kwargs: Provider-specific upsert options.
 
+        Returns:
+            Summary with document id, collection and inserted record IDs.
+        """
+        reader_output = self._create_reader().read(document_path)
+        return self._ingest_reader_output(
+            reader_output,
+            collection_name=collection_name,
+            ensure_collection=ensure_collection,
+            **kwargs,
+        )
+
+    def ingest_bytes(
+        self,
+        data: DocumentData,
+        filename: Optional[str] = None,
+        mimetype: Optional[str] = None,
+        collection_name: Optional[str] = None,
+        ensure_collection: bool = True,
+        **kwargs: Any,
+    ) -> RagIngestionResult:
+        """Read, chunk, embed and persist an in-memory document.
+
+        The data is handed to the reader as a stream, so uploads do not need
+        to be written to disk first (readers without stream support fall
+        back to a temporary file).
+
+        Args:
+            data: Raw bytes or a binary file-like object.
+            filename: Original file name, used for format detection.
+            mimetype: MIME type hint for data without a file extension.
+            collection_name: Optional target collection/index override.
+            ensure_collection: Create the collection if missing.
+            **kwargs: Provider-specific upsert options.
+
         Returns:
             Summary with document id, collection and inserted record IDs.
         """
         reader = self._create_reader()
-        splitter = self._create_splitter()
-        reader_output = reader.read(document_path)
-        splitter_output = splitter.split(reader_output)
+        if isinstance(reader, CachedReader):
+            reader_output = reader.read_stream(data, filename, mimetype)
+        else:
+            reader_output = read_from_stream(reader, data, filename, mimetype)
+        return self._ingest_reader_output(
+            reader_output,
+            collection_name=collection_name,
+            ensure_collection=ensure_collection,
+            **kwargs,
+        )
+
+    async def aingest_uploads(
+        self,
+        uploads: list[DocumentUpload],
+        collection_name: Optional[str] = None,
+        ensure_collection: bool = True,
+        max_concurrency: int = 4,
+        **kwargs: Any,
+    ) -> list[RagIngestionResult]:
+        """Ingest a batch of in-memory documents concurrently.
+
+        Each upload is processed by ``ingest_bytes`` in a worker thread, with
+        at most ``max_concurrency`` uploads in flight.
+
+        Args:
+            uploads: Documents to ingest.
+            collection_name: Optional target collection/index override.
+            ensure_collection: Create the collection if missing.
+            max_concurrency: Maximum number of uploads processed at once.
+            **kwargs: Provider-specific upsert options.
+
+        Returns:
+            Ingestion summaries in the same order as ``uploads``.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _ingest(upload: DocumentUpload) -> RagIngestionResult:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.ingest_bytes,
+                    upload.data,
+                    upload.filename,
+                    upload.mimetype,
+                    collection_name,
+                    ensure_collection,
+                    **kwargs,
+                )
+
+        return list(await asyncio.gather(*(_ingest(upload) for upload in uploads)))
+
+    async def aingest_source(
+        self,
+        source: BaseDocumentSource,
+        prefix: str = "",
+        prefetch: int = 4,
+        collection_name: Optional[str] = None,
+        ensure_collection: bool = True,
+        **kwargs: Any,
+    ) -> list[RagIngestionResult]:
+        """Ingest every document listed by a document source.
+
+        Up to ``prefetch`` upcoming documents are fetched concurrently while
+        the current one is converted, embedded and persisted, so remote
+        sources are not bound by per-object latency.
+
+        Args:
+            source: Document source to ingest from.
+            prefix: Key prefix used to narrow the listing.
+            prefetch: Number of documents fetched ahead of processing.
+            collection_name: Optional target collection/index override.
+            ensure_collection: Create the collection if missing.
+            **kwargs: Provider-specific upsert options.
+
+        Returns:
+            Ingestion summaries in listing order.
+        """
+        # Listing pages are fetched lazily by blocking SDK calls, so the
+        # iterator is created and advanced in a worker thread.
+        refs = await asyncio.to_thread(lambda: iter(source.list_documents(prefix)))
+        pending: deque[tuple[DocumentRef, asyncio.Task[bytes]]] = deque()
+
+        async def _fill() -> None:
+            while len(pending) < max(1, prefetch):
+                ref = await asyncio.to_thread(next, refs, None)
+                if ref is None:
+                    return
+                pending.append((ref, asyncio.ensure_future(source.fetch(ref))))
+
+        results: list[RagIngestionResult] = []
+        try:
+            await _fill()
+            while pending:
+                ref, task = pending.popleft()
+                data = await task
+                await _fill()
+                results.append(
+                    await asyncio.to_thread(
+                        self.ingest_bytes,
+                        data,
+                        ref.filename,
+                        ref.mimetype,
+                        collection_name,
+                        ensure_collection,
+                        **kwargs,
+                    )
+                )
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+        return results
+
+    def _ingest_reader_output(
+        self,
+        reader_output: Any,
+        collection_name: Optional[str] = None,
+        ensure_collection: bool = True,
+        **kwargs: Any,
+    ) -> RagIngestionResult:
+        """Chunk, embed and persist a reader output in the vector DB."""
+        splitter_output = self._create_splitter().split(reader_output)
         embedding_output = self.embedding_model.embed(splitter_output)
 
         target_collection = collection_name or str(self.params["collection_name"])
         vectors = embedding_output.embeddings
+        matrix = getattr(embedding_output, "matrix", None)
         record_ids = list(splitter_output.chunk_id)
-        dimension = len(vectors[0]) if vectors else None
-
-        if ensure_collection and not self.vector_db.has_collection(target_collection):
-            distance_metric = self.params["distance_metric"]
-            metric_value = (
-                distance_metric.value
-                if isinstance(distance_metric, DistanceMetric)
-                else str(distance_metric)
-            )
-            self.vector_db.create_collection(
-                CollectionConfigDTO(
-                    name=target_collection,
-                    dimension=dimension,
-                    metric=metric_value,
-                )
-            )
-
-        records = [
-            VectorRecordDTO(
-                id=record_id,
-                vector=vector,
-                payload={
-                    "chunk": chunk,
-                    "chunk_id": record_id,
-                    "document_name": splitter_output.document_name,
-                    "document_path": splitter_output.document_path,
-                    "document_id": splitter_output.document_id,
-                    "conversion_method": splitter_output.conversion_method,
-                    "reader_method": splitter_output.reader_method,
-                    "ocr_method": splitter_output.ocr_method,
-                    "split_method": splitter_output.split_method,
-                    "split_params": splitter_output.split_params or {},
-                    "metadata": splitter_output.metadata or {},
-                },
-            )
-            for record_id, chunk, vector in zip(
-                record_ids,
-                splitter_output.chunks,
-                vectors,
-            )
+        dimension = self._vector_dimension(vectors, self.embedding_model)
+
+        if ensure_collection:
+            self._ensure_collection(target_collection, dimension)
+
+        payloads = [
+            {
+                "chunk": chunk,
+                "chunk_id": record_id,
+                "document_name": splitter_output.document_name,
+                "document_path": splitter_output.document_path,
+                "document_id": splitter_output.document_id,
+                "conversion_method": splitter_output.conversion_method,
+                "reader_method": splitter_output.reader_method,
+                "ocr_method": splitter_output.ocr_method,
+                "split_method": splitter_output.split_method,
+                "split_params": splitter_output.split_params or {},
+                "metadata": splitter_output.metadata or {},
+            }
+            for record_id, chunk in zip(record_ids, splitter_output.chunks)
         ]
-        self.vector_db.upsert(target_collection, records, **kwargs)
+        if matrix is not None:
+            self.vector_db.upsert_matrix(
+                target_collection, record_ids, matrix, payloads, **kwargs
+            )
+        else:
+            records = [
+                VectorRecordDTO(id=record_id, vector=vector, payload=payload)
+                for record_id, vector, payload in zip(record_ids, vectors, payloads)
+            ]
+            self.vector_db.upsert(target_collection, records, **kwargs)
 
         return RagIngestionResult(
             document_id=str(splitter_output.document_id),
             collection_name=target_collection,
-            chunks_count=len(records),
+            chunks_count=len(payloads),
             record_ids=record_ids,
         )
 
@@ -232,7 +536,11 @@ class BaseRagService:
         """
         target_collection = collection_name or str(self.params["collection_name"])
         limit = int(top_k or self.params["top_k"])
-        query_vector = self._embed_query(question)
+        coalescer = self._get_query_coalescer()
+        if coalescer is not None:
+            query_vector = await coalescer.embed_query(question)
+        else:
+            query_vector = await self._aembed_query(question)
         matches = self.vector_db.search(
             collection_name=target_collection,
             query_vector=query_vector,
@@ -246,3 +554,119 @@ class BaseRagService:
             {"question": question, "context": context},
         )
         return RagAnswer(answer=answer, matches=matches, context=context)
+
+    async def migrate_embeddings(
+        self,
+        embedding_model: BaseEmbedding,
+        target_collection: Optional[str] = None,
+        source_collection: Optional[str] = None,
+        batch_size: int = 64,
+        max_records_per_second: Optional[float] = None,
+        on_progress: Optional[Callable[[EmbeddingMigrationProgress], None]] = None,
+    ) -> EmbeddingMigrationProgress:
+        """Re-embed a collection with a new model and swap to it when done.
+
+        Records are streamed from the source collection, their ``chunk``
+        payload is re-embedded in throttled batches and written to a shadow
+        collection. Blocking I/O runs in worker threads, so ``ask()`` keeps
+        serving from the source collection with the current model until
+        the job finishes. When the source is the active collection, the model
+        and collection are then swapped together on the event loop, which
+        makes the switch atomic for ``ask()``; migrating any other collection
+        leaves the service configuration untouched. If the job fails,
+        ``migration`` is reset and a target collection created by this call
+        is dropped, so a retry starts from an empty shadow.
+        Documents ingested during the migration are written to the source
+        collection only and must be re-ingested afterwards. An empty source
+        yields an empty target sized from ``embedding_model.dimensions``;
+        when the model does not expose them, the source collection is kept.
+
+        Args:
+            embedding_model: Embedding adapter to migrate to.
+            target_collection: Shadow collection name. Defaults to the
+                source name suffixed with a timestamp.
+            source_collection: Collection to migrate. Defaults to the
+                configured ``collection_name``.
+            batch_size: Records read and embedded per batch.
+            max_records_per_second: Optional throughput ceiling.
+            on_progress: Callback invoked after every batch.
+
+        Returns:
+            Final progress snapshot of the finished migration.
+
+        Raises:
+            NotImplementedError: If the vector DB cannot scroll records.
+        """
+        source = source_collection or str(self.params["collection_name"])
+        target = target_collection or f"{source}_{int(time.time())}"
+        progress = EmbeddingMigrationProgress(source_collection=source, target_collection=target)
+        self.migration = progress
+        created = owned = False
+        try:
+            try:
+                progress.total_records = await asyncio.to_thread(self.vector_db.count, source)
+            except NotImplementedError:
+                progress.total_records = None
+            batches = self.vector_db.scroll(source, batch_size=batch_size)
+            while True:
+                batch = await asyncio.to_thread(next, batches, None)
+                if batch is None:
+                    break
+                splitter_output = self._build_splitter_output(
+                    [str(record.payload.get("chunk", "")) for record in batch],
+                    [record.id for record in batch],
+                    document_name=source,
+                    split_method="migration",
+                )
+                if hasattr(embedding_model, "aembed"):
+                    output = await embedding_model.aembed(splitter_output)
+                else:
+                    output = await asyncio.to_thread(embedding_model.embed, splitter_output)
+                vectors = output.embeddings
+                matrix = getattr(output, "matrix", None)
+                if not created and len(vectors):
+                    dimension = self._vector_dimension(vectors, embedding_model)
+                    owned = await asyncio.to_thread(self._ensure_collection, target, dimension)
+                    created = True
+                if matrix is not None:
+                    await asyncio.to_thread(
+                        self.vector_db.upsert_matrix,
+                        target,
+                        [record.id for record in batch],
+                        matrix,
+                        [record.payload for record in batch],
+                    )
+                else:
+                    records = [
+                        VectorRecordDTO(id=record.id, vector=vector, payload=record.payload)
+                        for record, vector in zip(batch, vectors)
+                    ]
+                    await asyncio.to_thread(self.vector_db.upsert, target, records)
+                progress.processed_records += len(batch)
+                if on_progress is not None:
+                    on_progress(progress)
+                if max_records_per_second:
+                    expected = progress.processed_records / max_records_per_second
+                    await asyncio.sleep(max(expected - progress.elapsed_seconds, 0.0))
+
+            if not created:
+                dimension = self._vector_dimension([], embedding_model)
+                if dimension is not None:
+                    owned = await asyncio.to_thread(self._ensure_collection, target, dimension)
+                    created = True
+        except BaseException as exc:
+            self.migration = None
+            if owned:
+                try:
+                    await asyncio.to_thread(self.vector_db.delete_collection, target)
+                except Exception:
+                    exc.add_note(f"Partially migrated collection {target!r} was left in place.")
+            raise
+        if source == self.params["collection_name"]:
+            self.embedding_model = embedding_model
+            if created:
+                self.params["collection_name"] = target
+        progress.finished_at = time.monotonic()
+        if on_progress is not None:
+            on_progress(progress)
+        return progress
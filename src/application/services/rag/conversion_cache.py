@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import uuid
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Optional
+
+from .stream_reader import DocumentData, as_binary_stream, guess_extension, read_from_stream
+
+_HASH_BLOCK_SIZE: int = 1 << 20
+
+
+def _reader_version() -> str:
+    """Return the installed SplitterMR version used to tag cache entries."""
+    try:
+        return metadata.version("splitter-mr")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _key_options(options: dict[str, Any]) -> dict[str, Any]:
+    """Return the read options that affect the conversion itself.
+
+    ``document_id`` only labels the output, so it is left out of the key and
+    re-applied on cache hits.
+    """
+    return {name: value for name, value in options.items() if name != "document_id"}
+
+
+def _restore(
+    payload: dict[str, Any],
+    document_path: str,
+    document_name: Optional[str],
+    document_id: Optional[str],
+) -> Any:
+    """Rebuild a cached ``ReaderOutput`` for the current request.
+
+    Path, name and id describe this request rather than the one that filled
+    the cache. Without a requested id a fresh one is generated, as the
+    readers themselves do.
+    """
+    from splitter_mr.schema import ReaderOutput
+
+    payload["document_path"] = document_path
+    payload["document_name"] = document_name
+    payload["document_id"] = document_id or str(uuid.uuid4())
+    return ReaderOutput(**payload)
+
+
+class ConversionCache:
+    """On-disk cache of converted documents keyed by file content hash.
+
+    Each entry stores the serialized reader output as gzip-compressed JSON
+    under ``<cache_dir>/<key[:2]>/<key>.json.gz``. Keys combine the SHA-256
+    of the file content with the reader class, the reader version and the
+    read options, so changing any of them produces a fresh conversion.
+    """
+
+    def __init__(self, cache_dir: str | Path, compress_level: int = 6) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory where cache entries are stored.
+            compress_level: Gzip compression level (0-9).
+        """
+        self.cache_dir = Path(cache_dir)
+        self.compress_level = compress_level
+
+    @staticmethod
+    def hash_file(path: str | Path) -> str:
+        """Return the SHA-256 hex digest of a file's content."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def build_key(self, content_hash: str, reader: Any, **options: Any) -> str:
+        """Build the cache key for a document and reader configuration.
+
+        Args:
+            content_hash: SHA-256 digest of the document content.
+            reader: Reader instance performing the conversion.
+            **options: Options passed to ``reader.read``.
+
+        Returns:
+            Hex digest identifying the cache entry.
+        """
+        reader_cls = type(reader)
+        fingerprint = json.dumps(
+            {
+                "content": content_hash,
+                "reader": f"{reader_cls.__module__}.{reader_cls.__qualname__}",
+                "version": _reader_version(),
+                "options": options,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path holding the entry for ``key``."""
+        return self.cache_dir / key[:2] / f"{key}.json.gz"
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the cached payload for ``key`` or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with gzip.open(path, "rb") as f:
+                return json.loads(f.read().decode("utf-8"))
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+
+    def set(self, key: str, payload: dict[str, Any]) -> None:
+        """Store ``payload`` under ``key``.
+
+        The entry is written to a temporary file and atomically moved into
+        place so concurrent readers never observe a partial entry.
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(payload, default=str).encode("utf-8")
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                with gzip.GzipFile(
+                    fileobj=raw, mode="wb", compresslevel=self.compress_level, mtime=0
+                ) as f:
+                    f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+class CachedReader:
+    """Reader wrapper that serves conversions from a ``ConversionCache``.
+
+    Local files and in-memory uploads are cached; URLs and other inputs are
+    delegated to the wrapped reader unchanged.
+    """
+
+    def __init__(self, reader: Any, cache: ConversionCache) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            reader: SplitterMR reader performing the actual conversion.
+            cache: Cache used to store and retrieve reader outputs.
+        """
+        self.reader = reader
+        self.cache = cache
+
+    def read(self, file_path: Any = None, **kwargs: Any) -> Any:
+        """Return the cached conversion of ``file_path`` or convert it.
+
+        Args:
+            file_path: Path or URL passed to the wrapped reader.
+            **kwargs: Reader options; they are part of the cache key.
+
+        Returns:
+            A SplitterMR ``ReaderOutput``.
+        """
+        if file_path is None or not Path(str(file_path)).is_file():
+            return self.reader.read(file_path, **kwargs)
+
+        key = self.cache.build_key(
+            self.cache.hash_file(file_path), self.reader, **_key_options(kwargs)
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return _restore(
+                cached, str(file_path), Path(str(file_path)).name, kwargs.get("document_id")
+            )
+
+        output = self.reader.read(file_path, **kwargs)
+        if hasattr(output, "model_dump"):
+            self.cache.set(key, output.model_dump())
+        return output
+
+    def read_stream(
+        self,
+        data: DocumentData,
+        filename: Optional[str] = None,
+        mimetype: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Return the cached conversion of in-memory data or convert it.
+
+        Args:
+            data: Raw bytes or a binary file-like object.
+            filename: Original file name, used for format detection.
+            mimetype: MIME type hint.
+            **kwargs: Reader options; they are part of the cache key.
+
+        Returns:
+            A SplitterMR ``ReaderOutput``.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = as_binary_stream(data).read()
+        key = self.cache.build_key(
+            hashlib.sha256(data).hexdigest(),
+            self.reader,
+            extension=guess_extension(filename, mimetype),
+            mimetype=mimetype,
+            **_key_options(kwargs),
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return _restore(cached, filename or "", filename, kwargs.get("document_id"))
+
+        output = read_from_stream(self.reader, data, filename, mimetype, **kwargs)
+        if hasattr(output, "model_dump"):
+            self.cache.set(key, output.model_dump())
+        return output
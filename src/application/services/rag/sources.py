@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import mimetypes
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Iterator, Optional
+
+
+@dataclass(frozen=True)
+class DocumentRef:
+    """Reference to a document stored in a document source.
+
+    Attributes:
+        key: Source-specific identifier (relative path or object key).
+        filename: File name used for format detection.
+        size: Size in bytes, if known from the listing.
+        mimetype: MIME type, if known from the listing.
+    """
+
+    key: str
+    filename: str
+    size: Optional[int] = None
+    mimetype: Optional[str] = None
+
+
+class BaseDocumentSource(ABC):
+    """Abstract source of documents to ingest.
+
+    Sources expose a synchronous listing iterator and an asynchronous byte
+    fetcher, so ingestion can prefetch upcoming documents while the current
+    ones are being converted and embedded. Async ingestion creates and
+    advances the listing iterator in worker threads, so it may block.
+    """
+
+    @abstractmethod
+    def list_documents(self, prefix: str = "") -> Iterator[DocumentRef]:
+        """Iterate over the documents available under ``prefix``.
+
+        Args:
+            prefix: Key prefix used to narrow the listing.
+
+        Yields:
+            References to the available documents.
+        """
+
+    @abstractmethod
+    async def fetch(self, ref: DocumentRef) -> bytes:
+        """Return the raw content of a document.
+
+        Args:
+            ref: Reference obtained from ``list_documents``.
+
+        Returns:
+            The document bytes.
+
+        Raises:
+            FileNotFoundError: If the document no longer exists.
+        """
+
+
+class LocalDocumentSource(BaseDocumentSource):
+    """Document source backed by a local directory tree."""
+
+    def __init__(self, root: str | Path, pattern: str = "**/*") -> None:
+        """Initialize the local source.
+
+        Args:
+            root: Directory containing the documents.
+            pattern: Glob pattern (relative to ``root``) selecting documents.
+        """
+        self.root = Path(root)
+        self.pattern = pattern
+
+    def list_documents(self, prefix: str = "") -> Iterator[DocumentRef]:
+        """Iterate over matching files under ``root`` in sorted order."""
+        for path in sorted(self.root.glob(self.pattern)):
+            key = path.relative_to(self.root).as_posix()
+            if not path.is_file() or not key.startswith(prefix):
+                continue
+            yield DocumentRef(
+                key=key,
+                filename=path.name,
+                size=path.stat().st_size,
+                mimetype=mimetypes.guess_type(path.name)[0],
+            )
+
+    async def fetch(self, ref: DocumentRef) -> bytes:
+        """Read the file in a worker thread."""
+        return await asyncio.to_thread((self.root / ref.key).read_bytes)
+
+
+class LocalObjectStoreSource(BaseDocumentSource):
+    """Local stand-in for an object store such as S3, Blob Storage or GCS.
+
+    Objects live under ``<root>/<bucket>/<key>``. Listing is paginated like
+    the cloud APIs, and an optional per-request latency makes it possible to
+    exercise prefetching without network access.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        bucket: str,
+        latency: float = 0.0,
+        page_size: int = 1000,
+    ) -> None:
+        """Initialize the object-store stand-in.
+
+        Args:
+            root: Directory holding the buckets.
+            bucket: Bucket (container) name.
+            latency: Simulated seconds per fetch request.
+            page_size: Maximum number of keys per listing page.
+        """
+        self.bucket_path = Path(root) / bucket
+        self.latency = latency
+        self.page_size = page_size
+
+    def put_object(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``, creating parent prefixes."""
+        path = self.bucket_path / PurePosixPath(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def list_page(
+        self, prefix: str = "", continuation_token: Optional[str] = None
+    ) -> tuple[list[DocumentRef], Optional[str]]:
+        """Return one listing page and the token for the next one.
+
+        Args:
+            prefix: Key prefix used to narrow the listing.
+            continuation_token: Last key of the previous page.
+
+        Returns:
+            The page of references and the next continuation token, or None
+            when the listing is exhausted.
+        """
+        keys = sorted(
+            path.relative_to(self.bucket_path).as_posix()
+            for path in self.bucket_path.rglob("*")
+            if path.is_file()
+        )
+        keys = [k for k in keys if k.startswith(prefix)]
+        if continuation_token is not None:
+            keys = [k for k in keys if k > continuation_token]
+        page = keys[: self.page_size]
+        refs = [
+            DocumentRef(
+                key=key,
+                filename=PurePosixPath(key).name,
+                size=(self.bucket_path / key).stat().st_size,
+                mimetype=mimetypes.guess_type(key)[0],
+            )
+            for key in page
+        ]
+        next_token = page[-1] if len(keys) > self.page_size else None
+        return refs, next_token
+
+    def list_documents(self, prefix: str = "") -> Iterator[DocumentRef]:
+        """Iterate over all objects under ``prefix``, page by page."""
+        token: Optional[str] = None
+        while True:
+            refs, token = self.list_page(prefix, token)
+            yield from refs
+            if token is None:
+                break
+
+    async def fetch(self, ref: DocumentRef) -> bytes:
+        """Return the object content after the simulated latency."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        path = self.bucket_path / PurePosixPath(ref.key)
+        return await asyncio.to_thread(path.read_bytes)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import io
+import mimetypes
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+
+DocumentData = Union[bytes, bytearray, memoryview, BinaryIO]
+
+
+def as_binary_stream(data: DocumentData) -> BinaryIO:
+    """Return a seekable binary stream over ``data`` without copying bytes."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return io.BytesIO(data)
+    if not data.seekable():
+        return io.BytesIO(data.read())
+    return data
+
+
+def guess_extension(filename: Optional[str], mimetype: Optional[str]) -> str:
+    """Return the file extension (with dot) implied by a filename or MIME type."""
+    if filename and Path(filename).suffix:
+        return Path(filename).suffix.lower()
+    if mimetype:
+        return mimetypes.guess_extension(mimetype) or ""
+    return ""
+
+
+def _is_markitdown_reader(reader: Any) -> bool:
+    """Return True when ``reader`` is a SplitterMR ``MarkItDownReader``."""
+    from splitter_mr.reader import MarkItDownReader
+
+    return isinstance(reader, MarkItDownReader)
+
+
+def _markitdown_from_stream(
+    reader: Any,
+    stream: BinaryIO,
+    filename: Optional[str],
+    mimetype: Optional[str],
+    extension: str,
+    **kwargs: Any,
+) -> Any:
+    """Convert ``stream`` the way ``MarkItDownReader.read`` converts a file.
+
+    Applies the reader's defaults for ``prompt``, ``page_placeholder`` and
+    ``document_id`` and builds the MarkItDown instance from the reader's
+    public ``model``.
+    """
+    from markitdown import MarkItDown, StreamInfo
+    from splitter_mr.schema import (
+        DEFAULT_IMAGE_EXTRACTION_PROMPT,
+        DEFAULT_PAGE_PLACEHOLDER,
+        ReaderOutput,
+    )
+    from splitter_mr.schema.exceptions import MarkItDownReaderException
+
+    model = getattr(reader, "model", None)
+    if model is not None:
+        md = MarkItDown(llm_client=model.get_client(), llm_model=model.model_name)
+        ocr_method: Optional[str] = model.model_name
+    else:
+        md, ocr_method = MarkItDown(), None
+    prompt = kwargs.get("prompt", DEFAULT_IMAGE_EXTRACTION_PROMPT)
+    page_placeholder = kwargs.get("page_placeholder", DEFAULT_PAGE_PLACEHOLDER)
+
+    try:
+        result = md.convert_stream(
+            stream,
+            stream_info=StreamInfo(
+                mimetype=mimetype,
+                extension=extension or None,
+                filename=filename,
+            ),
+            llm_prompt=prompt,
+        )
+    except Exception as e:
+        raise MarkItDownReaderException(
+            f"MarkItDown processing failed for stream {filename or ''}: {e}"
+        ) from e
+
+    text = result.text_content
+    if not (page_placeholder and page_placeholder in text):
+        page_placeholder = None
+    return ReaderOutput(
+        text=text,
+        document_name=filename,
+        document_path=filename or "",
+        document_id=kwargs.get("document_id", str(uuid.uuid4())),
+        conversion_method="json" if extension == ".json" else "markdown",
+        reader_method="markitdown",
+        ocr_method=ocr_method,
+        page_placeholder=page_placeholder,
+        metadata=kwargs.get("metadata", {}),
+    )
+
+
+def read_from_stream(
+    reader: Any,
+    data: DocumentData,
+    filename: Optional[str] = None,
+    mimetype: Optional[str] = None,
+    **kwargs: Any,
+) -> Any:
+    """Convert in-memory document data with a SplitterMR reader.
+
+    ``MarkItDownReader`` instances convert the stream directly with the same
+    defaults as ``MarkItDownReader.read``. Other readers, and page-split
+    conversions that need a real file, fall back to a temporary file.
+
+    Args:
+        reader: SplitterMR reader instance.
+        data: Raw bytes or a binary file-like object.
+        filename: Original file name, used for format detection and naming.
+        mimetype: MIME type hint, used when the filename has no extension.
+        **kwargs: Options forwarded to the reader.
+
+    Returns:
+        A SplitterMR ``ReaderOutput``.
+    """
+    stream = as_binary_stream(data)
+    extension = guess_extension(filename, mimetype)
+    if _is_markitdown_reader(reader) and not kwargs.get("split_by_pages"):
+        return _markitdown_from_stream(reader, stream, filename, mimetype, extension, **kwargs)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        name = Path(filename).name if filename else f"document{extension}"
+        path = Path(tmp_dir) / name
+        with open(path, "wb") as f:
+            shutil.copyfileobj(stream, f)
+        output = reader.read(str(path), **kwargs)
+    if hasattr(output, "document_path"):
+        output.document_path = filename or ""
+    return output
@@ -1,19 +1,31 @@
 """Domain models for embedding operations."""
 
 from .constants import (
+    AZURE_OPENAI_EMBEDDING_BATCH_LIMITS,
     AZURE_OPENAI_EMBEDDING_PARAM_MAP,
+    BEDROCK_EMBEDDING_BATCH_LIMITS,
     BEDROCK_EMBEDDING_PARAM_MAP,
+    COHERE_EMBEDDING_BATCH_LIMITS,
     COHERE_EMBEDDING_PARAM_MAP,
+    GEMINI_EMBEDDING_BATCH_LIMITS,
     GEMINI_EMBEDDING_PARAM_MAP,
+    HASHING_EMBEDDING_BATCH_LIMITS,
+    HASHING_EMBEDDING_DEFAULTS,
+    OLLAMA_EMBEDDING_BATCH_LIMITS,
+    OPENAI_EMBEDDING_BATCH_LIMITS,
     OPENAI_EMBEDDING_PARAM_MAP,
+    VOYAGEAI_EMBEDDING_BATCH_LIMITS,
     VOYAGEAI_EMBEDDING_PARAM_MAP,
+    XAI_EMBEDDING_BATCH_LIMITS,
     XAI_EMBEDDING_PARAM_MAP,
 )
 from .protocols import Embedding, EmbeddingConfig
 from .types import (
     Embedding as EmbeddingDTO,
     EmbeddingConfig as EmbeddingConfigDTO,
+    EmbeddingFormat,
     EmbeddingProvider,
+    MatrixRows,
 )
 
 __all__: list[str] = [
@@ -23,7 +35,9 @@ __all__: list[str] = [
     # Concrete types
     "EmbeddingConfigDTO",
     "EmbeddingDTO",
+    "EmbeddingFormat",
     "EmbeddingProvider",
+    "MatrixRows",
     # Parameter maps
     "AZURE_OPENAI_EMBEDDING_PARAM_MAP",
     "BEDROCK_EMBEDDING_PARAM_MAP",
@@ -32,4 +46,16 @@ __all__: list[str] = [
     "XAI_EMBEDDING_PARAM_MAP",
     "OPENAI_EMBEDDING_PARAM_MAP",
     "VOYAGEAI_EMBEDDING_PARAM_MAP",
+    # Defaults
+    "HASHING_EMBEDDING_DEFAULTS",
+    # Batch limits
+    "AZURE_OPENAI_EMBEDDING_BATCH_LIMITS",
+    "BEDROCK_EMBEDDING_BATCH_LIMITS",
+    "COHERE_EMBEDDING_BATCH_LIMITS",
+    "GEMINI_EMBEDDING_BATCH_LIMITS",
+    "HASHING_EMBEDDING_BATCH_LIMITS",
+    "OLLAMA_EMBEDDING_BATCH_LIMITS",
+    "OPENAI_EMBEDDING_BATCH_LIMITS",
+    "VOYAGEAI_EMBEDDING_BATCH_LIMITS",
+    "XAI_EMBEDDING_BATCH_LIMITS",
 ]
@@ -1,4 +1,7 @@
 # Embeddings
+#
+# ``*_BATCH_LIMITS`` are the providers' hard per-request caps; the batcher
+# fills only part of ``max_tokens`` (see ``BaseEmbedding._TOKEN_HEADROOM``).
 
 ## Azure OpenAI
 
@@ -9,6 +12,11 @@ AZURE_OPENAI_EMBEDDING_PARAM_MAP: dict[str, str] = {
     "api_key": "api_key",
 }
 
+AZURE_OPENAI_EMBEDDING_BATCH_LIMITS: dict[str, int] = {
+    "max_items": 2048,
+    "max_tokens": 300_000,
+}
+
 ## Bedrock
 
 BEDROCK_EMBEDDING_PARAM_MAP: dict[str, str] = {
@@ -16,16 +24,29 @@ BEDROCK_EMBEDDING_PARAM_MAP: dict[str, str] = {
     "base_url": "endpoint_url",
 }
 
+BEDROCK_EMBEDDING_BATCH_LIMITS: dict[str, int] = {
+    "max_items": 96,
+}
+
 ## Cohere
 
 COHERE_EMBEDDING_PARAM_MAP: dict[str, str] = {
     "api_key": "cohere_api_key",
 }
 
+COHERE_EMBEDDING_BATCH_LIMITS: dict[str, int] = {
+    "max_items": 96,
+}
+
 ## Gemini
 
 GEMINI_EMBEDDING_PARAM_MAP: dict[str, str] = {
     "api_key": "google_api_key",
+    "dimensions": "output_dimensionality",
+}
+
+GEMINI_EMBEDDING_BATCH_LIMITS: dict[str, int] = {
+    "max_items": 100,
 }
 
 ## Grok (xAI – OpenAI-compatible)
@@ -35,6 +56,25 @@ XAI_EMBEDDING_PARAM_MAP: dict[str, str] = {
     "base_url": "openai_api_base",
 }
 
+XAI_EMBEDDING_BATCH_LIMITS: dict[str, int] = {
+    "max_items": 2048,
+    "max_tokens": 300_000,
+}
+
+## Hashing (offline)
+
+HASHING_EMBEDDING_DEFAULTS: dict[str, object] = {
+    "model": "hashing-v1",
+    "dimensions": 384,
+    "ngram_range": (3, 5),
+}
+
+HASHING_EMBEDDING_BATCH_LIMITS: dict[str, int] = {}
+
+## Ollama
+
+OLLAMA_EMBEDDING_BATCH_LIMITS: dict[str, int] = {"max_items": 32}
+
 ## OpenAI
 
 OPENAI_EMBEDDING_PARAM_MAP: dict[str, str] = {
@@ -43,8 +83,19 @@ OPENAI_EMBEDDING_PARAM_MAP: dict[str, str] = {
     "organization": "openai_organization",
 }
 
+OPENAI_EMBEDDING_BATCH_LIMITS: dict[str, int] = {
+    "max_items": 2048,
+    "max_tokens": 300_000,
+}
+
 ## VoyageAI
 
 VOYAGEAI_EMBEDDING_PARAM_MAP: dict[str, str] = {
     "api_key": "voyage_api_key",
+    "dimensions": "output_dimension",
+}
+
+VOYAGEAI_EMBEDDING_BATCH_LIMITS: dict[str, int] = {
+    "max_items": 1000,
+    "max_tokens": 120_000,
 }
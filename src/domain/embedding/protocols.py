@@ -30,6 +30,20 @@ class EmbeddingConfig(Protocol):
     max_retries: Optional[int]
     model_kwargs: Optional[dict[str, Any]]
 
+    # Request batching
+    max_batch_items: Optional[int]
+    max_batch_tokens: Optional[int]
+    max_concurrency: Optional[int]
+    max_async_concurrency: Optional[int]
+    sort_by_length: Optional[bool]
+
+    # Output
+    output_format: Optional[str]
+    dimensions: Optional[int]
+
+    # Instrumentation
+    sinks: Optional[list[Any]]
+
 
 class Embedding(Protocol):
     """Protocol defining the output structure of an embedding operation.
@@ -51,3 +65,4 @@ class Embedding(Protocol):
     split_method: str
     split_params: Optional[dict[str, Any]]
     metadata: Optional[dict[str, Any]]
+    matrix: Optional[Any]
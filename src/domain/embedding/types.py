@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional, Union
+from typing import Any, Iterator, Optional, Union
 
 from pydantic import SecretStr
 
@@ -16,10 +17,51 @@ class EmbeddingProvider(str, Enum):
     GOOGLE = "gemini"
     XAI = "grok"
     HUGGINGFACE = "ollama"
+    HASHING = "hashing"
     OPENAI = "openai"
     VOYAGEAI = "voyageai"
 
 
+class EmbeddingFormat(str, Enum):
+    """In-memory representation of the vectors returned by ``embed``."""
+
+    LIST = "list"
+    NUMPY = "numpy"
+
+
+class MatrixRows(Sequence):
+    """Read-only list view over the rows of a 2-D vector matrix.
+
+    Rows are converted to ``list[float]`` only when accessed, so consumers
+    that need Python lists pay for the conversion while array-aware
+    consumers can use the matrix directly.
+    """
+
+    def __init__(self, matrix: Any) -> None:
+        """Wrap an ``N x D`` array exposing ``__len__``, indexing and ``tolist``."""
+        self.matrix = matrix
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.matrix[index].tolist()
+
+    def __iter__(self) -> Iterator[list[float]]:
+        for row in self.matrix:
+            yield row.tolist()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MatrixRows):
+            other = other.matrix.tolist()
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return self.matrix.tolist() == list(other)
+
+    def __repr__(self) -> str:
+        return f"MatrixRows(shape={getattr(self.matrix, 'shape', len(self))})"
+
+
 @dataclass
 class EmbeddingConfig:
     """Concrete configuration for embedding model connections.
@@ -38,6 +80,16 @@ class EmbeddingConfig:
         timeout: Request timeout in seconds.
         max_retries: Maximum number of retry attempts.
         model_kwargs: Additional provider-specific parameters.
+        max_batch_items: Maximum number of texts per embedding request.
+        max_batch_tokens: Maximum estimated tokens per embedding request.
+        max_concurrency: Maximum number of requests in flight per call.
+        max_async_concurrency: Maximum number of async requests in flight
+            per embedding instance.
+        sort_by_length: Batch texts of similar length together.
+        output_format: Vector representation returned by ``embed``
+            (see ``EmbeddingFormat``).
+        dimensions: Target vector size (Matryoshka truncation).
+        sinks: Instrumentation sinks receiving one event per embedding call.
     """
 
     api_key: Optional[Union[str, SecretStr]] = None
@@ -50,6 +102,14 @@ class EmbeddingConfig:
     timeout: Optional[Union[float, int]] = None
     max_retries: Optional[int] = None
     model_kwargs: Optional[dict[str, Any]] = None
+    max_batch_items: Optional[int] = None
+    max_batch_tokens: Optional[int] = None
+    max_concurrency: Optional[int] = None
+    max_async_concurrency: Optional[int] = None
+    sort_by_length: Optional[bool] = None
+    output_format: Optional[str] = None
+    dimensions: Optional[int] = None
+    sinks: Optional[list[Any]] = None
 
 
 @dataclass
@@ -57,7 +117,8 @@ class Embedding:
     """Concrete embedding output extending SplitterMR SplitterOutput.
 
     Attributes:
-        embeddings: Embedding vectors, one list of floats per chunk.
+        embeddings: Embedding vectors, one list of floats per chunk. In
+            matrix mode this is a lazy ``MatrixRows`` view over ``matrix``.
         embedding_id: Unique identifier for this embedding batch.
         chunks: Text chunks from the splitter.
         chunk_id: Unique IDs corresponding to each chunk.
@@ -70,6 +131,8 @@ class Embedding:
         split_method: Method used to split the document.
         split_params: Parameters used during splitting.
         metadata: Additional metadata.
+        matrix: Contiguous ``N x D`` float32 array holding the vectors, set
+            when the model runs in ``EmbeddingFormat.NUMPY`` mode.
     """
 
     embeddings: list[list[float]] = field(default_factory=list)
@@ -85,3 +148,8 @@ class Embedding:
     split_method: str = ""
     split_params: Optional[dict[str, Any]] = None
     metadata: Optional[dict[str, Any]] = None
+    matrix: Optional[Any] = None
+
+    def __post_init__(self) -> None:
+        if self.matrix is not None and not self.embeddings:
+            self.embeddings = MatrixRows(self.matrix)
@@ -50,3 +50,16 @@ CLAUDE_PARAM_MAP: dict[str, str] = {
     "base_url": "anthropic_api_url",
     "api_key": "api_key",
 }
+
+## Simulated
+
+SIMULATED_LLM_DEFAULTS: dict[str, object] = {
+    "model": "simulated-v1",
+    "ttft_seconds": 0.3,
+    "ttft_sigma": 0.35,
+    "tokens_per_second": 60.0,
+    "output_tokens": 128,
+    "output_tokens_jitter": 0.25,
+    "error_rate": 0.0,
+    "seed": 0,
+}
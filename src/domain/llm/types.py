@@ -9,3 +9,4 @@ class LLMProvider(str, Enum):
     AWS = "bedrock"
     XAI = "grok"
     HUGGINGFACE = "ollama"
+    SIMULATED = "simulated"
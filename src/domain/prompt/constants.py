@@ -0,0 +1,3 @@
+# Line separating a template's static prefix, which providers may cache
+# across requests, from its per-request remainder. Removed from the prompt.
+CACHE_BOUNDARY: str = "<!-- cache-boundary -->"
@@ -11,8 +11,22 @@ class PromptTemplate(BaseModel):
 
 
 class Prompt(BaseModel):
-    """Represents the final processed prompt ready for the LLM."""
+    """Represents the final processed prompt ready for the LLM.
+
+    Attributes:
+        content: Full prompt text.
+        static_prefix: Leading part of ``content`` that is identical across
+            requests (the template text before ``CACHE_BOUNDARY``); LLM
+            adapters mark it for provider-side prompt caching. Empty when
+            the template declares no boundary.
+    """
 
     model_config = ConfigDict(frozen=True)
 
     content: str
+    static_prefix: str = ""
+
+    @property
+    def dynamic_suffix(self) -> str:
+        """Return the part of ``content`` after the static prefix."""
+        return self.content[len(self.static_prefix):]
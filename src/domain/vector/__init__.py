@@ -20,6 +20,7 @@ from .protocols import (
 from .types import (
     CollectionConfig as CollectionConfigDTO,
     DistanceMetric,
+    QuantizationType,
     VectorDBConfig as VectorDBConfigDTO,
     VectorRecord as VectorRecordDTO,
     VectorSearchResult as VectorSearchResultDTO,
@@ -40,6 +41,7 @@ __all__: list[str] = [
     "VectorSearchResultDTO",
     "VectorDBProvider",
     "DistanceMetric",
+    "QuantizationType",
     # Parameter maps
     "MILVUS_PARAM_MAP",
     "QDRANT_PARAM_MAP",
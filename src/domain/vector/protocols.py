@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Protocol
+from typing import Any, Iterator, Optional, Protocol
 
 from typing_extensions import Self
 
@@ -40,6 +40,10 @@ class CollectionConfig(Protocol):
     name: str
     dimension: Optional[int]
     metric: Optional[str]
+    quantization: Optional[str]
+    quantile: Optional[float]
+    calibration_size: Optional[int]
+    oversampling: Optional[float]
     kwargs: dict[str, Any]
 
 
@@ -159,6 +163,25 @@ class VectorDB(Protocol):
         """
         ...
 
+    def upsert_matrix(
+        self,
+        collection_name: str,
+        ids: list[str],
+        matrix: Any,
+        payloads: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> None:
+        """Insert or update records whose vectors are rows of a matrix.
+
+        Args:
+            collection_name: Target collection/index name.
+            ids: Record identifiers, one per matrix row.
+            matrix: ``N x D`` array of vectors.
+            payloads: Record payloads, one per matrix row.
+            **kwargs: Provider-specific write options.
+        """
+        ...
+
     def search(
         self,
         collection_name: str,
@@ -193,3 +216,32 @@ class VectorDB(Protocol):
             **kwargs: Provider-specific delete options.
         """
         ...
+
+    def scroll(
+        self,
+        collection_name: str,
+        batch_size: int = 100,
+        **kwargs: Any,
+    ) -> Iterator[list[VectorRecord]]:
+        """Iterate over all records of a collection in batches.
+
+        Args:
+            collection_name: Source collection/index name.
+            batch_size: Maximum number of records per yielded batch.
+            **kwargs: Provider-specific read options.
+
+        Yields:
+            Lists of records with id, payload and (when available) vector.
+        """
+        ...
+
+    def count(self, collection_name: str) -> int:
+        """Return the number of records stored in a collection.
+
+        Args:
+            collection_name: Target collection/index name.
+
+        Returns:
+            Number of stored records.
+        """
+        ...
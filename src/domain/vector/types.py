@@ -27,6 +27,19 @@ class DistanceMetric(str, Enum):
     DOT_PRODUCT = "dot_product"
 
 
+class QuantizationType(str, Enum):
+    """Vector compression schemes for stored embeddings.
+
+    ``SCALAR`` maps every component to an int8 (4x smaller than float32)
+    using per-collection calibrated ranges; ``BINARY`` keeps one sign bit
+    per component (32x smaller). Both are followed by a rescoring pass on
+    the original vectors.
+    """
+
+    SCALAR = "scalar"
+    BINARY = "binary"
+
+
 @dataclass
 class VectorDBConfig:
     """Concrete configuration for vector database connections.
@@ -75,12 +88,24 @@ class CollectionConfig:
         name: Collection or index name (required).
         dimension: Vector dimensionality.
         metric: Distance metric (use DistanceMetric enum values).
+        quantization: Vector compression (use QuantizationType values), or
+            None to store full-precision vectors only.
+        quantile: Fraction of component values the int8 range is
+            calibrated to cover; outliers beyond it are clipped.
+        calibration_size: Vectors stored before the int8 ranges are
+            calibrated on them; earlier vectors are searched exactly.
+        oversampling: Candidates fetched per requested hit before
+            rescoring them on the original vectors.
         kwargs: Additional provider-specific collection parameters.
     """
 
     name: str = ""
     dimension: Optional[int] = None
     metric: Optional[str] = None
+    quantization: Optional[str] = None
+    quantile: Optional[float] = None
+    calibration_size: Optional[int] = None
+    oversampling: Optional[float] = None
     kwargs: dict[str, Any] = field(default_factory=dict)
 
 
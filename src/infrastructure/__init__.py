@@ -1,5 +1,12 @@
-from .utils import resolve_parameters
+from .http_pool import HttpClientPool
+from .rate_limit import Priority, RateLimiter, rate_priority
+from .utils import estimate_tokens, resolve_parameters
 
 __all__: list[str] = [
+    "HttpClientPool",
+    "Priority",
+    "RateLimiter",
+    "estimate_tokens",
+    "rate_priority",
     "resolve_parameters",
-]
\ No newline at end of file
+]
@@ -1,4 +1,24 @@
 from .base import BaseEmbedding
+from .cache import CachedEmbedding, EmbeddingCache
+from .coalescer import QueryCoalescer
 from .factory import EmbeddingFactory
+from .instrumentation import (
+    BaseEmbeddingSink,
+    EmbeddingEvent,
+    InMemoryEmbeddingMetrics,
+    LatencyHistogram,
+)
+from .router import EmbeddingRouter
 
-__all__: list[str] = ["BaseEmbedding", "EmbeddingFactory"]
+__all__: list[str] = [
+    "BaseEmbedding",
+    "BaseEmbeddingSink",
+    "CachedEmbedding",
+    "EmbeddingCache",
+    "EmbeddingEvent",
+    "EmbeddingFactory",
+    "EmbeddingRouter",
+    "InMemoryEmbeddingMetrics",
+    "LatencyHistogram",
+    "QueryCoalescer",
+]
@@ -1,11 +1,33 @@
-from .azure_openai import AzureOpenAIEmbeddingModel
-from .bedrock import BedrockEmbeddingModel
-from .cohere import CohereEmbeddingModel
-from .gemini import GeminiEmbeddingModel
-from .grok import GrokEmbeddingModel
-from .ollama import OllamaEmbeddingModel
-from .openai import OpenAIEmbeddingModel
-from .voyageai import VoyageAIEmbeddingModel
+from typing import TYPE_CHECKING
+
+from ...registry import lazy_exports
+
+if TYPE_CHECKING:
+    from .azure_openai import AzureOpenAIEmbeddingModel
+    from .bedrock import BedrockEmbeddingModel
+    from .cohere import CohereEmbeddingModel
+    from .gemini import GeminiEmbeddingModel
+    from .grok import GrokEmbeddingModel
+    from .hashing import HashingEmbeddingModel, HashingEmbeddings
+    from .ollama import OllamaEmbeddingModel
+    from .openai import OpenAIEmbeddingModel
+    from .voyageai import VoyageAIEmbeddingModel
+
+# Adapters import their provider SDK, so each is loaded on first access.
+_EXPORTS: dict[str, str] = {
+    "AzureOpenAIEmbeddingModel": ".azure_openai",
+    "BedrockEmbeddingModel": ".bedrock",
+    "CohereEmbeddingModel": ".cohere",
+    "GeminiEmbeddingModel": ".gemini",
+    "GrokEmbeddingModel": ".grok",
+    "HashingEmbeddingModel": ".hashing",
+    "HashingEmbeddings": ".hashing",
+    "OllamaEmbeddingModel": ".ollama",
+    "OpenAIEmbeddingModel": ".openai",
+    "VoyageAIEmbeddingModel": ".voyageai",
+}
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
 
 __all__: list[str] = [
     "AzureOpenAIEmbeddingModel",
@@ -13,6 +35,8 @@ __all__: list[str] = [
     "CohereEmbeddingModel",
     "GeminiEmbeddingModel",
     "GrokEmbeddingModel",
+    "HashingEmbeddingModel",
+    "HashingEmbeddings",
     "OllamaEmbeddingModel",
     "OpenAIEmbeddingModel",
     "VoyageAIEmbeddingModel",
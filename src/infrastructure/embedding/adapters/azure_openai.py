@@ -6,6 +6,7 @@ from langchain_openai import AzureOpenAIEmbeddings
 from pydantic import SecretStr
 
 from ....domain.embedding.constants import (
+    AZURE_OPENAI_EMBEDDING_BATCH_LIMITS,
     AZURE_OPENAI_EMBEDDING_PARAM_MAP,
 )
 from ....domain.embedding.protocols import EmbeddingConfig
@@ -23,6 +24,10 @@ class AzureOpenAIEmbeddingModel(BaseEmbedding):
         client (AzureOpenAIEmbeddings): The Azure embeddings client.
     """
 
+    _BATCH_LIMITS = AZURE_OPENAI_EMBEDDING_BATCH_LIMITS
+    _NATIVE_DIMENSIONS = True
+    _SHARES_HTTP_CLIENT = True
+
     def __init__(
         self,
         config: Optional[EmbeddingConfig] = None,
@@ -51,6 +56,7 @@ class AzureOpenAIEmbeddingModel(BaseEmbedding):
             openai_api_version=api_version,
             **kwargs,
         )
+        params = self._extract_options(params)
 
         for cfg_key, lc_key in AZURE_OPENAI_EMBEDDING_PARAM_MAP.items():
             if cfg_key in params:
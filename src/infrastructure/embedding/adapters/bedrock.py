@@ -5,7 +5,10 @@ from typing import Any, Optional, Union
 from langchain_aws import BedrockEmbeddings
 from pydantic import SecretStr
 
-from ....domain.embedding.constants import BEDROCK_EMBEDDING_PARAM_MAP
+from ....domain.embedding.constants import (
+    BEDROCK_EMBEDDING_BATCH_LIMITS,
+    BEDROCK_EMBEDDING_PARAM_MAP,
+)
 from ....domain.embedding.protocols import EmbeddingConfig
 from ....domain.embedding.types import EmbeddingProvider
 from ...utils import resolve_parameters
@@ -21,6 +24,10 @@ class BedrockEmbeddingModel(BaseEmbedding):
         client (BedrockEmbeddings): The Bedrock embeddings client.
     """
 
+    _BATCH_LIMITS = BEDROCK_EMBEDDING_BATCH_LIMITS
+    _NATIVE_DIMENSIONS = True
+    _SYMMETRIC_QUERIES = False
+
     def __init__(
         self,
         config: Optional[EmbeddingConfig] = None,
@@ -43,6 +50,7 @@ class BedrockEmbeddingModel(BaseEmbedding):
         params: dict[str, Any] = resolve_parameters(
             config, model=model, api_key=api_key, **kwargs
         )
+        params = self._extract_options(params)
 
         for cfg_key, lc_key in BEDROCK_EMBEDDING_PARAM_MAP.items():
             if cfg_key in params:
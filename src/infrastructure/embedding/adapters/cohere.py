@@ -5,7 +5,10 @@ from typing import Any, Optional, Union
 from langchain_cohere import CohereEmbeddings
 from pydantic import SecretStr
 
-from ....domain.embedding.constants import COHERE_EMBEDDING_PARAM_MAP
+from ....domain.embedding.constants import (
+    COHERE_EMBEDDING_BATCH_LIMITS,
+    COHERE_EMBEDDING_PARAM_MAP,
+)
 from ....domain.embedding.protocols import EmbeddingConfig
 from ....domain.embedding.types import EmbeddingProvider
 from ...utils import resolve_parameters
@@ -21,6 +24,9 @@ class CohereEmbeddingModel(BaseEmbedding):
         client (CohereEmbeddings): The Cohere embeddings client.
     """
 
+    _BATCH_LIMITS = COHERE_EMBEDDING_BATCH_LIMITS
+    _SYMMETRIC_QUERIES = False
+
     def __init__(
         self,
         config: Optional[EmbeddingConfig] = None,
@@ -43,6 +49,7 @@ class CohereEmbeddingModel(BaseEmbedding):
         params: dict[str, Any] = resolve_parameters(
             config, model=model, api_key=api_key, **kwargs
         )
+        params = self._extract_options(params)
 
         for cfg_key, lc_key in COHERE_EMBEDDING_PARAM_MAP.items():
             if cfg_key in params:
@@ -5,7 +5,10 @@ from typing import Any, Optional, Union
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from pydantic import SecretStr
 
-from ....domain.embedding.constants import GEMINI_EMBEDDING_PARAM_MAP
+from ....domain.embedding.constants import (
+    GEMINI_EMBEDDING_BATCH_LIMITS,
+    GEMINI_EMBEDDING_PARAM_MAP,
+)
 from ....domain.embedding.protocols import EmbeddingConfig
 from ....domain.embedding.types import EmbeddingProvider
 from ...utils import resolve_parameters
@@ -22,6 +25,10 @@ class GeminiEmbeddingModel(BaseEmbedding):
             client.
     """
 
+    _BATCH_LIMITS = GEMINI_EMBEDDING_BATCH_LIMITS
+    _NATIVE_DIMENSIONS = True
+    _SYMMETRIC_QUERIES = False
+
     def __init__(
         self,
         config: Optional[EmbeddingConfig] = None,
@@ -44,6 +51,7 @@ class GeminiEmbeddingModel(BaseEmbedding):
         params: dict[str, Any] = resolve_parameters(
             config, model=model, api_key=api_key, **kwargs
         )
+        params = self._extract_options(params)
 
         for cfg_key, lc_key in GEMINI_EMBEDDING_PARAM_MAP.items():
             if cfg_key in params:
@@ -5,7 +5,10 @@ from typing import Any, Optional, Union
 from langchain_openai import OpenAIEmbeddings
 from pydantic import SecretStr
 
-from ....domain.embedding.constants import XAI_EMBEDDING_PARAM_MAP
+from ....domain.embedding.constants import (
+    XAI_EMBEDDING_BATCH_LIMITS,
+    XAI_EMBEDDING_PARAM_MAP,
+)
 from ....domain.embedding.protocols import EmbeddingConfig
 from ....domain.embedding.types import EmbeddingProvider
 from ...utils import resolve_parameters
@@ -25,6 +28,10 @@ class GrokEmbeddingModel(BaseEmbedding):
         client (OpenAIEmbeddings): OpenAI client configured for xAI.
     """
 
+    _BATCH_LIMITS = XAI_EMBEDDING_BATCH_LIMITS
+    _SHARES_HTTP_CLIENT = True
+    _DEFAULT_BASE_URL = XAI_BASE_URL
+
     def __init__(
         self,
         config: Optional[EmbeddingConfig] = None,
@@ -47,6 +54,7 @@ class GrokEmbeddingModel(BaseEmbedding):
         params: dict[str, Any] = resolve_parameters(
             config, model=model, api_key=api_key, **kwargs
         )
+        params = self._extract_options(params)
         params.setdefault("base_url", XAI_BASE_URL)
 
         for cfg_key, lc_key in XAI_EMBEDDING_PARAM_MAP.items():
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import re
+import zlib
+from typing import Any, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from ....domain.embedding.constants import (
+    HASHING_EMBEDDING_BATCH_LIMITS,
+    HASHING_EMBEDDING_DEFAULTS,
+)
+from ....domain.embedding.protocols import EmbeddingConfig
+from ....domain.embedding.types import EmbeddingProvider
+from ...utils import resolve_parameters
+from ..base import BaseEmbedding
+from ..factory import EmbeddingFactory
+
+HASHING_ALLOWED_KEYS: set[str] = {
+    "model",
+    "dimensions",
+    "ngram_range",
+    "token_weight",
+    "model_kwargs",
+}
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_FNV_PRIME = np.uint64(1099511628211)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+class HashingEmbeddings(Embeddings):
+    """Deterministic feature-hashing embeddings computed locally.
+
+    Each text is lower-cased and mapped to a signed bag of hashed character
+    n-grams (over UTF-8 bytes) and word tokens, then L2-normalized. The same
+    input always yields the same vector for a given model name.
+
+    The n-gram hashing is vectorized over the whole batch with NumPy, but the
+    work still grows with text length: on a single CPU core the default
+    ``ngram_range=(3, 5)`` embeds roughly 4-5k chunks/s at 1000 characters and
+    ~30k chunks/s at 100 characters. A single n-gram order such as ``(4, 4)``
+    is about 40% faster at 1000 characters.
+    """
+
+    def __init__(
+        self,
+        model: str = "hashing-v1",
+        dimensions: int = 384,
+        ngram_range: tuple[int, int] = (3, 5),
+        token_weight: float = 1.0,
+    ) -> None:
+        """Initialize the hashing embedder.
+
+        Args:
+            model: Name used to seed the hash functions.
+            dimensions: Output vector size.
+            ngram_range: Inclusive range of character n-gram sizes.
+            token_weight: Weight of each word token relative to an n-gram.
+        """
+        self.model = model
+        self.dimensions = int(dimensions)
+        self.ngram_range = (int(ngram_range[0]), int(ngram_range[1]))
+        self.token_weight = float(token_weight)
+        self._seed = zlib.crc32(model.encode("utf-8"))
+
+    def transform(self, texts: list[str]) -> np.ndarray:
+        """Embed ``texts`` into an ``N x dimensions`` float32 matrix."""
+        count, dims = len(texts), self.dimensions
+        if not count:
+            return np.zeros((0, dims), dtype=np.float32)
+        lowered = [text.lower() for text in texts]
+        owners: list[np.ndarray] = []
+        hashes: list[np.ndarray] = []
+        weights: list[np.ndarray] = []
+
+        # Character n-grams: one FNV pass per byte offset, shared by every
+        # size (the size-k hash extends the size-(k-1) one), then salted by
+        # size so equal prefixes of different lengths hash apart.
+        encoded = [f" {text} ".encode("utf-8") for text in lowered]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=count)
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+        owner = np.repeat(np.arange(count, dtype=np.int64), lengths)
+        low, high = self.ngram_range
+        rolling = np.full(len(data), self._seed, dtype=np.uint64)
+        for size in range(1, min(high, len(data)) + 1):
+            windows = len(data) - size + 1
+            rolling = (rolling[:windows] ^ data[size - 1 :]) * _FNV_PRIME
+            if size < low:
+                continue
+            inside = owner[:windows] == owner[size - 1 :]
+            owners.append(owner[:windows][inside])
+            hashes.append(rolling[inside] ^ np.uint64(size))
+            weights.append(np.ones(len(owners[-1])))
+
+        # Word tokens: hash each distinct token once.
+        per_text = [_TOKEN_PATTERN.findall(text) for text in lowered]
+        tokens = [token for words in per_text for token in words]
+        if tokens:
+            vocabulary = {
+                token: zlib.crc32(token.encode("utf-8"), self._seed)
+                for token in dict.fromkeys(tokens)
+            }
+            counts = np.fromiter(map(len, per_text), dtype=np.int64, count=count)
+            owners.append(np.repeat(np.arange(count, dtype=np.int64), counts))
+            hashes.append(
+                np.fromiter(map(vocabulary.__getitem__, tokens), dtype=np.uint64, count=len(tokens))
+            )
+            weights.append(np.full(len(tokens), self.token_weight))
+
+        matrix = np.zeros((count, dims), dtype=np.float64)
+        if hashes:
+            matrix = self._accumulate(
+                count, np.concatenate(owners), np.concatenate(hashes), np.concatenate(weights)
+            )
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix.astype(np.float32)
+
+    def _accumulate(
+        self,
+        count: int,
+        owner: np.ndarray,
+        hashes: np.ndarray,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        """Sum signed hashed features into a ``count x dimensions`` matrix."""
+        mixed = hashes * _MIX
+        mixed ^= mixed >> np.uint64(29)
+        signed = mixed.view(np.int64)
+        # Multiply-shift maps the high 32 bits onto ``[0, dimensions)``
+        # without a 64-bit modulo; the sign bit picks the feature's sign.
+        buckets = ((signed >> 32) & 0xFFFFFFFF) * self.dimensions >> 32
+        signs = np.copysign(weights, signed)
+        totals = np.bincount(
+            owner * self.dimensions + buckets,
+            weights=signs,
+            minlength=count * self.dimensions,
+        )
+        return totals.reshape(count, self.dimensions)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed a list of documents."""
+        return self.transform(list(texts)).tolist()
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a single query."""
+        return self.transform([text])[0].tolist()
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents without leaving the event loop (CPU-only work)."""
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Embed a query without leaving the event loop (CPU-only work)."""
+        return self.embed_query(text)
+
+
+@EmbeddingFactory.register(EmbeddingProvider.HASHING)
+class HashingEmbeddingModel(BaseEmbedding):
+    """Offline embedding provider for benchmarks and load tests.
+
+    Attributes:
+        client (HashingEmbeddings): The local hashing embedder.
+    """
+
+    _BATCH_LIMITS = HASHING_EMBEDDING_BATCH_LIMITS
+    _NATIVE_DIMENSIONS = True
+
+    def __init__(
+        self,
+        config: Optional[EmbeddingConfig] = None,
+        *,
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the hashing embedding wrapper.
+
+        Args:
+            config: An object adhering to the EmbeddingConfig protocol.
+            model: Name used to seed the hash functions.
+            dimensions: Output vector size.
+            **kwargs: Additional arguments for HashingEmbeddings
+                (``ngram_range``, ``token_weight``). Connection settings
+                such as ``api_key`` are ignored.
+        """
+        params: dict[str, Any] = resolve_parameters(
+            config,
+            allowed_keys=HASHING_ALLOWED_KEYS | set(self._OPTION_KEYS),
+            model=model,
+            dimensions=dimensions,
+            **kwargs,
+        )
+        params = self._extract_options(params)
+        params.update(params.pop("model_kwargs", None) or {})
+        for key, value in HASHING_EMBEDDING_DEFAULTS.items():
+            params.setdefault(key, value)
+        self.client = HashingEmbeddings(**params)
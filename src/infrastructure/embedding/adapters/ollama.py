@@ -5,6 +5,7 @@ from typing import Any, Optional, Union
 from langchain_ollama import OllamaEmbeddings
 from pydantic import SecretStr
 
+from ....domain.embedding.constants import OLLAMA_EMBEDDING_BATCH_LIMITS
 from ....domain.embedding.protocols import EmbeddingConfig
 from ....domain.embedding.types import EmbeddingProvider
 from ...utils import resolve_parameters
@@ -16,10 +17,18 @@ from ..factory import EmbeddingFactory
 class OllamaEmbeddingModel(BaseEmbedding):
     """Wrapper for LangChain's OllamaEmbeddings with flexible config.
 
+    Local runners pad every input of a batch to the longest one, so texts
+    are bucketed by length before batching (``sort_by_length``) unless
+    disabled through the config.
+
     Attributes:
         client (OllamaEmbeddings): The Ollama embeddings client.
     """
 
+    _BATCH_LIMITS = OLLAMA_EMBEDDING_BATCH_LIMITS
+    _NATIVE_DIMENSIONS = True
+    sort_by_length = True
+
     def __init__(
         self,
         config: Optional[EmbeddingConfig] = None,
@@ -48,5 +57,6 @@ class OllamaEmbeddingModel(BaseEmbedding):
             api_key=api_key,
             **kwargs,
         )
+        params = self._extract_options(params)
         params.pop("api_key", None)
         self.client = OllamaEmbeddings(**params)
@@ -5,7 +5,10 @@ from typing import Any, Optional, Union
 from langchain_openai import OpenAIEmbeddings
 from pydantic import SecretStr
 
-from ....domain.embedding.constants import OPENAI_EMBEDDING_PARAM_MAP
+from ....domain.embedding.constants import (
+    OPENAI_EMBEDDING_BATCH_LIMITS,
+    OPENAI_EMBEDDING_PARAM_MAP,
+)
 from ....domain.embedding.protocols import EmbeddingConfig
 from ....domain.embedding.types import EmbeddingProvider
 from ...utils import resolve_parameters
@@ -21,6 +24,11 @@ class OpenAIEmbeddingModel(BaseEmbedding):
         client (OpenAIEmbeddings): The instantiated OpenAI embeddings client.
     """
 
+    _BATCH_LIMITS = OPENAI_EMBEDDING_BATCH_LIMITS
+    _NATIVE_DIMENSIONS = True
+    _SHARES_HTTP_CLIENT = True
+    _DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
     def __init__(
         self,
         config: Optional[EmbeddingConfig] = None,
@@ -43,6 +51,7 @@ class OpenAIEmbeddingModel(BaseEmbedding):
         params: dict[str, Any] = resolve_parameters(
             config, model=model, api_key=api_key, **kwargs
         )
+        params = self._extract_options(params)
 
         for cfg_key, lc_key in OPENAI_EMBEDDING_PARAM_MAP.items():
             if cfg_key in params:
@@ -5,7 +5,10 @@ from typing import Any, Optional, Union
 from langchain_voyageai import VoyageAIEmbeddings
 from pydantic import SecretStr
 
-from ....domain.embedding.constants import VOYAGEAI_EMBEDDING_PARAM_MAP
+from ....domain.embedding.constants import (
+    VOYAGEAI_EMBEDDING_BATCH_LIMITS,
+    VOYAGEAI_EMBEDDING_PARAM_MAP,
+)
 from ....domain.embedding.protocols import EmbeddingConfig
 from ....domain.embedding.types import EmbeddingProvider
 from ...utils import resolve_parameters
@@ -21,6 +24,10 @@ class VoyageAIEmbeddingModel(BaseEmbedding):
         client (VoyageAIEmbeddings): The VoyageAI embeddings client.
     """
 
+    _BATCH_LIMITS = VOYAGEAI_EMBEDDING_BATCH_LIMITS
+    _NATIVE_DIMENSIONS = True
+    _SYMMETRIC_QUERIES = False
+
     def __init__(
         self,
         config: Optional[EmbeddingConfig] = None,
@@ -43,6 +50,7 @@ class VoyageAIEmbeddingModel(BaseEmbedding):
         params: dict[str, Any] = resolve_parameters(
             config, model=model, api_key=api_key, **kwargs
         )
+        params = self._extract_options(params)
 
         for cfg_key, lc_key in VOYAGEAI_EMBEDDING_PARAM_MAP.items():
             if cfg_key in params:
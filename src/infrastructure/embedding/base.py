@@ -1,30 +1,444 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import contextvars
+import math
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, Sequence
 from uuid import uuid4
 
 from ...domain.embedding.types import Embedding as EmbeddingDTO
+from ...domain.embedding.types import EmbeddingFormat, MatrixRows
+from ..http_pool import aclose_owned_http_clients, close_owned_http_clients
+from ..rate_limit import RateLimiter
+from ..utils import estimate_tokens
+from .batching import packing_tokens, plan_batches
+from .instrumentation import (
+    _CALL_STATS,
+    BaseEmbeddingSink,
+    EmbeddingCallStats,
+    EmbeddingEvent,
+    current_call_stats,
+)
+
+_MODEL_ATTRS: tuple[str, ...] = (
+    "model",
+    "model_id",
+    "model_name",
+    "azure_deployment",
+    "deployment",
+)
 
 
 class BaseEmbedding:
     """Base class for all embedding model wrappers.
 
-    Provides a common ``embed`` method that delegates vector generation
-    to the provider-specific client and wraps the result into an
+    Provides common ``embed`` / ``aembed`` methods that delegate vector
+    generation to the provider-specific client and wrap the result into an
     ``Embedding`` dataclass.
 
+    Chunks are split into request batches bounded by the provider limits
+    in ``_BATCH_LIMITS`` (overridable per instance), sent with bounded
+    concurrency and reassembled in input order. A failing batch is
+    retried on its own without resending the batches that succeeded.
+    Every request, queries included, first waits for its provider and model
+    budget in ``RateLimiter.shared()``, charged with its estimated tokens.
+
     Attributes:
         client: The LangChain embeddings instance set by subclasses.
+        max_batch_items: Maximum texts per request (None: provider default).
+        max_batch_tokens: Maximum estimated tokens per request (None:
+            ``_TOKEN_HEADROOM`` of the provider's cap).
+        max_concurrency: Maximum number of requests in flight per ``embed``
+            call.
+        max_async_concurrency: Maximum number of requests in flight across
+            all async calls on this instance.
+        sort_by_length: Group texts of similar estimated length into the
+            same batch (original order is restored afterwards). Cuts the
+            padding waste of local backends that pad every text in a batch
+            to the longest one.
+        batch_retries: Extra attempts for a failing batch.
+        batch_retry_backoff: Base delay in seconds between batch attempts.
+        output_format: ``EmbeddingFormat.NUMPY`` to return a contiguous
+            float32 matrix alongside a lazy list view.
+        dimensions: Target vector size. Providers flagged in
+            ``_NATIVE_DIMENSIONS`` shorten vectors server-side; vectors are
+            then truncated (if still longer) and L2-normalized client-side so
+            every provider returns unit vectors of this size.
+        sinks: Instrumentation sinks receiving one ``EmbeddingEvent`` per
+            ``embed``/``aembed``/``embed_query``/``aembed_query`` call.
+            Empty by default, in which case calls are not measured. Assign
+            ``BaseEmbedding.sinks`` to instrument every adapter at once.
     """
 
     client: Any
 
+    _BATCH_LIMITS: dict[str, int] = {}
+    # Provider token caps are hard limits and batches are packed from
+    # estimates, so only this fraction of ``_BATCH_LIMITS["max_tokens"]``
+    # is filled.
+    _TOKEN_HEADROOM: float = 0.8
+    _NATIVE_DIMENSIONS: bool = False
+    # False when ``embed_query`` embeds differently from documents (e.g. a
+    # query input type), so queries cannot be batched through ``_embed_texts``.
+    _SYMMETRIC_QUERIES: bool = True
+    # Adapters whose client accepts ``http_client``/``http_async_client``
+    # get pooled httpx clients from ``EmbeddingFactory`` (see ``http_pool``).
+    _SHARES_HTTP_CLIENT: bool = False
+    _DEFAULT_BASE_URL: Optional[str] = None
+    _OPTION_KEYS: tuple[str, ...] = (
+        "max_batch_items",
+        "max_batch_tokens",
+        "max_concurrency",
+        "max_async_concurrency",
+        "sort_by_length",
+        "batch_retries",
+        "batch_retry_backoff",
+        "output_format",
+        "dimensions",
+        "sinks",
+    )
+
+    max_batch_items: Optional[int] = None
+    max_batch_tokens: Optional[int] = None
+    max_concurrency: int = 1
+    max_async_concurrency: int = 8
+    sort_by_length: bool = False
+    batch_retries: int = 0
+    batch_retry_backoff: float = 0.5
+    output_format: str = EmbeddingFormat.LIST
+    dimensions: Optional[int] = None
+    sinks: Sequence[BaseEmbeddingSink] = ()
+
+    def _extract_options(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Pop wrapper-level options from resolved client parameters.
+
+        Adapters call this before instantiating the LangChain client so
+        options handled by ``BaseEmbedding`` are not forwarded to it. The
+        ``dimensions`` option is kept for providers with native support so
+        the adapter's parameter map can translate it.
+
+        Args:
+            params: Resolved constructor parameters (mutated in place).
+
+        Returns:
+            The remaining parameters for the LangChain client.
+        """
+        for key in self._OPTION_KEYS:
+            if key in params:
+                if key == "dimensions" and self._NATIVE_DIMENSIONS:
+                    setattr(self, key, params[key])
+                else:
+                    setattr(self, key, params.pop(key))
+        return params
+
+    # -- Instrumentation -----------------------------------------
+
+    def _identity(self) -> tuple[str, str]:
+        """Return the ``(provider, model)`` labels used in events.
+
+        Resolved on first use and cached on the instance, since every
+        request and event needs them.
+        """
+        identity = getattr(self, "_identity_labels", None)
+        if identity is None:
+            identity = self._resolve_identity()
+            self._identity_labels = identity
+        return identity
+
+    def _resolve_identity(self) -> tuple[str, str]:
+        """Look up the registered provider name and the client's model."""
+        from .factory import EmbeddingFactory
+
+        provider = next(
+            (
+                str(getattr(name, "value", name))
+                for name, cls in EmbeddingFactory._registry.items()
+                if cls is type(self)
+            ),
+            type(self).__name__,
+        )
+        client = getattr(self, "client", None)
+        model = next(
+            (
+                value
+                for value in (getattr(client, attr, None) for attr in _MODEL_ATTRS)
+                if isinstance(value, str) and value
+            ),
+            "",
+        )
+        return provider, model
+
+    def _emit(
+        self,
+        operation: str,
+        texts: list[str],
+        stats: EmbeddingCallStats,
+        latency: float,
+        error: Optional[BaseException],
+    ) -> None:
+        """Send one event to every sink."""
+        provider, model = self._identity()
+        event = EmbeddingEvent(
+            provider=provider,
+            model=model,
+            operation=operation,
+            items=len(texts),
+            tokens=sum(estimate_tokens(text) for text in texts),
+            input_bytes=sum(len(text.encode("utf-8")) for text in texts),
+            latency=latency,
+            requests=stats.requests,
+            retries=stats.retries,
+            cache_hits=stats.cache_hits,
+            error=type(error).__name__ if error is not None else None,
+        )
+        for sink in self.sinks:
+            sink.emit(event)
+
+    def _observe(self, operation: str, texts: list[str], call: Callable[[], Any]) -> Any:
+        """Run ``call`` and report it to the sinks, if any are configured."""
+        if not self.sinks:
+            return call()
+        stats = EmbeddingCallStats()
+        token = _CALL_STATS.set(stats)
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            return call()
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            _CALL_STATS.reset(token)
+            self._emit(operation, texts, stats, time.perf_counter() - started, error)
+
+    async def _aobserve(
+        self, operation: str, texts: list[str], call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Async counterpart of ``_observe``."""
+        if not self.sinks:
+            return await call()
+        stats = EmbeddingCallStats()
+        token = _CALL_STATS.set(stats)
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            return await call()
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            _CALL_STATS.reset(token)
+            self._emit(operation, texts, stats, time.perf_counter() - started, error)
+
+    # -- Requests ------------------------------------------------
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed one request batch, retrying it on failure."""
+        stats = current_call_stats()
+        tokens = sum(estimate_tokens(text) for text in texts)
+        attempt = 0
+        while True:
+            RateLimiter.shared().acquire(*self._identity(), tokens=tokens)
+            if stats is not None:
+                stats.add(requests=1, retries=int(attempt > 0))
+            try:
+                return self.client.embed_documents(texts)
+            except Exception:
+                if attempt >= self.batch_retries:
+                    raise
+                time.sleep(self.batch_retry_backoff * 2**attempt)
+                attempt += 1
+
+    def _fit_dimensions(self, vectors: list[list[float]]) -> list[list[float]]:
+        """Truncate vectors to ``dimensions`` and rescale them to unit length."""
+        if not self.dimensions:
+            return vectors
+        fitted: list[list[float]] = []
+        for vector in vectors:
+            head = list(vector[: self.dimensions])
+            norm = math.sqrt(math.fsum(x * x for x in head))
+            fitted.append([x / norm for x in head] if norm else head)
+        return fitted
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in limit-bounded batches and keep the input order."""
+        return self._fit_dimensions(self._request_vectors(texts))
+
+    def _plan(self, texts: list[str]) -> list[list[int]]:
+        """Split text indices into batches within the effective limits."""
+        token_counts = [packing_tokens(text) for text in texts]
+        max_tokens = self.max_batch_tokens
+        if not max_tokens and self._BATCH_LIMITS.get("max_tokens"):
+            max_tokens = int(self._BATCH_LIMITS["max_tokens"] * self._TOKEN_HEADROOM)
+        return plan_batches(
+            token_counts,
+            max_items=self.max_batch_items or self._BATCH_LIMITS.get("max_items"),
+            max_tokens=max_tokens,
+            order=(
+                sorted(range(len(texts)), key=token_counts.__getitem__)
+                if self.sort_by_length
+                else None
+            ),
+        )
+
+    @staticmethod
+    def _reassemble(
+        size: int, batches: list[list[int]], results: list[list[list[float]]]
+    ) -> list[list[float]]:
+        """Put per-batch vectors back into input order."""
+        vectors: list[list[float]] = [[] for _ in range(size)]
+        for batch, batch_vectors in zip(batches, results):
+            for index, vector in zip(batch, batch_vectors):
+                vectors[index] = vector
+        return vectors
+
+    def _request_vectors(self, texts: list[str]) -> list[list[float]]:
+        """Send limit-bounded batches to the provider and reassemble them."""
+        batches = self._plan(texts)
+        if not batches:
+            return []
+        if len(batches) == 1 and not self.sort_by_length:
+            return self._embed_batch(texts)
+
+        def _run(batch: list[int]) -> list[list[float]]:
+            return self._embed_batch([texts[i] for i in batch])
+
+        workers = min(max(1, self.max_concurrency), len(batches))
+        if workers == 1:
+            results = [_run(batch) for batch in batches]
+        else:
+            contexts = [contextvars.copy_context() for _ in batches]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(lambda ctx, batch: ctx.run(_run, batch), contexts, batches)
+                )
+        return self._reassemble(len(texts), batches, results)
+
+    # -- Async API -----------------------------------------------
+
+    def _async_slots(self) -> asyncio.Semaphore:
+        """Return this instance's request semaphore for the running loop."""
+        loop = asyncio.get_running_loop()
+        slots = getattr(self, "_async_slots_by_loop", None)
+        if slots is None:
+            slots = weakref.WeakKeyDictionary()
+            self._async_slots_by_loop = slots
+        semaphore = slots.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, self.max_async_concurrency))
+            slots[loop] = semaphore
+        return semaphore
+
+    async def _aembed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed one request batch asynchronously, retrying it on failure."""
+        stats = current_call_stats()
+        tokens = sum(estimate_tokens(text) for text in texts)
+        attempt = 0
+        while True:
+            await RateLimiter.shared().aacquire(*self._identity(), tokens=tokens)
+            if stats is not None:
+                stats.add(requests=1, retries=int(attempt > 0))
+            try:
+                async with self._async_slots():
+                    return await self.client.aembed_documents(texts)
+            except Exception:
+                if attempt >= self.batch_retries:
+                    raise
+                await asyncio.sleep(self.batch_retry_backoff * 2**attempt)
+                attempt += 1
+
+    async def _aembed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Async counterpart of ``_embed_texts``.
+
+        Batches run concurrently (bounded by ``max_async_concurrency``). If
+        one batch fails or the caller is cancelled, the remaining batch
+        requests are cancelled before the error propagates.
+        """
+        batches = self._plan(texts)
+        if not batches:
+            return []
+        if len(batches) == 1 and not self.sort_by_length:
+            return self._fit_dimensions(await self._aembed_batch(texts))
+
+        tasks = [
+            asyncio.ensure_future(self._aembed_batch([texts[i] for i in batch]))
+            for batch in batches
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return self._fit_dimensions(self._reassemble(len(texts), batches, results))
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Async counterpart of ``embed_query``."""
+
+        async def _call() -> list[float]:
+            await RateLimiter.shared().aacquire(*self._identity(), tokens=estimate_tokens(text))
+            async with self._async_slots():
+                vector = await self.client.aembed_query(text)
+            return self._fit_dimensions([vector])[0]
+
+        return await self._aobserve("aembed_query", [text], _call)
+
+    async def aembed(self, splitter_output: Any) -> EmbeddingDTO:
+        """Async counterpart of ``embed`` returning the same DTO.
+
+        Uses the LangChain client's ``aembed_documents`` so no worker
+        thread is held while requests are in flight.
+
+        Args:
+            splitter_output: A SplitterMR ``SplitterOutput`` instance
+                (or any object exposing the same attributes).
+
+        Returns:
+            An Embedding dataclass containing vectors and document
+            metadata.
+        """
+        texts = list(splitter_output.chunks)
+        vectors = await self._aobserve("aembed", texts, lambda: self._aembed_texts(texts))
+        return self._build_output(splitter_output, vectors)
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a single search query.
+
+        Uses the client's query embedding (some providers embed queries
+        differently from documents) and applies the ``dimensions`` setting.
+
+        Args:
+            text: Query text.
+
+        Returns:
+            The query vector.
+        """
+
+        def _call() -> list[float]:
+            RateLimiter.shared().acquire(*self._identity(), tokens=estimate_tokens(text))
+            return self._fit_dimensions([self.client.embed_query(text)])[0]
+
+        return self._observe("embed_query", [text], _call)
+
+    @staticmethod
+    def _to_matrix(vectors: list[list[float]]) -> Any:
+        """Pack vectors into a C-contiguous ``N x D`` float32 array."""
+        import numpy as np
+
+        if not len(vectors):
+            return np.empty((0, 0), dtype=np.float32)
+        return np.ascontiguousarray(vectors, dtype=np.float32)
+
     def embed(self, splitter_output: Any) -> EmbeddingDTO:
         """Produce embeddings from a SplitterMR ``SplitterOutput``.
 
         Calls the underlying LangChain client's ``embed_documents``
-        method and combines the resulting vectors with the splitter
-        metadata.
+        method once per request batch and combines the resulting vectors
+        with the splitter metadata.
 
         Args:
             splitter_output: A SplitterMR ``SplitterOutput`` instance
@@ -34,11 +448,23 @@ class BaseEmbedding:
             An Embedding dataclass containing vectors and document
             metadata.
         """
-        vectors: list[list[float]] = self.client.embed_documents(
-            splitter_output.chunks
+        texts = list(splitter_output.chunks)
+        vectors: list[list[float]] = self._observe(
+            "embed", texts, lambda: self._embed_texts(texts)
         )
+        return self._build_output(splitter_output, vectors)
+
+    def _build_output(
+        self, splitter_output: Any, vectors: list[list[float]]
+    ) -> EmbeddingDTO:
+        """Combine vectors with the splitter metadata into the DTO."""
+        matrix = None
+        if self.output_format == EmbeddingFormat.NUMPY:
+            matrix = self._to_matrix(vectors)
+            vectors = MatrixRows(matrix)
         return EmbeddingDTO(
             embeddings=vectors,
+            matrix=matrix,
             embedding_id=str(uuid4()),
             chunks=splitter_output.chunks,
             chunk_id=splitter_output.chunk_id,
@@ -64,3 +490,17 @@ class BaseEmbedding:
             ),
             metadata=getattr(splitter_output, "metadata", None),
         )
+
+    # -- Lifecycle -----------------------------------------------
+
+    def close(self) -> None:
+        """Close the sync HTTP clients ``client`` created for itself.
+
+        Pooled and caller-supplied httpx clients are shared and stay open;
+        async clients are closed by ``aclose``.
+        """
+        close_owned_http_clients(getattr(self, "client", None))
+
+    async def aclose(self) -> None:
+        """Close every HTTP client ``client`` created for itself."""
+        await aclose_owned_http_clients(getattr(self, "client", None))
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from .base import _MODEL_ATTRS, BaseEmbedding
+from .instrumentation import current_call_stats
+
+
+def encode_vector(vector: Iterable[float]) -> bytes:
+    """Serialize a vector as a float32 blob."""
+    return array("f", vector).tobytes()
+
+
+def decode_vector(blob: bytes) -> list[float]:
+    """Deserialize a float32 blob produced by ``encode_vector``."""
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """Persistent, content-addressed store of embedding vectors.
+
+    Vectors are stored as float32 blobs in a SQLite database running in WAL
+    mode, so readers in other threads and processes are never blocked by a
+    writer. Every hit refreshes the entry's access time and, once the stored
+    vectors exceed ``max_bytes``, the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: Optional[int] = 1 << 30) -> None:
+        """Initialize the store, creating the database if needed.
+
+        Args:
+            path: SQLite database file.
+            max_bytes: Upper bound for the stored vector bytes, or None for
+                no eviction.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._write_lock:
+            conn = self._connection()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, vector BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_accessed ON embeddings(accessed)"
+            )
+            conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection to the database."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def build_key(namespace: str, text: str) -> str:
+        """Return the cache key of ``text`` embedded under ``namespace``."""
+        digest = hashlib.sha256(namespace.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Return the cached vectors for the keys that are present.
+
+        Args:
+            keys: Cache keys to look up.
+
+        Returns:
+            Mapping from key to vector for every hit.
+        """
+        if not keys:
+            return {}
+        conn = self._connection()
+        found: dict[str, list[float]] = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            found.update((key, decode_vector(blob)) for key, blob in rows)
+        if found:
+            with self._write_lock:
+                now = time.time_ns()
+                conn.executemany(
+                    "UPDATE embeddings SET accessed = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                conn.commit()
+        return found
+
+    def put_many(self, items: dict[str, Iterable[float]]) -> None:
+        """Store vectors and evict least recently used entries over budget.
+
+        Args:
+            items: Mapping from cache key to vector.
+        """
+        if not items:
+            return
+        now = time.time_ns()
+        rows = []
+        for key, vector in items.items():
+            blob = encode_vector(vector)
+            rows.append((key, blob, len(blob), now))
+        conn = self._connection()
+        with self._write_lock:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, size, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete the oldest entries until the store fits ``max_bytes``."""
+        if self.max_bytes is None:
+            return
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        victims: list[tuple[str]] = []
+        for key, size in conn.execute("SELECT key, size FROM embeddings ORDER BY accessed"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM embeddings WHERE key = ?", victims)
+
+    def size_bytes(self) -> int:
+        """Return the total size of the stored vectors in bytes."""
+        (total,) = (
+            self._connection()
+            .execute("SELECT COALESCE(SUM(size), 0) FROM embeddings")
+            .fetchone()
+        )
+        return total
+
+    def __len__(self) -> int:
+        """Return the number of cached vectors."""
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return count
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embedding decorator that serves vectors from an ``EmbeddingCache``.
+
+    Wraps any ``BaseEmbedding`` adapter. Texts already cached under the same
+    provider, model and dimensions are answered locally; only the misses are
+    sent to the wrapped adapter, which still applies its own batching. Both
+    hits and misses are returned at float32 precision so results do not
+    depend on the cache state.
+
+    Attributes:
+        embedding: The wrapped adapter.
+        cache: The vector store.
+        namespace: Provider, model and dimensions the keys are scoped to.
+        query_namespace: Scope of query vectors, kept apart from documents
+            because some providers (Cohere, Gemini, Voyage) embed queries
+            differently.
+        hits: Number of texts served from the cache.
+        misses: Number of texts sent to the provider.
+    """
+
+    def __init__(
+        self,
+        embedding: BaseEmbedding,
+        cache: EmbeddingCache,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+    ) -> None:
+        """Initialize the decorator.
+
+        Args:
+            embedding: Adapter performing the actual embedding calls.
+            cache: Store holding the cached vectors.
+            provider: Provider name; defaults to the adapter class name.
+            model: Model name; read from the adapter client when omitted.
+            dimensions: Output dimensions; read from the adapter client
+                when omitted.
+        """
+        self.embedding = embedding
+        self.cache = cache
+        self.output_format = embedding.output_format
+        client = getattr(embedding, "client", None)
+        if model is None:
+            model = next(
+                (
+                    str(value)
+                    for value in (getattr(client, attr, None) for attr in _MODEL_ATTRS)
+                    if isinstance(value, str) and value
+                ),
+                "",
+            )
+        if dimensions is None:
+            value = embedding.dimensions or getattr(client, "dimensions", None)
+            dimensions = value if isinstance(value, int) else None
+        provider = getattr(provider, "value", provider) or type(embedding).__name__
+        self.namespace = f"{provider}|{model}|{dimensions or ''}"
+        self.query_namespace = f"q:{self.namespace}"
+        self.dimensions = dimensions
+        self._SYMMETRIC_QUERIES = embedding._SYMMETRIC_QUERIES
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        """Return the wrapped adapter's LangChain client."""
+        return self.embedding.client
+
+    def _identity(self) -> tuple[str, str]:
+        """Report events under the wrapped adapter's provider and model."""
+        return self.embedding._identity()
+
+    def embed_query(self, text: str) -> list[float]:
+        """Return the cached query vector or embed the query and store it."""
+        key, vector = self._lookup_query(text)
+        if vector is None:
+            vector = self._store({key: text}, [self.embedding.embed_query(text)])[key]
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Async counterpart of ``embed_query``; store I/O runs in a thread."""
+        key, vector = await asyncio.to_thread(self._lookup_query, text)
+        if vector is None:
+            fresh = await self.embedding.aembed_query(text)
+            vector = (await asyncio.to_thread(self._store, {key: text}, [fresh]))[key]
+        return vector
+
+    def _lookup_query(self, text: str) -> tuple[str, Optional[list[float]]]:
+        """Return the query's key and its cached vector, if any."""
+        key = self.cache.build_key(self.query_namespace, text)
+        vector = self.cache.get_many([key]).get(key)
+        self._count(hits=int(vector is not None), misses=int(vector is None))
+        return key, vector
+
+    def _count(self, hits: int, misses: int) -> None:
+        """Add to the hit and miss counters and the current call's stats."""
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += misses
+        stats = current_call_stats()
+        if stats is not None:
+            stats.add(cache_hits=hits)
+
+    def _lookup(self, texts: list[str]) -> tuple[list[str], dict[str, list[float]], dict[str, str]]:
+        """Return the keys, the cached vectors and the missing texts by key."""
+        keys = [self.cache.build_key(self.namespace, text) for text in texts]
+        found = self.cache.get_many(list(dict.fromkeys(keys)))
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+        hits = len(texts) - sum(1 for key in keys if key not in found)
+        self._count(hits=hits, misses=len(missing))
+        return keys, found, missing
+
+    def _store(
+        self, missing: dict[str, str], vectors: list[list[float]]
+    ) -> dict[str, list[float]]:
+        """Persist fresh vectors and return them at float32 precision."""
+        fresh = {
+            key: decode_vector(encode_vector(vector)) for key, vector in zip(missing, vectors)
+        }
+        self.cache.put_many(fresh)
+        return fresh
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Return cached vectors and embed only the missing texts."""
+        keys, found, missing = self._lookup(texts)
+        if missing:
+            vectors = self.embedding._embed_texts(list(missing.values()))
+            found.update(self._store(missing, vectors))
+        return [found[key] for key in keys]
+
+    async def _aembed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Async counterpart of ``_embed_texts``; store I/O runs in a thread."""
+        keys, found, missing = await asyncio.to_thread(self._lookup, texts)
+        if missing:
+            vectors = await self.embedding._aembed_texts(list(missing.values()))
+            found.update(await asyncio.to_thread(self._store, missing, vectors))
+        return [found[key] for key in keys]
+
+    def close(self) -> None:
+        """Close the wrapped adapter's own HTTP clients; the store stays open."""
+        self.embedding.close()
+
+    async def aclose(self) -> None:
+        """Async counterpart of ``close``."""
+        await self.embedding.aclose()
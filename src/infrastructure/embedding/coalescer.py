@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+
+class QueryCoalescer:
+    """Micro-batch concurrent query embeddings into shared requests.
+
+    Texts submitted within ``window`` seconds of the first pending one (or
+    until ``max_batch_size`` distinct texts are queued) are embedded with a
+    single batched request, and every caller receives its own vector.
+    Identical texts that are queued or already in flight share one slot.
+
+    A coalescer is bound to the event loop it is first used on. Batches go
+    through the adapter's document path, so it only suits adapters that
+    embed queries and documents alike (``_SYMMETRIC_QUERIES``).
+
+    Attributes:
+        embedding: Embedding adapter performing the batched requests.
+        window: Maximum seconds a text waits for companions.
+        max_batch_size: Number of distinct texts that triggers an early flush.
+        requests: Number of ``embed_query`` calls served.
+        batches: Number of batched requests sent.
+    """
+
+    def __init__(
+        self,
+        embedding: Any,
+        window: float = 0.005,
+        max_batch_size: int = 64,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            embedding: A ``BaseEmbedding`` adapter.
+            window: Collection window in seconds.
+            max_batch_size: Maximum distinct texts per batched request.
+        """
+        self.embedding = embedding
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.requests = 0
+        self.batches = 0
+        self._pending: dict[str, asyncio.Future] = {}
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def embed_query(self, text: str) -> list[float]:
+        """Return the vector of ``text``, batched with concurrent callers.
+
+        Cancelling one caller does not cancel the shared request.
+
+        Args:
+            text: Query text.
+
+        Returns:
+            The query vector.
+        """
+        loop = asyncio.get_running_loop()
+        self.requests += 1
+        future = self._in_flight.get(text) or self._pending.get(text)
+        if future is None:
+            future = loop.create_future()
+            self._pending[text] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._flush)
+        return list(await asyncio.shield(future))
+
+    def _flush(self) -> None:
+        """Send the pending texts as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        self._in_flight.update(batch)
+        self.batches += 1
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future]) -> None:
+        """Embed one batch and resolve its futures.
+
+        Uses the adapter's async API when available and a worker thread
+        otherwise.
+        """
+        try:
+            aembed_texts = getattr(self.embedding, "_aembed_texts", None)
+            if aembed_texts is not None:
+                vectors = await aembed_texts(list(batch))
+            else:
+                vectors = await asyncio.to_thread(self.embedding._embed_texts, list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+                    future.exception()
+        else:
+            for future, vector in zip(batch.values(), vectors):
+                if not future.done():
+                    future.set_result(vector)
+        finally:
+            for text, future in batch.items():
+                if self._in_flight.get(text) is future:
+                    del self._in_flight[text]
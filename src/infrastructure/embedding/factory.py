@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional, Type
+from typing import Any, Callable, Optional, Type, Union
 
 from ...domain.embedding.protocols import EmbeddingConfig
+from ...domain.embedding.types import EmbeddingProvider
+from ..http_pool import HttpClientPool, pooled_http_clients
+from ..instances import InstanceCache, fingerprint
+from ..registry import available_providers, load_provider
+from .cache import CachedEmbedding, EmbeddingCache
 
 
 class EmbeddingFactory:
@@ -10,9 +15,28 @@ class EmbeddingFactory:
 
     Implements the Registry pattern to allow dynamic registration of
     new embedding providers without modifying the factory logic.
+
+    Adapters are imported on first use: built-in providers are mapped to
+    their modules in ``_modules`` and third-party packages can expose
+    adapters under the ``_ENTRY_POINT_GROUP`` entry-point group.
     """
 
     _registry: dict[str, Type[Any]] = {}
+    # Built-in providers, imported on first ``create`` so that only the SDKs
+    # in use are loaded.
+    _modules: dict[str, str] = {
+        EmbeddingProvider.AZURE: ".adapters.azure_openai",
+        EmbeddingProvider.AWS: ".adapters.bedrock",
+        EmbeddingProvider.COHERE: ".adapters.cohere",
+        EmbeddingProvider.GOOGLE: ".adapters.gemini",
+        EmbeddingProvider.XAI: ".adapters.grok",
+        EmbeddingProvider.HUGGINGFACE: ".adapters.ollama",
+        EmbeddingProvider.HASHING: ".adapters.hashing",
+        EmbeddingProvider.OPENAI: ".adapters.openai",
+        EmbeddingProvider.VOYAGEAI: ".adapters.voyageai",
+    }
+    _ENTRY_POINT_GROUP = "ai_app_template.embedding_providers"
+    _instances: InstanceCache = InstanceCache()
 
     @classmethod
     def register(cls, provider: str) -> Callable:
@@ -31,11 +55,37 @@ class EmbeddingFactory:
 
         return decorator
 
+    @classmethod
+    def register_lazy(cls, provider: str, target: str) -> None:
+        """Register a provider whose adapter is imported on first ``create``.
+
+        Args:
+            provider: The provider identifier.
+            target: ``"module"`` registering itself on import, or
+                ``"module:Class"``.
+        """
+        cls._modules[provider] = target
+
+    @classmethod
+    def providers(cls) -> list[str]:
+        """Return the providers ``create`` accepts, without importing them."""
+        return available_providers(cls._registry, cls._modules, cls._ENTRY_POINT_GROUP)
+
+    @classmethod
+    def _load(cls, provider: str) -> Optional[Type[Any]]:
+        """Import the adapter of a lazy or entry-point provider."""
+        return load_provider(
+            cls._registry, cls._modules, provider, cls._ENTRY_POINT_GROUP, __package__
+        )
+
     @classmethod
     def create(
         cls,
         provider: str,
         config: Optional[EmbeddingConfig] = None,
+        cache: Optional[EmbeddingCache] = None,
+        http_pool: Union[HttpClientPool, bool] = True,
+        reuse: bool = False,
         **kwargs: Any,
     ) -> Any:
         """Create an instance of the requested embedding model.
@@ -43,17 +93,45 @@ class EmbeddingFactory:
         Args:
             provider: The provider identifier (must be registered).
             config: The configuration object.
+            cache: Optional persistent vector cache; when given, the model
+                is wrapped in a ``CachedEmbedding``.
+            http_pool: Pool providing shared httpx clients to adapters that
+                accept them; True uses ``HttpClientPool.shared()`` and False
+                lets the adapter build its own.
+            reuse: Return the instance memoized for the same provider,
+                configuration and arguments, creating it on first use.
+                Memoized instances live until ``close_all``.
             **kwargs: Additional overrides passed to the constructor.
 
         Returns:
             An instance of the specific embedding wrapper.
 
         Raises:
-            ValueError: If the provider is not registered.
+            ValueError: If the provider is neither registered nor
+                discoverable.
         """
-        if provider not in cls._registry:
+        if provider not in cls._registry and cls._load(provider) is None:
             raise ValueError(
                 f"Embedding provider '{provider}' is not registered."
             )
+        if reuse:
+            options = dict(cache=cache, http_pool=http_pool)
+            return cls._instances.get_or_create(
+                fingerprint(provider, config, {**kwargs, **options}),
+                lambda: cls.create(provider, config, **options, **kwargs),
+            )
         model_cls = cls._registry[provider]
-        return model_cls(config=config, **kwargs)
+        kwargs.update(pooled_http_clients(model_cls, config, kwargs, http_pool))
+        model = model_cls(config=config, **kwargs)
+        if cache is not None:
+            model = CachedEmbedding(model, cache, provider=provider)
+        return model
+
+    @classmethod
+    def close_all(cls) -> int:
+        """Close and forget every instance created with ``reuse=True``.
+
+        Returns:
+            Number of instances released.
+        """
+        return cls._instances.close_all()
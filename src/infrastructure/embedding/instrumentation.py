@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class EmbeddingCallStats:
+    """Counters collected while one instrumented call is running.
+
+    Attributes:
+        requests: Provider requests sent (including retries).
+        retries: Requests that were retries or failovers.
+        cache_hits: Texts answered from a local cache.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, requests: int = 0, retries: int = 0, cache_hits: int = 0) -> None:
+        """Increment counters; safe to call from batch worker threads."""
+        with self._lock:
+            self.requests += requests
+            self.retries += retries
+            self.cache_hits += cache_hits
+
+
+_CALL_STATS: ContextVar[Optional[EmbeddingCallStats]] = ContextVar(
+    "embedding_call_stats", default=None
+)
+
+
+def current_call_stats() -> Optional[EmbeddingCallStats]:
+    """Return the stats of the instrumented call in progress, if any."""
+    return _CALL_STATS.get()
+
+
+@dataclass
+class EmbeddingEvent:
+    """One completed embedding call.
+
+    Attributes:
+        provider: Provider identifier.
+        model: Model name.
+        operation: ``embed``, ``aembed``, ``embed_query`` or ``aembed_query``.
+        items: Number of input texts.
+        tokens: Estimated input tokens.
+        input_bytes: UTF-8 size of the input texts.
+        latency: Wall-clock duration in seconds.
+        requests: Provider requests sent.
+        retries: Retried or failed-over requests.
+        cache_hits: Texts served from a cache.
+        error: Exception type name when the call failed.
+    """
+
+    provider: str
+    model: str
+    operation: str
+    items: int
+    tokens: int
+    input_bytes: int
+    latency: float
+    requests: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    error: Optional[str] = None
+
+
+class BaseEmbeddingSink(ABC):
+    """Destination for embedding call events."""
+
+    @abstractmethod
+    def emit(self, event: EmbeddingEvent) -> None:
+        """Record one event. Implementations must be thread-safe and fast."""
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram with bounded relative error.
+
+    Values are grouped into buckets whose bounds grow by ``1 + precision``,
+    so percentiles are accurate to about ``precision`` while memory stays
+    proportional to the dynamic range rather than the sample count.
+    """
+
+    def __init__(self, precision: float = 0.02, minimum: float = 1e-6) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            precision: Relative width of each bucket.
+            minimum: Smallest distinguishable value; smaller values share
+                the first bucket.
+        """
+        self.precision = precision
+        self.minimum = minimum
+        self._log_base = math.log1p(precision)
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add one sample."""
+        index = math.ceil(math.log(max(value, self.minimum) / self.minimum) / self._log_base)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """Return the ``q``-th percentile (0-100), or 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100.0))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.minimum * (1 + self.precision) ** index, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Return the arithmetic mean of the samples."""
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass
+class EmbeddingMetrics:
+    """Aggregated counters for one provider and model."""
+
+    calls: int = 0
+    errors: int = 0
+    items: int = 0
+    tokens: int = 0
+    input_bytes: int = 0
+    requests: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    items_per_call: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram(minimum=1.0)
+    )
+
+
+class InMemoryEmbeddingMetrics(BaseEmbeddingSink):
+    """Sink aggregating events per ``(provider, model)`` in memory."""
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregator."""
+        self._metrics: dict[tuple[str, str], EmbeddingMetrics] = {}
+        self._lock = threading.Lock()
+
+    def emit(self, event: EmbeddingEvent) -> None:
+        """Fold ``event`` into the counters of its provider and model."""
+        with self._lock:
+            metrics = self._metrics.setdefault((event.provider, event.model), EmbeddingMetrics())
+            metrics.calls += 1
+            metrics.errors += event.error is not None
+            metrics.items += event.items
+            metrics.tokens += event.tokens
+            metrics.input_bytes += event.input_bytes
+            metrics.requests += event.requests
+            metrics.retries += event.retries
+            metrics.cache_hits += event.cache_hits
+            metrics.latency.record(event.latency)
+            metrics.items_per_call.record(event.items)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a summary per ``provider/model`` key.
+
+        Returns:
+            Counters plus latency percentiles (p50, p90, p99) in seconds and
+            throughput in items per second of embedding time.
+        """
+        with self._lock:
+            summary: dict[str, dict[str, Any]] = {}
+            for (provider, model), metrics in self._metrics.items():
+                latency = metrics.latency
+                summary[f"{provider}/{model}"] = {
+                    "calls": metrics.calls,
+                    "errors": metrics.errors,
+                    "items": metrics.items,
+                    "tokens": metrics.tokens,
+                    "input_bytes": metrics.input_bytes,
+                    "requests": metrics.requests,
+                    "retries": metrics.retries,
+                    "cache_hits": metrics.cache_hits,
+                    "latency_p50": latency.percentile(50),
+                    "latency_p90": latency.percentile(90),
+                    "latency_p99": latency.percentile(99),
+                    "latency_max": latency.max,
+                    "items_per_second": (
+                        metrics.items / latency.total if latency.total else 0.0
+                    ),
+                }
+            return summary
+
+    def reset(self) -> None:
+        """Discard all aggregated data."""
+        with self._lock:
+            self._metrics.clear()
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from ..utils import RETRYABLE_STATUS, status_code
+from .base import BaseEmbedding
+from .factory import EmbeddingFactory
+from .instrumentation import current_call_stats
+
+
+@dataclass
+class EndpointState:
+    """Load and health bookkeeping for one routed endpoint.
+
+    Attributes:
+        embedding: Adapter bound to the endpoint.
+        outstanding: Requests currently in flight.
+        latency: Exponentially weighted average request latency (seconds).
+        failures: Consecutive retryable failures.
+        ejected_until: Monotonic time until which the endpoint is skipped.
+        requests: Total requests sent.
+    """
+
+    embedding: BaseEmbedding
+    outstanding: int = 0
+    latency: float = 0.0
+    failures: int = 0
+    ejected_until: float = 0.0
+    requests: int = 0
+
+    def cost(self) -> float:
+        """Return the expected wait for one more request on this endpoint."""
+        return (self.outstanding + 1) * max(self.latency, 1e-3)
+
+
+class EmbeddingRouter(BaseEmbedding):
+    """Spread embedding batches across deployments of the same model.
+
+    Each batch goes to the healthy endpoint with the lowest expected wait,
+    estimated from its outstanding requests and observed latency. An endpoint
+    answering 429 or 5xx is ejected for ``ejection_seconds`` (doubling on
+    consecutive failures, up to ``max_ejection_seconds``) and the batch is
+    retried on another endpoint, so the deployments' quotas add up.
+
+    Attributes:
+        endpoints: Per-endpoint state, in configuration order.
+        ejection_seconds: Base ejection period after a retryable error.
+        max_ejection_seconds: Upper bound for the ejection period.
+        latency_alpha: Smoothing factor of the latency average.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[BaseEmbedding],
+        ejection_seconds: float = 5.0,
+        max_ejection_seconds: float = 60.0,
+        latency_alpha: float = 0.3,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            endpoints: Adapters for the same model on different deployments.
+            ejection_seconds: Base ejection period after a 429/5xx.
+            max_ejection_seconds: Maximum ejection period.
+            latency_alpha: Weight of the newest latency sample.
+            max_concurrency: Batches in flight per call; defaults to twice
+                the number of endpoints.
+
+        Raises:
+            ValueError: If no endpoints are given.
+        """
+        if not endpoints:
+            raise ValueError("EmbeddingRouter requires at least one endpoint.")
+        self.endpoints = [EndpointState(embedding) for embedding in endpoints]
+        self.ejection_seconds = ejection_seconds
+        self.max_ejection_seconds = max_ejection_seconds
+        self.latency_alpha = latency_alpha
+        first = endpoints[0]
+        self._BATCH_LIMITS = first._BATCH_LIMITS
+        self.max_batch_items = first.max_batch_items
+        self.max_batch_tokens = first.max_batch_tokens
+        self.max_concurrency = max_concurrency or 2 * len(endpoints)
+        self.sort_by_length = first.sort_by_length
+        self.output_format = first.output_format
+        self.dimensions = first.dimensions
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_configs(
+        cls,
+        provider: str,
+        configs: Sequence[Any],
+        **kwargs: Any,
+    ) -> EmbeddingRouter:
+        """Create one adapter per configuration and route across them.
+
+        Args:
+            provider: Registered ``EmbeddingFactory`` provider.
+            configs: One configuration per deployment.
+            **kwargs: Options passed to ``EmbeddingRouter``.
+
+        Returns:
+            The router.
+        """
+        return cls(
+            [EmbeddingFactory.create(provider, config=config) for config in configs],
+            **kwargs,
+        )
+
+    @property
+    def client(self) -> Any:
+        """Return the first endpoint's client (for introspection only)."""
+        return self.endpoints[0].embedding.client
+
+    def _identity(self) -> tuple[str, str]:
+        """Report events under the first endpoint's provider and model."""
+        return self.endpoints[0].embedding._identity()
+
+    def _failover(self, index: int, tried: set[int]) -> bool:
+        """Mark endpoint ``index`` as tried; return False when none remain."""
+        tried.add(index)
+        stats = current_call_stats()
+        if stats is not None and len(tried) < len(self.endpoints):
+            stats.add(retries=1)
+        return len(tried) < len(self.endpoints)
+
+    def _acquire(self, exclude: set[int]) -> tuple[int, EndpointState]:
+        """Reserve the cheapest healthy endpoint not in ``exclude``."""
+        with self._lock:
+            now = time.monotonic()
+            candidates = [
+                (index, state)
+                for index, state in enumerate(self.endpoints)
+                if index not in exclude
+            ]
+            if not candidates:
+                raise RuntimeError("All embedding endpoints failed.")
+            healthy = [item for item in candidates if item[1].ejected_until <= now]
+            pool = healthy or [min(candidates, key=lambda item: item[1].ejected_until)]
+            index, state = min(pool, key=lambda item: item[1].cost())
+            state.outstanding += 1
+            state.requests += 1
+            return index, state
+
+    def _release(
+        self, state: EndpointState, elapsed: Optional[float] = None, failed: bool = False
+    ) -> None:
+        """Record the outcome of a request on ``state``.
+
+        Args:
+            state: Endpoint the request was sent to.
+            elapsed: Latency of a successful request.
+            failed: Whether the request failed with a retryable status.
+        """
+        with self._lock:
+            state.outstanding -= 1
+            if elapsed is not None:
+                state.failures = 0
+                state.latency = (
+                    elapsed
+                    if state.latency == 0.0
+                    else self.latency_alpha * elapsed + (1 - self.latency_alpha) * state.latency
+                )
+            if not failed:
+                return
+            state.failures += 1
+            period = min(
+                self.ejection_seconds * 2 ** (state.failures - 1), self.max_ejection_seconds
+            )
+            state.ejected_until = time.monotonic() + period
+
+    def _route(self, call: Any) -> Any:
+        """Run ``call(embedding)`` on endpoints until one succeeds."""
+        tried: set[int] = set()
+        while True:
+            index, state = self._acquire(tried)
+            started = time.monotonic()
+            try:
+                result = call(state.embedding)
+            except Exception as exc:
+                if status_code(exc) not in RETRYABLE_STATUS:
+                    self._release(state)
+                    raise
+                self._release(state, failed=True)
+                if not self._failover(index, tried):
+                    raise
+                continue
+            self._release(state, elapsed=time.monotonic() - started)
+            return result
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Send one batch to the best endpoint, failing over on 429/5xx."""
+        return self._route(lambda embedding: embedding._embed_batch(texts))
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query on the best endpoint, failing over on 429/5xx."""
+        return self._route(lambda embedding: embedding.embed_query(text))
+
+    async def _aroute(self, call: Any) -> Any:
+        """Async counterpart of ``_route``."""
+        tried: set[int] = set()
+        while True:
+            index, state = self._acquire(tried)
+            started = time.monotonic()
+            try:
+                result = await call(state.embedding)
+            except Exception as exc:
+                if status_code(exc) not in RETRYABLE_STATUS:
+                    self._release(state)
+                    raise
+                self._release(state, failed=True)
+                if not self._failover(index, tried):
+                    raise
+                continue
+            except BaseException:
+                self._release(state)
+                raise
+            self._release(state, elapsed=time.monotonic() - started)
+            return result
+
+    async def _aembed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Send one batch to the best endpoint asynchronously."""
+        return await self._aroute(lambda embedding: embedding._aembed_batch(texts))
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Embed a query on the best endpoint asynchronously."""
+        return await self._aroute(lambda embedding: embedding.aembed_query(text))
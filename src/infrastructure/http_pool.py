@@ -0,0 +1,540 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Union
+from urllib.parse import urlsplit
+
+import httpx
+from httpx._utils import get_environment_proxies
+
+from .rate_limit import RateLimiter
+from .utils import resolve_parameters
+
+# Clients created by any ``HttpClientPool``; adapters never close them.
+_POOLED_CLIENTS: "weakref.WeakSet[Any]" = weakref.WeakSet()
+# Attributes leading from a LangChain model to its SDK and httpx clients.
+_CLIENT_ATTRS: tuple[str, ...] = (
+    "root_client",
+    "root_async_client",
+    "client",
+    "async_client",
+    "_client",
+    "_async_client",
+)
+# Attributes holding httpx clients supplied by the caller.
+_SUPPLIED_ATTRS: tuple[str, ...] = ("http_client", "http_async_client")
+
+# Config keys that may hold a provider endpoint, in lookup order.
+_BASE_URL_KEYS: tuple[str, ...] = (
+    "base_url",
+    "azure_endpoint",
+    "openai_api_base",
+    "xai_api_base",
+)
+
+
+@dataclass
+class PoolStats:
+    """Request counters of the clients sharing one origin.
+
+    Attributes:
+        requests: Requests sent since the pool was created.
+        in_flight: Requests whose response has not been closed yet.
+        peak_in_flight: Highest ``in_flight`` observed.
+        max_connections: Connection limit of each client.
+    """
+
+    requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    max_connections: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def started(self) -> Callable[[], None]:
+        """Count a new request and return the idempotent callback ending it."""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        done = threading.Event()
+
+        def finish() -> None:
+            if done.is_set():
+                return
+            done.set()
+            with self._lock:
+                self.in_flight -= 1
+
+        return finish
+
+    @property
+    def saturation(self) -> float:
+        """Return in-flight requests per connection slot.
+
+        Values near or above 1.0 mean HTTP/1.1 requests queue for a
+        connection (or HTTP/2 requests share them).
+        """
+        return self.in_flight / self.max_connections if self.max_connections else 0.0
+
+
+_Notify = Callable[[httpx.Request, httpx.Response], None]
+
+# Receives ``(origin, request, response)`` once response headers arrive.
+ResponseListener = Callable[[str, httpx.Request, httpx.Response], None]
+
+
+class _TrackedStream(httpx.SyncByteStream):
+    """Response body that ends its request when closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, finish: Callable[[], None]) -> None:
+        self._stream = stream
+        self._finish = finish
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._finish()
+
+
+class _AsyncTrackedStream(httpx.AsyncByteStream):
+    """Async counterpart of ``_TrackedStream``."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, finish: Callable[[], None]) -> None:
+        self._stream = stream
+        self._finish = finish
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._finish()
+
+
+class _TrackedTransport(httpx.BaseTransport):
+    """Transport recording in-flight requests into ``PoolStats``."""
+
+    def __init__(
+        self, transport: httpx.BaseTransport, stats: PoolStats, notify: _Notify
+    ) -> None:
+        self._transport = transport
+        self._stats = stats
+        self._notify = notify
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        finish = self._stats.started()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            finish()
+            raise
+        response.stream = _TrackedStream(response.stream, finish)
+        try:
+            self._notify(request, response)
+        except BaseException:
+            response.close()
+            raise
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncTrackedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``_TrackedTransport``."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, stats: PoolStats, notify: _Notify
+    ) -> None:
+        self._transport = transport
+        self._stats = stats
+        self._notify = notify
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        finish = self._stats.started()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            finish()
+            raise
+        response.stream = _AsyncTrackedStream(response.stream, finish)
+        try:
+            self._notify(request, response)
+        except BaseException:
+            await response.aclose()
+            raise
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """Async transport keeping one connection pool per event loop.
+
+    Connections opened on one loop cannot be used from another (they fail
+    with "Event loop is closed" once that loop ends), so a client shared
+    across ``asyncio.run`` calls or worker loops gets a pool per loop.
+    Pools of closed loops are dropped.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncBaseTransport]) -> None:
+        self._factory = factory
+        self._transports: dict[asyncio.AbstractEventLoop, httpx.AsyncBaseTransport] = {}
+        self._lock = threading.Lock()
+
+    def _current(self) -> httpx.AsyncBaseTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for stale in [other for other in self._transports if other.is_closed()]:
+                del self._transports[stale]
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = self._transports[loop] = self._factory()
+            return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._current().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.pop(loop, None)
+            self._transports.clear()
+        if transport is not None:
+            await transport.aclose()
+
+
+def origin_of(url: str) -> str:
+    """Return the ``scheme://host[:port]`` part of ``url``, lower-cased."""
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class HttpClientPool:
+    """Shared httpx clients, one sync and one async client per origin.
+
+    Adapters talking to the same origin (for instance OpenAI chat and
+    OpenAI embeddings) reuse one connection pool, so warm TLS connections
+    and HTTP/2 multiplexing are shared across them. Connections are kept
+    alive for ``keepalive_expiry`` seconds, well beyond httpx's 5 s default,
+    so bursty traffic does not pay a handshake after every pause. HTTP/2 is
+    used when the ``h2`` package is installed (``http2`` extra).
+
+    With ``trust_env`` (the default), ``HTTP_PROXY``/``HTTPS_PROXY``/
+    ``ALL_PROXY``/``NO_PROXY`` are honoured as in a plain ``httpx.Client``,
+    and proxied requests get their own tracked connection pool.
+
+    Async clients may be shared across event loops (``asyncio.run`` calls,
+    worker threads): each loop gets its own connection pool.
+    """
+
+    _shared: Optional[HttpClientPool] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 90.0,
+        http2: Optional[bool] = None,
+        timeout: Union[float, httpx.Timeout] = httpx.Timeout(600.0, connect=10.0),
+        trust_env: bool = True,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            max_connections: Connection limit of each client.
+            max_keepalive_connections: Idle connections kept per client.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Negotiate HTTP/2; defaults to whether ``h2`` is installed.
+            timeout: Default request timeout; provider SDKs usually override
+                it per request.
+            trust_env: Route requests through the proxies configured in
+                the environment.
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        self.http2 = http2
+        self.timeout = timeout
+        self.trust_env = trust_env
+        self._clients: dict[str, httpx.Client] = {}
+        self._async_clients: dict[str, httpx.AsyncClient] = {}
+        self._stats: dict[str, PoolStats] = {}
+        self._listeners: list[ResponseListener] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> HttpClientPool:
+        """Return the process-wide pool, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def add_listener(self, listener: ResponseListener) -> None:
+        """Call ``listener`` with every response's origin, request and headers.
+
+        Listeners run on the request path and must be fast; their errors
+        propagate to the caller after the response is closed.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def _notifier(self, origin: str) -> _Notify:
+        """Return the callback passing responses from ``origin`` to listeners."""
+
+        def notify(request: httpx.Request, response: httpx.Response) -> None:
+            for listener in self._listeners:
+                listener(origin, request, response)
+
+        return notify
+
+    def _stats_for(self, origin: str) -> PoolStats:
+        """Return the counters of ``origin``; the caller holds ``_lock``."""
+        stats = self._stats.get(origin)
+        if stats is None:
+            stats = PoolStats(max_connections=self.limits.max_connections or 0)
+            self._stats[origin] = stats
+        return stats
+
+    def _proxy_mounts(self, build: Callable[[str], Any]) -> dict[str, Any]:
+        """Return httpx ``mounts`` for the environment's proxy settings.
+
+        httpx ignores environment proxies once a client gets an explicit
+        ``transport``, so the pool rebuilds the mounts httpx would create:
+        ``build(proxy_url)`` for proxied patterns and None (the default
+        transport) for ``NO_PROXY`` entries.
+        """
+        if not self.trust_env:
+            return {}
+        return {
+            pattern: None if proxy is None else build(proxy)
+            for pattern, proxy in get_environment_proxies().items()
+        }
+
+    def client(self, base_url: str) -> httpx.Client:
+        """Return the shared sync client for ``base_url``'s origin."""
+        origin = origin_of(base_url)
+        with self._lock:
+            client = self._clients.get(origin)
+            if client is None or client.is_closed:
+                stats, notify = self._stats_for(origin), self._notifier(origin)
+
+                def _transport(proxy: Optional[str] = None) -> httpx.BaseTransport:
+                    transport = httpx.HTTPTransport(
+                        limits=self.limits, http2=self.http2, proxy=proxy
+                    )
+                    return _TrackedTransport(transport, stats, notify)
+
+                client = httpx.Client(
+                    transport=_transport(),
+                    mounts=self._proxy_mounts(_transport),
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                )
+                _POOLED_CLIENTS.add(client)
+                self._clients[origin] = client
+            return client
+
+    def async_client(self, base_url: str) -> httpx.AsyncClient:
+        """Return the shared async client for ``base_url``'s origin."""
+        origin = origin_of(base_url)
+        with self._lock:
+            client = self._async_clients.get(origin)
+            if client is None or client.is_closed:
+                stats, notify = self._stats_for(origin), self._notifier(origin)
+
+                def _transport(proxy: Optional[str] = None) -> httpx.AsyncBaseTransport:
+                    transport = _LoopLocalTransport(
+                        lambda: httpx.AsyncHTTPTransport(
+                            limits=self.limits, http2=self.http2, proxy=proxy
+                        )
+                    )
+                    return _AsyncTrackedTransport(transport, stats, notify)
+
+                client = httpx.AsyncClient(
+                    transport=_transport(),
+                    mounts=self._proxy_mounts(_transport),
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                )
+                _POOLED_CLIENTS.add(client)
+                self._async_clients[origin] = client
+            return client
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Return request and saturation counters per origin."""
+        with self._lock:
+            return {
+                origin: {
+                    "requests": stats.requests,
+                    "in_flight": stats.in_flight,
+                    "peak_in_flight": stats.peak_in_flight,
+                    "max_connections": stats.max_connections,
+                    "saturation": stats.saturation,
+                    "http2": self.http2,
+                }
+                for origin, stats in self._stats.items()
+            }
+
+    def close(self) -> None:
+        """Close every sync client; async clients need ``aclose``."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close every client."""
+        self.close()
+        with self._lock:
+            clients = list(self._async_clients.values())
+            self._async_clients.clear()
+        for client in clients:
+            await client.aclose()
+
+
+def owned_http_clients(root: Any, depth: int = 3) -> list[Any]:
+    """Return the httpx clients ``root`` created for itself.
+
+    Walks the SDK client attributes of a LangChain model (for instance
+    ``root_client._client`` or ``client._client._client``). Clients drawn
+    from an ``HttpClientPool``, passed in as ``http_client`` or
+    ``http_async_client``, or built by LangChain's process-wide client cache
+    are shared with other models and are left out.
+
+    Args:
+        root: LangChain model (or SDK client) to inspect.
+        depth: Maximum number of attribute hops from ``root``.
+
+    Returns:
+        The owned sync and async httpx clients.
+    """
+    found: list[Any] = []
+    shared: set[int] = set()
+    seen: set[int] = set()
+    stack: list[tuple[Any, int]] = [(root, 0)]
+    while stack:
+        obj, level = stack.pop()
+        if obj is None or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if _http_client_kind(obj) is not None:
+            found.append(obj)
+            continue
+        if level >= depth:
+            continue
+        for name in _SUPPLIED_ATTRS:
+            supplied = _safe_getattr(obj, name)
+            if supplied is not None:
+                shared.add(id(supplied))
+        for name in _CLIENT_ATTRS:
+            stack.append((_safe_getattr(obj, name), level + 1))
+    return [
+        client
+        for client in found
+        if id(client) not in shared
+        and client not in _POOLED_CLIENTS
+        and not type(client).__module__.startswith("langchain")
+    ]
+
+
+def _http_client_kind(obj: Any) -> Optional[str]:
+    """Return ``"sync"``/``"async"`` for httpx-style clients, else None.
+
+    SDKs may build on an httpx fork, so any ``Client``/``AsyncClient``
+    class from an ``httpx*`` package is recognised.
+    """
+    for cls in type(obj).__mro__:
+        if cls.__module__.split(".")[0].startswith("httpx"):
+            if cls.__name__ == "Client":
+                return "sync"
+            if cls.__name__ == "AsyncClient":
+                return "async"
+    return None
+
+
+def _safe_getattr(obj: Any, name: str) -> Any:
+    """Return ``obj.name`` or None when it is missing or fails to resolve."""
+    try:
+        return getattr(obj, name, None)
+    except Exception:
+        return None
+
+
+def close_owned_http_clients(root: Any) -> None:
+    """Close the sync httpx clients ``root`` created for itself.
+
+    Async clients need ``aclose_owned_http_clients``.
+    """
+    for client in owned_http_clients(root):
+        if _http_client_kind(client) == "sync":
+            client.close()
+
+
+async def aclose_owned_http_clients(root: Any) -> None:
+    """Close every httpx client ``root`` created for itself."""
+    for client in owned_http_clients(root):
+        if _http_client_kind(client) == "async":
+            await client.aclose()
+        else:
+            client.close()
+
+
+def pooled_http_clients(
+    model_cls: type,
+    config: Optional[Any],
+    overrides: dict[str, Any],
+    pool: Union[HttpClientPool, bool],
+) -> dict[str, Any]:
+    """Return the ``http_client``/``http_async_client`` kwargs for a model.
+
+    The pool's responses are also fed to ``RateLimiter.shared()`` so
+    rate-limit headers correct the shared budgets. Nothing is returned
+    when pooling is disabled, when ``model_cls`` does
+    not declare ``_SHARES_HTTP_CLIENT``, when the caller already supplied a
+    client, or when no endpoint is known.
+
+    Args:
+        model_cls: Adapter class about to be instantiated.
+        config: Configuration object passed to the adapter.
+        overrides: Keyword overrides passed to the adapter.
+        pool: Pool to draw from, True for ``HttpClientPool.shared()`` or
+            False to let the adapter build its own clients.
+    """
+    if pool is False or not getattr(model_cls, "_SHARES_HTTP_CLIENT", False):
+        return {}
+    params = resolve_parameters(config, **overrides)
+    if params.get("http_client") is not None or params.get("http_async_client") is not None:
+        return {}
+    base_url = next(
+        (params[key] for key in _BASE_URL_KEYS if isinstance(params.get(key), str)),
+        getattr(model_cls, "_DEFAULT_BASE_URL", None),
+    )
+    if not base_url:
+        return {}
+    if pool is True:
+        pool = HttpClientPool.shared()
+    RateLimiter.shared().attach(pool)
+    return {
+        "http_client": pool.client(base_url),
+        "http_async_client": pool.async_client(base_url),
+    }
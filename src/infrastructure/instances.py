@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import is_dataclass
+from enum import Enum
+from typing import Any, Callable, Optional
+
+from .utils import _config_to_dict
+
+
+def _canonical(value: Any) -> Any:
+    """Return a JSON-serializable stand-in for ``value``.
+
+    Plain data is kept as is, containers are normalized recursively and
+    secrets are unwrapped (the fingerprint is hashed). Other objects, such
+    as caches, pools or clients, are identified by identity, so two calls
+    share an instance only when they pass the very same object.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in sorted(value.items(), key=str)}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(item) for item in value), key=repr)
+    if callable(getattr(value, "get_secret_value", None)):
+        return value.get_secret_value()
+    if is_dataclass(value) and not isinstance(value, type):
+        return {type(value).__qualname__: _canonical(_config_to_dict(value))}
+    return f"<{type(value).__qualname__}@{id(value):x}>"
+
+
+def fingerprint(provider: Any, config: Optional[Any], overrides: dict[str, Any]) -> str:
+    """Return a stable key for ``create(provider, config, **overrides)``.
+
+    The configuration object is flattened like ``resolve_parameters`` does,
+    so equal configurations of different instances map to the same key.
+
+    Args:
+        provider: Provider identifier.
+        config: Configuration object passed to the factory.
+        overrides: Keyword arguments passed to the factory.
+
+    Returns:
+        Hex SHA-256 digest of the canonical arguments.
+    """
+    payload = {
+        "provider": _canonical(provider),
+        "config": _canonical(_config_to_dict(config)),
+        "overrides": _canonical(overrides),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class InstanceCache:
+    """Thread-safe memo of adapter instances keyed by their fingerprint.
+
+    Concurrent requests for a missing key build the instance once; the
+    other callers wait for it. Instances live until ``close_all``, which
+    releases their connections through ``close()`` or ``disconnect()``.
+
+    Attributes:
+        hits: Requests served by an existing instance.
+        misses: Requests that built a new instance.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._instances: dict[str, Any] = {}
+        self._building: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(self, key: str, build: Callable[[], Any]) -> Any:
+        """Return the instance stored under ``key``, building it if needed.
+
+        Args:
+            key: Instance fingerprint.
+            build: Zero-argument callable creating the instance. Errors
+                propagate and nothing is stored.
+
+        Returns:
+            The shared instance.
+        """
+        with self._lock:
+            if key in self._instances:
+                self.hits += 1
+                return self._instances[key]
+            build_lock = self._building.setdefault(key, threading.Lock())
+        with build_lock:
+            with self._lock:
+                if key in self._instances:
+                    self.hits += 1
+                    return self._instances[key]
+            try:
+                instance = build()
+            except BaseException:
+                with self._lock:
+                    self._building.pop(key, None)
+                raise
+            # Publish the instance and retire the build lock together so a
+            # caller arriving in between cannot miss both and build again.
+            with self._lock:
+                self._instances[key] = instance
+                self._building.pop(key, None)
+                self.misses += 1
+            return instance
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._instances)
+
+    def close_all(self) -> int:
+        """Close and forget every instance.
+
+        Each instance's ``close()`` or, failing that, ``disconnect()`` is
+        called. All instances are attempted even if one fails; the first
+        error is raised afterwards.
+
+        Returns:
+            Number of instances released.
+        """
+        with self._lock:
+            instances = list(self._instances.values())
+            self._instances.clear()
+        error: Optional[BaseException] = None
+        for instance in instances:
+            for name in ("close", "disconnect"):
+                release = getattr(instance, name, None)
+                if callable(release):
+                    try:
+                        release()
+                    except Exception as exc:
+                        error = error or exc
+                    break
+        if error is not None:
+            raise error
+        return len(instances)
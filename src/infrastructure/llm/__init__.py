@@ -1,4 +1,31 @@
 from .base import BaseLlm
+from .batch import (
+    AnthropicBatchClient,
+    BaseBatchClient,
+    BatchError,
+    BatchRequest,
+    BatchResult,
+    OpenAIBatchClient,
+)
+from .cache import CachedChatModel, CachedLlm, LlmResponseCache
 from .factory import LlmFactory
+from .instrumentation import BaseStreamSink, InMemoryStreamMetrics, StreamEvent
+from .router import LlmRouter
 
-__all__: list[str] = ["BaseLlm", "LlmFactory"]
+__all__: list[str] = [
+    "AnthropicBatchClient",
+    "BaseBatchClient",
+    "BaseLlm",
+    "BaseStreamSink",
+    "BatchError",
+    "BatchRequest",
+    "BatchResult",
+    "CachedChatModel",
+    "CachedLlm",
+    "InMemoryStreamMetrics",
+    "LlmFactory",
+    "LlmResponseCache",
+    "LlmRouter",
+    "OpenAIBatchClient",
+    "StreamEvent",
+]
@@ -1,10 +1,31 @@
-from .anthropic import AnthropicModel
-from .azure_openai import AzureOpenAIModel
-from .bedrock import BedrockModel
-from .gemini import GeminiModel
-from .grok import GrokModel
-from .ollama import OllamaModel
-from .openai import OpenAIModel
+from typing import TYPE_CHECKING
+
+from ...registry import lazy_exports
+
+if TYPE_CHECKING:
+    from .anthropic import AnthropicModel
+    from .azure_openai import AzureOpenAIModel
+    from .bedrock import BedrockModel
+    from .gemini import GeminiModel
+    from .grok import GrokModel
+    from .ollama import OllamaModel
+    from .openai import OpenAIModel
+    from .simulated import SimulatedChatModel, SimulatedModel
+
+# Adapters import their provider SDK, so each is loaded on first access.
+_EXPORTS: dict[str, str] = {
+    "AnthropicModel": ".anthropic",
+    "AzureOpenAIModel": ".azure_openai",
+    "BedrockModel": ".bedrock",
+    "GeminiModel": ".gemini",
+    "GrokModel": ".grok",
+    "OllamaModel": ".ollama",
+    "OpenAIModel": ".openai",
+    "SimulatedChatModel": ".simulated",
+    "SimulatedModel": ".simulated",
+}
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
 
 __all__: list[str] = [
     "AnthropicModel",
@@ -14,4 +35,6 @@ __all__: list[str] = [
     "GeminiModel",
     "OllamaModel",
     "OpenAIModel",
+    "SimulatedChatModel",
+    "SimulatedModel",
 ]
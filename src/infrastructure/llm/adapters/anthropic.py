@@ -6,8 +6,11 @@ from pydantic import SecretStr
 from ....domain.llm.constants import CLAUDE_PARAM_MAP
 from ....domain.llm.protocols import ModelConfig
 from ....domain.llm.types import LLMProvider
+from ....domain.prompt.types import Prompt
 from ..base import BaseLlm
+from ..batch import AnthropicBatchClient
 from ..factory import LlmFactory
+from ..prompt_cache import cache_control_messages
 from ...utils import resolve_parameters
 
 
@@ -53,3 +56,32 @@ class AnthropicModel(BaseLlm):
                 params[langchain_key] = params.pop(config_key)
 
         self.client = ChatAnthropic(**params)
+
+    def format_prompt(self, prompt: Prompt) -> tuple[Any, dict[str, Any]]:
+        """Mark the prompt's static prefix with an Anthropic cache breakpoint."""
+        if not prompt.static_prefix:
+            return prompt.content, {}
+        return cache_control_messages(prompt), {}
+
+    def batch_client(self) -> AnthropicBatchClient:
+        """Return a Message Batches API client sharing this model's settings."""
+        api_key = self.client.anthropic_api_key
+        params = {
+            key: value
+            for key, value in {
+                "temperature": self.client.temperature,
+                "top_k": self.client.top_k,
+                "top_p": self.client.top_p,
+                "stop_sequences": self.client.stop_sequences,
+                "thinking": self.client.thinking,
+            }.items()
+            if value is not None
+        }
+        params.update(self.client.model_kwargs)
+        return AnthropicBatchClient(
+            model=self.client.model,
+            api_key=api_key.get_secret_value() if api_key else None,
+            base_url=self.client.anthropic_api_url,
+            max_tokens=self.client.max_tokens,
+            params=params,
+        )
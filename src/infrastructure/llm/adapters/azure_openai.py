@@ -19,6 +19,8 @@ class AzureOpenAIModel(BaseLlm):
     by Azure, handling field mapping (e.g., base_url -> azure_endpoint).
     """
 
+    _SHARES_HTTP_CLIENT = True
+
     def __init__(
         self,
         config: Optional[ModelConfig] = None,
@@ -6,8 +6,10 @@ from pydantic import SecretStr
 from ....domain.llm.constants import BEDROCK_PARAM_MAP
 from ....domain.llm.protocols import ModelConfig
 from ....domain.llm.types import LLMProvider
+from ....domain.prompt.types import Prompt
 from ..base import BaseLlm
 from ..factory import LlmFactory
+from ..prompt_cache import cache_control_messages
 
 
 @LlmFactory.register(LLMProvider.AWS)
@@ -53,4 +55,10 @@ class BedrockModel(BaseLlm):
 
         params.pop("api_key", None)
 
-        self.client = ChatBedrock(**params)
\ No newline at end of file
+        self.client = ChatBedrock(**params)
+
+    def format_prompt(self, prompt: Prompt) -> tuple[Any, dict[str, Any]]:
+        """Mark the static prefix with ``cache_control`` (Anthropic models)."""
+        if not prompt.static_prefix or "anthropic" not in str(self.client.model_id):
+            return prompt.content, {}
+        return cache_control_messages(prompt), {}
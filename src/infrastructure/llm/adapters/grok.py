@@ -22,6 +22,9 @@ class GrokModel(BaseLlm):
         client (ChatXAI): The instantiated LangChain xAI client.
     """
 
+    _SHARES_HTTP_CLIENT = True
+    _DEFAULT_BASE_URL = "https://api.x.ai/v1"
+
     def __init__(
         self,
         config: Optional[ModelConfig] = None,
@@ -6,8 +6,11 @@ from pydantic import SecretStr
 from ....domain.llm.constants import OPENAI_PARAM_MAP
 from ....domain.llm.protocols import ModelConfig
 from ....domain.llm.types import LLMProvider
+from ....domain.prompt.types import Prompt
 from ..base import BaseLlm
+from ..batch import OpenAIBatchClient
 from ..factory import LlmFactory
+from ..prompt_cache import prompt_cache_key
 from ...utils import resolve_parameters
 
 
@@ -22,6 +25,9 @@ class OpenAIModel(BaseLlm):
         client (ChatOpenAI): The instantiated LangChain OpenAI client.
     """
 
+    _SHARES_HTTP_CLIENT = True
+    _DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
     def __init__(
         self,
         config: Optional[ModelConfig] = None,
@@ -54,3 +60,25 @@ class OpenAIModel(BaseLlm):
                 params[langchain_key] = params.pop(config_key)
 
         self.client = ChatOpenAI(**params)
+
+    def format_prompt(self, prompt: Prompt) -> tuple[Any, dict[str, Any]]:
+        """Route prompts sharing a static prefix to the same prompt cache."""
+        key = prompt_cache_key(prompt)
+        return prompt.content, ({"prompt_cache_key": key} if key else {})
+
+    def batch_client(self) -> OpenAIBatchClient:
+        """Return an OpenAI Batch API client sharing this model's settings."""
+        api_key = self.client.openai_api_key
+        params = {
+            key: value
+            for key, value in self.client._default_params.items()
+            if key not in {"model", "stream"}
+        }
+        return OpenAIBatchClient(
+            model=self.client.model_name,
+            api_key=api_key.get_secret_value() if api_key else None,
+            base_url=self.client.openai_api_base or self._DEFAULT_BASE_URL,
+            max_tokens=self.client.max_tokens,
+            http_client=self.client.http_async_client,
+            params=params,
+        )
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, ClassVar, Iterator, Optional
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+from ....domain.llm.constants import SIMULATED_LLM_DEFAULTS
+from ....domain.llm.protocols import ModelConfig
+from ....domain.llm.types import LLMProvider
+from ...utils import estimate_tokens, resolve_parameters
+from ..base import BaseLlm
+from ..factory import LlmFactory
+
+SIMULATED_ALLOWED_KEYS: set[str] = {
+    "model",
+    "ttft_seconds",
+    "ttft_sigma",
+    "tokens_per_second",
+    "output_tokens",
+    "output_tokens_jitter",
+    "max_tokens",
+    "error_rate",
+    "seed",
+    "model_kwargs",
+}
+
+_VOCABULARY: tuple[str, ...] = (
+    "the", "model", "returns", "a", "simulated", "answer", "about", "your",
+    "request", "with", "latency", "tokens", "context", "data", "system",
+    "result", "value", "service", "query", "response", "and", "of", "to",
+    "in", "for", "is", "on", "that", "this", "it", "by", "as",
+)
+
+
+class SimulatedProviderError(RuntimeError):
+    """Injected provider failure, carrying a retryable HTTP status."""
+
+    def __init__(self, message: str = "Simulated provider error", status_code: int = 503) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class SimulatedChatModel(BaseChatModel):
+    """Chat model answering locally with a configurable latency profile.
+
+    Every request waits a time to first token drawn from a log-normal
+    distribution (median ``ttft_seconds``, shape ``ttft_sigma``), then emits
+    ``output_tokens`` (± ``output_tokens_jitter``) word tokens at
+    ``tokens_per_second``. A fraction ``error_rate`` of requests fails with
+    ``SimulatedProviderError`` (HTTP 503) after the first-token delay.
+
+    Answers depend only on ``seed`` and the prompt. Latency and failures
+    depend on the seed, the prompt and how often that prompt was sent
+    before, so runs replay identically whatever the request interleaving.
+    Retrying a failed prompt draws fresh values. Attempt counts are kept
+    for the ``_MAX_TRACKED_PROMPTS`` most recently sent prompts; an evicted
+    prompt starts over from its first attempt.
+    """
+
+    model: str = "simulated-v1"
+    ttft_seconds: float = 0.3
+    ttft_sigma: float = 0.35
+    tokens_per_second: float = 60.0
+    output_tokens: int = 128
+    output_tokens_jitter: float = 0.25
+    max_tokens: Optional[int] = None
+    error_rate: float = 0.0
+    seed: int = 0
+
+    _MAX_TRACKED_PROMPTS: ClassVar[int] = 4096
+
+    _attempts: OrderedDict[str, int] = PrivateAttr(default_factory=OrderedDict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "simulated"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "ttft_seconds": self.ttft_seconds,
+            "tokens_per_second": self.tokens_per_second,
+            "output_tokens": self.output_tokens,
+            "error_rate": self.error_rate,
+            "seed": self.seed,
+        }
+
+    # -- Deterministic draws ----------------------------------------
+
+    def _plan(self, messages: list[BaseMessage]) -> tuple[str, list[str], float, bool]:
+        """Draw the prompt text, output tokens, first-token delay and failure."""
+        prompt = "\n".join(str(message.content) for message in messages)
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        with self._lock:
+            attempt = self._attempts.pop(digest, 0)
+            self._attempts[digest] = attempt + 1
+            if len(self._attempts) > self._MAX_TRACKED_PROMPTS:
+                self._attempts.popitem(last=False)
+
+        content_rng = random.Random(f"{self.seed}:{digest}")
+        spread = self.output_tokens * self.output_tokens_jitter
+        length = max(1, round(content_rng.uniform(-spread, spread) + self.output_tokens))
+        if self.max_tokens is not None:
+            length = min(length, self.max_tokens)
+        words = [content_rng.choice(_VOCABULARY) for _ in range(length)]
+        tokens = [word if i == 0 else f" {word}" for i, word in enumerate(words)]
+
+        call_rng = random.Random(f"{self.seed}:{digest}:{attempt}")
+        ttft = (
+            call_rng.lognormvariate(math.log(self.ttft_seconds), self.ttft_sigma)
+            if self.ttft_seconds > 0
+            else 0.0
+        )
+        failed = call_rng.random() < self.error_rate
+        return prompt, tokens, ttft, failed
+
+    def _token_interval(self) -> float:
+        return 1.0 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def _usage(self, prompt: str, tokens: list[str]) -> dict[str, int]:
+        input_tokens = estimate_tokens(prompt)
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": len(tokens),
+            "total_tokens": input_tokens + len(tokens),
+        }
+
+    def _result(self, prompt: str, tokens: list[str]) -> ChatResult:
+        message = AIMessage(
+            content="".join(tokens),
+            usage_metadata=self._usage(prompt, tokens),
+            response_metadata={"model_name": self.model, "finish_reason": "stop"},
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    # -- LangChain hooks --------------------------------------------
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        prompt, tokens, ttft, failed = self._plan(messages)
+        time.sleep(ttft)
+        if failed:
+            raise SimulatedProviderError()
+        time.sleep(self._token_interval() * max(len(tokens) - 1, 0))
+        return self._result(prompt, tokens)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        prompt, tokens, ttft, failed = self._plan(messages)
+        await asyncio.sleep(ttft)
+        if failed:
+            raise SimulatedProviderError()
+        await asyncio.sleep(self._token_interval() * max(len(tokens) - 1, 0))
+        return self._result(prompt, tokens)
+
+    def _chunk(self, prompt: str, tokens: list[str], index: int) -> ChatGenerationChunk:
+        last = index == len(tokens) - 1
+        return ChatGenerationChunk(
+            message=AIMessageChunk(
+                content=tokens[index],
+                usage_metadata=self._usage(prompt, tokens) if last else None,
+                response_metadata={"model_name": self.model} if last else {},
+            )
+        )
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        prompt, tokens, ttft, failed = self._plan(messages)
+        time.sleep(ttft)
+        if failed:
+            raise SimulatedProviderError()
+        interval = self._token_interval()
+        for index in range(len(tokens)):
+            if index:
+                time.sleep(interval)
+            chunk = self._chunk(prompt, tokens, index)
+            if run_manager:
+                run_manager.on_llm_new_token(tokens[index], chunk=chunk)
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        prompt, tokens, ttft, failed = self._plan(messages)
+        await asyncio.sleep(ttft)
+        if failed:
+            raise SimulatedProviderError()
+        interval = self._token_interval()
+        for index in range(len(tokens)):
+            if index:
+                await asyncio.sleep(interval)
+            chunk = self._chunk(prompt, tokens, index)
+            if run_manager:
+                await run_manager.on_llm_new_token(tokens[index], chunk=chunk)
+            yield chunk
+
+
+@LlmFactory.register(LLMProvider.SIMULATED)
+class SimulatedModel(BaseLlm):
+    """Offline LLM provider for benchmarks and load tests.
+
+    Attributes:
+        client (SimulatedChatModel): The local simulated chat model.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ModelConfig] = None,
+        *,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the simulated model wrapper.
+
+        Args:
+            config: An object adhering to the ModelConfig protocol.
+            model: Name reported in responses and rate-limit keys.
+            **kwargs: Latency profile of SimulatedChatModel
+                (``ttft_seconds``, ``ttft_sigma``, ``tokens_per_second``,
+                ``output_tokens``, ``output_tokens_jitter``, ``max_tokens``,
+                ``error_rate``, ``seed``). Connection settings such as
+                ``api_key`` are ignored.
+        """
+        params: dict[str, Any] = resolve_parameters(
+            config,
+            allowed_keys=SIMULATED_ALLOWED_KEYS | {"rate_limiter"},
+            model=model,
+            **kwargs,
+        )
+        params.update(params.pop("model_kwargs", None) or {})
+        for key, value in SIMULATED_LLM_DEFAULTS.items():
+            params.setdefault(key, value)
+        self.client = SimulatedChatModel(**params)
@@ -1,6 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from ...domain.llm.protocols import ModelConfig
+from ...domain.prompt.types import Prompt
+from ..http_pool import aclose_owned_http_clients, close_owned_http_clients
+
+if TYPE_CHECKING:
+    from .batch import BaseBatchClient
 
 
 class BaseLlm:
@@ -11,6 +16,10 @@ class BaseLlm:
     """
 
     _PARAM_MAP: Dict[str, str] = {}
+    # Adapters whose client accepts ``http_client``/``http_async_client``
+    # get pooled httpx clients from ``LlmFactory`` (see ``http_pool``).
+    _SHARES_HTTP_CLIENT: bool = False
+    _DEFAULT_BASE_URL: Optional[str] = None
 
     def _resolve_parameters(
         self, config: Optional[ModelConfig], **overrides: Any
@@ -59,3 +68,40 @@ class BaseLlm:
                 if langchain_key not in params:
                     params[langchain_key] = params.pop(config_key)
         return params
+
+    def format_prompt(self, prompt: Prompt) -> Tuple[Any, Dict[str, Any]]:
+        """Translate a domain prompt into the client's input and call options.
+
+        Adapters whose provider supports prompt caching override this to
+        mark ``prompt.static_prefix`` as cacheable; by default the prompt
+        is sent as plain text.
+
+        Args:
+            prompt: The processed prompt.
+
+        Returns:
+            The input for ``client.invoke``/``ainvoke``/``astream`` and the
+            keyword arguments to pass along with it.
+        """
+        return prompt.content, {}
+
+    def batch_client(self) -> Optional["BaseBatchClient"]:
+        """Return a client for the provider's asynchronous batch API.
+
+        Returns:
+            A batch client configured like ``client``, or None when the
+            provider has no batch API.
+        """
+        return None
+
+    def close(self) -> None:
+        """Close the sync HTTP clients ``client`` created for itself.
+
+        Pooled and caller-supplied httpx clients are shared and stay open;
+        async clients are closed by ``aclose``.
+        """
+        close_owned_http_clients(getattr(self, "client", None))
+
+    async def aclose(self) -> None:
+        """Close every HTTP client ``client`` created for itself."""
+        await aclose_owned_http_clients(getattr(self, "client", None))
@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+import httpx
+
+from ...domain.prompt.types import Prompt
+from ..http_pool import HttpClientPool
+from .prompt_cache import EPHEMERAL_CACHE_CONTROL
+
+
+class BatchError(RuntimeError):
+    """Raised when a provider batch fails as a whole."""
+
+
+@dataclass
+class BatchRequest:
+    """One prompt of a batch job.
+
+    Attributes:
+        custom_id: Caller-chosen identifier, unique within the batch, used
+            to map results back.
+        prompt: The processed prompt; its static prefix is marked for
+            prompt caching where the provider supports it.
+        max_tokens: Completion budget; defaults to the client's.
+        options: Call options of this request (e.g. the ``prompt_cache_key``
+            returned by ``BaseLlm.format_prompt``), added to its body.
+    """
+
+    custom_id: str
+    prompt: Prompt
+    max_tokens: Optional[int] = None
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch request.
+
+    Attributes:
+        custom_id: Identifier of the request.
+        content: Generated text; empty when the request failed.
+        usage: ``input_tokens``, ``output_tokens``, ``cache_read_tokens`` and
+            ``cache_creation_tokens`` when reported.
+        error: Failure description, or None on success.
+    """
+
+    custom_id: str
+    content: str = ""
+    usage: dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchStatus:
+    """Progress of a submitted batch.
+
+    Attributes:
+        batch_id: Provider identifier of the batch.
+        state: Provider status string.
+        done: Whether the provider stopped processing the batch.
+    """
+
+    batch_id: str
+    state: str
+    done: bool
+
+
+class BaseBatchClient(ABC):
+    """Client for a provider's asynchronous batch API.
+
+    Batches are processed within hours at a discount and outside the
+    synchronous rate limits. ``run`` submits the requests, polls until the
+    batch ends and returns the results keyed by ``custom_id``.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        params: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            model: Model used for every request.
+            api_key: Provider API key.
+            base_url: API root; defaults to the provider's public endpoint.
+            max_tokens: Default completion budget of the requests.
+            http_client: Async client to send requests with; defaults to
+                the shared ``HttpClientPool`` client of ``base_url``.
+            params: Provider call parameters added to every request body
+                (``temperature``, ``top_p``, ``stop``...), so batched
+                requests sample like direct calls.
+        """
+        self.model = model
+        self.api_key = api_key
+        self.base_url = (base_url or self._default_base_url()).rstrip("/")
+        self.max_tokens = max_tokens
+        self.params = dict(params or {})
+        self._http = http_client
+
+    @staticmethod
+    @abstractmethod
+    def _default_base_url() -> str:
+        """Return the provider's public API root."""
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Return the async HTTP client."""
+        if self._http is None:
+            self._http = HttpClientPool.shared().async_client(self.base_url)
+        return self._http
+
+    @abstractmethod
+    async def submit(self, requests: Sequence[BatchRequest]) -> str:
+        """Create a batch and return its identifier."""
+
+    @abstractmethod
+    async def status(self, batch_id: str) -> BatchStatus:
+        """Return the progress of a batch."""
+
+    @abstractmethod
+    async def results(self, batch_id: str) -> dict[str, BatchResult]:
+        """Download the results of an ended batch, keyed by ``custom_id``."""
+
+    async def run(
+        self,
+        requests: Sequence[BatchRequest],
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+    ) -> dict[str, BatchResult]:
+        """Submit ``requests``, wait for the batch and return its results.
+
+        Requests without a result (expired or cancelled batches) are
+        reported with an error.
+
+        Args:
+            requests: Requests with unique ``custom_id`` values.
+            poll_interval: Seconds between status checks.
+            timeout: Seconds to wait before giving up; the batch keeps
+                running on the provider side.
+
+        Returns:
+            One result per request, keyed by ``custom_id``.
+
+        Raises:
+            ValueError: If ``custom_id`` values are not unique.
+            TimeoutError: If the batch does not end within ``timeout``.
+            BatchError: If the provider rejects the whole batch.
+        """
+        ids = [request.custom_id for request in requests]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Batch requests need unique custom_id values.")
+        if not requests:
+            return {}
+        batch_id = await self.submit(requests)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not (status := await self.status(batch_id)).done:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch {batch_id} still {status.state} after {timeout}s.")
+            await asyncio.sleep(poll_interval)
+        results = await self.results(batch_id)
+        for custom_id in ids:
+            results.setdefault(
+                custom_id, BatchResult(custom_id, error=f"No result (batch {status.state}).")
+            )
+        return results
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send an authenticated request and raise on HTTP errors."""
+        response = await self.http.request(method, url, headers=self._headers(), **kwargs)
+        response.raise_for_status()
+        return response
+
+    @abstractmethod
+    def _headers(self) -> dict[str, str]:
+        """Return the authentication headers."""
+
+
+def _jsonl(lines: Sequence[dict[str, Any]]) -> bytes:
+    return "".join(json.dumps(line) + "\n" for line in lines).encode("utf-8")
+
+
+def _parse_jsonl(text: str) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class OpenAIBatchClient(BaseBatchClient):
+    """OpenAI Batch API client for ``/v1/chat/completions`` requests.
+
+    Requests are uploaded as a JSONL file, the batch runs within the 24 h
+    completion window and results are read from its output and error files.
+    """
+
+    _DONE = frozenset({"completed", "failed", "expired", "cancelled"})
+
+    @staticmethod
+    def _default_base_url() -> str:
+        return "https://api.openai.com/v1"
+
+    def _headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+
+    def _line(self, request: BatchRequest) -> dict[str, Any]:
+        body: dict[str, Any] = {
+            **self.params,
+            **request.options,
+            "model": self.model,
+            "messages": [{"role": "user", "content": request.prompt.content}],
+        }
+        max_tokens = request.max_tokens or self.max_tokens
+        if max_tokens:
+            body["max_completion_tokens"] = max_tokens
+        return {
+            "custom_id": request.custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body,
+        }
+
+    async def submit(self, requests: Sequence[BatchRequest]) -> str:
+        upload = await self._request(
+            "POST",
+            f"{self.base_url}/files",
+            data={"purpose": "batch"},
+            files={
+                "file": (
+                    "batch.jsonl",
+                    _jsonl([self._line(r) for r in requests]),
+                    "application/jsonl",
+                )
+            },
+        )
+        batch = await self._request(
+            "POST",
+            f"{self.base_url}/batches",
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+        )
+        return batch.json()["id"]
+
+    async def status(self, batch_id: str) -> BatchStatus:
+        response = await self._request("GET", f"{self.base_url}/batches/{batch_id}")
+        state = response.json()["status"]
+        return BatchStatus(batch_id, state, state in self._DONE)
+
+    async def results(self, batch_id: str) -> dict[str, BatchResult]:
+        batch = (await self._request("GET", f"{self.base_url}/batches/{batch_id}")).json()
+        if batch["status"] == "failed" and not batch.get("output_file_id"):
+            errors = (batch.get("errors") or {}).get("data") or []
+            detail = "; ".join(str(error.get("message")) for error in errors)
+            raise BatchError(f"Batch {batch_id} failed: {detail or 'no detail'}")
+        results: dict[str, BatchResult] = {}
+        for key in ("output_file_id", "error_file_id"):
+            if not batch.get(key):
+                continue
+            content = await self._request("GET", f"{self.base_url}/files/{batch[key]}/content")
+            for line in _parse_jsonl(content.text):
+                results[line["custom_id"]] = self._result(line)
+        return results
+
+    @staticmethod
+    def _result(line: dict[str, Any]) -> BatchResult:
+        custom_id = line["custom_id"]
+        response = line.get("response") or {}
+        if line.get("error") or response.get("status_code", 200) >= 400:
+            error = line.get("error") or (response.get("body") or {}).get("error") or {}
+            return BatchResult(custom_id, error=str(error.get("message", error)))
+        body = response["body"]
+        usage = body.get("usage") or {}
+        details = usage.get("prompt_tokens_details") or {}
+        return BatchResult(
+            custom_id,
+            content=body["choices"][0]["message"].get("content") or "",
+            usage={
+                "input_tokens": usage.get("prompt_tokens", 0),
+                "output_tokens": usage.get("completion_tokens", 0),
+                "cache_read_tokens": details.get("cached_tokens") or 0,
+                "cache_creation_tokens": 0,
+            },
+        )
+
+
+class AnthropicBatchClient(BaseBatchClient):
+    """Anthropic Message Batches API client.
+
+    Static prompt prefixes are sent with a ``cache_control`` breakpoint, so
+    requests of one batch sharing a prefix read it from the prompt cache.
+    """
+
+    API_VERSION = "2023-06-01"
+    # Required by the Messages API when the caller sets no budget.
+    DEFAULT_MAX_TOKENS = 1024
+
+    @staticmethod
+    def _default_base_url() -> str:
+        return "https://api.anthropic.com"
+
+    def _headers(self) -> dict[str, str]:
+        headers = {"anthropic-version": self.API_VERSION}
+        if self.api_key:
+            headers["x-api-key"] = self.api_key
+        return headers
+
+    def _params(self, request: BatchRequest) -> dict[str, Any]:
+        prompt = request.prompt
+        content: Any = prompt.content
+        if prompt.static_prefix:
+            content = [
+                {
+                    "type": "text",
+                    "text": prompt.static_prefix,
+                    "cache_control": dict(EPHEMERAL_CACHE_CONTROL),
+                }
+            ]
+            if prompt.dynamic_suffix:
+                content.append({"type": "text", "text": prompt.dynamic_suffix})
+        return {
+            **self.params,
+            **request.options,
+            "model": self.model,
+            "max_tokens": request.max_tokens or self.max_tokens or self.DEFAULT_MAX_TOKENS,
+            "messages": [{"role": "user", "content": content}],
+        }
+
+    async def submit(self, requests: Sequence[BatchRequest]) -> str:
+        response = await self._request(
+            "POST",
+            f"{self.base_url}/v1/messages/batches",
+            json={
+                "requests": [
+                    {"custom_id": request.custom_id, "params": self._params(request)}
+                    for request in requests
+                ]
+            },
+        )
+        return response.json()["id"]
+
+    async def status(self, batch_id: str) -> BatchStatus:
+        response = await self._request("GET", f"{self.base_url}/v1/messages/batches/{batch_id}")
+        state = response.json()["processing_status"]
+        return BatchStatus(batch_id, state, state == "ended")
+
+    async def results(self, batch_id: str) -> dict[str, BatchResult]:
+        batch = (
+            await self._request("GET", f"{self.base_url}/v1/messages/batches/{batch_id}")
+        ).json()
+        url = batch.get("results_url") or f"{self.base_url}/v1/messages/batches/{batch_id}/results"
+        content = await self._request("GET", url)
+        return {
+            line["custom_id"]: self._result(line) for line in _parse_jsonl(content.text)
+        }
+
+    @staticmethod
+    def _result(line: dict[str, Any]) -> BatchResult:
+        custom_id = line["custom_id"]
+        result = line.get("result") or {}
+        if result.get("type") != "succeeded":
+            error = (result.get("error") or {}).get("error") or result.get("error") or {}
+            message = error.get("message") if isinstance(error, dict) else None
+            return BatchResult(custom_id, error=message or str(result.get("type", "unknown")))
+        message = result["message"]
+        usage = message.get("usage") or {}
+        cache_read = usage.get("cache_read_input_tokens") or 0
+        cache_creation = usage.get("cache_creation_input_tokens") or 0
+        return BatchResult(
+            custom_id,
+            content="".join(
+                block.get("text", "")
+                for block in message.get("content", [])
+                if block.get("type") == "text"
+            ),
+            usage={
+                "input_tokens": usage.get("input_tokens", 0) + cache_read + cache_creation,
+                "output_tokens": usage.get("output_tokens", 0),
+                "cache_read_tokens": cache_read,
+                "cache_creation_tokens": cache_creation,
+            },
+        )
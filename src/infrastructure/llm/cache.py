@@ -0,0 +1,439 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import reduce
+from operator import add
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, Optional
+
+from langchain_core.messages import (
+    AIMessageChunk,
+    BaseMessage,
+    message_chunk_to_message,
+    message_to_dict,
+    messages_from_dict,
+)
+
+from ...domain.prompt.types import Prompt
+from .base import BaseLlm
+from .batch import BaseBatchClient
+
+
+@dataclass
+class CachedResponse:
+    """A recorded model response.
+
+    Attributes:
+        messages: Serialized messages (``message_to_dict`` format); a single
+            message for ``invoke`` and every chunk, in order, for ``stream``.
+        streamed: Whether ``messages`` holds stream chunks.
+    """
+
+    messages: list[dict[str, Any]]
+    streamed: bool = False
+
+    def to_message(self) -> BaseMessage:
+        """Return the response as one message, merging recorded chunks."""
+        messages = messages_from_dict(self.messages)
+        if not self.streamed:
+            return messages[0]
+        return message_chunk_to_message(reduce(add, messages))
+
+    def to_chunks(self) -> list[BaseMessage]:
+        """Return the response as stream chunks."""
+        messages = messages_from_dict(self.messages)
+        if self.streamed:
+            return messages
+        (message,) = messages
+        return [AIMessageChunk(**message.model_dump(exclude={"type"}))]
+
+    def dumps(self) -> str:
+        """Serialize the response as JSON."""
+        return json.dumps({"messages": self.messages, "streamed": self.streamed})
+
+    @classmethod
+    def loads(cls, data: str) -> CachedResponse:
+        """Deserialize a response produced by ``dumps``."""
+        return cls(**json.loads(data))
+
+
+class LlmResponseCache:
+    """Two-tier exact-match store of model responses.
+
+    The memory tier is an LRU bounded by ``max_entries``. When ``path`` is
+    set, responses are also written to a SQLite database in WAL mode, which
+    survives restarts and is shared by every process using the file; disk
+    hits are promoted to memory. Entries expire ``ttl`` seconds after they
+    were stored, in both tiers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: Optional[str | Path] = None,
+        ttl: Optional[float] = None,
+        max_disk_entries: Optional[int] = 100_000,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Capacity of the in-memory tier.
+            path: SQLite database file for the disk tier, or None for
+                memory only.
+            ttl: Default time to live in seconds, or None to never expire.
+            max_disk_entries: Capacity of the disk tier, or None for no
+                eviction.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_disk_entries = max_disk_entries
+        self.path = Path(path) if path is not None else None
+        self._memory: OrderedDict[str, tuple[Optional[float], CachedResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                conn = self._connection()
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                    "expires REAL, accessed INTEGER NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)"
+                )
+                conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection to the disk tier."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def build_key(namespace: str, prompt: str) -> str:
+        """Return the cache key of a rendered ``prompt`` under ``namespace``."""
+        digest = hashlib.sha256(namespace.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the live response stored under ``key``, if any."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires, response = entry
+                if expires is None or expires > now:
+                    self._memory.move_to_end(key)
+                    return response
+                del self._memory[key]
+        if self.path is None:
+            return None
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT response, expires FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        data, expires = row
+        with self._lock:
+            if expires is not None and expires <= now:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            conn.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (time.time_ns(), key)
+            )
+            conn.commit()
+            response = CachedResponse.loads(data)
+            self._remember(key, expires, response)
+        return response
+
+    def put(self, key: str, response: CachedResponse, ttl: Optional[float] = None) -> None:
+        """Store ``response`` in every tier.
+
+        Args:
+            key: Cache key from ``build_key``.
+            response: Response to store.
+            ttl: Time to live in seconds; defaults to the cache ``ttl``.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._remember(key, expires, response)
+            if self.path is None:
+                return
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, expires, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response.dumps(), expires, time.time_ns()),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def _remember(
+        self, key: str, expires: Optional[float], response: CachedResponse
+    ) -> None:
+        """Insert into the memory tier; the caller holds ``_lock``."""
+        self._memory[key] = (expires, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired rows, then the least recently used over capacity."""
+        conn.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+        if self.max_disk_entries is None:
+            return
+        conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        )
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self.path is not None:
+                conn = self._connection()
+                conn.execute("DELETE FROM responses")
+                conn.commit()
+
+    def __len__(self) -> int:
+        """Return the number of entries in the memory tier."""
+        return len(self._memory)
+
+    def close(self) -> None:
+        """Close the calling thread's disk connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+# Client attributes naming the model, in lookup order.
+_MODEL_ATTRS: tuple[str, ...] = ("model_name", "model", "model_id", "deployment_name")
+
+
+def _serialize_prompt(value: Any) -> str:
+    """Render a LangChain model input as canonical JSON."""
+    if hasattr(value, "to_messages"):
+        value = value.to_messages()
+    if isinstance(value, BaseMessage):
+        value = [value]
+    if isinstance(value, (list, tuple)):
+        value = [
+            message_to_dict(item) if isinstance(item, BaseMessage) else item
+            for item in value
+        ]
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+class CachedChatModel:
+    """LangChain chat model proxy answering repeated requests from a cache.
+
+    ``invoke``/``ainvoke`` and ``stream``/``astream`` look up the response
+    by provider, model, generation parameters, call options and rendered
+    prompt. Misses are forwarded to the wrapped client and stored; streams
+    are stored only once they completed and are replayed chunk by chunk on
+    a hit. Any other attribute is read from the wrapped client.
+
+    Pass ``cache_bypass=True`` to a call, or set ``bypass``, to skip the
+    lookup; the fresh response still replaces the stored one.
+
+    Attributes:
+        client: The wrapped LangChain chat model.
+        cache: The response store.
+        namespace: Provider, model and parameters the keys are scoped to.
+        ttl: Time to live of stored responses; defaults to the cache's.
+        bypass: Skip lookups for every call.
+        hits: Number of calls answered from the cache.
+        misses: Number of calls sent to the provider.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        cache: LlmResponseCache,
+        provider: Optional[str] = None,
+        ttl: Optional[float] = None,
+        bypass: bool = False,
+    ) -> None:
+        """Initialize the proxy.
+
+        Args:
+            client: Chat model to forward misses to.
+            cache: Store holding the responses.
+            provider: Provider name; defaults to the client class name.
+            ttl: Time to live in seconds for responses stored by this proxy.
+            bypass: Skip lookups for every call.
+        """
+        self.client = client
+        self.cache = cache
+        self.ttl = ttl
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+        provider = getattr(provider, "value", provider) or type(client).__name__
+        model = next(
+            (
+                value
+                for value in (getattr(client, attr, None) for attr in _MODEL_ATTRS)
+                if isinstance(value, str) and value
+            ),
+            "",
+        )
+        params = getattr(client, "_identifying_params", None)
+        params = json.dumps(params if isinstance(params, dict) else {}, sort_keys=True, default=str)
+        self.namespace = f"{provider}|{model}|{params}"
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def _key(self, value: Any, kwargs: dict[str, Any]) -> tuple[str, bool]:
+        """Return the cache key of a call and whether to skip the lookup.
+
+        Pops ``cache_bypass`` from ``kwargs``; the runnable ``config`` does
+        not take part in the key.
+        """
+        bypass = bool(kwargs.pop("cache_bypass", False) or self.bypass)
+        options = json.dumps(kwargs, sort_keys=True, default=str)
+        return self.cache.build_key(self.namespace, _serialize_prompt(value) + options), bypass
+
+    def _lookup(self, key: str, bypass: bool) -> Optional[CachedResponse]:
+        """Return the stored response for ``key`` and count the outcome."""
+        response = None if bypass else self.cache.get(key)
+        with self._stats_lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def _store_message(self, key: str, message: BaseMessage) -> None:
+        self.cache.put(key, CachedResponse([message_to_dict(message)]), self.ttl)
+
+    def _store_chunks(self, key: str, chunks: list[BaseMessage]) -> None:
+        response = CachedResponse([message_to_dict(chunk) for chunk in chunks], streamed=True)
+        self.cache.put(key, response, self.ttl)
+
+    def invoke(self, input: Any, config: Any = None, **kwargs: Any) -> BaseMessage:
+        """Return the cached response, or invoke the client and store it."""
+        key, bypass = self._key(input, kwargs)
+        cached = self._lookup(key, bypass)
+        if cached is not None:
+            return cached.to_message()
+        message = self.client.invoke(input, config, **kwargs)
+        self._store_message(key, message)
+        return message
+
+    async def ainvoke(self, input: Any, config: Any = None, **kwargs: Any) -> BaseMessage:
+        """Async counterpart of ``invoke``; store I/O runs in a thread."""
+        key, bypass = self._key(input, kwargs)
+        cached = await asyncio.to_thread(self._lookup, key, bypass)
+        if cached is not None:
+            return cached.to_message()
+        message = await self.client.ainvoke(input, config, **kwargs)
+        await asyncio.to_thread(self._store_message, key, message)
+        return message
+
+    def stream(self, input: Any, config: Any = None, **kwargs: Any) -> Iterator[BaseMessage]:
+        """Replay a cached response, or stream from the client and record it."""
+        key, bypass = self._key(input, kwargs)
+        cached = self._lookup(key, bypass)
+        if cached is not None:
+            yield from cached.to_chunks()
+            return
+        chunks: list[BaseMessage] = []
+        for chunk in self.client.stream(input, config, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        if chunks:
+            self._store_chunks(key, chunks)
+
+    async def astream(
+        self, input: Any, config: Any = None, **kwargs: Any
+    ) -> AsyncIterator[BaseMessage]:
+        """Async counterpart of ``stream``."""
+        key, bypass = self._key(input, kwargs)
+        cached = await asyncio.to_thread(self._lookup, key, bypass)
+        if cached is not None:
+            for chunk in cached.to_chunks():
+                yield chunk
+            return
+        chunks: list[BaseMessage] = []
+        async for chunk in self.client.astream(input, config, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        if chunks:
+            await asyncio.to_thread(self._store_chunks, key, chunks)
+
+
+class CachedLlm(BaseLlm):
+    """LLM wrapper decorator whose ``client`` serves responses from a cache.
+
+    Attributes:
+        llm: The wrapped model wrapper.
+        client (CachedChatModel): Caching proxy around ``llm.client``.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        cache: LlmResponseCache,
+        provider: Optional[str] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Initialize the decorator.
+
+        Args:
+            llm: Model wrapper exposing a LangChain ``client``.
+            cache: Store holding the responses.
+            provider: Provider name used in cache keys.
+            ttl: Time to live in seconds of stored responses.
+        """
+        self.llm = llm
+        self.client = CachedChatModel(
+            llm.client, cache, provider=provider or type(llm).__name__, ttl=ttl
+        )
+
+    def format_prompt(self, prompt: Prompt) -> tuple[Any, dict[str, Any]]:
+        """Format ``prompt`` the way the wrapped model does."""
+        if isinstance(self.llm, BaseLlm):
+            return self.llm.format_prompt(prompt)
+        return super().format_prompt(prompt)
+
+    def batch_client(self) -> Optional[BaseBatchClient]:
+        """Return the wrapped model's batch client; batches bypass the cache."""
+        if isinstance(self.llm, BaseLlm):
+            return self.llm.batch_client()
+        return None
+
+    def close(self) -> None:
+        """Close the wrapped model's own HTTP clients; the cache stays open."""
+        close = getattr(self.llm, "close", None)
+        if callable(close):
+            close()
+
+    async def aclose(self) -> None:
+        """Async counterpart of ``close``."""
+        aclose = getattr(self.llm, "aclose", None)
+        if callable(aclose):
+            await aclose()
@@ -1,6 +1,12 @@
-from typing import Any, Callable, Dict, Optional, Type
+from typing import Any, Callable, Dict, Optional, Type, Union
 
 from ...domain.llm.protocols import ModelConfig
+from ...domain.llm.types import LLMProvider
+from ..http_pool import HttpClientPool, pooled_http_clients
+from ..instances import InstanceCache, fingerprint
+from ..rate_limit import ChatModelRateLimiter, RateLimiter
+from ..registry import available_providers, load_provider
+from .cache import _MODEL_ATTRS, CachedLlm, LlmResponseCache
 
 
 class LlmFactory:
@@ -8,9 +14,27 @@ class LlmFactory:
 
     This class implements the Registry pattern to allow dynamic registration
     of new LLM providers without modifying the factory logic.
+
+    Adapters are imported on first use: built-in providers are mapped to
+    their modules in ``_modules`` and third-party packages can expose
+    adapters under the ``_ENTRY_POINT_GROUP`` entry-point group.
     """
 
     _registry: Dict[str, Type[Any]] = {}
+    # Built-in providers, imported on first ``create`` so that only the SDKs
+    # in use are loaded.
+    _modules: Dict[str, str] = {
+        LLMProvider.OPENAI: ".adapters.openai",
+        LLMProvider.AZURE: ".adapters.azure_openai",
+        LLMProvider.ANTHROPIC: ".adapters.anthropic",
+        LLMProvider.GOOGLE: ".adapters.gemini",
+        LLMProvider.AWS: ".adapters.bedrock",
+        LLMProvider.XAI: ".adapters.grok",
+        LLMProvider.HUGGINGFACE: ".adapters.ollama",
+        LLMProvider.SIMULATED: ".adapters.simulated",
+    }
+    _ENTRY_POINT_GROUP = "ai_app_template.llm_providers"
+    _instances: InstanceCache = InstanceCache()
 
     @classmethod
     def register(cls, provider: str) -> Callable:
@@ -29,25 +53,127 @@ class LlmFactory:
 
         return decorator
 
+    @classmethod
+    def register_lazy(cls, provider: str, target: str) -> None:
+        """Register a provider whose adapter is imported on first ``create``.
+
+        Args:
+            provider: The provider identifier.
+            target: ``"module"`` registering itself on import, or
+                ``"module:Class"``.
+        """
+        cls._modules[provider] = target
+
+    @classmethod
+    def providers(cls) -> list[str]:
+        """Return the providers ``create`` accepts, without importing them."""
+        return available_providers(cls._registry, cls._modules, cls._ENTRY_POINT_GROUP)
+
+    @classmethod
+    def _load(cls, provider: str) -> Optional[Type[Any]]:
+        """Import the adapter of a lazy or entry-point provider."""
+        return load_provider(
+            cls._registry, cls._modules, provider, cls._ENTRY_POINT_GROUP, __package__
+        )
+
     @classmethod
     def create(
-        cls, provider: str, config: Optional[ModelConfig] = None, **kwargs: Any
+        cls,
+        provider: str,
+        config: Optional[ModelConfig] = None,
+        *,
+        cache: Optional[LlmResponseCache] = None,
+        cache_ttl: Optional[float] = None,
+        http_pool: Union[HttpClientPool, bool] = True,
+        rate_limiter: Union[RateLimiter, bool] = True,
+        reuse: bool = False,
+        **kwargs: Any,
     ) -> Any:
         """Create an instance of the requested LLM model.
 
         Args:
             provider: The provider identifier (must be registered).
             config: The configuration object.
+            cache: Response cache; when set, the model is wrapped in a
+                ``CachedLlm`` so repeated requests skip the provider.
+            cache_ttl: Time to live in seconds of responses stored by this
+                model; defaults to the cache's own TTL.
+            http_pool: Pool providing shared httpx clients to adapters that
+                accept them; True uses ``HttpClientPool.shared()`` and False
+                lets the adapter build its own.
+            rate_limiter: Limiter installed as the LangChain client's
+                ``rate_limiter`` hook (unless one is already set); True uses
+                ``RateLimiter.shared()`` and False disables throttling.
+            reuse: Return the instance memoized for the same provider,
+                configuration and arguments, creating it on first use, so
+                per-request callers share one SDK client. Memoized
+                instances live until ``close_all``.
             **kwargs: Additional overrides passed to the model constructor.
 
         Returns:
             An instance of the specific model wrapper.
 
         Raises:
-            ValueError: If the provider is not registered.
+            ValueError: If the provider is neither registered nor
+                discoverable.
         """
-        if provider not in cls._registry:
+        if provider not in cls._registry and cls._load(provider) is None:
             raise ValueError(f"Provider '{provider}' is not registered.")
+        if reuse:
+            options = dict(
+                cache=cache, cache_ttl=cache_ttl, http_pool=http_pool, rate_limiter=rate_limiter
+            )
+            return cls._instances.get_or_create(
+                fingerprint(provider, config, {**kwargs, **options}),
+                lambda: cls.create(provider, config, **options, **kwargs),
+            )
 
         model_cls = cls._registry[provider]
-        return model_cls(config=config, **kwargs)
+        kwargs.update(pooled_http_clients(model_cls, config, kwargs, http_pool))
+        model = model_cls(config=config, **kwargs)
+        if rate_limiter is not False:
+            cls._install_rate_limiter(
+                model,
+                provider,
+                RateLimiter.shared() if rate_limiter is True else rate_limiter,
+            )
+        if cache is not None:
+            model = CachedLlm(model, cache, provider=provider, ttl=cache_ttl)
+        return model
+
+    @classmethod
+    def close_all(cls) -> int:
+        """Close and forget every instance created with ``reuse=True``.
+
+        Returns:
+            Number of instances released.
+        """
+        return cls._instances.close_all()
+
+    @staticmethod
+    def _install_rate_limiter(model: Any, provider: str, limiter: RateLimiter) -> None:
+        """Hook ``limiter`` into the model's LangChain client, if it has one.
+
+        Each request is charged the client's ``max_tokens`` completion
+        budget; the prompt share is corrected from rate-limit headers.
+        """
+        client = getattr(model, "client", None)
+        if client is None or "rate_limiter" not in getattr(type(client), "model_fields", {}):
+            return
+        if client.rate_limiter is not None:
+            return
+        name = next(
+            (
+                value
+                for value in (getattr(client, attr, None) for attr in _MODEL_ATTRS)
+                if isinstance(value, str) and value
+            ),
+            "",
+        )
+        max_tokens = getattr(client, "max_tokens", None)
+        client.rate_limiter = ChatModelRateLimiter(
+            limiter,
+            provider,
+            name,
+            tokens=max_tokens if isinstance(max_tokens, int) else 0,
+        )
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from ..embedding.instrumentation import LatencyHistogram
+from .cache import _MODEL_ATTRS
+
+
+@dataclass
+class StreamEvent:
+    """Latency profile of one completed (or failed) streamed response.
+
+    Attributes:
+        provider: Provider identifier.
+        model: Model name.
+        ttft: Seconds from the request to the first chunk; None if no chunk
+            arrived.
+        duration: Seconds from the request to the end of the stream.
+        output_tokens: Tokens generated, as reported by the provider or,
+            failing that, the number of chunks.
+        chunks: Chunks received.
+        inter_token_latency: Mean seconds between tokens after the first
+            chunk.
+        tokens_per_second: Output tokens per second after the first chunk.
+        error: Exception type name when the stream failed or was abandoned.
+    """
+
+    provider: str
+    model: str
+    ttft: Optional[float]
+    duration: float
+    output_tokens: int
+    chunks: int
+    inter_token_latency: float
+    tokens_per_second: float
+    error: Optional[str] = None
+
+    def as_metadata(self) -> dict[str, Any]:
+        """Return the measurements for ``ChatMessage.metadata``."""
+        return {
+            "ttft": self.ttft,
+            "duration": self.duration,
+            "output_tokens": self.output_tokens,
+            "chunks": self.chunks,
+            "inter_token_latency": self.inter_token_latency,
+            "tokens_per_second": self.tokens_per_second,
+        }
+
+
+class StreamTimer:
+    """Measure a stream with constant state: a counter and three timestamps.
+
+    Call ``tick`` once per received chunk and ``finish`` when the stream
+    ends. Inter-token figures are derived from the first and last chunk
+    times, so nothing is stored per token.
+    """
+
+    __slots__ = ("started", "first", "last", "chunks")
+
+    def __init__(self) -> None:
+        """Start the clock."""
+        self.started = time.perf_counter()
+        self.first = 0.0
+        self.last = 0.0
+        self.chunks = 0
+
+    def tick(self) -> None:
+        """Record the arrival of one chunk."""
+        now = time.perf_counter()
+        if not self.chunks:
+            self.first = now
+        self.last = now
+        self.chunks += 1
+
+    def finish(
+        self,
+        provider: str,
+        model: str,
+        output_tokens: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> StreamEvent:
+        """Stop the clock and summarize the stream.
+
+        Args:
+            provider: Provider label of the event.
+            model: Model label of the event.
+            output_tokens: Output tokens reported by the provider; the
+                chunk count is used when unknown.
+            error: Exception that ended the stream, if any.
+
+        Returns:
+            The stream's event.
+        """
+        duration = time.perf_counter() - self.started
+        tokens = output_tokens if output_tokens else self.chunks
+        generating = self.last - self.first
+        return StreamEvent(
+            provider=provider,
+            model=model,
+            ttft=self.first - self.started if self.chunks else None,
+            duration=duration,
+            output_tokens=tokens,
+            chunks=self.chunks,
+            inter_token_latency=generating / (tokens - 1) if tokens > 1 else 0.0,
+            tokens_per_second=(tokens - 1) / generating if generating > 0 else 0.0,
+            error=type(error).__name__ if error is not None else None,
+        )
+
+
+class BaseStreamSink(ABC):
+    """Destination for streaming latency events."""
+
+    @abstractmethod
+    def emit(self, event: StreamEvent) -> None:
+        """Record one event. Implementations must be thread-safe and fast."""
+
+
+def llm_identity(llm: Any) -> tuple[str, str]:
+    """Return the ``(provider, model)`` labels of a model wrapper."""
+    from .factory import LlmFactory
+
+    inner = getattr(llm, "llm", llm)
+    provider = next(
+        (
+            str(getattr(name, "value", name))
+            for name, cls in LlmFactory._registry.items()
+            if cls is type(inner)
+        ),
+        type(inner).__name__,
+    )
+    client = getattr(inner, "client", None)
+    model = next(
+        (
+            value
+            for value in (getattr(client, attr, None) for attr in _MODEL_ATTRS)
+            if isinstance(value, str) and value
+        ),
+        "",
+    )
+    return provider, model
+
+
+@dataclass
+class StreamMetrics:
+    """Aggregated streaming figures for one provider and model."""
+
+    streams: int = 0
+    errors: int = 0
+    output_tokens: int = 0
+    ttft: LatencyHistogram = field(default_factory=LatencyHistogram)
+    inter_token_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    duration: LatencyHistogram = field(default_factory=LatencyHistogram)
+    tokens_per_second: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram(minimum=1e-3)
+    )
+
+
+class InMemoryStreamMetrics(BaseStreamSink):
+    """Sink aggregating stream events per ``(provider, model)`` in memory."""
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregator."""
+        self._metrics: dict[tuple[str, str], StreamMetrics] = {}
+        self._lock = threading.Lock()
+
+    def emit(self, event: StreamEvent) -> None:
+        """Fold ``event`` into the figures of its provider and model."""
+        with self._lock:
+            metrics = self._metrics.setdefault((event.provider, event.model), StreamMetrics())
+            metrics.streams += 1
+            metrics.errors += event.error is not None
+            metrics.output_tokens += event.output_tokens
+            metrics.duration.record(event.duration)
+            if event.ttft is not None:
+                metrics.ttft.record(event.ttft)
+            if event.output_tokens > 1:
+                metrics.inter_token_latency.record(event.inter_token_latency)
+                metrics.tokens_per_second.record(event.tokens_per_second)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a summary per ``provider/model`` key.
+
+        Returns:
+            Counters plus p50/p90/p99 of time to first token, inter-token
+            latency and duration (seconds), and p50 tokens per second.
+        """
+        with self._lock:
+            summary: dict[str, dict[str, Any]] = {}
+            for (provider, model), metrics in self._metrics.items():
+                summary[f"{provider}/{model}"] = {
+                    "streams": metrics.streams,
+                    "errors": metrics.errors,
+                    "output_tokens": metrics.output_tokens,
+                    "ttft_p50": metrics.ttft.percentile(50),
+                    "ttft_p90": metrics.ttft.percentile(90),
+                    "ttft_p99": metrics.ttft.percentile(99),
+                    "itl_p50": metrics.inter_token_latency.percentile(50),
+                    "itl_p90": metrics.inter_token_latency.percentile(90),
+                    "itl_p99": metrics.inter_token_latency.percentile(99),
+                    "duration_p50": metrics.duration.percentile(50),
+                    "duration_p90": metrics.duration.percentile(90),
+                    "duration_p99": metrics.duration.percentile(99),
+                    "tokens_per_second_p50": metrics.tokens_per_second.percentile(50),
+                }
+            return summary
+
+    def reset(self) -> None:
+        """Discard all aggregated data."""
+        with self._lock:
+            self._metrics.clear()
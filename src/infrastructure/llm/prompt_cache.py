@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional
+
+from langchain_core.messages import BaseMessage, HumanMessage
+
+from ...domain.prompt.types import Prompt
+
+# Anthropic cache breakpoint; entries live for five minutes after last use.
+EPHEMERAL_CACHE_CONTROL: dict[str, str] = {"type": "ephemeral"}
+
+
+def cache_control_messages(prompt: Prompt) -> list[BaseMessage]:
+    """Render ``prompt`` with a cache breakpoint after its static prefix.
+
+    Produces the content-block form understood by Anthropic models (direct
+    or through Bedrock): the prefix block carries ``cache_control``, so the
+    provider caches everything up to and including it.
+
+    Args:
+        prompt: Prompt with a non-empty ``static_prefix``.
+
+    Returns:
+        A single human message made of the prefix and remainder blocks.
+    """
+    blocks: list[dict[str, Any]] = [
+        {
+            "type": "text",
+            "text": prompt.static_prefix,
+            "cache_control": dict(EPHEMERAL_CACHE_CONTROL),
+        }
+    ]
+    if prompt.dynamic_suffix:
+        blocks.append({"type": "text", "text": prompt.dynamic_suffix})
+    return [HumanMessage(content=blocks)]
+
+
+def prompt_cache_key(prompt: Prompt) -> Optional[str]:
+    """Return a routing key shared by prompts with the same static prefix.
+
+    OpenAI caches prompt prefixes automatically; sending the same
+    ``prompt_cache_key`` makes requests land where the prefix is cached.
+    """
+    if not prompt.static_prefix:
+        return None
+    return hashlib.sha256(prompt.static_prefix.encode("utf-8")).hexdigest()[:32]
+
+
+def cache_usage(message: Any) -> dict[str, int]:
+    """Summarize token usage, including prompt-cache reads and writes.
+
+    Args:
+        message: Response message (or merged stream chunk) from LangChain.
+
+    Returns:
+        ``input_tokens``, ``output_tokens``, ``cache_read_tokens`` and
+        ``cache_creation_tokens``; empty when the provider reported no usage.
+    """
+    usage = getattr(message, "usage_metadata", None)
+    if not usage:
+        return {}
+    details = usage.get("input_token_details") or {}
+    return {
+        "input_tokens": usage.get("input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+        "cache_read_tokens": details.get("cache_read") or 0,
+        "cache_creation_tokens": details.get("cache_creation") or 0,
+    }
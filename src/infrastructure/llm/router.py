@@ -0,0 +1,444 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, Sequence
+
+from langchain_core.messages import BaseMessage
+
+from ...domain.prompt.types import Prompt
+from ..utils import RETRYABLE_STATUS, status_code
+from .base import BaseLlm
+from .factory import LlmFactory
+
+
+def _should_failover(exc: BaseException) -> bool:
+    """Return whether another backend may succeed where this one failed.
+
+    Errors without an HTTP status (connection resets, timeouts) and
+    throttling or server errors qualify; other 4xx errors are the caller's
+    and would fail on every backend.
+    """
+    status = status_code(exc)
+    return status is None or status in RETRYABLE_STATUS
+
+
+@dataclass
+class BackendState:
+    """Health and latency bookkeeping for one routed backend.
+
+    Attributes:
+        llm: Model wrapper bound to the backend.
+        name: Label used in errors and snapshots.
+        ttft: Recent time-to-first-token samples in seconds; for
+            ``ainvoke`` the full response time. Requests cancelled after
+            losing a race are not sampled: their latency is unknown.
+        failures: Consecutive failures.
+        open_until: Monotonic time until which the circuit is open.
+        requests: Requests sent, including hedges.
+        hedges: Hedged duplicates sent to this backend.
+        wins: Races (hedged requests) this backend won.
+        losses: Requests cancelled because another backend answered first.
+        errors: Failed requests.
+    """
+
+    llm: Any
+    name: str
+    ttft: deque[float] = field(default_factory=lambda: deque(maxlen=200))
+    failures: int = 0
+    open_until: float = 0.0
+    requests: int = 0
+    hedges: int = 0
+    wins: int = 0
+    losses: int = 0
+    errors: int = 0
+
+
+class LlmRouter(BaseLlm):
+    """Route chat requests across providers or deployments.
+
+    Backends are tried in configuration order, skipping those whose circuit
+    is open. When the chosen backend has not produced its first token (its
+    full response, for ``ainvoke``) within the ``hedge_percentile`` of its
+    recent time-to-first-token, the same request is also sent to the next
+    backend. The first to answer wins and the other request is cancelled,
+    which trims the latency tail at the cost of roughly
+    ``100 - hedge_percentile`` percent extra requests.
+
+    A failing backend (network errors, 408/429/5xx) triggers failover to
+    the next one. After ``failure_threshold`` consecutive failures its
+    circuit opens for ``open_seconds``, doubling while it keeps failing,
+    up to ``max_open_seconds``. Once that period elapses the backend gets
+    a trial request, and success closes the circuit. Once a stream has
+    yielded its first chunk it is committed to its backend, and later
+    errors propagate.
+
+    Hedging applies to ``ainvoke`` and ``astream``; the blocking ``invoke``
+    and ``stream`` only fail over.
+
+    ``format_prompt`` passes the domain ``Prompt`` through, and each backend
+    formats it with its own ``format_prompt`` when the request is sent, so
+    provider prompt caching keeps working behind the router.
+
+    Attributes:
+        backends: Per-backend state, in priority order.
+        client: The router itself, which exposes the LangChain chat surface
+            (``invoke``, ``ainvoke``, ``stream``, ``astream``).
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[Any],
+        hedge_percentile: float = 95.0,
+        initial_hedge_delay: float = 2.0,
+        min_hedge_delay: float = 0.05,
+        max_hedge_delay: float = 30.0,
+        min_samples: int = 20,
+        failure_threshold: int = 3,
+        open_seconds: float = 10.0,
+        max_open_seconds: float = 120.0,
+        names: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            backends: Model wrappers exposing a LangChain ``client``.
+            hedge_percentile: Latency percentile (0-100) after which a hedge
+                is sent; None or 100 disables hedging.
+            initial_hedge_delay: Hedge delay used until ``min_samples``
+                latencies have been observed on the backend.
+            min_hedge_delay: Lower bound of the adaptive hedge delay.
+            max_hedge_delay: Upper bound of the adaptive hedge delay.
+            min_samples: Samples needed before the percentile is trusted.
+            failure_threshold: Consecutive failures that open a circuit.
+            open_seconds: Initial open period of a circuit.
+            max_open_seconds: Longest open period.
+            names: Labels of the backends; default to their class names.
+
+        Raises:
+            ValueError: If no backends are given.
+        """
+        if not backends:
+            raise ValueError("LlmRouter requires at least one backend.")
+        names = list(names or [])
+        self.backends = [
+            BackendState(llm, names[i] if i < len(names) else type(llm).__name__)
+            for i, llm in enumerate(backends)
+        ]
+        self.hedge_percentile = hedge_percentile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.min_samples = min_samples
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_providers(
+        cls, providers: Sequence[tuple[str, Any]], **kwargs: Any
+    ) -> LlmRouter:
+        """Create one model per ``(provider, config)`` pair and route across them.
+
+        Args:
+            providers: Registered ``LlmFactory`` providers with their
+                configuration objects, in priority order.
+            **kwargs: Options passed to ``LlmRouter``.
+
+        Returns:
+            The router.
+        """
+        return cls(
+            [LlmFactory.create(provider, config=config) for provider, config in providers],
+            names=[str(getattr(provider, "value", provider)) for provider, _ in providers],
+            **kwargs,
+        )
+
+    @property
+    def client(self) -> LlmRouter:
+        """Return the router, which stands in for a LangChain chat model."""
+        return self
+
+    def format_prompt(self, prompt: Prompt) -> tuple[Any, dict[str, Any]]:
+        """Defer formatting to the backend that serves the request."""
+        return prompt, {}
+
+    @staticmethod
+    def _request(llm: Any, input: Any, kwargs: dict[str, Any]) -> tuple[Any, dict[str, Any]]:
+        """Return ``llm``'s input and call options for a routed request."""
+        if not isinstance(input, Prompt):
+            return input, kwargs
+        if isinstance(llm, BaseLlm):
+            formatted, options = llm.format_prompt(input)
+        else:
+            formatted, options = input.content, {}
+        return formatted, {**options, **kwargs}
+
+    # -- Backend selection ------------------------------------------
+
+    def _order(self, exclude: set[int]) -> list[int]:
+        """Return untried backends, closed circuits first, in priority order."""
+        now = time.monotonic()
+        with self._lock:
+            candidates = [i for i in range(len(self.backends)) if i not in exclude]
+            closed = [i for i in candidates if self.backends[i].open_until <= now]
+            opened = sorted(
+                (i for i in candidates if i not in closed),
+                key=lambda i: self.backends[i].open_until,
+            )
+        return closed + opened
+
+    def hedge_delay(self, index: int) -> Optional[float]:
+        """Return how long to wait on backend ``index`` before hedging."""
+        if self.hedge_percentile is None or self.hedge_percentile >= 100:
+            return None
+        with self._lock:
+            samples = sorted(self.backends[index].ttft)
+        if len(samples) < self.min_samples:
+            delay = self.initial_hedge_delay
+        else:
+            rank = max(1, math.ceil(len(samples) * self.hedge_percentile / 100.0))
+            delay = samples[rank - 1]
+        return min(max(delay, self.min_hedge_delay), self.max_hedge_delay)
+
+    def _started(self, index: int, hedge: bool = False) -> None:
+        with self._lock:
+            state = self.backends[index]
+            state.requests += 1
+            state.hedges += hedge
+
+    def _succeeded(self, index: int, ttft: float, raced: bool = False) -> None:
+        with self._lock:
+            state = self.backends[index]
+            state.ttft.append(ttft)
+            state.failures = 0
+            state.open_until = 0.0
+            state.wins += raced
+
+    def _cancelled(self, index: int) -> None:
+        """Record a lost race.
+
+        Its latency is only known to exceed the winner's, so it is not
+        sampled: counting it would drag the percentile, hence the hedge
+        delay, down with every hedge.
+        """
+        with self._lock:
+            self.backends[index].losses += 1
+
+    def _failed(self, index: int) -> None:
+        with self._lock:
+            state = self.backends[index]
+            state.errors += 1
+            state.failures += 1
+            if state.failures >= self.failure_threshold:
+                period = min(
+                    self.open_seconds * 2 ** (state.failures - self.failure_threshold),
+                    self.max_open_seconds,
+                )
+                state.open_until = time.monotonic() + period
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return counters, circuit state and hedge delay per backend."""
+        now = time.monotonic()
+        summary: dict[str, dict[str, Any]] = {}
+        for index, state in enumerate(self.backends):
+            summary[state.name] = {
+                "requests": state.requests,
+                "hedges": state.hedges,
+                "wins": state.wins,
+                "losses": state.losses,
+                "errors": state.errors,
+                "open": state.open_until > now,
+                "hedge_delay": self.hedge_delay(index),
+            }
+        return summary
+
+    # -- Blocking surface -------------------------------------------
+
+    def _run(self, call: Callable[[Any], Any]) -> Any:
+        """Run ``call(llm)`` on backends in order until one succeeds."""
+        tried: set[int] = set()
+        while True:
+            order = self._order(tried)
+            if not order:
+                raise RuntimeError("All LLM backends failed.")
+            index = order[0]
+            tried.add(index)
+            self._started(index)
+            started = time.monotonic()
+            try:
+                result = call(self.backends[index].llm)
+            except Exception as exc:
+                if not _should_failover(exc):
+                    raise
+                self._failed(index)
+                if len(tried) == len(self.backends):
+                    raise
+                continue
+            self._succeeded(index, time.monotonic() - started)
+            return result
+
+    def invoke(self, input: Any, config: Any = None, **kwargs: Any) -> BaseMessage:
+        """Invoke the first healthy backend, failing over on errors."""
+
+        def call(llm: Any) -> BaseMessage:
+            prompt, options = self._request(llm, input, kwargs)
+            return llm.client.invoke(prompt, config, **options)
+
+        return self._run(call)
+
+    def stream(self, input: Any, config: Any = None, **kwargs: Any) -> Iterator[BaseMessage]:
+        """Stream from the first backend that yields a chunk."""
+
+        def call(llm: Any) -> tuple[Iterator[BaseMessage], Optional[BaseMessage]]:
+            prompt, options = self._request(llm, input, kwargs)
+            return self._first_chunk(llm.client.stream(prompt, config, **options))
+
+        iterator, first = self._run(call)
+        if first is None:
+            return
+        yield first
+        yield from iterator
+
+    @staticmethod
+    def _first_chunk(iterable: Any) -> tuple[Iterator[BaseMessage], Optional[BaseMessage]]:
+        iterator = iter(iterable)
+        return iterator, next(iterator, None)
+
+    # -- Hedged async surface ---------------------------------------
+
+    async def _race(
+        self,
+        start: Callable[[Any], Awaitable[Any]],
+        cleanup: Callable[[Any], Awaitable[None]],
+    ) -> Any:
+        """Run ``start(llm)`` with hedging and failover.
+
+        Args:
+            start: Coroutine factory returning the first result of a backend.
+            cleanup: Releases the result of a request that lost the race.
+
+        Returns:
+            The first successful result.
+        """
+        tried: set[int] = set()
+        pending: dict[asyncio.Future[Any], tuple[int, float]] = {}
+        last_error: Optional[BaseException] = None
+
+        def launch(hedge: bool = False) -> bool:
+            order = self._order(tried)
+            if not order:
+                return False
+            index = order[0]
+            tried.add(index)
+            self._started(index, hedge=hedge)
+            task = asyncio.ensure_future(start(self.backends[index].llm))
+            pending[task] = (index, time.monotonic())
+            return True
+
+        launch()
+        try:
+            while pending:
+                primary_index = next(iter(pending.values()))[0]
+                timeout = self.hedge_delay(primary_index) if len(pending) == 1 else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if launch(hedge=True):
+                        continue
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index, started = pending.pop(task)
+                    exc = task.exception()
+                    if exc is None:
+                        self._succeeded(index, time.monotonic() - started, raced=bool(pending))
+                        for loser, (loser_index, _) in pending.items():
+                            loser.cancel()
+                            self._cancelled(loser_index)
+                        await self._discard(pending, cleanup)
+                        pending.clear()
+                        for extra in done - {task}:
+                            if not extra.cancelled() and extra.exception() is None:
+                                await cleanup(extra.result())
+                        return task.result()
+                    if not _should_failover(exc):
+                        raise exc
+                    self._failed(index)
+                    last_error = exc
+                if not pending and not launch():
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await self._discard(pending, cleanup)
+        assert last_error is not None
+        raise last_error
+
+    @staticmethod
+    async def _discard(
+        tasks: dict[asyncio.Future[Any], Any], cleanup: Callable[[Any], Awaitable[None]]
+    ) -> None:
+        """Wait for cancelled tasks and release results that slipped through."""
+        if not tasks:
+            return
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if not isinstance(result, BaseException):
+                await cleanup(result)
+
+    async def ainvoke(self, input: Any, config: Any = None, **kwargs: Any) -> BaseMessage:
+        """Invoke with hedging and failover across backends."""
+
+        async def start(llm: Any) -> BaseMessage:
+            prompt, options = self._request(llm, input, kwargs)
+            return await llm.client.ainvoke(prompt, config, **options)
+
+        async def cleanup(result: BaseMessage) -> None:
+            return None
+
+        return await self._race(start, cleanup)
+
+    async def astream(
+        self, input: Any, config: Any = None, **kwargs: Any
+    ) -> AsyncIterator[BaseMessage]:
+        """Stream from the backend that yields the first chunk first."""
+
+        async def start(llm: Any) -> tuple[Any, Optional[BaseMessage]]:
+            prompt, options = self._request(llm, input, kwargs)
+            iterator = llm.client.astream(prompt, config, **options).__aiter__()
+            try:
+                return iterator, await iterator.__anext__()
+            except StopAsyncIteration:
+                return iterator, None
+            except BaseException:
+                await _aclose(iterator)
+                raise
+
+        async def cleanup(result: tuple[Any, Optional[BaseMessage]]) -> None:
+            await _aclose(result[0])
+
+        iterator, first = await self._race(start, cleanup)
+        try:
+            if first is None:
+                return
+            yield first
+            async for chunk in iterator:
+                yield chunk
+        finally:
+            await _aclose(iterator)
+
+
+async def _aclose(iterator: Any) -> None:
+    """Close an async iterator if it supports it."""
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        try:
+            await aclose()
+        except Exception:
+            pass
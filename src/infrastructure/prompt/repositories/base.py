@@ -1,6 +1,7 @@
 import re
 from typing import Any
 
+from src.domain.prompt.constants import CACHE_BOUNDARY
 from src.domain.prompt.protocols import PromptStorageAdapter
 from src.domain.prompt.types import Prompt, PromptTemplate
 
@@ -29,6 +30,9 @@ class BasePromptRepository:
         """
         Fetches template and replaces variables based on the configured pattern.
 
+        Text before the first ``CACHE_BOUNDARY`` marker becomes the prompt's
+        ``static_prefix``; the marker itself is removed.
+
         Args:
             template_path: Identifier for the raw template.
             variables: Data to inject into the template.
@@ -37,11 +41,21 @@ class BasePromptRepository:
             Prompt: Processed content as a Domain Entity.
         """
         raw_template: PromptTemplate = self._storage.load_template(template_path)
-        content: str = raw_template.content
+        prefix, boundary, rest = raw_template.content.partition(CACHE_BOUNDARY)
+        if not boundary:
+            prefix, rest = "", prefix
+        elif rest.startswith("\n"):
+            # A marker on its own line should not leave a blank line behind
+            rest = rest[1:]
 
         # Substitution using the compiled regex pattern
-        final_content: str = self._pattern.sub(
+        static_prefix: str = self._substitute(prefix, variables)
+        final_content: str = static_prefix + self._substitute(rest, variables)
+
+        return Prompt(content=final_content, static_prefix=static_prefix)
+
+    def _substitute(self, content: str, variables: dict[str, Any]) -> str:
+        """Replace the variables found in ``content``, leaving unknown ones."""
+        return self._pattern.sub(
             lambda m: str(variables.get(m.group(1), m.group(0))), content
         )
-
-        return Prompt(content=final_content)
@@ -0,0 +1,496 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Any, Iterator, Mapping, Optional
+
+from langchain_core.rate_limiters import BaseRateLimiter
+
+
+class Priority(IntEnum):
+    """Queueing class of a rate-limited request; lower values go first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+_PRIORITY: ContextVar[Priority] = ContextVar("rate_limit_priority", default=Priority.NORMAL)
+
+
+@contextmanager
+def rate_priority(priority: Priority) -> Iterator[None]:
+    """Queue requests made inside the block under ``priority``.
+
+    The priority follows the current context, so it also applies to
+    embedding batches sent from worker threads and to awaited tasks.
+    """
+    token = _PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNITS: dict[str, float] = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: str, now: float) -> Optional[float]:
+    """Parse a reset/retry delay into seconds.
+
+    Accepts plain seconds (``"1.5"``), Go-style durations (``"6m0s"``,
+    ``"20ms"``), RFC 3339 timestamps and HTTP dates.
+    """
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    parts = _DURATION.findall(value)
+    if parts and "".join(f"{n}{u}" for n, u in parts) == value:
+        return sum(float(n) * _UNITS[u] for n, u in parts)
+    try:
+        return max(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() - now, 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - now, 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _header_number(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                continue
+    return None
+
+
+@dataclass
+class TokenBucket:
+    """Continuously refilling budget.
+
+    Attributes:
+        capacity: Maximum level (the per-window limit).
+        rate: Refill per second.
+        level: Current budget; negative after an oversized request.
+        updated: Monotonic time of the last refill.
+    """
+
+    capacity: float
+    rate: float
+    level: float
+    updated: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def per_minute(cls, limit: float) -> TokenBucket:
+        """Return a full bucket allowing ``limit`` units per minute."""
+        return cls(capacity=limit, rate=limit / 60.0, level=limit)
+
+    def refill(self, now: float) -> None:
+        """Add the budget accrued since the last refill."""
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """Return seconds until ``amount`` (at most ``capacity``) is available."""
+        missing = min(amount, self.capacity) - self.level
+        return missing / self.rate if missing > 0 else 0.0
+
+    def resize(self, limit: float) -> None:
+        """Adopt a new per-minute ``limit``, keeping the spent budget."""
+        spent = self.capacity - self.level
+        self.capacity = limit
+        self.rate = limit / 60.0
+        self.level = limit - spent
+
+
+@dataclass
+class _KeyState:
+    """Buckets and wait queue of one ``(provider, model)``."""
+
+    requests: Optional[TokenBucket] = None
+    tokens: Optional[TokenBucket] = None
+    paused_until: float = 0.0
+    queue: list[tuple[int, int]] = field(default_factory=list)
+    waits: int = 0
+    waited: float = 0.0
+
+    def refill(self, now: float) -> None:
+        for bucket in (self.requests, self.tokens):
+            if bucket is not None:
+                bucket.refill(now)
+
+    def delay(self, tokens: float, now: float) -> float:
+        """Return seconds until a request of ``tokens`` may be sent."""
+        delays = [self.paused_until - now]
+        if self.requests is not None:
+            delays.append(self.requests.delay(1))
+        if self.tokens is not None:
+            delays.append(self.tokens.delay(tokens))
+        return max(delays)
+
+    def consume(self, tokens: float) -> None:
+        if self.requests is not None:
+            self.requests.level -= 1
+        if self.tokens is not None:
+            self.tokens.level -= tokens
+
+
+class RateLimiter:
+    """Process-wide request and token budgets per provider and model.
+
+    Each ``(provider, model)`` key has an optional requests-per-minute and
+    tokens-per-minute token bucket. Callers wait in one queue per key
+    ordered by ``Priority`` and then arrival, so requests are admitted in
+    FIFO order within a class and a large request is never overtaken by
+    later small ones. Oversized requests are admitted once the bucket is
+    full and leave it in debt.
+
+    Limits are set with ``configure`` or learned from provider rate-limit
+    headers (OpenAI/xAI ``x-ratelimit-*``, Anthropic ``anthropic-ratelimit-*``
+    and ``retry-after``), which also pull the local budget down to what the
+    provider reports as remaining. Keys without limits are not throttled.
+    """
+
+    _shared: Optional[RateLimiter] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, poll_interval: float = 0.05) -> None:
+        """Initialize a limiter without limits.
+
+        Args:
+            poll_interval: Longest sleep between admission checks, bounding
+                how late a waiter notices budget freed by header updates.
+        """
+        self.poll_interval = poll_interval
+        self._states: dict[tuple[str, str], _KeyState] = {}
+        self._learned: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._pools: set[int] = set()
+
+    @classmethod
+    def shared(cls) -> RateLimiter:
+        """Return the process-wide limiter, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _state(self, provider: str, model: str) -> _KeyState:
+        """Return the state of a key; the caller holds ``_lock``."""
+        key = (str(getattr(provider, "value", provider)), model)
+        state = self._states.get(key)
+        if state is None:
+            state = _KeyState()
+            learned = self._learned.get(model, {})
+            if "requests" in learned:
+                state.requests = TokenBucket.per_minute(learned["requests"])
+            if "tokens" in learned:
+                state.tokens = TokenBucket.per_minute(learned["tokens"])
+            self._states[key] = state
+        return state
+
+    def configure(
+        self,
+        provider: str,
+        model: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ) -> None:
+        """Set the limits of a key; None leaves that dimension unlimited."""
+        with self._lock:
+            state = self._state(provider, model)
+            state.requests = (
+                TokenBucket.per_minute(requests_per_minute) if requests_per_minute else None
+            )
+            state.tokens = (
+                TokenBucket.per_minute(tokens_per_minute) if tokens_per_minute else None
+            )
+
+    def _try(self, state: _KeyState, ticket: tuple[int, int], tokens: float) -> float:
+        """Admit ``ticket`` if it is first and the budget allows; else delay."""
+        if state.queue[0] != ticket:
+            return self.poll_interval
+        now = time.monotonic()
+        state.refill(now)
+        delay = state.delay(tokens, now)
+        if delay > 0:
+            return delay
+        heapq.heappop(state.queue)
+        state.consume(tokens)
+        return 0.0
+
+    def _enter(
+        self, provider: str, model: str, tokens: float, priority: Optional[Priority]
+    ) -> tuple[_KeyState, Optional[tuple[int, int]]]:
+        """Admit immediately when possible, otherwise enqueue a ticket."""
+        with self._lock:
+            state = self._state(provider, model)
+            if not state.queue:
+                now = time.monotonic()
+                state.refill(now)
+                if state.delay(tokens, now) <= 0:
+                    state.consume(tokens)
+                    return state, None
+            ticket = (int(_PRIORITY.get() if priority is None else priority), next(self._sequence))
+            heapq.heappush(state.queue, ticket)
+            return state, ticket
+
+    def _leave(self, state: _KeyState, ticket: tuple[int, int], waited: float) -> None:
+        """Drop a ticket that gave up and record the wait."""
+        with self._lock:
+            if ticket in state.queue:
+                state.queue.remove(ticket)
+                heapq.heapify(state.queue)
+            state.waits += 1
+            state.waited += waited
+
+    def acquire(
+        self,
+        provider: str,
+        model: str,
+        tokens: float = 0,
+        priority: Optional[Priority] = None,
+        timeout: Optional[float] = None,
+    ) -> float:
+        """Block until a request of ``tokens`` may be sent.
+
+        Args:
+            provider: Provider identifier.
+            model: Model or deployment name.
+            tokens: Estimated tokens the request consumes.
+            priority: Queueing class; defaults to the ``rate_priority``
+                of the current context.
+            timeout: Longest wait in seconds, or None to wait forever.
+
+        Returns:
+            Seconds spent waiting.
+
+        Raises:
+            TimeoutError: If the budget did not free up within ``timeout``.
+        """
+        state, ticket = self._enter(provider, model, tokens, priority)
+        if ticket is None:
+            return 0.0
+        start = time.monotonic()
+        try:
+            while True:
+                with self._lock:
+                    delay = self._try(state, ticket, tokens)
+                if delay <= 0:
+                    return time.monotonic() - start
+                if timeout is not None and time.monotonic() - start + delay > timeout:
+                    raise TimeoutError(f"Rate limit budget for {provider}/{model} not available.")
+                time.sleep(min(delay, self.poll_interval))
+        finally:
+            self._leave(state, ticket, time.monotonic() - start)
+
+    async def aacquire(
+        self,
+        provider: str,
+        model: str,
+        tokens: float = 0,
+        priority: Optional[Priority] = None,
+        timeout: Optional[float] = None,
+    ) -> float:
+        """Async counterpart of ``acquire``; waiting never blocks the loop."""
+        state, ticket = self._enter(provider, model, tokens, priority)
+        if ticket is None:
+            return 0.0
+        start = time.monotonic()
+        try:
+            while True:
+                with self._lock:
+                    delay = self._try(state, ticket, tokens)
+                if delay <= 0:
+                    return time.monotonic() - start
+                if timeout is not None and time.monotonic() - start + delay > timeout:
+                    raise TimeoutError(f"Rate limit budget for {provider}/{model} not available.")
+                await asyncio.sleep(min(delay, self.poll_interval))
+        finally:
+            self._leave(state, ticket, time.monotonic() - start)
+
+    def observe_headers(
+        self,
+        model: str,
+        headers: Mapping[str, str],
+        status: Optional[int] = None,
+        provider: Optional[str] = None,
+    ) -> None:
+        """Correct the budgets of ``model`` from a provider response.
+
+        Args:
+            model: Model or deployment the response belongs to.
+            headers: Response headers (case-insensitive mapping preferred).
+            status: HTTP status; a 429 pauses the key for ``retry-after``.
+            provider: Restrict the update to one provider's key.
+        """
+        headers = {k.lower(): v for k, v in headers.items()}
+        now = time.time()
+        observed: dict[str, tuple[Optional[float], Optional[float], Optional[float]]] = {}
+        for kind in ("requests", "tokens"):
+            limit = _header_number(
+                headers, f"x-ratelimit-limit-{kind}", f"anthropic-ratelimit-{kind}-limit"
+            )
+            remaining = _header_number(
+                headers,
+                f"x-ratelimit-remaining-{kind}",
+                f"anthropic-ratelimit-{kind}-remaining",
+            )
+            reset_value = headers.get(f"x-ratelimit-reset-{kind}") or headers.get(
+                f"anthropic-ratelimit-{kind}-reset"
+            )
+            reset = _parse_duration(reset_value, now) if reset_value else None
+            if limit is not None or remaining is not None:
+                observed[kind] = (limit, remaining, reset)
+        retry_after: Optional[float] = None
+        if "retry-after-ms" in headers:
+            retry_after = (_header_number(headers, "retry-after-ms") or 0.0) / 1000.0
+        elif "retry-after" in headers:
+            retry_after = _parse_duration(headers["retry-after"], now)
+        if not observed and retry_after is None:
+            return
+
+        with self._lock:
+            learned = self._learned.setdefault(model, {})
+            for kind, (limit, _, _) in observed.items():
+                if limit:
+                    learned[kind] = limit
+            provider_name = getattr(provider, "value", provider)
+            states = [
+                state
+                for (key_provider, key_model), state in self._states.items()
+                if key_model == model and provider_name in (None, key_provider)
+            ]
+            mono = time.monotonic()
+            for state in states:
+                state.refill(mono)
+                for kind, (limit, remaining, reset) in observed.items():
+                    bucket: Optional[TokenBucket] = getattr(state, kind)
+                    if limit:
+                        if bucket is None:
+                            bucket = TokenBucket.per_minute(limit)
+                            setattr(state, kind, bucket)
+                        elif bucket.capacity != limit:
+                            bucket.resize(limit)
+                    if bucket is not None and remaining is not None:
+                        bucket.level = min(bucket.level, remaining)
+                    if remaining == 0 and reset:
+                        state.paused_until = max(state.paused_until, mono + reset)
+                if status == 429 and retry_after is not None:
+                    state.paused_until = max(state.paused_until, mono + retry_after)
+
+    def observe_response(self, origin: str, request: Any, response: Any) -> None:
+        """``HttpClientPool`` listener feeding response headers to the limiter.
+
+        The model is read from the JSON request body or, for Azure OpenAI,
+        from the ``/deployments/<name>/`` path segment.
+        """
+        model: Optional[str] = None
+        try:
+            body = json.loads(request.content or b"{}")
+            if isinstance(body, dict) and isinstance(body.get("model"), str):
+                model = body["model"]
+        except (ValueError, RuntimeError):
+            pass
+        if model is None:
+            match = re.search(r"/deployments/([^/]+)/", request.url.path)
+            model = match.group(1) if match else None
+        if model:
+            self.observe_headers(model, response.headers, status=response.status_code)
+
+    def attach(self, pool: Any) -> None:
+        """Listen to the responses of an ``HttpClientPool`` (idempotent)."""
+        with self._lock:
+            if id(pool) in self._pools:
+                return
+            self._pools.add(id(pool))
+        pool.add_listener(self.observe_response)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the budget and queue of every key as ``provider/model``."""
+        with self._lock:
+            now = time.monotonic()
+            summary: dict[str, dict[str, Any]] = {}
+            for (provider, model), state in self._states.items():
+                state.refill(now)
+                summary[f"{provider}/{model}"] = {
+                    "requests_available": state.requests.level if state.requests else None,
+                    "tokens_available": state.tokens.level if state.tokens else None,
+                    "queued": len(state.queue),
+                    "paused_for": max(state.paused_until - now, 0.0),
+                    "waits": state.waits,
+                    "waited": state.waited,
+                }
+            return summary
+
+    def reset(self) -> None:
+        """Forget every limit, learned header value and queue."""
+        with self._lock:
+            self._states.clear()
+            self._learned.clear()
+
+
+class ChatModelRateLimiter(BaseRateLimiter):
+    """LangChain ``rate_limiter`` hook drawing from a ``RateLimiter`` key.
+
+    LangChain calls it before every chat request (``invoke``, ``stream`` and
+    their async forms) but does not pass the prompt, so each request is
+    charged ``tokens`` up front, typically the completion budget
+    (``max_tokens``), and the prompt's share is corrected from the
+    provider's remaining-tokens headers.
+    """
+
+    def __init__(
+        self, limiter: RateLimiter, provider: str, model: str, tokens: float = 0
+    ) -> None:
+        """Bind the hook to one key.
+
+        Args:
+            limiter: Limiter holding the budgets.
+            provider: Provider identifier.
+            model: Model or deployment name.
+            tokens: Tokens charged per request.
+        """
+        self.limiter = limiter
+        self.provider = provider
+        self.model = model
+        self.tokens = tokens
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """Wait for (or, when not ``blocking``, test) the key's budget."""
+        try:
+            self.limiter.acquire(
+                self.provider, self.model, self.tokens, timeout=None if blocking else 0.0
+            )
+        except TimeoutError:
+            return False
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """Async counterpart of ``acquire``."""
+        try:
+            await self.limiter.aacquire(
+                self.provider, self.model, self.tokens, timeout=None if blocking else 0.0
+            )
+        except TimeoutError:
+            return False
+        return True
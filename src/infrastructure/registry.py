@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import importlib
+from importlib.metadata import entry_points
+from typing import Any, Callable, Mapping, MutableMapping, Optional
+
+
+def import_target(target: str, package: Optional[str] = None) -> Any:
+    """Import ``"module[:attribute]"`` and return the module or attribute.
+
+    Args:
+        target: Module path, relative to ``package`` when it starts with a
+            dot, optionally followed by ``:`` and an attribute name.
+        package: Anchor for relative module paths.
+
+    Returns:
+        The imported module, or its attribute when one is named.
+    """
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name, package)
+    return getattr(module, attribute) if attribute else module
+
+
+def load_provider(
+    registry: MutableMapping[str, type],
+    modules: Mapping[str, str],
+    provider: str,
+    group: str,
+    package: Optional[str] = None,
+) -> Optional[type]:
+    """Return the class registered for ``provider``, importing it on demand.
+
+    Adapter modules register themselves with their factory's ``register``
+    decorator when imported, so importing the module named in ``modules``
+    is enough. Unknown providers are looked up among the installed
+    distributions' entry points of ``group``, whose object is either an
+    adapter class (registered here) or a module registering itself.
+
+    Args:
+        registry: The factory's provider-to-class registry.
+        modules: Provider names mapped to ``"module[:Class]"`` targets.
+        provider: Requested provider.
+        group: Entry-point group searched for third-party providers.
+        package: Anchor for relative module paths in ``modules``.
+
+    Returns:
+        The adapter class, or None if no source provides it.
+    """
+    if provider in registry:
+        return registry[provider]
+    target = modules.get(provider)
+    if target is not None:
+        loaded = import_target(target, package)
+    else:
+        name = getattr(provider, "value", provider)
+        found = [ep for ep in entry_points(group=group) if ep.name == name]
+        if not found:
+            return None
+        loaded = found[0].load()
+    if isinstance(loaded, type):
+        registry.setdefault(provider, loaded)
+    return registry.get(provider)
+
+
+def available_providers(
+    registry: Mapping[str, type], modules: Mapping[str, str], group: str
+) -> list[str]:
+    """Return every provider name a factory can create, without importing any."""
+    names = {str(getattr(key, "value", key)) for key in (*registry, *modules)}
+    names.update(ep.name for ep in entry_points(group=group))
+    return sorted(names)
+
+
+def lazy_exports(module_name: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` importing submodules on first access.
+
+    Args:
+        module_name: ``__name__`` of the package defining ``__getattr__``.
+        exports: Public names mapped to the relative submodule defining them.
+
+    Returns:
+        The ``__getattr__`` function (PEP 562).
+    """
+    module = importlib.import_module(module_name)
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, module_name), name)
+        setattr(module, name, value)
+        return value
+
+    return __getattr__
@@ -1,6 +1,9 @@
 from dataclasses import asdict, is_dataclass
 from typing import Any, Optional
 
+# HTTP statuses worth retrying elsewhere: timeouts, throttling, server errors.
+RETRYABLE_STATUS: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504})
+
 
 def _config_to_dict(config: Optional[Any]) -> dict[str, Any]:
     """Convert supported config shapes into a dictionary."""
@@ -62,4 +65,43 @@ def resolve_parameters(
         if allowed_keys is None or mapped_key in allowed_keys:
             final_params[mapped_key] = value
 
-    return final_params
\ No newline at end of file
+    return final_params
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of ``text`` without a tokenizer.
+
+    Uses the common heuristic of roughly four characters per token, which
+    is close enough for batching and rate-limiting decisions.
+
+    Args:
+        text: Input text.
+
+    Returns:
+        Estimated number of tokens (at least 1).
+    """
+    return len(text) // 4 + 1
+
+
+def status_code(exc: BaseException) -> Optional[int]:
+    """Extract the HTTP status code carried by a provider SDK exception.
+
+    Args:
+        exc: Exception raised by a provider client.
+
+    Returns:
+        The status code, or None for errors without an HTTP response
+        (connection failures, timeouts, client-side errors).
+    """
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        return status
+    if isinstance(response, dict):
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if isinstance(status, int):
+            return status
+    return None
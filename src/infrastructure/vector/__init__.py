@@ -1,20 +1,43 @@
 """Infrastructure layer for vector database integrations."""
 
-from .adapters import (
-    CosmosDBVectorDatabase,
-    MilvusVectorDatabase,
-    MongoDBVectorDatabase,
-    OpenSearchVectorDatabase,
-    PineconeVectorDatabase,
-    QdrantVectorDatabase,
-    VertexDBVectorDatabase,
-)
+from typing import TYPE_CHECKING
+
+from ..registry import lazy_exports
 from .base import BaseVectorDatabase
 from .factory import VectorDBFactory
+from .quantization import QuantizedIndex, QuantizedVectorDatabase, ScalarQuantizer
+
+if TYPE_CHECKING:
+    from .adapters import (
+        CosmosDBVectorDatabase,
+        MilvusVectorDatabase,
+        MongoDBVectorDatabase,
+        OpenSearchVectorDatabase,
+        PineconeVectorDatabase,
+        QdrantVectorDatabase,
+        VertexDBVectorDatabase,
+    )
+
+# Adapters import their provider SDK, so each is loaded on first access.
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "CosmosDBVectorDatabase": ".adapters",
+        "MilvusVectorDatabase": ".adapters",
+        "MongoDBVectorDatabase": ".adapters",
+        "OpenSearchVectorDatabase": ".adapters",
+        "PineconeVectorDatabase": ".adapters",
+        "QdrantVectorDatabase": ".adapters",
+        "VertexDBVectorDatabase": ".adapters",
+    },
+)
 
 __all__ = [
     "BaseVectorDatabase",
     "VectorDBFactory",
+    "QuantizedIndex",
+    "QuantizedVectorDatabase",
+    "ScalarQuantizer",
     "CosmosDBVectorDatabase",
     "MilvusVectorDatabase",
     "MongoDBVectorDatabase",
@@ -1,12 +1,30 @@
 """Vector database adapters for various providers."""
 
-from .cosmos_db import CosmosDBVectorDatabase
-from .milvus_db import MilvusVectorDatabase
-from .mongo_db import MongoDBVectorDatabase
-from .opensearch_db import OpenSearchVectorDatabase
-from .pinecone_db import PineconeVectorDatabase
-from .qdrant_db import QdrantVectorDatabase
-from .vertex_db import VertexDBVectorDatabase
+from typing import TYPE_CHECKING
+
+from ...registry import lazy_exports
+
+if TYPE_CHECKING:
+    from .cosmos_db import CosmosDBVectorDatabase
+    from .milvus_db import MilvusVectorDatabase
+    from .mongo_db import MongoDBVectorDatabase
+    from .opensearch_db import OpenSearchVectorDatabase
+    from .pinecone_db import PineconeVectorDatabase
+    from .qdrant_db import QdrantVectorDatabase
+    from .vertex_db import VertexDBVectorDatabase
+
+# Adapters import their provider SDK, so each is loaded on first access.
+_EXPORTS: dict[str, str] = {
+    "CosmosDBVectorDatabase": ".cosmos_db",
+    "MilvusVectorDatabase": ".milvus_db",
+    "MongoDBVectorDatabase": ".mongo_db",
+    "OpenSearchVectorDatabase": ".opensearch_db",
+    "PineconeVectorDatabase": ".pinecone_db",
+    "QdrantVectorDatabase": ".qdrant_db",
+    "VertexDBVectorDatabase": ".vertex_db",
+}
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "CosmosDBVectorDatabase",
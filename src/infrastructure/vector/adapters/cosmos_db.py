@@ -7,6 +7,7 @@ from ....domain.vector import (
     COSMOS_PARAM_MAP,
     CollectionConfig,
     VectorRecord,
+    VectorRecordDTO,
     VectorSearchResultDTO as VectorSearchResult,
     VectorDBConfig,
     VectorDBProvider,
@@ -306,6 +307,32 @@ class CosmosDBVectorDatabase(BaseVectorDatabase):
             )
         return sorted(scored, key=lambda hit: hit.score, reverse=True)[:limit]
 
+    def fetch(
+        self,
+        collection_name: str,
+        ids: list[str],
+        **kwargs: Any,
+    ) -> list[VectorRecord]:
+        """Fetch items by IDs from a Cosmos DB container."""
+        if not ids:
+            return []
+        db = self._get_database()
+        container = db.get_container_client(collection_name)
+        items = container.query_items(
+            query="SELECT c.id, c.vector, c.payload FROM c WHERE ARRAY_CONTAINS(@ids, c.id)",
+            parameters=[{"name": "@ids", "value": list(ids)}],
+            enable_cross_partition_query=True,
+            **kwargs,
+        )
+        return [
+            VectorRecordDTO(
+                id=str(item.get("id", "")),
+                vector=list(item.get("vector") or []),
+                payload=dict(item.get("payload", {}) or {}),
+            )
+            for item in items
+        ]
+
     def delete(
         self,
         collection_name: str,
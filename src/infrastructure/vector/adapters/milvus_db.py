@@ -1,12 +1,14 @@
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
-from pymilvus import MilvusClient
+from pymilvus import DataType, MilvusClient
 
 from ....domain.vector import (
     MILVUS_PARAM_MAP,
     CollectionConfig,
     DistanceMetric,
+    QuantizationType,
     VectorRecord,
+    VectorRecordDTO,
     VectorSearchResultDTO as VectorSearchResult,
     VectorDBConfig,
     VectorDBProvider,
@@ -14,6 +16,7 @@ from ....domain.vector import (
 from ...utils import resolve_parameters
 from ..base import BaseVectorDatabase
 from ..factory import VectorDBFactory
+from ..quantization import DEFAULT_OVERSAMPLING
 
 MILVUS_ALLOWED_KEYS: set[str] = {
     "uri",
@@ -28,6 +31,19 @@ _METRIC_MAP: dict[DistanceMetric, str] = {
     DistanceMetric.DOT_PRODUCT: "IP",
 }
 
+# Index type and build parameters per quantization scheme. Both refine
+# their candidates on stored higher-precision data (``refine_k``).
+_QUANTIZED_INDEXES: dict[str, tuple[str, dict[str, Any]]] = {
+    QuantizationType.SCALAR: (
+        "HNSW_SQ",
+        {"sq_type": "SQ8", "refine": True, "refine_type": "FP32"},
+    ),
+    QuantizationType.BINARY: (
+        "IVF_RABITQ",
+        {"nlist": 128, "refine": True, "refine_type": "FP32"},
+    ),
+}
+
 
 @VectorDBFactory.register(VectorDBProvider.MILVUS)
 class MilvusVectorDatabase(BaseVectorDatabase):
@@ -40,8 +56,13 @@ class MilvusVectorDatabase(BaseVectorDatabase):
         - uri: Connection URI string (alternative to host:port).
         - username / password: Authentication credentials.
         - timeout: Connection timeout in seconds (default: 60).
+
+    Quantized collections are created with an explicit schema (VARCHAR
+    ``id``, float ``vector``, dynamic payload fields) and a quantized index.
     """
 
+    _NATIVE_QUANTIZATION = frozenset(QuantizationType)
+
     def __init__(
         self,
         config: Optional[VectorDBConfig] = None,
@@ -151,6 +172,8 @@ class MilvusVectorDatabase(BaseVectorDatabase):
                 config.metric, "COSINE"
             )
         params.update(config.kwargs)
+        if config.quantization:
+            params = self._quantized_collection_params(config)
         try:
             self.client.create_collection(**params)
         except Exception as exc:
@@ -158,6 +181,37 @@ class MilvusVectorDatabase(BaseVectorDatabase):
                 f"Failed to create Milvus collection "
                 f"'{config.name}': {exc}"
             ) from exc
+        if config.quantization:
+            self._quantized[config.name] = config
+
+    def _quantized_collection_params(self, config: CollectionConfig) -> dict[str, Any]:
+        """Build ``create_collection`` arguments with a quantized index."""
+        if config.dimension is None:
+            raise RuntimeError(
+                "Milvus quantized collections require CollectionConfig.dimension."
+            )
+        extra = dict(config.kwargs)
+        schema = self.client.create_schema(
+            auto_id=False, enable_dynamic_field=extra.pop("enable_dynamic_field", True)
+        )
+        schema.add_field(
+            "id", DataType.VARCHAR, is_primary=True, max_length=extra.pop("max_length", 512)
+        )
+        schema.add_field("vector", DataType.FLOAT_VECTOR, dim=config.dimension)
+        index_type, index_params = _QUANTIZED_INDEXES[config.quantization]
+        indexes = self.client.prepare_index_params()
+        indexes.add_index(
+            field_name="vector",
+            index_type=index_type,
+            metric_type=_METRIC_MAP.get(config.metric or DistanceMetric.COSINE, "COSINE"),
+            params=dict(index_params),
+        )
+        return {
+            "collection_name": config.name,
+            "schema": schema,
+            "index_params": indexes,
+            **extra,
+        }
 
     def delete_collection(self, name: str) -> None:
         """Delete a Milvus collection.
@@ -214,6 +268,25 @@ class MilvusVectorDatabase(BaseVectorDatabase):
             **kwargs,
         )
 
+    def upsert_matrix(
+        self,
+        collection_name: str,
+        ids: list[str],
+        matrix: Any,
+        payloads: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> None:
+        """Upsert rows whose vectors are views into a float32 matrix."""
+        rows = [
+            {"id": record_id, "vector": row, **payload}
+            for record_id, row, payload in zip(ids, matrix, payloads)
+        ]
+        self.client.upsert(
+            collection_name=collection_name,
+            data=rows,
+            **kwargs,
+        )
+
     def search(
         self,
         collection_name: str,
@@ -222,6 +295,14 @@ class MilvusVectorDatabase(BaseVectorDatabase):
         **kwargs: Any,
     ) -> list[VectorSearchResult]:
         """Run similarity search against a Milvus collection."""
+        quantized = self._quantized.get(collection_name)
+        if quantized is not None and "search_params" not in kwargs:
+            kwargs["search_params"] = {
+                "params": {
+                    "refine_k": quantized.oversampling
+                    or DEFAULT_OVERSAMPLING[quantized.quantization]
+                }
+            }
         response = self.client.search(
             collection_name=collection_name,
             data=[query_vector],
@@ -256,3 +337,39 @@ class MilvusVectorDatabase(BaseVectorDatabase):
             ids=ids,
             **kwargs,
         )
+
+    def scroll(
+        self,
+        collection_name: str,
+        batch_size: int = 100,
+        **kwargs: Any,
+    ) -> Iterator[list[VectorRecord]]:
+        """Iterate over all rows of a Milvus collection in batches."""
+        iterator = self.client.query_iterator(
+            collection_name=collection_name,
+            batch_size=batch_size,
+            output_fields=kwargs.pop("output_fields", ["*"]),
+            **kwargs,
+        )
+        try:
+            while True:
+                rows = iterator.next()
+                if not rows:
+                    break
+                yield [
+                    VectorRecordDTO(
+                        id=str(row.get("id", "")),
+                        vector=list(row.get("vector") or []),
+                        payload={
+                            k: v for k, v in row.items() if k not in {"id", "vector"}
+                        },
+                    )
+                    for row in rows
+                ]
+        finally:
+            iterator.close()
+
+    def count(self, collection_name: str) -> int:
+        """Return the number of rows in a Milvus collection."""
+        stats = self.client.get_collection_stats(collection_name=collection_name)
+        return int(stats.get("row_count", 0))
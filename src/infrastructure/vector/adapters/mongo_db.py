@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from pymongo import MongoClient
 from pymongo.operations import SearchIndexModel
@@ -8,6 +8,7 @@ from ....domain.vector import (
     CollectionConfig,
     DistanceMetric,
     VectorRecord,
+    VectorRecordDTO,
     VectorSearchResultDTO as VectorSearchResult,
     VectorDBConfig,
     VectorDBProvider,
@@ -335,3 +336,47 @@ class MongoDBVectorDatabase(BaseVectorDatabase):
         db = self._get_database()
         collection = db[collection_name]
         collection.delete_many({"_id": {"$in": ids}}, **kwargs)
+
+    def fetch(
+        self,
+        collection_name: str,
+        ids: list[str],
+        **kwargs: Any,
+    ) -> list[VectorRecord]:
+        """Fetch documents by IDs from a MongoDB collection."""
+        collection = self._get_database()[collection_name]
+        return [
+            VectorRecordDTO(
+                id=str(doc.get("_id", "")),
+                vector=list(doc.get("vector") or []),
+                payload=dict(doc.get("payload", {}) or {}),
+            )
+            for doc in collection.find({"_id": {"$in": list(ids)}}, **kwargs)
+        ]
+
+    def scroll(
+        self,
+        collection_name: str,
+        batch_size: int = 100,
+        **kwargs: Any,
+    ) -> Iterator[list[VectorRecord]]:
+        """Iterate over all documents of a MongoDB collection in batches."""
+        collection = self._get_database()[collection_name]
+        batch: list[VectorRecord] = []
+        for doc in collection.find({}, batch_size=batch_size, **kwargs):
+            batch.append(
+                VectorRecordDTO(
+                    id=str(doc.get("_id", "")),
+                    vector=list(doc.get("vector") or []),
+                    payload=dict(doc.get("payload", {}) or {}),
+                )
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def count(self, collection_name: str) -> int:
+        """Return the number of documents in a MongoDB collection."""
+        return int(self._get_database()[collection_name].count_documents({}))
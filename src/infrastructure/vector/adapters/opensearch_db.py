@@ -1,10 +1,15 @@
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
+import numpy as np
 from opensearchpy import OpenSearch
 
 from ....domain.vector import (
     CollectionConfig,
+    CollectionConfigDTO,
+    DistanceMetric,
+    QuantizationType,
     VectorRecord,
+    VectorRecordDTO,
     VectorSearchResultDTO as VectorSearchResult,
     VectorDBConfig,
     VectorDBProvider,
@@ -12,6 +17,14 @@ from ....domain.vector import (
 from ...utils import resolve_parameters
 from ..base import BaseVectorDatabase
 from ..factory import VectorDBFactory
+from ..quantization import (
+    DEFAULT_CALIBRATION_SIZE,
+    ScalarQuantizer,
+    binarize,
+    exact_scores,
+    oversampled_limit,
+    rank,
+)
 
 OPENSEARCH_ALLOWED_KEYS: set[str] = {
     "hosts",
@@ -21,6 +34,15 @@ OPENSEARCH_ALLOWED_KEYS: set[str] = {
     "use_ssl",
 }
 
+_SPACE_TYPES: dict[str, str] = {
+    DistanceMetric.COSINE: "cosinesimil",
+    DistanceMetric.EUCLIDEAN: "l2",
+    DistanceMetric.DOT_PRODUCT: "innerproduct",
+}
+
+# Documents of an int8 index stored before its ranges were calibrated.
+_UNCALIBRATED_QUERY: dict[str, Any] = {"bool": {"must_not": {"exists": {"field": "vector"}}}}
+
 
 @VectorDBFactory.register(VectorDBProvider.OPENSEARCH)
 class OpenSearchVectorDatabase(BaseVectorDatabase):
@@ -34,8 +56,18 @@ class OpenSearchVectorDatabase(BaseVectorDatabase):
         - verify_certs: Verify SSL certificates (default: True).
         - timeout: Connection timeout in seconds.
         - url: Full connection URL (alternative to host:port).
+
+    Quantized indexes store int8 (``byte``) or packed-bit (``binary``) knn
+    vectors plus the original floats in an unindexed ``source_vector``
+    field. Searches fetch ``limit x oversampling`` candidates and rescore
+    them on the originals. Int8 indexes store ``source_vector`` only until
+    ``calibration_size`` documents exist (and search them exactly); the
+    ranges are then fitted on those documents, kept in the index ``_meta``
+    so every client encodes identically, and the documents are encoded.
     """
 
+    _NATIVE_QUANTIZATION = frozenset(QuantizationType)
+
     def __init__(
         self,
         config: Optional[VectorDBConfig] = None,
@@ -112,6 +144,7 @@ class OpenSearchVectorDatabase(BaseVectorDatabase):
             params["basic_auth"] = (cfg_username, cfg_password)
 
         self.client = OpenSearch(**params)
+        self._quantizers: dict[str, ScalarQuantizer] = {}
 
     # -- Connection --------------------------------------------------
 
@@ -162,7 +195,10 @@ class OpenSearchVectorDatabase(BaseVectorDatabase):
         extra: dict[str, Any] = dict(config.kwargs)
         body: dict[str, Any] = extra.pop("body", {})
 
-        if config.dimension is not None and "mappings" not in body:
+        if config.quantization and config.dimension is not None and "mappings" not in body:
+            body.setdefault("settings", {}).setdefault("index", {})["knn"] = True
+            body["mappings"] = self._quantized_mappings(config)
+        elif config.dimension is not None and "mappings" not in body:
             space_type = config.metric or "cosinesimil"
             body.setdefault("settings", {}).setdefault(
                 "index", {}
@@ -192,6 +228,108 @@ class OpenSearchVectorDatabase(BaseVectorDatabase):
                 f"Failed to create OpenSearch index "
                 f"'{config.name}': {exc}"
             ) from exc
+        if config.quantization:
+            self._quantized[config.name] = config
+
+    @staticmethod
+    def _quantization_meta(config: CollectionConfig) -> dict[str, Any]:
+        """Return the ``_meta`` entry describing a quantized index."""
+        return {
+            "type": str(QuantizationType(config.quantization).value),
+            "metric": config.metric,
+            "quantile": config.quantile,
+            "calibration_size": config.calibration_size,
+            "oversampling": config.oversampling,
+        }
+
+    def _quantized_mappings(self, config: CollectionConfig) -> dict[str, Any]:
+        """Build the mappings of a byte or binary knn index."""
+        if config.quantization == QuantizationType.BINARY:
+            vector = {
+                "type": "knn_vector",
+                "dimension": config.dimension,
+                "data_type": "binary",
+                "method": {"name": "hnsw", "space_type": "hamming", "engine": "faiss"},
+            }
+        else:
+            vector = {
+                "type": "knn_vector",
+                "dimension": config.dimension,
+                "data_type": "byte",
+                "method": {
+                    "name": "hnsw",
+                    "space_type": _SPACE_TYPES.get(
+                        config.metric or DistanceMetric.COSINE, "cosinesimil"
+                    ),
+                    "engine": "lucene",
+                },
+            }
+        return {
+            "_meta": {"quantization": self._quantization_meta(config)},
+            "properties": {
+                "vector": vector,
+                "source_vector": {"type": "float", "index": False, "doc_values": False},
+            },
+        }
+
+    def _collection_quantization(self, name: str) -> Optional[CollectionConfig]:
+        """Return the quantization of index ``name``, reading its ``_meta``."""
+        if name in self._quantized:
+            return self._quantized[name]
+        try:
+            mappings = self.client.indices.get_mapping(index=name)
+        except Exception:
+            return None
+        mapping = next(iter(mappings.values()), {}).get("mappings", {})
+        meta = mapping.get("_meta", {}).get("quantization")
+        if not meta:
+            return None
+        config = CollectionConfigDTO(
+            name=name,
+            metric=meta.get("metric"),
+            quantization=meta["type"],
+            quantile=meta.get("quantile"),
+            calibration_size=meta.get("calibration_size"),
+            oversampling=meta.get("oversampling"),
+        )
+        if meta.get("calibration"):
+            self._quantizers[name] = ScalarQuantizer.from_dict(meta["calibration"])
+        self._quantized[name] = config
+        return config
+
+    def _encode(self, config: CollectionConfig, matrix: np.ndarray) -> Optional[np.ndarray]:
+        """Quantize vectors for ``config``'s index.
+
+        Returns None for an int8 index whose ranges are not calibrated yet.
+        """
+        if config.quantization == QuantizationType.BINARY:
+            return binarize(matrix).view(np.int8)
+        quantizer = self._quantizers.get(config.name)
+        return None if quantizer is None else quantizer.encode(matrix)
+
+    def _calibrate(self, config: CollectionConfig, **kwargs: Any) -> None:
+        """Calibrate an int8 index once it holds ``calibration_size`` documents.
+
+        The ranges are fitted on every document stored so far, saved in the
+        index ``_meta`` and used to encode those documents.
+        """
+        count = self.client.count(index=config.name, body={"query": _UNCALIBRATED_QUERY})
+        if int(count.get("count", 0)) < (config.calibration_size or DEFAULT_CALIBRATION_SIZE):
+            return
+        hits = [
+            hit
+            for batch in self._scroll_hits(config.name, _UNCALIBRATED_QUERY, ["source_vector"])
+            for hit in batch
+        ]
+        matrix = np.asarray([hit["_source"]["source_vector"] for hit in hits], dtype=np.float32)
+        quantizer = ScalarQuantizer.fit(matrix, config.quantile or 0.99)
+        meta = {**self._quantization_meta(config), "calibration": quantizer.to_dict()}
+        self.client.indices.put_mapping(index=config.name, body={"_meta": {"quantization": meta}})
+        self._quantizers[config.name] = quantizer
+        for hit, codes in zip(hits, quantizer.encode(matrix)):
+            self.client.update(
+                index=config.name, id=hit["_id"], body={"doc": {"vector": codes.tolist()}}, **kwargs
+            )
 
     def delete_collection(self, name: str) -> None:
         """Delete an OpenSearch index.
@@ -242,17 +380,32 @@ class OpenSearchVectorDatabase(BaseVectorDatabase):
     ) -> None:
         """Insert or update vector records in an OpenSearch index."""
         refresh = kwargs.pop("refresh", True)
-        for record in records:
+        quantized = self._collection_quantization(collection_name)
+        codes: Optional[np.ndarray] = None
+        if quantized is not None and records:
+            codes = self._encode(
+                quantized,
+                np.asarray([record.vector for record in records], dtype=np.float32),
+            )
+        for position, record in enumerate(records):
+            body: dict[str, Any] = {
+                "vector": record.vector,
+                "payload": record.payload,
+            }
+            if quantized is not None:
+                body.pop("vector")
+                if codes is not None:
+                    body["vector"] = codes[position].tolist()
+                body["source_vector"] = list(record.vector)
             self.client.index(
                 index=collection_name,
                 id=record.id,
-                body={
-                    "vector": record.vector,
-                    "payload": record.payload,
-                },
+                body=body,
                 refresh=refresh,
                 **kwargs,
             )
+        if quantized is not None and records and codes is None:
+            self._calibrate(quantized, refresh=refresh, **kwargs)
 
     def search(
         self,
@@ -262,6 +415,11 @@ class OpenSearchVectorDatabase(BaseVectorDatabase):
         **kwargs: Any,
     ) -> list[VectorSearchResult]:
         """Run similarity search against an OpenSearch index."""
+        quantized = self._collection_quantization(collection_name)
+        if quantized is not None and "body" not in kwargs:
+            return self._search_quantized(
+                quantized, query_vector, limit, **kwargs
+            )
         body = kwargs.pop(
             "body",
             {
@@ -291,6 +449,54 @@ class OpenSearchVectorDatabase(BaseVectorDatabase):
             for hit in hits
         ]
 
+    def _search_quantized(
+        self,
+        config: CollectionConfig,
+        query_vector: list[float],
+        limit: int,
+        **kwargs: Any,
+    ) -> list[VectorSearchResult]:
+        """Search the quantized field, then rescore on ``source_vector``."""
+        query = np.asarray([query_vector], dtype=np.float32)
+        codes = self._encode(config, query)
+        if codes is None:
+            # Not calibrated yet: the few stored documents are scanned exactly.
+            hits = [
+                hit
+                for batch in self._scroll_hits(
+                    config.name, _UNCALIBRATED_QUERY, ["payload", "source_vector"]
+                )
+                for hit in batch
+            ]
+        else:
+            candidates = oversampled_limit(limit, config)
+            response = self.client.search(
+                index=config.name,
+                body={
+                    "size": candidates,
+                    "_source": ["payload", "source_vector"],
+                    "query": {
+                        "knn": {"vector": {"vector": codes[0].tolist(), "k": candidates}}
+                    },
+                },
+                **kwargs,
+            )
+            hits = response.get("hits", {}).get("hits", [])
+        hits = [hit for hit in hits if hit.get("_source", {}).get("source_vector")]
+        if not hits:
+            return []
+        scores = exact_scores(
+            query[0], [hit["_source"]["source_vector"] for hit in hits], config.metric
+        )
+        return [
+            VectorSearchResult(
+                id=str(hits[i].get("_id", "")),
+                score=float(scores[i]),
+                payload=dict(hits[i]["_source"].get("payload", {}) or {}),
+            )
+            for i in rank(scores, limit, config.metric)
+        ]
+
     def delete(
         self,
         collection_name: str,
@@ -306,3 +512,57 @@ class OpenSearchVectorDatabase(BaseVectorDatabase):
                 refresh=refresh,
                 **kwargs,
             )
+
+    def scroll(
+        self,
+        collection_name: str,
+        batch_size: int = 100,
+        **kwargs: Any,
+    ) -> Iterator[list[VectorRecord]]:
+        """Iterate over all documents of an OpenSearch index in batches."""
+        for hits in self._scroll_hits(
+            collection_name, {"match_all": {}}, batch_size=batch_size, **kwargs
+        ):
+            yield [
+                VectorRecordDTO(
+                    id=str(hit.get("_id", "")),
+                    vector=list(
+                        hit.get("_source", {}).get("source_vector")
+                        or hit.get("_source", {}).get("vector")
+                        or []
+                    ),
+                    payload=dict(hit.get("_source", {}).get("payload", {}) or {}),
+                )
+                for hit in hits
+            ]
+
+    def _scroll_hits(
+        self,
+        index: str,
+        query: dict[str, Any],
+        source: Optional[list[str]] = None,
+        batch_size: int = 500,
+        **kwargs: Any,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Iterate over the raw hits of ``query`` with the scroll API."""
+        keep_alive = kwargs.pop("scroll", "2m")
+        body: dict[str, Any] = {"size": batch_size, "query": query}
+        if source is not None:
+            body["_source"] = source
+        response = self.client.search(index=index, body=body, scroll=keep_alive, **kwargs)
+        scroll_id = response.get("_scroll_id")
+        try:
+            while True:
+                hits = response.get("hits", {}).get("hits", [])
+                if not hits:
+                    break
+                yield hits
+                response = self.client.scroll(scroll_id=scroll_id, scroll=keep_alive)
+                scroll_id = response.get("_scroll_id", scroll_id)
+        finally:
+            if scroll_id:
+                self.client.clear_scroll(scroll_id=scroll_id)
+
+    def count(self, collection_name: str) -> int:
+        """Return the number of documents in an OpenSearch index."""
+        return int(self.client.count(index=collection_name).get("count", 0))
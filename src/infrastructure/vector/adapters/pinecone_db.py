@@ -5,6 +5,7 @@ from pinecone import Pinecone, ServerlessSpec
 from ....domain.vector import (
     CollectionConfig,
     VectorRecord,
+    VectorRecordDTO,
     VectorSearchResultDTO as VectorSearchResult,
     VectorDBConfig,
     VectorDBProvider,
@@ -206,6 +207,18 @@ class PineconeVectorDatabase(BaseVectorDatabase):
         index = self._get_index(collection_name)
         index.upsert(vectors=vectors, **kwargs)
 
+    def upsert_matrix(
+        self,
+        collection_name: str,
+        ids: list[str],
+        matrix: Any,
+        payloads: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> None:
+        """Upsert vectors given as row views into a float32 matrix."""
+        index = self._get_index(collection_name)
+        index.upsert(vectors=list(zip(ids, matrix, payloads)), **kwargs)
+
     def search(
         self,
         collection_name: str,
@@ -236,6 +249,36 @@ class PineconeVectorDatabase(BaseVectorDatabase):
             for match in matches
         ]
 
+    def fetch(
+        self,
+        collection_name: str,
+        ids: list[str],
+        **kwargs: Any,
+    ) -> list[VectorRecord]:
+        """Fetch vectors and metadata by IDs from a Pinecone index."""
+        if not ids:
+            return []
+        index = self._get_index(collection_name)
+        response = index.fetch(ids=ids, **kwargs)
+        vectors = getattr(response, "vectors", None)
+        if vectors is None and isinstance(response, dict):
+            vectors = response.get("vectors", {})
+        records: list[VectorRecord] = []
+        for record_id, vector in (vectors or {}).items():
+            values = getattr(vector, "values", None)
+            metadata = getattr(vector, "metadata", None)
+            if isinstance(vector, dict):
+                values = vector.get("values")
+                metadata = vector.get("metadata")
+            records.append(
+                VectorRecordDTO(
+                    id=str(record_id),
+                    vector=list(values or []),
+                    payload=dict(metadata or {}),
+                )
+            )
+        return records
+
     def delete(
         self,
         collection_name: str,
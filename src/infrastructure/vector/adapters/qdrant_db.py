@@ -1,13 +1,27 @@
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from uuid import NAMESPACE_URL, UUID, uuid5
 
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointIdsList, PointStruct, VectorParams
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Distance,
+    PointIdsList,
+    PointStruct,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+)
 
 from ....domain.vector import (
     CollectionConfig,
     DistanceMetric,
+    QuantizationType,
     VectorRecord,
+    VectorRecordDTO,
     VectorSearchResultDTO as VectorSearchResult,
     VectorDBConfig,
     VectorDBProvider,
@@ -15,6 +29,7 @@ from ....domain.vector import (
 from ...utils import resolve_parameters
 from ..base import BaseVectorDatabase
 from ..factory import VectorDBFactory
+from ..quantization import DEFAULT_OVERSAMPLING
 
 QDRANT_ALLOWED_KEYS: set[str] = {
     "url",
@@ -50,8 +65,13 @@ class QdrantVectorDatabase(BaseVectorDatabase):
         - prefix: URL path prefix.
         - timeout: Request timeout in seconds.
         - path: Path for in-memory / persisted local mode.
+
+    Quantized collections keep their codes in RAM and the original vectors
+    for rescoring, which Qdrant applies with the configured oversampling.
     """
 
+    _NATIVE_QUANTIZATION = frozenset(QuantizationType)
+
     def __init__(
         self,
         config: Optional[VectorDBConfig] = None,
@@ -174,6 +194,22 @@ class QdrantVectorDatabase(BaseVectorDatabase):
             distance=distance,
         )
         extra: dict[str, Any] = dict(config.kwargs)
+        if config.quantization == QuantizationType.SCALAR:
+            extra.setdefault(
+                "quantization_config",
+                ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8,
+                        quantile=config.quantile,
+                        always_ram=True,
+                    )
+                ),
+            )
+        elif config.quantization == QuantizationType.BINARY:
+            extra.setdefault(
+                "quantization_config",
+                BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True)),
+            )
         try:
             self.client.create_collection(
                 collection_name=config.name,
@@ -185,6 +221,8 @@ class QdrantVectorDatabase(BaseVectorDatabase):
                 f"Failed to create Qdrant collection "
                 f"'{config.name}': {exc}"
             ) from exc
+        if config.quantization:
+            self._quantized[config.name] = config
 
     def delete_collection(self, name: str) -> None:
         """Delete a Qdrant collection.
@@ -248,6 +286,25 @@ class QdrantVectorDatabase(BaseVectorDatabase):
             **kwargs,
         )
 
+    def upsert_matrix(
+        self,
+        collection_name: str,
+        ids: list[str],
+        matrix: Any,
+        payloads: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> None:
+        """Upload a float32 matrix through Qdrant's array-aware uploader."""
+        kwargs.setdefault("wait", True)
+        point_ids = [self._coerce_point_id(record_id) for record_id in ids]
+        self.client.upload_collection(
+            collection_name=collection_name,
+            vectors=matrix,
+            payload=payloads,
+            ids=[p if isinstance(p, int) else str(p) for p in point_ids],
+            **kwargs,
+        )
+
     def search(
         self,
         collection_name: str,
@@ -256,6 +313,15 @@ class QdrantVectorDatabase(BaseVectorDatabase):
         **kwargs: Any,
     ) -> list[VectorSearchResult]:
         """Run similarity search against a Qdrant collection."""
+        quantized = self._quantized.get(collection_name)
+        if quantized is not None and "search_params" not in kwargs:
+            kwargs["search_params"] = SearchParams(
+                quantization=QuantizationSearchParams(
+                    rescore=True,
+                    oversampling=quantized.oversampling
+                    or DEFAULT_OVERSAMPLING[quantized.quantization],
+                )
+            )
         response = self.client.search(
             collection_name=collection_name,
             query_vector=query_vector,
@@ -285,3 +351,39 @@ class QdrantVectorDatabase(BaseVectorDatabase):
             ),
             **kwargs,
         )
+
+    def scroll(
+        self,
+        collection_name: str,
+        batch_size: int = 100,
+        **kwargs: Any,
+    ) -> Iterator[list[VectorRecord]]:
+        """Iterate over all points of a Qdrant collection in batches."""
+        with_vectors = kwargs.pop("with_vectors", False)
+        offset: Any = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=with_vectors,
+                **kwargs,
+            )
+            if points:
+                yield [
+                    VectorRecordDTO(
+                        id=str(point.id),
+                        vector=list(point.vector or []),
+                        payload=dict(point.payload or {}),
+                    )
+                    for point in points
+                ]
+            if offset is None:
+                break
+
+    def count(self, collection_name: str) -> int:
+        """Return the exact number of points in a Qdrant collection."""
+        return int(
+            self.client.count(collection_name=collection_name, exact=True).count
+        )
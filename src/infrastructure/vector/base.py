@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from typing_extensions import Self
 
@@ -9,6 +9,7 @@ from ...domain.vector import (
     CollectionConfig,
     VectorDBConfig,
     VectorRecord,
+    VectorRecordDTO,
     VectorSearchResult,
 )
 
@@ -27,6 +28,9 @@ class BaseVectorDatabase(ABC):
             parameters.
     """
 
+    # ``QuantizationType`` values the provider implements server-side.
+    _NATIVE_QUANTIZATION: frozenset[str] = frozenset()
+
     def __init__(
         self,
         config: Optional[VectorDBConfig] = None,
@@ -42,6 +46,7 @@ class BaseVectorDatabase(ABC):
         """
         self.config = config
         self.client: Any = None
+        self._quantized: dict[str, CollectionConfig] = {}
 
     # -- Context-manager lifecycle -----------------------------------
 
@@ -142,6 +147,34 @@ class BaseVectorDatabase(ABC):
             **kwargs: Provider-specific write options.
         """
 
+    def upsert_matrix(
+        self,
+        collection_name: str,
+        ids: list[str],
+        matrix: Any,
+        payloads: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> None:
+        """Insert or update records whose vectors are rows of a matrix.
+
+        Adapters whose SDK accepts arrays override this method to hand the
+        float32 matrix (or views of its rows) over without building Python
+        lists. The default implementation converts each row and delegates
+        to ``upsert``.
+
+        Args:
+            collection_name: Target collection/index name.
+            ids: Record identifiers, one per matrix row.
+            matrix: ``N x D`` array of vectors.
+            payloads: Record payloads, one per matrix row.
+            **kwargs: Provider-specific write options.
+        """
+        records = [
+            VectorRecordDTO(id=record_id, vector=row.tolist(), payload=payload)
+            for record_id, row, payload in zip(ids, matrix, payloads)
+        ]
+        self.upsert(collection_name, records, **kwargs)
+
     @abstractmethod
     def search(
         self,
@@ -176,3 +209,71 @@ class BaseVectorDatabase(ABC):
             ids: Record identifiers to delete.
             **kwargs: Provider-specific delete options.
         """
+
+    def fetch(
+        self,
+        collection_name: str,
+        ids: list[str],
+        **kwargs: Any,
+    ) -> list[VectorRecord]:
+        """Return the stored records (with vectors) for the given IDs.
+
+        Adapters that support point lookups override this method; it is
+        required for client-side rescoring of quantized collections.
+
+        Args:
+            collection_name: Source collection/index name.
+            ids: Record identifiers; unknown IDs are skipped.
+            **kwargs: Provider-specific read options.
+
+        Returns:
+            The records found, in no particular order.
+
+        Raises:
+            NotImplementedError: If the adapter cannot fetch by ID.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support fetching records."
+        )
+
+    def scroll(
+        self,
+        collection_name: str,
+        batch_size: int = 100,
+        **kwargs: Any,
+    ) -> Iterator[list[VectorRecord]]:
+        """Iterate over all records of a collection in batches.
+
+        Adapters that support full-collection reads override this method;
+        the default implementation raises ``NotImplementedError``.
+
+        Args:
+            collection_name: Source collection/index name.
+            batch_size: Maximum number of records per yielded batch.
+            **kwargs: Provider-specific read options.
+
+        Yields:
+            Lists of records with id, payload and (when available) vector.
+
+        Raises:
+            NotImplementedError: If the adapter cannot enumerate records.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support scrolling records."
+        )
+
+    def count(self, collection_name: str) -> int:
+        """Return the number of records stored in a collection.
+
+        Args:
+            collection_name: Target collection/index name.
+
+        Returns:
+            Number of stored records.
+
+        Raises:
+            NotImplementedError: If the adapter cannot count records.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support counting records."
+        )
@@ -1,6 +1,8 @@
 from typing import Any, Callable, Optional, Type
 
-from ...domain.vector import VectorDBConfig
+from ...domain.vector import VectorDBConfig, VectorDBProvider
+from ..instances import InstanceCache, fingerprint
+from ..registry import available_providers, load_provider
 from .base import BaseVectorDatabase
 
 
@@ -9,9 +11,26 @@ class VectorDBFactory:
 
     Implements the Registry pattern so new providers can be added without
     modifying the factory logic.
+
+    Adapters are imported on first use: built-in providers are mapped to
+    their modules in ``_modules`` and third-party packages can expose
+    adapters under the ``_ENTRY_POINT_GROUP`` entry-point group.
     """
 
     _registry: dict[str, Type[Any]] = {}
+    # Built-in providers, imported on first ``create`` so that only the SDKs
+    # in use are loaded.
+    _modules: dict[str, str] = {
+        VectorDBProvider.COSMOS_DB: ".adapters.cosmos_db",
+        VectorDBProvider.MILVUS: ".adapters.milvus_db",
+        VectorDBProvider.MONGODB: ".adapters.mongo_db",
+        VectorDBProvider.OPENSEARCH: ".adapters.opensearch_db",
+        VectorDBProvider.PINECONE: ".adapters.pinecone_db",
+        VectorDBProvider.QDRANT: ".adapters.qdrant_db",
+        VectorDBProvider.VERTEX_AI: ".adapters.vertex_db",
+    }
+    _ENTRY_POINT_GROUP = "ai_app_template.vector_providers"
+    _instances: InstanceCache = InstanceCache()
 
     @classmethod
     def register(cls, provider: str) -> Callable:
@@ -30,11 +49,35 @@ class VectorDBFactory:
 
         return decorator
 
+    @classmethod
+    def register_lazy(cls, provider: str, target: str) -> None:
+        """Register a provider whose adapter is imported on first ``create``.
+
+        Args:
+            provider: The provider identifier.
+            target: ``"module"`` registering itself on import, or
+                ``"module:Class"``.
+        """
+        cls._modules[provider] = target
+
+    @classmethod
+    def providers(cls) -> list[str]:
+        """Return the providers ``create`` accepts, without importing them."""
+        return available_providers(cls._registry, cls._modules, cls._ENTRY_POINT_GROUP)
+
+    @classmethod
+    def _load(cls, provider: str) -> Optional[Type[Any]]:
+        """Import the adapter of a lazy or entry-point provider."""
+        return load_provider(
+            cls._registry, cls._modules, provider, cls._ENTRY_POINT_GROUP, __package__
+        )
+
     @classmethod
     def create(
         cls,
         provider: str,
         config: Optional[VectorDBConfig] = None,
+        reuse: bool = False,
         **kwargs: Any,
     ) -> BaseVectorDatabase:
         """Create an instance of the requested vector database adapter.
@@ -42,6 +85,10 @@ class VectorDBFactory:
         Args:
             provider: The provider identifier (must be registered).
             config: The configuration object.
+            reuse: Return the instance memoized for the same provider,
+                configuration and arguments, creating it on first use.
+                Callers share it, so they must not ``disconnect`` it;
+                ``close_all`` does at shutdown.
             **kwargs: Additional overrides passed to the adapter
                 constructor.
 
@@ -49,11 +96,26 @@ class VectorDBFactory:
             An instance of the specific vector database adapter.
 
         Raises:
-            ValueError: If the provider is not registered.
+            ValueError: If the provider is neither registered nor
+                discoverable.
         """
-        if provider not in cls._registry:
+        if provider not in cls._registry and cls._load(provider) is None:
             raise ValueError(
                 f"Provider '{provider}' is not registered."
             )
+        if reuse:
+            return cls._instances.get_or_create(
+                fingerprint(provider, config, kwargs),
+                lambda: cls.create(provider, config, **kwargs),
+            )
         db_cls = cls._registry[provider]
         return db_cls(config=config, **kwargs)
+
+    @classmethod
+    def close_all(cls) -> int:
+        """Disconnect and forget every instance created with ``reuse=True``.
+
+        Returns:
+            Number of instances released.
+        """
+        return cls._instances.close_all()
@@ -0,0 +1,500 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Iterator, Optional
+
+import numpy as np
+
+from ...domain.vector import (
+    CollectionConfig,
+    CollectionConfigDTO,
+    DistanceMetric,
+    QuantizationType,
+    VectorRecord,
+    VectorSearchResultDTO as VectorSearchResult,
+)
+from .base import BaseVectorDatabase
+
+DEFAULT_QUANTILE: float = 0.99
+# Vectors kept at full precision before the int8 ranges are fitted: fewer
+# samples give ranges that clip most of the later vectors.
+DEFAULT_CALIBRATION_SIZE: int = 256
+DEFAULT_OVERSAMPLING: dict[str, float] = {
+    QuantizationType.SCALAR: 2.0,
+    QuantizationType.BINARY: 4.0,
+}
+
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def oversampled_limit(limit: int, config: CollectionConfig) -> int:
+    """Return the number of candidates to fetch for ``limit`` hits."""
+    factor = config.oversampling or DEFAULT_OVERSAMPLING.get(config.quantization, 1.0)
+    return max(limit, math.ceil(limit * factor))
+
+
+def exact_scores(query: Any, matrix: Any, metric: Optional[str]) -> np.ndarray:
+    """Score rows of ``matrix`` against ``query`` at full precision.
+
+    Returns cosine similarity, dot product or Euclidean distance, matching
+    the scores reported by the vector databases for each metric.
+    """
+    query = np.asarray(query, dtype=np.float32)
+    matrix = np.asarray(matrix, dtype=np.float32).reshape(-1, query.shape[0])
+    if metric == DistanceMetric.EUCLIDEAN:
+        return np.linalg.norm(matrix - query, axis=1)
+    dots = matrix @ query
+    if metric == DistanceMetric.DOT_PRODUCT:
+        return dots
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+
+def rank(scores: np.ndarray, limit: int, metric: Optional[str]) -> np.ndarray:
+    """Return the indices of the ``limit`` best scores, best first."""
+    keys = scores if metric == DistanceMetric.EUCLIDEAN else -scores
+    limit = min(limit, len(keys))
+    if limit <= 0:
+        return np.empty(0, dtype=np.int64)
+    top = np.argpartition(keys, limit - 1)[:limit]
+    return top[np.argsort(keys[top], kind="stable")]
+
+
+class ScalarQuantizer:
+    """Per-dimension affine mapping between float32 and int8.
+
+    The range of each dimension is calibrated to cover ``quantile`` of the
+    observed values, so a few outliers do not waste the 256 levels.
+    """
+
+    def __init__(self, offset: Any, scale: Any) -> None:
+        """Initialize from calibrated ranges.
+
+        Args:
+            offset: Lower bound of each dimension.
+            scale: Width of one int8 step in each dimension.
+        """
+        self.offset = np.asarray(offset, dtype=np.float32)
+        self.scale = np.asarray(scale, dtype=np.float32)
+
+    @classmethod
+    def fit(cls, matrix: Any, quantile: float = DEFAULT_QUANTILE) -> ScalarQuantizer:
+        """Calibrate the ranges on a sample of vectors.
+
+        Args:
+            matrix: ``N x D`` sample of the collection's vectors.
+            quantile: Fraction of values each range must cover.
+
+        Returns:
+            The calibrated quantizer.
+        """
+        matrix = np.asarray(matrix, dtype=np.float32)
+        tail = (1.0 - quantile) / 2.0
+        low = np.quantile(matrix, tail, axis=0)
+        high = np.quantile(matrix, 1.0 - tail, axis=0)
+        return cls(low, np.maximum(high - low, 1e-12) / 255.0)
+
+    def encode(self, matrix: Any) -> np.ndarray:
+        """Quantize vectors to int8 codes."""
+        levels = np.rint((np.asarray(matrix, dtype=np.float32) - self.offset) / self.scale)
+        return np.clip(levels - 128.0, -128, 127).astype(np.int8)
+
+    def decode(self, codes: Any) -> np.ndarray:
+        """Reconstruct approximate float32 vectors from int8 codes."""
+        return (np.asarray(codes, dtype=np.float32) + 128.0) * self.scale + self.offset
+
+    def dot(self, query: Any, codes: np.ndarray) -> np.ndarray:
+        """Return approximate dot products without decoding the codes."""
+        query = np.asarray(query, dtype=np.float32)
+        weights = query * self.scale
+        bias = float(query @ self.offset + 128.0 * weights.sum())
+        return codes.astype(np.float32) @ weights + bias
+
+    def to_dict(self) -> dict[str, list[float]]:
+        """Serialize the calibration (e.g. into collection metadata)."""
+        return {"offset": self.offset.tolist(), "scale": self.scale.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ScalarQuantizer:
+        """Restore a calibration produced by ``to_dict``."""
+        return cls(data["offset"], data["scale"])
+
+
+def binarize(matrix: Any) -> np.ndarray:
+    """Pack the sign bit of every component, 8 components per byte."""
+    return np.packbits(np.asarray(matrix) > 0, axis=-1)
+
+
+def hamming(query_bits: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Return the Hamming distance between packed bit vectors."""
+    return _POPCOUNT[np.bitwise_xor(codes, query_bits)].sum(axis=1, dtype=np.int64)
+
+
+class QuantizedIndex:
+    """In-memory index of compressed vectors used to pick candidates.
+
+    Only the codes (int8 or packed bits) and one float32 norm per vector are
+    kept; the original vectors stay in the database and are used to rescore
+    the candidates.
+
+    For int8 codes, vectors are kept at full precision (and scored exactly)
+    until ``calibration_size`` of them were added; the ranges are then
+    fitted on all of them and the buffered vectors are encoded. Call
+    ``calibrate`` with a representative sample to skip the buffering.
+
+    Attributes:
+        quantization: ``QuantizationType`` value.
+        metric: Distance metric of the collection.
+        quantile: Calibration quantile for int8 codes.
+        calibration_size: Vectors buffered before the int8 ranges are fitted.
+        quantizer: Calibrated int8 quantizer (scalar quantization only).
+    """
+
+    def __init__(
+        self,
+        quantization: str,
+        metric: Optional[str] = None,
+        quantile: Optional[float] = None,
+        calibration_size: Optional[int] = None,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            quantization: ``QuantizationType`` value.
+            metric: Distance metric of the collection.
+            quantile: Calibration quantile for int8 codes.
+            calibration_size: Vectors buffered before the int8 ranges are
+                fitted.
+
+        Raises:
+            ValueError: If the quantization type is unknown.
+        """
+        self.quantization = QuantizationType(quantization)
+        self.metric = metric or DistanceMetric.COSINE
+        self.quantile = quantile or DEFAULT_QUANTILE
+        self.calibration_size = calibration_size or DEFAULT_CALIBRATION_SIZE
+        self.quantizer: Optional[ScalarQuantizer] = None
+        self.ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._codes: Optional[np.ndarray] = None
+        self._norms = np.empty(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        """Return the number of indexed vectors."""
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by codes and norms."""
+        if self._codes is None:
+            return 0
+        return self._codes.nbytes + self._norms.nbytes
+
+    @property
+    def calibrated(self) -> bool:
+        """Whether vectors are stored as codes rather than buffered."""
+        return self.quantization == QuantizationType.BINARY or self.quantizer is not None
+
+    def calibrate(self, sample: Any) -> None:
+        """Fit the int8 ranges on a representative sample.
+
+        Vectors buffered at full precision are encoded with the new ranges.
+        """
+        if self.quantization != QuantizationType.SCALAR:
+            return
+        buffered = None if self.calibrated else self._codes
+        self.quantizer = ScalarQuantizer.fit(sample, self.quantile)
+        if buffered is not None:
+            self._codes = self.quantizer.encode(buffered)
+
+    def encode(self, matrix: Any) -> np.ndarray:
+        """Compress vectors with the index's scheme.
+
+        Before calibration, int8 indexes return the float32 vectors as is.
+        """
+        if self.quantization == QuantizationType.BINARY:
+            return binarize(matrix)
+        if self.quantizer is None:
+            return np.asarray(matrix, dtype=np.float32)
+        return self.quantizer.encode(matrix)
+
+    def add(self, ids: list[str], matrix: Any) -> None:
+        """Insert or replace vectors.
+
+        Args:
+            ids: Record identifiers, one per row.
+            matrix: ``N x D`` vectors.
+        """
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if not ids:
+            return
+        codes = self.encode(matrix)
+        norms = np.linalg.norm(matrix, axis=1).astype(np.float32)
+        if self._codes is None:
+            self._codes = np.empty((0, codes.shape[1]), dtype=codes.dtype)
+        fresh: list[int] = []
+        for record_id, row in dict(zip(ids, range(len(ids)))).items():
+            position = self._positions.get(record_id)
+            if position is None:
+                self._positions[record_id] = len(self.ids) + len(fresh)
+                fresh.append(row)
+            else:
+                self._codes[position] = codes[row]
+                self._norms[position] = norms[row]
+        if fresh:
+            self.ids.extend(ids[row] for row in fresh)
+            self._codes = np.concatenate([self._codes, codes[fresh]])
+            self._norms = np.concatenate([self._norms, norms[fresh]])
+        if not self.calibrated and len(self) >= self.calibration_size:
+            self.calibrate(self._codes)
+
+    def remove(self, ids: list[str]) -> None:
+        """Drop vectors by identifier; unknown identifiers are ignored."""
+        doomed = {self._positions[i] for i in ids if i in self._positions}
+        if not doomed or self._codes is None:
+            return
+        keep = np.array([p for p in range(len(self.ids)) if p not in doomed], dtype=np.int64)
+        self.ids = [self.ids[p] for p in keep]
+        self._codes = self._codes[keep]
+        self._norms = self._norms[keep]
+        self._positions = {record_id: p for p, record_id in enumerate(self.ids)}
+
+    def approximate_scores(self, query: Any) -> np.ndarray:
+        """Score every indexed vector from its codes (higher is better)."""
+        query = np.asarray(query, dtype=np.float32)
+        if self._codes is None or not len(self):
+            return np.empty(0, dtype=np.float32)
+        if self.quantization == QuantizationType.BINARY:
+            return -hamming(binarize(query), self._codes).astype(np.float32)
+        if self.quantizer is None:
+            scores = exact_scores(query, self._codes, self.metric)
+            return -scores if self.metric == DistanceMetric.EUCLIDEAN else scores
+        dots = self.quantizer.dot(query, self._codes)
+        if self.metric == DistanceMetric.DOT_PRODUCT:
+            return dots
+        if self.metric == DistanceMetric.EUCLIDEAN:
+            return 2.0 * dots - self._norms**2
+        return np.divide(dots, self._norms, out=np.zeros_like(dots), where=self._norms > 0)
+
+    def candidates(self, query: Any, count: int) -> list[str]:
+        """Return the identifiers of the ``count`` best approximate matches."""
+        scores = self.approximate_scores(query)
+        return [self.ids[i] for i in rank(scores, count, DistanceMetric.COSINE)]
+
+
+class QuantizedVectorDatabase(BaseVectorDatabase):
+    """Adapter decorator adding quantize-then-rescore search.
+
+    Collections created with ``CollectionConfig.quantization`` are delegated
+    unchanged when the wrapped adapter supports that scheme natively (see
+    ``BaseVectorDatabase._NATIVE_QUANTIZATION``). Otherwise the database
+    keeps the full-precision vectors and this wrapper maintains a compact
+    ``QuantizedIndex`` of them: searches pick ``limit x oversampling``
+    candidates from the codes, fetch their original vectors and rescore
+    them exactly.
+
+    Searches with provider-specific options (filters, custom bodies) are
+    delegated to the database, since they cannot be evaluated locally.
+
+    Attributes:
+        database: The wrapped adapter.
+        indexes: Client-side indexes by collection name.
+    """
+
+    def __init__(self, database: BaseVectorDatabase) -> None:
+        """Initialize the decorator.
+
+        Args:
+            database: Adapter storing the vectors and payloads.
+        """
+        super().__init__(database.config)
+        self.database = database
+        self.client = database.client
+        self.indexes: dict[str, QuantizedIndex] = {}
+
+    # -- Connection --------------------------------------------------
+
+    def connect(self) -> None:
+        """Connect the wrapped adapter."""
+        self.database.connect()
+
+    def disconnect(self) -> None:
+        """Disconnect the wrapped adapter."""
+        self.database.disconnect()
+
+    def health(self) -> bool:
+        """Return the wrapped adapter's health."""
+        return self.database.health()
+
+    # -- Collection CRUD ---------------------------------------------
+
+    def _client_side(self, config: CollectionConfig) -> bool:
+        """Whether ``config`` needs a client-side index on this database."""
+        return bool(config.quantization) and (
+            config.quantization not in self.database._NATIVE_QUANTIZATION
+        )
+
+    def create_collection(self, config: CollectionConfig) -> None:
+        """Create a collection, natively quantized when supported.
+
+        Args:
+            config: Collection configuration.
+
+        Raises:
+            RuntimeError: If creation fails.
+        """
+        if not self._client_side(config):
+            self.database.create_collection(config)
+            return
+        self.database.create_collection(
+            CollectionConfigDTO(
+                name=config.name,
+                dimension=config.dimension,
+                metric=config.metric,
+                kwargs=dict(config.kwargs),
+            )
+        )
+        self.attach(config)
+
+    def attach(self, config: CollectionConfig, batch_size: int = 256) -> QuantizedIndex:
+        """Build the client-side index of an existing collection.
+
+        Args:
+            config: Configuration the collection was created with.
+            batch_size: Records read per scroll batch.
+
+        Returns:
+            The collection's index (empty for a new collection).
+
+        Raises:
+            RuntimeError: If the collection holds records but none of them
+                can be read back with its vector, so every search would
+                rescore nothing.
+        """
+        index = QuantizedIndex(
+            config.quantization, config.metric, config.quantile, config.calibration_size
+        )
+        self._quantized[config.name] = config
+        self.indexes[config.name] = index
+        if not self.database.has_collection(config.name):
+            return index
+        try:
+            stored: Optional[int] = 0
+            for records in self.database.scroll(config.name, batch_size=batch_size):
+                stored += len(records)
+                self._index(config.name, [r for r in records if r.vector])
+        except NotImplementedError:
+            try:
+                stored = self.database.count(config.name)
+            except NotImplementedError:
+                stored = None
+        if stored and not len(index):
+            self.indexes.pop(config.name, None)
+            self._quantized.pop(config.name, None)
+            raise RuntimeError(
+                f"Collection '{config.name}' holds {stored} records but "
+                f"{type(self.database).__name__} returned no vectors to rebuild "
+                "its quantized index from."
+            )
+        return index
+
+    def delete_collection(self, name: str) -> None:
+        """Delete a collection and its client-side index."""
+        self.database.delete_collection(name)
+        self.indexes.pop(name, None)
+        self._quantized.pop(name, None)
+
+    def list_collections(self) -> list[str]:
+        """Return the wrapped adapter's collections."""
+        return self.database.list_collections()
+
+    def has_collection(self, name: str) -> bool:
+        """Check whether the wrapped adapter has ``name``."""
+        return self.database.has_collection(name)
+
+    # -- Vector CRUD ---------------------------------------------
+
+    def _index(self, collection_name: str, records: list[VectorRecord]) -> None:
+        """Add records to the collection's client-side index, if any."""
+        index = self.indexes.get(collection_name)
+        if index is not None and records:
+            index.add([r.id for r in records], [r.vector for r in records])
+
+    def upsert(
+        self,
+        collection_name: str,
+        records: list[VectorRecord],
+        **kwargs: Any,
+    ) -> None:
+        """Store full-precision records and index their codes."""
+        self.database.upsert(collection_name, records, **kwargs)
+        self._index(collection_name, records)
+
+    def upsert_matrix(
+        self,
+        collection_name: str,
+        ids: list[str],
+        matrix: Any,
+        payloads: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> None:
+        """Store a float32 matrix and index its codes."""
+        self.database.upsert_matrix(collection_name, ids, matrix, payloads, **kwargs)
+        index = self.indexes.get(collection_name)
+        if index is not None and len(ids):
+            index.add(list(ids), matrix)
+
+    def search(
+        self,
+        collection_name: str,
+        query_vector: list[float],
+        limit: int = 5,
+        **kwargs: Any,
+    ) -> list[VectorSearchResult]:
+        """Pick candidates from the codes and rescore the originals."""
+        index = self.indexes.get(collection_name)
+        if index is None or kwargs:
+            return self.database.search(collection_name, query_vector, limit, **kwargs)
+        config = self._quantized[collection_name]
+        candidates = index.candidates(query_vector, oversampled_limit(limit, config))
+        records = [r for r in self.database.fetch(collection_name, candidates) if r.vector]
+        if not records:
+            return []
+        scores = exact_scores(query_vector, [r.vector for r in records], index.metric)
+        return [
+            VectorSearchResult(
+                id=records[i].id,
+                score=float(scores[i]),
+                payload=dict(records[i].payload),
+            )
+            for i in rank(scores, limit, index.metric)
+        ]
+
+    def delete(
+        self,
+        collection_name: str,
+        ids: list[str],
+        **kwargs: Any,
+    ) -> None:
+        """Delete records from the database and the client-side index."""
+        self.database.delete(collection_name, ids, **kwargs)
+        index = self.indexes.get(collection_name)
+        if index is not None:
+            index.remove(ids)
+
+    def fetch(self, collection_name: str, ids: list[str], **kwargs: Any) -> list[VectorRecord]:
+        """Fetch records through the wrapped adapter."""
+        return self.database.fetch(collection_name, ids, **kwargs)
+
+    def scroll(
+        self,
+        collection_name: str,
+        batch_size: int = 100,
+        **kwargs: Any,
+    ) -> Iterator[list[VectorRecord]]:
+        """Iterate over records through the wrapped adapter."""
+        return self.database.scroll(collection_name, batch_size, **kwargs)
+
+    def count(self, collection_name: str) -> int:
+        """Count records through the wrapped adapter."""
+        return self.database.count(collection_name)
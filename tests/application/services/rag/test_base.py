@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass, field
 from types import SimpleNamespace
 from typing import Any
 
+import numpy as np
 import pytest
 
-from src.application.services.rag.base import BaseRagService
+from src.application.services.rag.base import (
+    BaseRagService,
+    DocumentUpload,
+    EmbeddingMigrationProgress,
+)
 from src.domain.chat.types import ChatMessage
 from src.domain.vector import CollectionConfigDTO, VectorRecordDTO, VectorSearchResultDTO
 
@@ -39,9 +46,23 @@ class DummyVectorDB:
     def create_collection(self, config: CollectionConfigDTO) -> None:
         self.collections.add(config.name)
 
+    def delete_collection(self, name: str) -> None:
+        self.collections.discard(name)
+
     def upsert(self, collection_name: str, records: list[VectorRecordDTO], **kwargs: Any) -> None:
         self.upsert_calls.append({"collection_name": collection_name, "records": records})
 
+    def upsert_matrix(
+        self,
+        collection_name: str,
+        ids: list[str],
+        matrix: Any,
+        payloads: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> None:
+        self.upsert_matrix_calls = getattr(self, "upsert_matrix_calls", [])
+        self.upsert_matrix_calls.append({"ids": ids, "matrix": matrix, "payloads": payloads})
+
     def search(
         self,
         collection_name: str,
@@ -49,8 +70,26 @@ class DummyVectorDB:
         limit: int = 5,
         **kwargs: Any,
     ) -> list[VectorSearchResultDTO]:
+        self.searched_collection = collection_name
         return self.search_results[:limit]
 
+    def scroll(self, collection_name: str, batch_size: int = 100, **kwargs: Any):
+        records = [
+            record
+            for call in self.upsert_calls
+            if call["collection_name"] == collection_name
+            for record in call["records"]
+        ]
+        for start in range(0, len(records), batch_size):
+            yield records[start : start + batch_size]
+
+    def count(self, collection_name: str) -> int:
+        return sum(
+            len(call["records"])
+            for call in self.upsert_calls
+            if call["collection_name"] == collection_name
+        )
+
 
 class DummyEmbeddingModel:
     def __init__(self) -> None:
@@ -102,6 +141,66 @@ def test_ingest_document_valid_document_upserts_all_chunks(rag_service: BaseRagS
     assert len(vector_db.upsert_calls[0]["records"]) == 2
 
 
+def test_ingest_bytes_valid_upload_upserts_all_chunks(rag_service: BaseRagService) -> None:
+    result = rag_service.ingest_bytes(b"%PDF-1.7", filename="upload.pdf")
+
+    assert result.chunks_count == 2
+    assert len(rag_service.vector_db.upsert_calls) == 1
+
+
+def test_ingest_document_matrix_output_uses_upsert_matrix(
+    rag_service: BaseRagService,
+) -> None:
+    matrix = np.ones((2, 3), dtype=np.float32)
+    rag_service.embedding_model.embed = lambda _: SimpleNamespace(
+        embeddings=[[1.0] * 3] * 2, matrix=matrix
+    )
+
+    result = rag_service.ingest_document(document_path="docs/file.pdf")
+
+    call = rag_service.vector_db.upsert_matrix_calls[0]
+    assert call["matrix"] is matrix
+    assert call["ids"] == ["c1", "c2"]
+    assert call["payloads"][1]["chunk"] == "beta"
+    assert rag_service.vector_db.upsert_calls == []
+    assert result.chunks_count == 2
+
+
+def test_embed_query_prefers_adapter_embed_query(rag_service: BaseRagService) -> None:
+    rag_service.embedding_model.embed_query = lambda question: [1.0, 0.0]
+
+    assert rag_service._embed_query("q") == [1.0, 0.0]
+
+
+def test_ingest_document_no_chunks_uses_model_dimensions(rag_service: BaseRagService) -> None:
+    created: list[CollectionConfigDTO] = []
+    rag_service.vector_db.create_collection = created.append
+    rag_service.embedding_model.dimensions = 512
+    rag_service.embedding_model.embed = lambda _: SimpleNamespace(embeddings=[])
+
+    rag_service.ingest_document(document_path="docs/file.pdf")
+
+    assert created[0].dimension == 512
+
+
+@pytest.mark.asyncio
+async def test_aingest_uploads_batch_returns_results_in_order(
+    rag_service: BaseRagService,
+) -> None:
+    uploads = [
+        DocumentUpload(data=b"one", filename="one.txt"),
+        DocumentUpload(data=b"two", mimetype="text/plain"),
+        DocumentUpload(data=b"three", filename="three.txt"),
+    ]
+
+    results = await rag_service.aingest_uploads(uploads, max_concurrency=2)
+
+    assert len(results) == 3
+    assert all(result.collection_name == "docs" for result in results)
+    assert len(rag_service.vector_db.upsert_calls) == 3
+    assert rag_service.vector_db.collections == {"docs"}
+
+
 @pytest.mark.asyncio
 async def test_ask_with_matches_returns_grounded_answer(rag_service: BaseRagService) -> None:
     vector_db = rag_service.vector_db
@@ -117,6 +216,123 @@ async def test_ask_with_matches_returns_grounded_answer(rag_service: BaseRagServ
     assert "policy chunk" in answer.context
 
 
+@pytest.mark.asyncio
+async def test_migrate_embeddings_reembeds_into_shadow_and_swaps(
+    rag_service: BaseRagService,
+) -> None:
+    rag_service.ingest_document(document_path="docs/file.pdf")
+    new_model = SimpleNamespace(
+        client=SimpleNamespace(embed_query=lambda question: [1.0] * 5),
+        embed=lambda output: SimpleNamespace(embeddings=[[1.0] * 5 for _ in output.chunks]),
+    )
+    snapshots: list[int] = []
+
+    progress = await rag_service.migrate_embeddings(
+        new_model,
+        target_collection="docs_v2",
+        batch_size=1,
+        on_progress=lambda p: snapshots.append(p.processed_records),
+    )
+    await rag_service.ask(question="Where?")
+
+    migrated = rag_service.vector_db.upsert_calls[1:]
+    assert [len(call["records"]) for call in migrated] == [1, 1]
+    assert migrated[0]["records"][0].vector == [1.0] * 5
+    assert migrated[0]["records"][0].payload["chunk"] == "alpha"
+    assert snapshots == [1, 2, 2]
+    assert progress.finished and progress.total_records == 2
+    assert rag_service.embedding_model is new_model
+    assert rag_service.vector_db.searched_collection == "docs_v2"
+
+
+@pytest.mark.asyncio
+async def test_migrate_embeddings_empty_collection_creates_target(
+    rag_service: BaseRagService,
+) -> None:
+    new_model = SimpleNamespace(
+        dimensions=5,
+        client=SimpleNamespace(embed_query=lambda question: [1.0] * 5),
+        embed=lambda output: SimpleNamespace(embeddings=[]),
+    )
+
+    progress = await rag_service.migrate_embeddings(new_model, target_collection="docs_v2")
+    await rag_service.ask(question="Where?")
+
+    assert progress.finished and progress.processed_records == 0
+    assert "docs_v2" in rag_service.vector_db.collections
+    assert rag_service.vector_db.searched_collection == "docs_v2"
+
+
+@pytest.mark.asyncio
+async def test_ask_with_query_batch_window_coalesces_queries(
+    rag_service: BaseRagService,
+) -> None:
+    batches: list[list[str]] = []
+
+    def embed_texts(texts: list[str]) -> list[list[float]]:
+        batches.append(texts)
+        return [[0.1, 0.2, 0.3] for _ in texts]
+
+    rag_service.embedding_model._embed_texts = embed_texts
+    rag_service.params["query_batch_window"] = 0.01
+
+    answers = await asyncio.gather(*(rag_service.ask(question=q) for q in ["a", "b", "a"]))
+
+    assert len(answers) == 3
+    assert batches == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_ask_with_query_batch_window_skips_asymmetric_query_adapters(
+    rag_service: BaseRagService,
+) -> None:
+    batches: list[list[str]] = []
+    rag_service.embedding_model._embed_texts = batches.append
+    rag_service.embedding_model._SYMMETRIC_QUERIES = False
+    rag_service.params["query_batch_window"] = 0.01
+
+    answers = await asyncio.gather(*(rag_service.ask(question=q) for q in ["a", "b"]))
+
+    assert len(answers) == 2
+    assert batches == []
+    assert rag_service._get_query_coalescer() is None
+
+
+def test_migration_progress_reports_throughput_and_eta(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(time, "monotonic", lambda: 105.0)
+    progress = EmbeddingMigrationProgress(
+        source_collection="a",
+        target_collection="b",
+        total_records=100,
+        processed_records=25,
+        started_at=100.0,
+    )
+
+    assert progress.throughput == pytest.approx(5.0)
+    assert progress.eta_seconds == pytest.approx(15.0)
+
+
+@pytest.mark.asyncio
+async def test_migrate_embeddings_other_collection_keeps_active_configuration(
+    rag_service: BaseRagService,
+) -> None:
+    record = VectorRecordDTO(id="a1", vector=[0.0] * 3, payload={"chunk": "old"})
+    rag_service.vector_db.upsert_calls.append({"collection_name": "archive", "records": [record]})
+    original_model = rag_service.embedding_model
+    new_model = SimpleNamespace(
+        embed=lambda output: SimpleNamespace(embeddings=[[1.0] * 5 for _ in output.chunks]),
+    )
+
+    progress = await rag_service.migrate_embeddings(
+        new_model, target_collection="archive_v2", source_collection="archive"
+    )
+
+    assert progress.finished and progress.processed_records == 1
+    assert "archive_v2" in rag_service.vector_db.collections
+    assert rag_service.params["collection_name"] == "docs"
+    assert rag_service.embedding_model is original_model
+
+
 # ---- Error paths ---- #
 def test_create_reader_invalid_method_raises_value_error() -> None:
     service = BaseRagService(
@@ -130,7 +346,87 @@ def test_create_reader_invalid_method_raises_value_error() -> None:
         service._create_reader()
 
 
+@pytest.mark.asyncio
+async def test_migrate_embeddings_without_scroll_support_raises() -> None:
+    vector_db = SimpleNamespace(count=lambda name: 0)
+    vector_db.scroll = lambda *args, **kwargs: (_ for _ in ()).throw(NotImplementedError())
+    service = BaseRagService(
+        vector_db=vector_db,
+        embedding_model=DummyEmbeddingModel(),
+        chat_service=DummyChatService(),
+    )
+
+    with pytest.raises(NotImplementedError):
+        await service.migrate_embeddings(DummyEmbeddingModel())
+
+    assert service.params["collection_name"] == "documents"
+    assert service.migration is None
+
+
+@pytest.mark.asyncio
+async def test_migrate_embeddings_failure_drops_partial_target(
+    rag_service: BaseRagService,
+) -> None:
+    rag_service.ingest_document(document_path="docs/file.pdf")
+    calls: list[int] = []
+
+    def embed(output: Any) -> Any:
+        calls.append(len(output.chunks))
+        if len(calls) > 1:
+            raise RuntimeError("provider down")
+        return SimpleNamespace(embeddings=[[1.0] * 5 for _ in output.chunks])
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        await rag_service.migrate_embeddings(
+            SimpleNamespace(embed=embed), target_collection="docs_v2", batch_size=1
+        )
+
+    assert calls == [1, 1]
+    assert "docs_v2" not in rag_service.vector_db.collections
+    assert rag_service.migration is None
+    assert rag_service.params["collection_name"] == "docs"
+
+
+@pytest.mark.asyncio
+async def test_migrate_embeddings_failure_reports_undeletable_target(
+    rag_service: BaseRagService,
+) -> None:
+    rag_service.ingest_document(document_path="docs/file.pdf")
+
+    def delete_collection(name: str) -> None:
+        raise RuntimeError("delete refused")
+
+    def embed(output: Any) -> Any:
+        if "docs_v2" in rag_service.vector_db.collections:
+            raise RuntimeError("provider down")
+        return SimpleNamespace(embeddings=[[1.0] * 5 for _ in output.chunks])
+
+    rag_service.vector_db.delete_collection = delete_collection
+
+    with pytest.raises(RuntimeError, match="provider down") as excinfo:
+        await rag_service.migrate_embeddings(
+            SimpleNamespace(embed=embed), target_collection="docs_v2", batch_size=1
+        )
+
+    assert excinfo.value.__notes__ == ["Partially migrated collection 'docs_v2' was left in place."]
+    assert rag_service.migration is None
+
+
 # ---- Edge cases ---- #
+@pytest.mark.asyncio
+async def test_migrate_embeddings_empty_collection_without_dimensions_keeps_source(
+    rag_service: BaseRagService,
+) -> None:
+    new_model = DummyEmbeddingModel()
+
+    progress = await rag_service.migrate_embeddings(new_model, target_collection="docs_v2")
+
+    assert progress.finished
+    assert "docs_v2" not in rag_service.vector_db.collections
+    assert rag_service.params["collection_name"] == "docs"
+    assert rag_service.embedding_model is new_model
+
+
 @pytest.mark.asyncio
 async def test_ask_without_matches_returns_empty_context(rag_service: BaseRagService) -> None:
     answer = await rag_service.ask(question="Unknown")
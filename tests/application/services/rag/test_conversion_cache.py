@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from splitter_mr.schema import ReaderOutput
+
+from src.application.services.rag.base import BaseRagService
+from src.application.services.rag.conversion_cache import CachedReader, ConversionCache
+
+
+# ---- Mocks, fixtures & helpers ---- #
+class CountingReader:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def read(self, file_path: Any = None, **kwargs: Any) -> ReaderOutput:
+        self.calls += 1
+        text = Path(str(file_path)).read_text() if Path(str(file_path)).is_file() else "remote"
+        return ReaderOutput(
+            text=f"# {text}",
+            document_name=Path(str(file_path)).name,
+            document_path=str(file_path),
+            conversion_method="md",
+            reader_method="markitdown",
+        )
+
+
+def _write(tmp_path: Path, name: str, content: str) -> Path:
+    path = tmp_path / name
+    path.write_text(content)
+    return path
+
+
+# ---- Happy path ---- #
+def test_cached_reader_second_read_skips_conversion(tmp_path: Path) -> None:
+    document = _write(tmp_path, "doc.txt", "hello")
+    reader = CountingReader()
+    cached = CachedReader(reader, ConversionCache(tmp_path / "cache"))
+
+    first = cached.read(str(document))
+    second = cached.read(str(document))
+
+    assert reader.calls == 1
+    assert second.text == first.text == "# hello"
+    assert second.conversion_method == "md"
+    assert list((tmp_path / "cache").rglob("*.json.gz"))
+
+
+def test_cached_reader_hit_keeps_requested_document_id(tmp_path: Path) -> None:
+    document = _write(tmp_path, "doc.txt", "hello")
+    reader = CountingReader()
+    cached = CachedReader(reader, ConversionCache(tmp_path / "cache"))
+
+    cached.read(str(document), document_id="doc-1")
+    labelled = cached.read(str(document), document_id="doc-2")
+    unlabelled = cached.read(str(document))
+
+    assert reader.calls == 1
+    assert labelled.document_id == "doc-2"
+    assert unlabelled.document_id not in {None, "doc-1"}
+
+
+def test_cached_reader_same_content_other_path_reports_new_path(tmp_path: Path) -> None:
+    reader = CountingReader()
+    cached = CachedReader(reader, ConversionCache(tmp_path / "cache"))
+    cached.read(str(_write(tmp_path, "a.txt", "same")))
+
+    output = cached.read(str(_write(tmp_path, "b.txt", "same")))
+
+    assert reader.calls == 1
+    assert output.document_name == "b.txt"
+    assert output.document_path.endswith("b.txt")
+
+
+def test_create_reader_with_cache_dir_returns_cached_reader(tmp_path: Path) -> None:
+    service = BaseRagService(
+        vector_db=None,
+        embedding_model=None,
+        chat_service=None,
+        conversion_cache_dir=str(tmp_path),
+    )
+
+    assert isinstance(service._create_reader(), CachedReader)
+
+
+# ---- Edge cases ---- #
+def test_cached_reader_changed_content_or_options_converts_again(tmp_path: Path) -> None:
+    document = _write(tmp_path, "doc.txt", "v1")
+    reader = CountingReader()
+    cached = CachedReader(reader, ConversionCache(tmp_path / "cache"))
+    cached.read(str(document))
+
+    cached.read(str(document), page_placeholder="<!-- page -->")
+    document.write_text("v2")
+    output = cached.read(str(document))
+
+    assert reader.calls == 3
+    assert output.text == "# v2"
+
+
+def test_cached_reader_non_local_input_bypasses_cache(tmp_path: Path) -> None:
+    reader = CountingReader()
+    cached = CachedReader(reader, ConversionCache(tmp_path / "cache"))
+
+    cached.read("https://example.com/doc.pdf")
+    cached.read("https://example.com/doc.pdf")
+
+    assert reader.calls == 2
+    assert not (tmp_path / "cache").exists()
+
+
+def test_conversion_cache_corrupted_entry_is_a_miss(tmp_path: Path) -> None:
+    cache = ConversionCache(tmp_path)
+    key = "ab" + "0" * 62
+    entry = tmp_path / "ab" / f"{key}.json.gz"
+    entry.parent.mkdir(parents=True)
+    entry.write_bytes(b"not gzip")
+
+    assert cache.get(key) is None
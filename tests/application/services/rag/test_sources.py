@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from src.application.services.rag.base import BaseRagService, RagIngestionResult
+from src.application.services.rag.sources import (
+    BaseDocumentSource,
+    DocumentRef,
+    LocalDocumentSource,
+    LocalObjectStoreSource,
+)
+
+
+# ---- Mocks, fixtures & helpers ---- #
+class TrackingSource(BaseDocumentSource):
+    def __init__(self, count: int, fail_key: str | None = None) -> None:
+        self.count = count
+        self.fail_key = fail_key
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.listing_threads: set[int] = set()
+
+    def list_documents(self, prefix: str = "") -> Iterator[DocumentRef]:
+        for i in range(self.count):
+            self.listing_threads.add(threading.get_ident())
+            yield DocumentRef(key=f"doc-{i}", filename=f"doc-{i}.txt")
+
+    async def fetch(self, ref: DocumentRef) -> bytes:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if ref.key == self.fail_key:
+            raise FileNotFoundError(ref.key)
+        return ref.key.encode()
+
+
+def _service(monkeypatch: pytest.MonkeyPatch) -> tuple[BaseRagService, list[bytes]]:
+    service = BaseRagService(vector_db=None, embedding_model=None, chat_service=None)
+    ingested: list[bytes] = []
+
+    def _ingest_bytes(data: bytes, *args: Any, **kwargs: Any) -> RagIngestionResult:
+        ingested.append(data)
+        return RagIngestionResult(
+            document_id=data.decode(), collection_name="docs", chunks_count=1, record_ids=[]
+        )
+
+    monkeypatch.setattr(service, "ingest_bytes", _ingest_bytes)
+    return service, ingested
+
+
+# ---- Happy path ---- #
+def test_local_document_source_lists_and_fetches_files(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.md").write_text("alpha")
+    (tmp_path / "sub" / "b.pdf").write_bytes(b"%PDF")
+    source = LocalDocumentSource(tmp_path)
+
+    refs = list(source.list_documents())
+    data = asyncio.run(source.fetch(refs[0]))
+
+    assert [ref.key for ref in refs] == ["a.md", "sub/b.pdf"]
+    assert refs[1].mimetype == "application/pdf"
+    assert data == b"alpha"
+
+
+def test_local_object_store_source_paginates_listing(tmp_path: Path) -> None:
+    store = LocalObjectStoreSource(tmp_path, bucket="docs", page_size=2)
+    for key in ["2024/a.txt", "2024/b.txt", "2024/c.txt", "2025/d.txt"]:
+        store.put_object(key, key.encode())
+
+    first_page, token = store.list_page(prefix="2024/")
+    keys = [ref.key for ref in store.list_documents(prefix="2024/")]
+
+    assert [ref.key for ref in first_page] == ["2024/a.txt", "2024/b.txt"]
+    assert token == "2024/b.txt"
+    assert keys == ["2024/a.txt", "2024/b.txt", "2024/c.txt"]
+    assert asyncio.run(store.fetch(first_page[0])) == b"2024/a.txt"
+
+
+@pytest.mark.asyncio
+async def test_aingest_source_prefetches_documents_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, ingested = _service(monkeypatch)
+    source = TrackingSource(count=6)
+
+    results = await service.aingest_source(source, prefetch=3)
+
+    assert [r.document_id for r in results] == [f"doc-{i}" for i in range(6)]
+    assert ingested == [f"doc-{i}".encode() for i in range(6)]
+    assert source.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_aingest_source_lists_documents_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, _ = _service(monkeypatch)
+    source = TrackingSource(count=3)
+
+    await service.aingest_source(source, prefetch=1)
+
+    assert source.listing_threads
+    assert threading.get_ident() not in source.listing_threads
+
+
+# ---- Error paths ---- #
+@pytest.mark.asyncio
+async def test_aingest_source_fetch_failure_propagates_and_cancels_prefetch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, ingested = _service(monkeypatch)
+    source = TrackingSource(count=5, fail_key="doc-1")
+
+    with pytest.raises(FileNotFoundError):
+        await service.aingest_source(source, prefetch=2)
+
+    assert ingested == [b"doc-0"]
+    assert source.in_flight == 0
+
+
+# ---- Edge cases ---- #
+@pytest.mark.asyncio
+async def test_aingest_source_empty_listing_returns_no_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service, _ = _service(monkeypatch)
+
+    assert await service.aingest_source(TrackingSource(count=0)) == []
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Any
+
+from splitter_mr.reader import MarkItDownReader
+
+from src.application.services.rag.conversion_cache import CachedReader, ConversionCache
+from src.application.services.rag.stream_reader import guess_extension, read_from_stream
+
+
+# ---- Mocks, fixtures & helpers ---- #
+class PathOnlyReader:
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+
+    def read(self, file_path: Any = None, **kwargs: Any) -> Any:
+        self.paths.append(str(file_path))
+        from splitter_mr.schema import ReaderOutput
+
+        return ReaderOutput(text=Path(file_path).read_text(), document_path=str(file_path))
+
+
+class NonSeekableStream(io.RawIOBase):
+    def __init__(self, data: bytes) -> None:
+        self._inner = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self._inner.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+# ---- Happy path ---- #
+def test_read_from_stream_markitdown_reader_converts_bytes() -> None:
+    output = read_from_stream(MarkItDownReader(), b"hello from memory", filename="note.txt")
+
+    assert "hello from memory" in output.text
+    assert output.document_name == "note.txt"
+    assert output.reader_method == "markitdown"
+
+
+def test_read_from_stream_applies_markitdown_read_defaults(tmp_path: Path) -> None:
+    path = tmp_path / "note.txt"
+    path.write_text("hello <!-- page --> world")
+    reader = MarkItDownReader()
+
+    streamed = read_from_stream(reader, path.read_bytes(), filename="note.txt")
+    from_file = reader.read(str(path))
+    labelled = read_from_stream(reader, b"text", filename="n.txt", document_id="doc-7")
+
+    assert streamed.text == from_file.text
+    assert streamed.page_placeholder == from_file.page_placeholder == "<!-- page -->"
+    assert streamed.document_id
+    assert labelled.document_id == "doc-7"
+    assert labelled.page_placeholder is None
+
+
+def test_read_from_stream_path_only_reader_uses_temp_file() -> None:
+    reader = PathOnlyReader()
+
+    output = read_from_stream(reader, io.BytesIO(b"payload"), mimetype="text/plain")
+
+    assert output.text == "payload"
+    assert reader.paths[0].endswith(".txt")
+    assert not Path(reader.paths[0]).exists()
+    assert output.document_path == ""
+
+
+def test_cached_reader_read_stream_second_call_hits_cache(tmp_path: Path) -> None:
+    reader = PathOnlyReader()
+    cached = CachedReader(reader, ConversionCache(tmp_path))
+
+    cached.read_stream(b"same bytes", filename="a.txt")
+    output = cached.read_stream(b"same bytes", filename="b.txt")
+
+    assert len(reader.paths) == 1
+    assert output.text == "same bytes"
+    assert output.document_name == "b.txt"
+
+
+def test_cached_reader_read_stream_keeps_requested_document_id(tmp_path: Path) -> None:
+    reader = PathOnlyReader()
+    cached = CachedReader(reader, ConversionCache(tmp_path))
+
+    cached.read_stream(b"same bytes", filename="a.txt", document_id="first")
+    output = cached.read_stream(b"same bytes", filename="a.txt", document_id="second")
+
+    assert len(reader.paths) == 1
+    assert output.document_id == "second"
+
+
+# ---- Edge cases ---- #
+def test_read_from_stream_non_seekable_stream_is_buffered() -> None:
+    output = read_from_stream(
+        MarkItDownReader(), NonSeekableStream(b"streamed text"), filename="s.txt"
+    )
+
+    assert "streamed text" in output.text
+
+
+def test_guess_extension_prefers_filename_over_mimetype() -> None:
+    assert guess_extension("Report.PDF", "text/plain") == ".pdf"
+    assert guess_extension(None, "application/pdf") == ".pdf"
+    assert guess_extension(None, None) == ""
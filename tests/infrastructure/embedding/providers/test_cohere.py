@@ -114,3 +114,18 @@ class TestCohereEmbeddingModel:
 
         mock_inst.embed_documents.assert_called_once_with(["hello"])
         assert result.embeddings == [[0.1, 0.2]]
+
+    def test_init_dimensions_applied_client_side(self, mock_cohere_embeddings):
+        """Test that dimensions fall back to truncation for Cohere."""
+        mock_inst = mock_cohere_embeddings.return_value
+        mock_inst.embed_documents.return_value = [[3.0, 4.0, 12.0]]
+
+        model = CohereEmbeddingModel(api_key="k", dimensions=2)
+        result = model.embed(
+            MagicMock(
+                chunks=["hello"], chunk_id=["c1"], document_path="/t.txt", split_method="char"
+            )
+        )
+
+        assert "dimensions" not in mock_cohere_embeddings.call_args.kwargs
+        assert result.embeddings == [[0.6, 0.8]]
@@ -0,0 +1,93 @@
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.embedding import EmbeddingConfigDTO, EmbeddingProvider
+from src.infrastructure.embedding.adapters.hashing import (
+    HashingEmbeddingModel,
+    HashingEmbeddings,
+)
+from src.infrastructure.embedding.factory import EmbeddingFactory
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+def _dot(a: list[float], b: list[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+# ---- Happy path ---- #
+
+
+class TestHashingEmbeddingModel:
+    def test_embed_documents_is_deterministic_unit_vectors(self):
+        """Test that vectors are stable, fixed-size and normalized."""
+        client = HashingEmbeddingModel(dimensions=64).client
+
+        first = client.embed_documents(["hello world", "foo"])
+        second = HashingEmbeddingModel(dimensions=64).client.embed_documents(["hello world", "foo"])
+
+        assert first == second
+        assert all(len(v) == 64 for v in first)
+        assert math.isclose(math.sqrt(_dot(first[0], first[0])), 1.0, rel_tol=1e-5)
+
+    def test_similar_texts_score_higher_than_unrelated(self):
+        """Test that shared n-grams and tokens produce similarity."""
+        client = HashingEmbeddings()
+        a, b, c = client.embed_documents(
+            ["the quick brown fox", "the quick brown foxes", "quarterly revenue report"]
+        )
+
+        assert _dot(a, b) > _dot(a, c)
+
+    def test_query_matches_document_vector(self):
+        """Test that queries and documents share the same space."""
+        client = HashingEmbeddings()
+
+        assert client.embed_query("retrieval") == client.embed_documents(["retrieval"])[0]
+
+    def test_model_name_seeds_hashes(self):
+        """Test that different model names give different vectors."""
+        assert HashingEmbeddings(model="a").embed_query("x y z") != HashingEmbeddings(
+            model="b"
+        ).embed_query("x y z")
+
+    @pytest.mark.asyncio
+    async def test_async_methods_match_sync(self):
+        """Test the async variants."""
+        client = HashingEmbeddings(dimensions=32)
+
+        assert await client.aembed_documents(["a b"]) == client.embed_documents(["a b"])
+        assert await client.aembed_query("a b") == client.embed_query("a b")
+
+    def test_factory_creates_hashing_model_from_config(self):
+        """Test registration and that connection settings are ignored."""
+        model = EmbeddingFactory.create(
+            EmbeddingProvider.HASHING,
+            config=EmbeddingConfigDTO(api_key="unused", dimensions=128),
+        )
+
+        assert isinstance(model, HashingEmbeddingModel)
+        assert model.client.dimensions == 128
+
+    def test_embed_returns_dto(self):
+        """Test the full embed() path."""
+        result = HashingEmbeddingModel().embed(
+            MagicMock(
+                chunks=["alpha", "beta"], chunk_id=["1", "2"], document_path="", split_method=""
+            )
+        )
+
+        assert len(result.embeddings) == 2
+        assert len(result.embeddings[0]) == 384
+
+    # ---- Edge cases ---- #
+
+    def test_empty_text_gives_zero_vector(self):
+        """Test that featureless input does not divide by zero."""
+        assert HashingEmbeddings(dimensions=8).embed_query("") == [0.0] * 8
+
+    def test_empty_batch_returns_empty_list(self):
+        """Test an empty batch."""
+        assert HashingEmbeddings().embed_documents([]) == []
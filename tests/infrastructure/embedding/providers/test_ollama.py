@@ -109,3 +109,12 @@ class TestOllamaEmbeddingModel:
 
         mock_inst.embed_documents.assert_called_once_with(["hello"])
         assert result.embeddings == [[0.1, 0.2]]
+
+    def test_init_sorts_by_length_unless_disabled(self, mock_ollama_embeddings):
+        """Test that length bucketing is on by default and configurable."""
+        default = OllamaEmbeddingModel(model="nomic-embed-text")
+        disabled = OllamaEmbeddingModel(model="nomic-embed-text", sort_by_length=False)
+
+        assert default.sort_by_length is True
+        assert disabled.sort_by_length is False
+        assert "sort_by_length" not in mock_ollama_embeddings.call_args.kwargs
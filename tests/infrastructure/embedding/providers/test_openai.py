@@ -131,3 +131,10 @@ class TestOpenAIEmbeddingModel:
         assert model.client == mock_inst
         assert hasattr(model.client, "embed_documents")
         assert hasattr(model.client, "embed_query")
+
+    def test_init_dimensions_forwarded_to_client(self, mock_openai_embeddings):
+        """Test that dimensions use the native OpenAI parameter."""
+        model = OpenAIEmbeddingModel(api_key="sk-test", dimensions=512)
+
+        assert mock_openai_embeddings.call_args.kwargs["dimensions"] == 512
+        assert model.dimensions == 512
@@ -108,3 +108,11 @@ class TestVoyageAIEmbeddingModel:
 
         mock_inst.embed_documents.assert_called_once_with(["hello"])
         assert result.embeddings == [[0.1, 0.2]]
+
+    def test_init_dimensions_maps_to_output_dimension(self, mock_voyage_embeddings):
+        """Test that dimensions map to the VoyageAI parameter."""
+        VoyageAIEmbeddingModel(api_key="k", dimensions=256)
+
+        kw = mock_voyage_embeddings.call_args.kwargs
+        assert kw["output_dimension"] == 256
+        assert "dimensions" not in kw
@@ -1,9 +1,16 @@
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any, Optional
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
+import numpy as np
+import pytest
+
+from src.domain.embedding import OPENAI_EMBEDDING_BATCH_LIMITS, EmbeddingFormat
 from src.infrastructure.embedding.base import BaseEmbedding
+from src.infrastructure.rate_limit import RateLimiter
+from src.infrastructure.utils import estimate_tokens
 
 # ---- Mocks, fixtures & helpers ---- #
 
@@ -149,3 +156,367 @@ class TestBaseEmbedding:
         r2 = model.embed(splitter_output)
 
         assert r1.embedding_id != r2.embedding_id
+
+
+class TestBaseEmbeddingBatching:
+    def test_embed_item_limit_splits_requests_and_keeps_order(self):
+        """Test that chunks are sent in bounded batches and reassembled."""
+        mock_client = MagicMock()
+        mock_client.embed_documents.side_effect = lambda texts: [
+            [float(len(t))] for t in texts
+        ]
+        model = ConcreteEmbedding(mock_client)
+        model.max_batch_items = 2
+        model.max_concurrency = 3
+
+        result = model.embed(
+            MockSplitterOutput(
+                chunks=["a", "bb", "ccc", "dddd", "eeeee"],
+                chunk_id=["1", "2", "3", "4", "5"],
+            )
+        )
+
+        assert mock_client.embed_documents.call_count == 3
+        assert result.embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+
+    def test_embed_provider_token_limit_splits_requests(self):
+        """Test that the class-level provider token limit is honoured."""
+        mock_client = MagicMock()
+        mock_client.embed_documents.side_effect = lambda texts: [[0.0]] * len(texts)
+        model = ConcreteEmbedding(mock_client)
+        model._BATCH_LIMITS = {"max_tokens": 30}
+
+        model.embed(
+            MockSplitterOutput(chunks=["x" * 80, "y" * 80, "z" * 80], chunk_id=["1", "2", "3"])
+        )
+
+        batches = [c.args[0] for c in mock_client.embed_documents.call_args_list]
+        assert [len(b) for b in batches] == [1, 1, 1]
+
+    def test_embed_dense_text_stays_under_provider_token_cap(self):
+        """Test that text denser than four chars per token is not overpacked."""
+        mock_client = MagicMock()
+        mock_client.embed_documents.side_effect = lambda texts: [[0.0]] * len(texts)
+        model = ConcreteEmbedding(mock_client)
+        model._BATCH_LIMITS = OPENAI_EMBEDDING_BATCH_LIMITS
+        # About one real token per CJK character and per three characters of code.
+        cjk, code = "語" * 30_000, "x=f(a[i]);" * 9_000
+        real_tokens = {cjk: 30_000, code: 30_000}
+
+        model.embed(MockSplitterOutput(chunks=[cjk, code] * 20, chunk_id=["c"] * 40))
+
+        batches = [c.args[0] for c in mock_client.embed_documents.call_args_list]
+        assert len(batches) > 1
+        assert all(
+            sum(real_tokens[text] for text in batch)
+            <= OPENAI_EMBEDDING_BATCH_LIMITS["max_tokens"]
+            for batch in batches
+        )
+
+    def test_extract_options_removes_wrapper_keys(self):
+        """Test that batching options are consumed and not forwarded."""
+        model = ConcreteEmbedding(MagicMock())
+
+        params = model._extract_options(
+            {"model": "m", "max_batch_items": 8, "max_concurrency": 4, "batch_retries": 2}
+        )
+
+        assert params == {"model": "m"}
+        assert (model.max_batch_items, model.max_concurrency, model.batch_retries) == (8, 4, 2)
+
+    def test_embed_sort_by_length_buckets_and_restores_order(self):
+        """Test that similar lengths share a batch and output order is kept."""
+        mock_client = MagicMock()
+        mock_client.embed_documents.side_effect = lambda texts: [
+            [float(len(t))] for t in texts
+        ]
+        model = ConcreteEmbedding(mock_client)
+        model.max_batch_items = 2
+        model.sort_by_length = True
+        chunks = ["x" * 400, "a", "y" * 400, "bb"]
+
+        result = model.embed(MockSplitterOutput(chunks=chunks, chunk_id=["1", "2", "3", "4"]))
+
+        batches = [c.args[0] for c in mock_client.embed_documents.call_args_list]
+        assert batches == [["a", "bb"], ["x" * 400, "y" * 400]]
+        assert result.embeddings == [[400.0], [1.0], [400.0], [2.0]]
+
+    def test_embed_sort_by_length_reduces_padded_characters(self):
+        """Test that bucketing cuts the work of a backend padding each batch."""
+        chunks = ["short chunk " * 8 if i % 4 else "long chunk " * 800 for i in range(128)]
+        output = MockSplitterOutput(chunks=chunks, chunk_id=[str(i) for i in range(128)])
+        padded: dict[bool, int] = {}
+        for bucketed in (False, True):
+            mock_client = MagicMock()
+            mock_client.embed_documents.side_effect = lambda texts: [[1.0]] * len(texts)
+            model = ConcreteEmbedding(mock_client)
+            model.max_batch_items = 16
+            model.sort_by_length = bucketed
+
+            model.embed(output)
+
+            batches = [c.args[0] for c in mock_client.embed_documents.call_args_list]
+            # A padding runner computes batch size x longest text per batch.
+            padded[bucketed] = sum(len(b) * max(map(len, b)) for b in batches)
+
+        assert padded[True] * 2 < padded[False]
+
+    # ---- Failure modes ---- #
+
+    def test_embed_failing_batch_is_retried_alone(self):
+        """Test that only the failing batch is resent on retry."""
+        calls: list[list[str]] = []
+        failed: list[bool] = []
+
+        def embed_documents(texts: list[str]) -> list[list[float]]:
+            calls.append(texts)
+            if texts == ["c"] and not failed:
+                failed.append(True)
+                raise RuntimeError("transient")
+            return [[1.0]] * len(texts)
+
+        mock_client = MagicMock()
+        mock_client.embed_documents.side_effect = embed_documents
+        model = ConcreteEmbedding(mock_client)
+        model.max_batch_items = 2
+        model.batch_retries = 1
+        model.batch_retry_backoff = 0.0
+
+        result = model.embed(MockSplitterOutput(chunks=["a", "b", "c"], chunk_id=["1", "2", "3"]))
+
+        assert calls == [["a", "b"], ["c"], ["c"]]
+        assert len(result.embeddings) == 3
+
+    def test_embed_retries_exhausted_raises(self):
+        """Test that the error surfaces once the retries are used up."""
+        mock_client = MagicMock()
+        mock_client.embed_documents.side_effect = RuntimeError("down")
+        model = ConcreteEmbedding(mock_client)
+        model.batch_retries = 2
+        model.batch_retry_backoff = 0.0
+
+        with pytest.raises(RuntimeError):
+            model.embed(MockSplitterOutput(chunks=["a"], chunk_id=["1"]))
+
+        assert mock_client.embed_documents.call_count == 3
+
+
+class TestBaseEmbeddingMatrixMode:
+    def test_embed_numpy_format_returns_float32_matrix(self):
+        """Test that matrix mode yields a contiguous float32 array."""
+        mock_client = MagicMock()
+        mock_client.embed_documents.return_value = [[0.5, 1.0], [2.0, 4.0]]
+        model = ConcreteEmbedding(mock_client)
+        model.output_format = EmbeddingFormat.NUMPY
+
+        result = model.embed(MockSplitterOutput(chunks=["a", "b"], chunk_id=["1", "2"]))
+
+        assert result.matrix.dtype == np.float32
+        assert result.matrix.shape == (2, 2)
+        assert result.matrix.flags["C_CONTIGUOUS"]
+        assert result.embeddings[1] == [2.0, 4.0]
+        assert result.embeddings == [[0.5, 1.0], [2.0, 4.0]]
+        assert len(result.embeddings) == 2
+
+    def test_embed_default_format_has_no_matrix(self):
+        """Test that list mode remains the default."""
+        mock_client = MagicMock()
+        mock_client.embed_documents.return_value = [[0.5]]
+
+        result = ConcreteEmbedding(mock_client).embed(
+            MockSplitterOutput(chunks=["a"], chunk_id=["1"])
+        )
+
+        assert result.matrix is None
+        assert isinstance(result.embeddings, list)
+
+
+class TestBaseEmbeddingDimensions:
+    def test_embed_dimensions_truncates_and_normalizes(self):
+        """Test client-side Matryoshka truncation to unit vectors."""
+        mock_client = MagicMock()
+        mock_client.embed_documents.return_value = [[3.0, 4.0, 5.0], [0.0, 0.0, 1.0]]
+        model = ConcreteEmbedding(mock_client)
+        model.dimensions = 2
+
+        result = model.embed(MockSplitterOutput(chunks=["a", "b"], chunk_id=["1", "2"]))
+
+        assert result.embeddings == [[0.6, 0.8], [0.0, 0.0]]
+
+    def test_embed_query_applies_dimensions(self):
+        """Test that query vectors match the document vector size."""
+        mock_client = MagicMock()
+        mock_client.embed_query.return_value = [0.0, 2.0, 9.0]
+        model = ConcreteEmbedding(mock_client)
+        model.dimensions = 2
+
+        assert model.embed_query("q") == [0.0, 1.0]
+
+    def test_queries_are_charged_to_the_rate_limiter(self, monkeypatch):
+        """Test that queries wait for the shared budget like batches do."""
+        limiter = MagicMock()
+        limiter.aacquire = AsyncMock()
+        monkeypatch.setattr(RateLimiter, "shared", classmethod(lambda cls: limiter))
+        mock_client = MagicMock()
+        mock_client.embed_query.return_value = [1.0]
+        mock_client.aembed_query = AsyncMock(return_value=[1.0])
+        model = ConcreteEmbedding(mock_client)
+
+        model.embed_query("some query")
+        asyncio.run(model.aembed_query("some query"))
+
+        provider, model_name = model._identity()
+        tokens = estimate_tokens("some query")
+        limiter.acquire.assert_called_once_with(provider, model_name, tokens=tokens)
+        limiter.aacquire.assert_awaited_once_with(provider, model_name, tokens=tokens)
+
+    def test_identity_is_resolved_once_per_instance(self, monkeypatch):
+        """Test that the registry is not scanned on every batch."""
+        mock_client = MagicMock()
+        mock_client.embed_documents.side_effect = lambda texts: [[1.0]] * len(texts)
+        model = ConcreteEmbedding(mock_client)
+        model.max_batch_items = 1
+        resolve = MagicMock(return_value=("provider", "model"))
+        monkeypatch.setattr(model, "_resolve_identity", resolve)
+
+        model.embed(MockSplitterOutput(chunks=["a", "b", "c"], chunk_id=["1", "2", "3"]))
+        model.embed_query("q")
+
+        assert resolve.call_count == 1
+
+    def test_extract_options_keeps_dimensions_for_native_providers(self):
+        """Test that native providers still receive the dimensions key."""
+        model = ConcreteEmbedding(MagicMock())
+        model._NATIVE_DIMENSIONS = True
+
+        params = model._extract_options({"dimensions": 256})
+
+        assert params == {"dimensions": 256}
+        assert model.dimensions == 256
+
+
+class TestBaseEmbeddingAsync:
+    @pytest.mark.asyncio
+    async def test_aembed_matches_embed_output(self):
+        """Test that the async path builds the same DTO as embed()."""
+        mock_client = MagicMock()
+        mock_client.embed_documents.return_value = [[0.1, 0.2], [0.3, 0.4]]
+        mock_client.aembed_documents = AsyncMock(return_value=[[0.1, 0.2], [0.3, 0.4]])
+        model = ConcreteEmbedding(mock_client)
+        splitter_output = MockSplitterOutput(
+            chunks=["a", "b"], chunk_id=["1", "2"], document_name="d", split_method="s"
+        )
+
+        sync_result = model.embed(splitter_output)
+        async_result = await model.aembed(splitter_output)
+
+        async_result.embedding_id = sync_result.embedding_id
+        assert async_result == sync_result
+
+    @pytest.mark.asyncio
+    async def test_aembed_sort_by_length_restores_order(self):
+        """Test that async bucketing sends sorted batches and keeps order."""
+        mock_client = MagicMock()
+        mock_client.aembed_documents = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] for t in texts]
+        )
+        model = ConcreteEmbedding(mock_client)
+        model.sort_by_length = True
+        chunks = ["x" * 400, "a", "bb"]
+
+        result = await model.aembed(MockSplitterOutput(chunks=chunks, chunk_id=["1", "2", "3"]))
+
+        mock_client.aembed_documents.assert_awaited_once_with(["a", "bb", "x" * 400])
+        assert result.embeddings == [[400.0], [1.0], [2.0]]
+
+    @pytest.mark.asyncio
+    async def test_aembed_limits_in_flight_requests_per_instance(self):
+        """Test that concurrent calls share the instance semaphore."""
+        in_flight = peak = 0
+
+        async def aembed_documents(texts: list[str]) -> list[list[float]]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[1.0] for _ in texts]
+
+        mock_client = MagicMock()
+        mock_client.aembed_documents = aembed_documents
+        model = ConcreteEmbedding(mock_client)
+        model.max_batch_items = 1
+        model.max_async_concurrency = 2
+
+        output = MockSplitterOutput(chunks=["a", "b", "c"], chunk_id=["1", "2", "3"])
+        results = await asyncio.gather(*(model.aembed(output) for _ in range(3)))
+
+        assert peak == 2
+        assert all(len(result.embeddings) == 3 for result in results)
+
+    @pytest.mark.asyncio
+    async def test_aembed_query_applies_dimensions(self):
+        """Test the async query path."""
+        mock_client = MagicMock()
+        mock_client.aembed_query = AsyncMock(return_value=[3.0, 4.0, 1.0])
+        model = ConcreteEmbedding(mock_client)
+        model.dimensions = 2
+
+        assert await model.aembed_query("q") == [0.6, 0.8]
+
+    # ---- Failure modes ---- #
+
+    @pytest.mark.asyncio
+    async def test_aembed_cancellation_cancels_pending_batches(self):
+        """Test that cancelling the caller cancels every batch request."""
+        started = asyncio.Event()
+        cancelled: list[str] = []
+
+        async def aembed_documents(texts: list[str]) -> list[list[float]]:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.extend(texts)
+                raise
+            return [[1.0] for _ in texts]
+
+        mock_client = MagicMock()
+        mock_client.aembed_documents = aembed_documents
+        model = ConcreteEmbedding(mock_client)
+        model.max_batch_items = 1
+        task = asyncio.create_task(
+            model.aembed(MockSplitterOutput(chunks=["a", "b"], chunk_id=["1", "2"]))
+        )
+        await started.wait()
+
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert sorted(cancelled) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_aembed_failing_batch_cancels_siblings(self):
+        """Test that one failing batch stops the other requests."""
+        cancelled: list[str] = []
+
+        async def aembed_documents(texts: list[str]) -> list[list[float]]:
+            if texts == ["bad"]:
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.extend(texts)
+                raise
+            return [[1.0]]
+
+        mock_client = MagicMock()
+        mock_client.aembed_documents = aembed_documents
+        model = ConcreteEmbedding(mock_client)
+        model.max_batch_items = 1
+
+        with pytest.raises(RuntimeError):
+            await model.aembed(MockSplitterOutput(chunks=["ok", "bad"], chunk_id=["1", "2"]))
+
+        assert cancelled == ["ok"]
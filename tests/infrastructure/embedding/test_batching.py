@@ -0,0 +1,35 @@
+from src.infrastructure.embedding.batching import packing_tokens, plan_batches
+
+# ---- Happy path ---- #
+
+
+def test_plan_batches_no_limits_returns_single_batch():
+    assert plan_batches([5, 5, 5]) == [[0, 1, 2]]
+
+
+def test_plan_batches_item_limit_splits_in_order():
+    assert plan_batches([1] * 5, max_items=2) == [[0, 1], [2, 3], [4]]
+
+
+def test_plan_batches_token_limit_splits_before_overflow():
+    assert plan_batches([4, 4, 4, 1], max_tokens=8) == [[0, 1], [2, 3]]
+
+
+def test_plan_batches_custom_order_is_followed():
+    assert plan_batches([1, 1, 1], max_items=2, order=[2, 0, 1]) == [[2, 0], [1]]
+
+
+def test_packing_tokens_counts_dense_scripts_conservatively():
+    assert packing_tokens("a" * 300) == 101
+    assert packing_tokens("語" * 300) == 301
+
+
+# ---- Edge cases ---- #
+
+
+def test_plan_batches_oversize_text_gets_own_batch():
+    assert plan_batches([2, 50, 2], max_tokens=10) == [[0], [1], [2]]
+
+
+def test_plan_batches_empty_input_returns_no_batches():
+    assert plan_batches([], max_items=3) == []
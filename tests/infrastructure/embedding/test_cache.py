@@ -0,0 +1,183 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.services.rag.base import BaseRagService
+from src.infrastructure.embedding.base import BaseEmbedding
+from src.infrastructure.embedding.cache import CachedEmbedding, EmbeddingCache
+from src.infrastructure.embedding.factory import EmbeddingFactory
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+@dataclass
+class MockSplitterOutput:
+    chunks: list[str] = field(default_factory=list)
+    chunk_id: list[str] = field(default_factory=list)
+    document_path: str = ""
+    split_method: str = ""
+
+
+class FakeEmbedding(BaseEmbedding):
+    def __init__(self, config: Optional[Any] = None, model: str = "m1", **kwargs: Any) -> None:
+        self.client = MagicMock()
+        self.client.model = model
+        self.client.dimensions = None
+        self.client.embed_documents.side_effect = lambda texts: [
+            [len(t) + 0.1, 1.0 / 3] for t in texts
+        ]
+        self.client.embed_query.side_effect = lambda text: [-float(len(text)), 0.5]
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> EmbeddingCache:
+    return EmbeddingCache(tmp_path / "vectors.db")
+
+
+def _output(*chunks: str) -> MockSplitterOutput:
+    return MockSplitterOutput(chunks=list(chunks), chunk_id=[str(i) for i in range(len(chunks))])
+
+
+# ---- Happy path ---- #
+
+
+def test_cached_embedding_hit_skips_provider(store: EmbeddingCache) -> None:
+    inner = FakeEmbedding()
+    model = CachedEmbedding(inner, store, provider="fake")
+
+    first = model.embed(_output("alpha", "beta"))
+    second = model.embed(_output("beta", "alpha"))
+
+    assert inner.client.embed_documents.call_count == 1
+    assert second.embeddings == [first.embeddings[1], first.embeddings[0]]
+    assert (model.hits, model.misses) == (2, 2)
+
+
+def test_cached_embedding_only_misses_are_sent(store: EmbeddingCache) -> None:
+    inner = FakeEmbedding()
+    model = CachedEmbedding(inner, store, provider="fake")
+    model.embed(_output("alpha"))
+
+    model.embed(_output("alpha", "gamma", "gamma"))
+
+    inner.client.embed_documents.assert_called_with(["gamma"])
+
+
+def test_cached_embedding_vectors_are_float32_on_hit_and_miss(store: EmbeddingCache) -> None:
+    model = CachedEmbedding(FakeEmbedding(), store, provider="fake")
+
+    miss = model.embed(_output("abc")).embeddings
+    hit = model.embed(_output("abc")).embeddings
+
+    assert miss == hit
+    assert miss[0][1] != 1.0 / 3
+    assert miss[0][1] == pytest.approx(1.0 / 3, rel=1e-6)
+
+
+def test_cached_embedding_persists_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "vectors.db"
+    CachedEmbedding(FakeEmbedding(), EmbeddingCache(path), provider="fake").embed(_output("x"))
+
+    inner = FakeEmbedding()
+    CachedEmbedding(inner, EmbeddingCache(path), provider="fake").embed(_output("x"))
+
+    inner.client.embed_documents.assert_not_called()
+
+
+def test_factory_create_with_cache_wraps_model(store: EmbeddingCache) -> None:
+    original = EmbeddingFactory._registry.copy()
+    try:
+        EmbeddingFactory.register("fake")(FakeEmbedding)
+
+        model = EmbeddingFactory.create("fake", cache=store)
+    finally:
+        EmbeddingFactory._registry = original
+
+    assert isinstance(model, CachedEmbedding)
+    assert model.namespace == "fake|m1|"
+
+
+@pytest.mark.asyncio
+async def test_cached_embedding_aembed_shares_cache_with_sync_path(store: EmbeddingCache) -> None:
+    inner = FakeEmbedding()
+    inner.client.aembed_documents = AsyncMock(return_value=[[9.0, 9.0]])
+    model = CachedEmbedding(inner, store, provider="fake")
+    model.embed(_output("alpha"))
+
+    result = await model.aembed(_output("alpha", "beta"))
+
+    inner.client.aembed_documents.assert_awaited_once_with(["beta"])
+    assert result.embeddings[1] == [9.0, 9.0]
+
+
+@pytest.mark.asyncio
+async def test_cached_embedding_caches_queries_apart_from_documents(
+    store: EmbeddingCache,
+) -> None:
+    inner = FakeEmbedding()
+    inner.client.aembed_query = AsyncMock(return_value=[7.0, 7.0])
+    model = CachedEmbedding(inner, store, provider="fake")
+    document = model.embed(_output("alpha")).embeddings[0]
+
+    first = model.embed_query("alpha")
+    second = model.embed_query("alpha")
+    other = await model.aembed_query("beta")
+
+    assert first == second == [-5.0, 0.5] != document
+    assert inner.client.embed_query.call_count == 1
+    assert other == [7.0, 7.0]
+    assert await model.aembed_query("beta") == other
+    inner.client.aembed_query.assert_awaited_once_with("beta")
+    assert (model.hits, model.misses) == (2, 3)
+
+
+def test_cached_embedding_exposes_wrapped_dimensions(store: EmbeddingCache) -> None:
+    inner = FakeEmbedding()
+    inner.dimensions = 256
+
+    model = CachedEmbedding(inner, store, provider="fake")
+
+    assert model.dimensions == 256
+    assert BaseRagService._vector_dimension([], model) == 256
+
+
+def test_cached_embedding_keeps_asymmetric_queries_out_of_coalescing(
+    store: EmbeddingCache,
+) -> None:
+    inner = FakeEmbedding()
+    inner._SYMMETRIC_QUERIES = False
+    service = BaseRagService(
+        vector_db=MagicMock(),
+        embedding_model=CachedEmbedding(inner, store, provider="fake"),
+        chat_service=MagicMock(),
+        query_batch_window=0.01,
+    )
+
+    assert service._get_query_coalescer() is None
+
+
+# ---- Edge cases ---- #
+
+
+def test_cached_embedding_other_model_is_a_miss(store: EmbeddingCache) -> None:
+    CachedEmbedding(FakeEmbedding(model="m1"), store, provider="fake").embed(_output("x"))
+    inner = FakeEmbedding(model="m2")
+
+    CachedEmbedding(inner, store, provider="fake").embed(_output("x"))
+
+    inner.client.embed_documents.assert_called_once_with(["x"])
+
+
+def test_embedding_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    store = EmbeddingCache(tmp_path / "vectors.db", max_bytes=16)
+    store.put_many({"a": [1.0, 2.0]})
+    store.put_many({"b": [3.0, 4.0]})
+    store.get_many(["a"])
+
+    store.put_many({"c": [5.0, 6.0]})
+
+    assert set(store.get_many(["a", "b", "c"])) == {"a", "c"}
+    assert store.size_bytes() == 16
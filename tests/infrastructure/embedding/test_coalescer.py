@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.infrastructure.embedding.coalescer import QueryCoalescer
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+class RecordingEmbedding:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[list[str]] = []
+        self.fail = fail
+        self.release = threading.Event()
+        self.release.set()
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.release.wait(timeout=5)
+        self.calls.append(texts)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [[float(len(text))] for text in texts]
+
+
+# ---- Happy path ---- #
+
+
+@pytest.mark.asyncio
+async def test_embed_query_concurrent_callers_share_one_batch() -> None:
+    embedding = RecordingEmbedding()
+    coalescer = QueryCoalescer(embedding, window=0.01)
+
+    vectors = await asyncio.gather(*(coalescer.embed_query(t) for t in ["a", "bb", "ccc"]))
+
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert embedding.calls == [["a", "bb", "ccc"]]
+    assert (coalescer.requests, coalescer.batches) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_embed_query_duplicate_texts_are_sent_once() -> None:
+    embedding = RecordingEmbedding()
+    coalescer = QueryCoalescer(embedding, window=0.01)
+
+    first, second = await asyncio.gather(coalescer.embed_query("x"), coalescer.embed_query("x"))
+
+    assert first == second == [1.0]
+    assert first is not second
+    assert embedding.calls == [["x"]]
+
+
+@pytest.mark.asyncio
+async def test_embed_query_max_batch_size_flushes_early() -> None:
+    embedding = RecordingEmbedding()
+    coalescer = QueryCoalescer(embedding, window=10.0, max_batch_size=2)
+
+    vectors = await asyncio.wait_for(
+        asyncio.gather(coalescer.embed_query("a"), coalescer.embed_query("b")), timeout=1
+    )
+
+    assert vectors == [[1.0], [1.0]]
+
+
+@pytest.mark.asyncio
+async def test_embed_query_joins_in_flight_request() -> None:
+    embedding = RecordingEmbedding()
+    embedding.release.clear()
+    coalescer = QueryCoalescer(embedding, window=0.0)
+    first = asyncio.create_task(coalescer.embed_query("x"))
+    await asyncio.sleep(0.02)
+
+    second = asyncio.create_task(coalescer.embed_query("x"))
+    await asyncio.sleep(0)
+    embedding.release.set()
+
+    assert await first == await second == [1.0]
+    assert embedding.calls == [["x"]]
+
+
+# ---- Failure modes ---- #
+
+
+@pytest.mark.asyncio
+async def test_embed_query_provider_error_reaches_every_caller() -> None:
+    coalescer = QueryCoalescer(RecordingEmbedding(fail=True), window=0.01)
+
+    results = await asyncio.gather(
+        coalescer.embed_query("a"), coalescer.embed_query("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_embed_query_cancelled_caller_does_not_cancel_others() -> None:
+    coalescer = QueryCoalescer(RecordingEmbedding(), window=0.02)
+    cancelled = asyncio.create_task(coalescer.embed_query("x"))
+    survivor = asyncio.create_task(coalescer.embed_query("x"))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+
+    assert await survivor == [1.0]
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
@@ -0,0 +1,189 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.embedding.base import BaseEmbedding
+from src.infrastructure.embedding.cache import CachedEmbedding, EmbeddingCache
+from src.infrastructure.embedding.instrumentation import (
+    BaseEmbeddingSink,
+    EmbeddingEvent,
+    InMemoryEmbeddingMetrics,
+    LatencyHistogram,
+    current_call_stats,
+)
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+@dataclass
+class MockSplitterOutput:
+    chunks: list[str] = field(default_factory=list)
+    chunk_id: list[str] = field(default_factory=list)
+    document_path: str = ""
+    split_method: str = ""
+
+
+class RecordingSink(BaseEmbeddingSink):
+    def __init__(self) -> None:
+        self.events: list[EmbeddingEvent] = []
+
+    def emit(self, event: EmbeddingEvent) -> None:
+        self.events.append(event)
+
+
+class FakeEmbedding(BaseEmbedding):
+    def __init__(self, **kwargs: Any) -> None:
+        self.client = MagicMock()
+        self.client.model = "fake-model"
+        self.client.embed_documents.side_effect = lambda texts: [[1.0, 0.0] for _ in texts]
+        self.client.embed_query.side_effect = lambda text: [1.0, 0.0]
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+def _output(*chunks: str) -> MockSplitterOutput:
+    return MockSplitterOutput(chunks=list(chunks), chunk_id=[str(i) for i in range(len(chunks))])
+
+
+def _event(latency: float, items: int = 1, **kwargs: Any) -> EmbeddingEvent:
+    values: dict[str, Any] = dict(
+        provider="p", model="m", operation="embed", items=items, tokens=items, input_bytes=items
+    )
+    values.update(kwargs)
+    return EmbeddingEvent(latency=latency, **values)
+
+
+# ---- Happy path ---- #
+
+
+def test_latency_histogram_percentiles_within_precision() -> None:
+    histogram = LatencyHistogram(precision=0.01)
+    for value in range(1, 1001):
+        histogram.record(value / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.01)
+    assert histogram.percentile(100) == pytest.approx(1.0)
+    assert histogram.mean == pytest.approx(0.5005)
+
+
+def test_in_memory_metrics_aggregates_per_provider_and_model() -> None:
+    metrics = InMemoryEmbeddingMetrics()
+    metrics.emit(_event(0.1, items=10, requests=2, retries=1))
+    metrics.emit(_event(0.3, items=30, cache_hits=5, error="TimeoutError"))
+    metrics.emit(_event(0.2, items=1, model="other"))
+
+    snapshot = metrics.snapshot()
+
+    summary = snapshot["p/m"]
+    assert summary["calls"] == 2
+    assert summary["errors"] == 1
+    assert summary["items"] == 40
+    assert summary["requests"] == 2
+    assert summary["retries"] == 1
+    assert summary["cache_hits"] == 5
+    assert summary["latency_max"] == pytest.approx(0.3)
+    assert summary["items_per_second"] == pytest.approx(100.0)
+    assert snapshot["p/other"]["calls"] == 1
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_embed_emits_event_with_request_and_retry_counts() -> None:
+    sink = RecordingSink()
+    model = FakeEmbedding(sinks=[sink], batch_retries=1, batch_retry_backoff=0.0)
+    model.client.embed_documents.side_effect = [
+        RuntimeError("boom"),
+        [[1.0, 0.0], [0.0, 1.0]],
+    ]
+
+    model.embed(_output("alpha", "béta"))
+
+    (event,) = sink.events
+    assert event.operation == "embed"
+    assert event.model == "fake-model"
+    assert event.provider == "FakeEmbedding"
+    assert event.items == 2
+    assert event.input_bytes == len("alpha") + len("béta".encode("utf-8"))
+    assert event.requests == 2
+    assert event.retries == 1
+    assert event.error is None
+    assert event.latency >= 0.0
+
+
+def test_requests_are_counted_across_worker_threads() -> None:
+    sink = RecordingSink()
+    model = FakeEmbedding(sinks=[sink], max_batch_items=1, max_concurrency=4)
+
+    model.embed(_output(*[f"t{i}" for i in range(8)]))
+
+    assert sink.events[0].requests == 8
+
+
+def test_cached_embedding_reports_cache_hits(tmp_path: Path) -> None:
+    sink = RecordingSink()
+    store = EmbeddingCache(tmp_path / "cache.db")
+    model = CachedEmbedding(FakeEmbedding(), store)
+    model.sinks = [sink]
+
+    model.embed(_output("a", "b"))
+    model.embed(_output("a", "c"))
+
+    first, second = sink.events
+    assert (first.cache_hits, first.requests) == (0, 1)
+    assert (second.cache_hits, second.requests) == (1, 1)
+    assert second.model == "fake-model"
+
+
+@pytest.mark.asyncio
+async def test_aembed_query_emits_event() -> None:
+    sink = RecordingSink()
+    model = FakeEmbedding(sinks=[sink])
+
+    async def _aembed_query(text: str) -> list[float]:
+        return [1.0, 0.0]
+
+    model.client.aembed_query = _aembed_query
+
+    await model.aembed_query("hello")
+
+    (event,) = sink.events
+    assert event.operation == "aembed_query"
+    assert event.items == 1
+
+
+# ---- Failure modes ---- #
+
+
+def test_failed_call_emits_error_event_and_reraises() -> None:
+    sink = RecordingSink()
+    model = FakeEmbedding(sinks=[sink])
+    model.client.embed_query.side_effect = ValueError("bad input")
+
+    with pytest.raises(ValueError):
+        model.embed_query("x")
+
+    (event,) = sink.events
+    assert event.error == "ValueError"
+    assert event.operation == "embed_query"
+
+
+def test_no_sinks_skips_measurement() -> None:
+    model = FakeEmbedding()
+    seen: list[Any] = []
+
+    def _embed(texts: list[str]) -> list[list[float]]:
+        seen.append(current_call_stats())
+        return [[1.0, 0.0] for _ in texts]
+
+    model.client.embed_documents.side_effect = _embed
+
+    model.embed(_output("a"))
+
+    assert model.sinks == ()
+    assert seen == [None]
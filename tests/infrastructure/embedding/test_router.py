@@ -0,0 +1,119 @@
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.embedding.base import BaseEmbedding
+from src.infrastructure.embedding.router import EmbeddingRouter
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+@dataclass
+class MockSplitterOutput:
+    chunks: list[str] = field(default_factory=list)
+    chunk_id: list[str] = field(default_factory=list)
+    document_path: str = ""
+    split_method: str = ""
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class Endpoint(BaseEmbedding):
+    def __init__(self, name: str, delay: float = 0.0, error: Optional[Exception] = None) -> None:
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.batches: list[list[str]] = []
+        self.client = MagicMock()
+        self.client.embed_documents.side_effect = self._embed
+        self.client.embed_query.side_effect = lambda text: self._embed([text])[0]
+
+    def _embed(self, texts: list[str]) -> list[list[float]]:
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        self.batches.append(texts)
+        return [[float(len(t))] for t in texts]
+
+
+def _output(n: int) -> MockSplitterOutput:
+    return MockSplitterOutput(
+        chunks=[f"t{i}" for i in range(n)], chunk_id=[str(i) for i in range(n)]
+    )
+
+
+# ---- Happy path ---- #
+
+
+def test_router_spreads_batches_across_endpoints() -> None:
+    a, b = Endpoint("a", delay=0.02), Endpoint("b", delay=0.02)
+    router = EmbeddingRouter([a, b])
+    router.max_batch_items = 1
+
+    result = router.embed(_output(8))
+
+    assert len(result.embeddings) == 8
+    assert a.batches and b.batches
+    assert len(a.batches) + len(b.batches) == 8
+
+
+def test_router_prefers_lower_latency_endpoint() -> None:
+    slow, fast = Endpoint("slow"), Endpoint("fast")
+    router = EmbeddingRouter([slow, fast])
+    router.endpoints[0].latency = 1.0
+    router.endpoints[1].latency = 0.01
+
+    router.embed_query("q")
+
+    assert fast.batches == [["q"]]
+    assert slow.batches == []
+
+
+# ---- Failure modes ---- #
+
+
+def test_router_rate_limited_endpoint_is_ejected_and_work_moves() -> None:
+    limited, healthy = Endpoint("limited", error=StatusError(429)), Endpoint("healthy")
+    router = EmbeddingRouter([limited, healthy], ejection_seconds=30.0)
+    router.endpoints[1].latency = 5.0
+
+    first = router.embed(_output(1))
+    router.embed(_output(1))
+
+    assert first.embeddings == [[2.0]]
+    assert router.endpoints[0].ejected_until > time.monotonic()
+    assert router.endpoints[0].requests == 1
+    assert len(healthy.batches) == 2
+
+
+def test_router_non_retryable_error_is_raised_without_ejection() -> None:
+    router = EmbeddingRouter([Endpoint("a", error=StatusError(400)), Endpoint("b")])
+    router.endpoints[1].latency = 5.0
+
+    with pytest.raises(StatusError):
+        router.embed_query("q")
+
+    assert router.endpoints[0].ejected_until == 0.0
+
+
+def test_router_all_endpoints_failing_raises() -> None:
+    router = EmbeddingRouter(
+        [Endpoint("a", error=StatusError(503)), Endpoint("b", error=StatusError(503))]
+    )
+
+    with pytest.raises(StatusError):
+        router.embed(_output(1))
+
+    assert all(state.outstanding == 0 for state in router.endpoints)
+
+
+def test_router_requires_endpoints() -> None:
+    with pytest.raises(ValueError):
+        EmbeddingRouter([])
@@ -0,0 +1,134 @@
+import asyncio
+import time
+
+import pytest
+
+from src.domain.llm.types import LLMProvider
+from src.infrastructure.llm.adapters.simulated import (
+    SimulatedChatModel,
+    SimulatedModel,
+    SimulatedProviderError,
+)
+from src.infrastructure.llm.factory import LlmFactory
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+def _fast(**kwargs) -> SimulatedChatModel:
+    profile = {"ttft_seconds": 0.0, "tokens_per_second": 0.0, "output_tokens": 12}
+    profile.update(kwargs)
+    return SimulatedModel(**profile).client
+
+
+# ---- Happy path ---- #
+
+
+class TestSimulatedModel:
+    def test_factory_creates_simulated_model(self):
+        """Test that the provider is available through the factory."""
+        llm = LlmFactory.create(LLMProvider.SIMULATED, api_key="ignored", seed=7)
+
+        assert isinstance(llm, SimulatedModel)
+        assert llm.client.seed == 7
+        assert llm.client.model == "simulated-v1"
+
+    def test_output_is_deterministic_per_seed_and_prompt(self):
+        """Test that answers replay across instances and differ by prompt."""
+        first = _fast(seed=1).invoke("hello").content
+        again = _fast(seed=1).invoke("hello").content
+
+        assert first == again
+        assert _fast(seed=2).invoke("hello").content != first
+        assert _fast(seed=1).invoke("bye").content != first
+
+    def test_stream_matches_invoke_and_reports_usage(self):
+        """Test that streaming yields one token per chunk with usage at the end."""
+        model = _fast(output_tokens_jitter=0.0)
+
+        chunks = list(model.stream("hello"))
+        merged = sum(chunks[1:], chunks[0])
+
+        assert len([chunk for chunk in chunks if chunk.content]) == 12
+        assert merged.content == model.invoke("hello").content
+        assert merged.usage_metadata["output_tokens"] == 12
+
+    @pytest.mark.asyncio
+    async def test_astream_follows_latency_profile(self):
+        """Test time to first token and token rate of the async stream."""
+        model = _fast(
+            ttft_seconds=0.05, ttft_sigma=0.0, tokens_per_second=200, output_tokens_jitter=0.0
+        )
+
+        start = time.monotonic()
+        first_at = None
+        async for chunk in model.astream("hello"):
+            first_at = first_at or time.monotonic() - start
+        total = time.monotonic() - start
+
+        assert first_at == pytest.approx(0.05, abs=0.03)
+        assert total == pytest.approx(0.05 + 11 / 200, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_overlap(self):
+        """Test that async requests wait concurrently, not serially."""
+        model = _fast(ttft_seconds=0.1, ttft_sigma=0.0)
+
+        start = time.monotonic()
+        results = await asyncio.gather(*(model.ainvoke(f"q{i}") for i in range(20)))
+
+        assert len(results) == 20
+        assert time.monotonic() - start < 0.5
+
+
+# ---- Failure modes/Edge cases ---- #
+
+
+class TestSimulatedModelFailures:
+    def test_error_rate_fails_with_retryable_status(self):
+        """Test that injected errors carry a 503 and retries draw fresh values."""
+        model = _fast(error_rate=0.5, seed=3)
+        outcomes = []
+        for i in range(40):
+            try:
+                model.invoke(f"q{i}")
+                outcomes.append(True)
+            except SimulatedProviderError as exc:
+                assert exc.status_code == 503
+                outcomes.append(False)
+
+        assert 5 < outcomes.count(False) < 35
+        replay = _fast(error_rate=0.5, seed=3)
+        for i in range(40):
+            try:
+                replay.invoke(f"q{i}")
+                assert outcomes[i]
+            except SimulatedProviderError:
+                assert not outcomes[i]
+
+    def test_max_tokens_caps_output_length(self):
+        """Test that max_tokens truncates the simulated answer."""
+        model = _fast(output_tokens=50, max_tokens=5)
+
+        assert model.invoke("hello").usage_metadata["output_tokens"] == 5
+
+    def test_attempt_tracking_is_bounded_to_recent_prompts(self, monkeypatch):
+        """Test that attempt counts keep only the most recently sent prompts."""
+        monkeypatch.setattr(SimulatedChatModel, "_MAX_TRACKED_PROMPTS", 2)
+        model = _fast()
+
+        for prompt in ["a", "b", "a", "c"]:
+            model.invoke(prompt)
+
+        assert list(model._attempts.values()) == [2, 1]
+        assert len(model._attempts) == 2
+
+    def test_error_rate_is_part_of_identifying_params(self):
+        """Test that models differing only by error rate are told apart."""
+        assert _fast(error_rate=0.5)._identifying_params["error_rate"] == 0.5
+        assert _fast()._identifying_params != _fast(error_rate=0.5)._identifying_params
+
+    def test_connection_settings_are_ignored(self):
+        """Test that provider-agnostic settings do not reach the client."""
+        model = SimulatedModel(api_key="k", base_url="http://x", ttft_seconds=0.0)
+
+        assert model.client.ttft_seconds == 0.0
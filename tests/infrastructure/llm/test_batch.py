@@ -0,0 +1,350 @@
+import json
+from typing import Any
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from src.application.services.chat.langchain import LangChainChatService
+from src.domain.chat.types import ChatMode
+from src.domain.prompt.types import Prompt
+from src.infrastructure.llm.adapters.anthropic import AnthropicModel
+from src.infrastructure.llm.adapters.openai import OpenAIModel
+from src.infrastructure.llm.adapters.simulated import SimulatedModel
+from src.infrastructure.llm.batch import (
+    AnthropicBatchClient,
+    BatchError,
+    BatchRequest,
+    OpenAIBatchClient,
+)
+from src.infrastructure.llm.prompt_cache import prompt_cache_key
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+class StandInBatchServer:
+    """Local stand-in for the OpenAI Batch and Anthropic Message Batches APIs.
+
+    Batches end after ``polls`` status checks. Prompts containing "fail"
+    produce a per-request error; every other prompt is echoed back.
+    """
+
+    def __init__(self, polls: int = 2, state: str = "completed") -> None:
+        self.polls = polls
+        self.state = state
+        self.files: dict[str, str] = {}
+        self.batches: dict[str, dict[str, Any]] = {}
+        self.submitted: list[dict[str, Any]] = []
+        self.status_checks = 0
+        self.transport = httpx.MockTransport(self.handle)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=self.transport)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/v1/messages/batches"):
+            return self._anthropic(request, path)
+        return self._openai(request, path)
+
+    def _advance(self, batch: dict[str, Any]) -> None:
+        self.status_checks += 1
+        batch["checks"] += 1
+
+    # -- OpenAI ------------------------------------------------------
+
+    def _openai(self, request: httpx.Request, path: str) -> httpx.Response:
+        if path == "/v1/files":
+            body = request.content.decode()
+            lines = [line for line in body.splitlines() if line.startswith('{"custom_id"')]
+            file_id = f"file-{len(self.files)}"
+            self.files[file_id] = "\n".join(lines)
+            return httpx.Response(200, json={"id": file_id})
+        if path == "/v1/batches":
+            payload = json.loads(request.content)
+            batch_id = f"batch_{len(self.batches)}"
+            lines = [json.loads(line) for line in self.files[payload["input_file_id"]].splitlines()]
+            self.submitted.extend(lines)
+            self.batches[batch_id] = {"lines": lines, "checks": 0}
+            return httpx.Response(200, json={"id": batch_id, "status": "validating"})
+        if path.startswith("/v1/batches/"):
+            batch_id = path.rsplit("/", 1)[-1]
+            batch = self.batches[batch_id]
+            self._advance(batch)
+            if batch["checks"] <= self.polls:
+                return httpx.Response(200, json={"id": batch_id, "status": "in_progress"})
+            return httpx.Response(200, json=self._openai_done(batch_id, batch))
+        if path.endswith("/content"):
+            return httpx.Response(200, text=self.files[path.split("/")[3]])
+        return httpx.Response(404)
+
+    def _openai_done(self, batch_id: str, batch: dict[str, Any]) -> dict[str, Any]:
+        if self.state == "failed":
+            return {
+                "id": batch_id,
+                "status": "failed",
+                "errors": {"data": [{"message": "invalid model"}]},
+            }
+        output, errors = [], []
+        for line in batch["lines"][: -1 if self.state == "expired" else None]:
+            prompt = line["body"]["messages"][0]["content"]
+            if "fail" in prompt:
+                errors.append(
+                    {
+                        "custom_id": line["custom_id"],
+                        "response": {
+                            "status_code": 400,
+                            "body": {"error": {"message": "bad request"}},
+                        },
+                        "error": None,
+                    }
+                )
+                continue
+            output.append(
+                {
+                    "custom_id": line["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "choices": [{"message": {"content": f"echo: {prompt}"}}],
+                            "usage": {
+                                "prompt_tokens": 10,
+                                "completion_tokens": 3,
+                                "prompt_tokens_details": {"cached_tokens": 4},
+                            },
+                        },
+                    },
+                    "error": None,
+                }
+            )
+        self.files[f"{batch_id}-out"] = "\n".join(json.dumps(line) for line in output)
+        self.files[f"{batch_id}-err"] = "\n".join(json.dumps(line) for line in errors)
+        return {
+            "id": batch_id,
+            "status": self.state,
+            "output_file_id": f"{batch_id}-out",
+            "error_file_id": f"{batch_id}-err" if errors else None,
+        }
+
+    # -- Anthropic ---------------------------------------------------
+
+    def _anthropic(self, request: httpx.Request, path: str) -> httpx.Response:
+        if path == "/v1/messages/batches":
+            requests = json.loads(request.content)["requests"]
+            batch_id = f"msgbatch_{len(self.batches)}"
+            self.submitted.extend(requests)
+            self.batches[batch_id] = {"lines": requests, "checks": 0}
+            return httpx.Response(200, json={"id": batch_id, "processing_status": "in_progress"})
+        if path.endswith("/results"):
+            batch = self.batches[path.split("/")[4]]
+            return httpx.Response(
+                200, text="\n".join(json.dumps(self._anthropic_result(r)) for r in batch["lines"])
+            )
+        batch_id = path.rsplit("/", 1)[-1]
+        batch = self.batches[batch_id]
+        self._advance(batch)
+        done = batch["checks"] > self.polls
+        return httpx.Response(
+            200,
+            json={
+                "id": batch_id,
+                "processing_status": "ended" if done else "in_progress",
+                "results_url": (
+                    f"https://api.anthropic.com/v1/messages/batches/{batch_id}/results"
+                    if done
+                    else None
+                ),
+            },
+        )
+
+    @staticmethod
+    def _anthropic_result(request: dict[str, Any]) -> dict[str, Any]:
+        content = request["params"]["messages"][0]["content"]
+        text = content if isinstance(content, str) else "".join(b["text"] for b in content)
+        if "fail" in text:
+            return {
+                "custom_id": request["custom_id"],
+                "result": {
+                    "type": "errored",
+                    "error": {"type": "error", "error": {"message": "invalid request"}},
+                },
+            }
+        return {
+            "custom_id": request["custom_id"],
+            "result": {
+                "type": "succeeded",
+                "message": {
+                    "content": [{"type": "text", "text": f"echo: {text}"}],
+                    "usage": {
+                        "input_tokens": 2,
+                        "output_tokens": 3,
+                        "cache_read_input_tokens": 8,
+                        "cache_creation_input_tokens": 0,
+                    },
+                },
+            },
+        }
+
+
+def _requests(*contents: str) -> list[BatchRequest]:
+    return [BatchRequest(f"r{i}", Prompt(content=c)) for i, c in enumerate(contents)]
+
+
+# ---- Happy path ---- #
+
+
+@pytest.mark.asyncio
+async def test_openai_batch_maps_results_back_by_custom_id() -> None:
+    server = StandInBatchServer(polls=2)
+    client = OpenAIBatchClient(
+        model="gpt-4o-mini", api_key="k", max_tokens=50, http_client=server.client()
+    )
+
+    results = await client.run(_requests("a", "b", "c"), poll_interval=0)
+
+    assert {key: result.content for key, result in results.items()} == {
+        "r0": "echo: a",
+        "r1": "echo: b",
+        "r2": "echo: c",
+    }
+    assert results["r1"].usage == {
+        "input_tokens": 10,
+        "output_tokens": 3,
+        "cache_read_tokens": 4,
+        "cache_creation_tokens": 0,
+    }
+    assert server.status_checks == 4
+    assert server.submitted[0]["url"] == "/v1/chat/completions"
+    assert server.submitted[0]["body"]["max_completion_tokens"] == 50
+
+
+@pytest.mark.asyncio
+async def test_anthropic_batch_marks_static_prefix_cacheable() -> None:
+    server = StandInBatchServer(polls=1)
+    client = AnthropicBatchClient(model="claude", api_key="k", http_client=server.client())
+    prompt = Prompt(content="rules\nq1", static_prefix="rules\n")
+
+    results = await client.run([BatchRequest("x", prompt)], poll_interval=0)
+
+    assert results["x"].content == "echo: rules\nq1"
+    assert results["x"].usage["input_tokens"] == 10
+    assert results["x"].usage["cache_read_tokens"] == 8
+    blocks = server.submitted[0]["params"]["messages"][0]["content"]
+    assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+    assert blocks[1]["text"] == "q1"
+    assert server.submitted[0]["params"]["max_tokens"] == AnthropicBatchClient.DEFAULT_MAX_TOKENS
+
+
+@pytest.mark.asyncio
+async def test_service_batch_mode_submits_one_batch_in_input_order() -> None:
+    server = StandInBatchServer(polls=1)
+    llm = OpenAIModel(model="gpt-4o-mini", api_key="k", http_async_client=server.client())
+    repository = MagicMock()
+    repository.get_prompt.side_effect = lambda path, values: Prompt(content=values["q"])
+    service = LangChainChatService(
+        llm=llm, repository=repository, mode=ChatMode.BATCH, batch_poll_interval=0
+    )
+
+    messages = await service.chat("p.txt", [{"q": f"q{i}"} for i in range(12)])
+
+    assert [m.content for m in messages] == [f"echo: q{i}" for i in range(12)]
+    assert messages[3].metadata["custom_id"] == "3"
+    assert len(server.batches) == 1
+    assert service.history == []
+
+
+@pytest.mark.asyncio
+async def test_batch_requests_keep_sampling_settings_and_cache_key() -> None:
+    server = StandInBatchServer(polls=0)
+    llm = OpenAIModel(
+        model="gpt-4o-mini",
+        api_key="k",
+        temperature=0.2,
+        top_p=0.9,
+        http_async_client=server.client(),
+    )
+    repository = MagicMock()
+    repository.get_prompt.return_value = Prompt(content="rules\nq", static_prefix="rules\n")
+    service = LangChainChatService(
+        llm=llm, repository=repository, mode=ChatMode.BATCH, batch_poll_interval=0
+    )
+
+    await service.chat("p.txt", {})
+
+    body = server.submitted[0]["body"]
+    assert (body["temperature"], body["top_p"]) == (0.2, 0.9)
+    assert body["prompt_cache_key"] == prompt_cache_key(repository.get_prompt.return_value)
+    assert "stream" not in body
+
+
+def test_anthropic_batch_client_inherits_sampling_settings() -> None:
+    llm = AnthropicModel(model="claude", api_key="k", temperature=0.3, top_k=5, stop=["END"])
+
+    params = llm.batch_client().params
+
+    assert params == {"temperature": 0.3, "top_k": 5, "stop_sequences": ["END"]}
+
+
+@pytest.mark.asyncio
+async def test_service_batch_mode_falls_back_to_concurrent_calls() -> None:
+    llm = SimulatedModel(
+        ttft_seconds=0.0, tokens_per_second=0.0, output_tokens=4, output_tokens_jitter=0.0
+    )
+    repository = MagicMock()
+    repository.get_prompt.side_effect = lambda path, values: Prompt(content=values["q"])
+    service = LangChainChatService(llm=llm, repository=repository, mode=ChatMode.BATCH)
+
+    messages = await service.chat("p.txt", [{"q": "a"}, {"q": "b"}])
+
+    assert [m.metadata["custom_id"] for m in messages] == ["0", "1"]
+    assert messages[0].content == llm.client.invoke("a").content
+    assert messages[1].metadata["usage"]["output_tokens"] == 4
+
+
+# ---- Failure modes/Edge cases ---- #
+
+
+@pytest.mark.asyncio
+async def test_request_errors_do_not_fail_the_batch() -> None:
+    server = StandInBatchServer(polls=0)
+    openai = OpenAIBatchClient(model="m", http_client=server.client())
+    anthropic = AnthropicBatchClient(model="m", http_client=server.client())
+
+    for client in (openai, anthropic):
+        results = await client.run(_requests("ok", "please fail"), poll_interval=0)
+
+        assert results["r0"].error is None
+        assert results["r1"].content == ""
+        assert results["r1"].error in {"bad request", "invalid request"}
+
+
+@pytest.mark.asyncio
+async def test_expired_batch_reports_missing_results() -> None:
+    server = StandInBatchServer(polls=0, state="expired")
+    client = OpenAIBatchClient(model="m", http_client=server.client())
+
+    results = await client.run(_requests("a", "b"), poll_interval=0)
+
+    assert results["r0"].content == "echo: a"
+    assert results["r1"].error == "No result (batch expired)."
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_raises() -> None:
+    server = StandInBatchServer(polls=0, state="failed")
+    client = OpenAIBatchClient(model="m", http_client=server.client())
+
+    with pytest.raises(BatchError, match="invalid model"):
+        await client.run(_requests("a"), poll_interval=0)
+
+
+@pytest.mark.asyncio
+async def test_timeout_and_duplicate_ids_raise() -> None:
+    server = StandInBatchServer(polls=100)
+    client = OpenAIBatchClient(model="m", http_client=server.client())
+
+    with pytest.raises(TimeoutError, match="batch_0"):
+        await client.run(_requests("a"), poll_interval=0.01, timeout=0.03)
+    with pytest.raises(ValueError):
+        await client.run([BatchRequest("x", Prompt(content="a"))] * 2)
+    assert await client.run([]) == {}
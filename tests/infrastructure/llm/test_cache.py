@@ -0,0 +1,160 @@
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.infrastructure.llm.cache import (
+    CachedChatModel,
+    CachedLlm,
+    CachedResponse,
+    LlmResponseCache,
+)
+from src.infrastructure.llm.factory import LlmFactory
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+class FakeModel:
+    """Model wrapper exposing a fake LangChain client."""
+
+    def __init__(self, config: Optional[Any] = None, **kwargs: Any) -> None:
+        self.client = FakeListChatModel(responses=kwargs.get("responses", ["first", "second"]))
+
+
+@pytest.fixture
+def clean_registry():
+    original_registry = LlmFactory._registry.copy()
+    yield
+    LlmFactory._registry = original_registry
+
+
+def _proxy(cache: LlmResponseCache, **kwargs: Any) -> CachedChatModel:
+    return CachedChatModel(FakeListChatModel(responses=["first", "second"]), cache, **kwargs)
+
+
+# ---- Happy path ---- #
+
+
+def test_invoke_repeated_prompt_is_served_from_cache() -> None:
+    model = _proxy(LlmResponseCache())
+
+    first = model.invoke("hello")
+    second = model.invoke("hello")
+    other = model.invoke("bye")
+
+    assert (first.content, second.content, other.content) == ("first", "first", "second")
+    assert (model.hits, model.misses) == (1, 2)
+    assert isinstance(second, AIMessage)
+
+
+def test_call_options_and_params_are_part_of_the_key() -> None:
+    cache = LlmResponseCache()
+    model = _proxy(cache, provider="fake")
+    other = CachedChatModel(FakeListChatModel(responses=["other"]), cache, provider="fake")
+
+    model.invoke("hello")
+
+    assert model.invoke("hello", stop=["x"]).content == "second"
+    assert other.invoke("hello").content == "other"
+    assert model.namespace.startswith("fake|")
+
+
+@pytest.mark.asyncio
+async def test_astream_is_recorded_and_replayed_as_stream() -> None:
+    model = _proxy(LlmResponseCache())
+
+    recorded = [chunk.content async for chunk in model.astream([HumanMessage("hi")])]
+    replayed = [chunk.content async for chunk in model.astream([HumanMessage("hi")])]
+    merged = await model.ainvoke([HumanMessage("hi")])
+
+    assert recorded == list("first")
+    assert replayed == recorded
+    assert merged.content == "first"
+    assert isinstance(merged, AIMessage)
+    assert model.hits == 2
+
+
+def test_stream_replays_response_recorded_by_invoke() -> None:
+    model = _proxy(LlmResponseCache())
+    model.invoke("hello")
+
+    assert [chunk.content for chunk in model.stream("hello")] == ["first"]
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path: Path) -> None:
+    path = tmp_path / "responses.db"
+    _proxy(LlmResponseCache(path=path)).invoke("hello")
+
+    model = _proxy(LlmResponseCache(path=path))
+
+    assert model.invoke("hello").content == "first"
+    assert model.hits == 1
+    assert len(model.cache) == 1
+
+
+def test_factory_wraps_model_when_cache_given(clean_registry) -> None:
+    LlmFactory.register("fake")(FakeModel)
+    cache = LlmResponseCache()
+
+    llm = LlmFactory.create("fake", cache=cache, cache_ttl=60)
+    llm.client.invoke("hello")
+
+    assert isinstance(llm, CachedLlm)
+    assert isinstance(llm.llm, FakeModel)
+    assert llm.client.ttl == 60
+    assert llm.client.invoke("hello").content == "first"
+    assert llm.client.responses == ["first", "second"]
+
+
+# ---- Failure modes/Edge cases ---- #
+
+
+def test_bypass_skips_lookup_but_refreshes_entry() -> None:
+    model = _proxy(LlmResponseCache())
+    model.invoke("hello")
+
+    assert model.invoke("hello", cache_bypass=True).content == "second"
+    assert model.invoke("hello").content == "second"
+
+
+def test_expired_entries_are_not_served(tmp_path: Path, monkeypatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("src.infrastructure.llm.cache.time.time", lambda: now[0])
+    cache = LlmResponseCache(path=tmp_path / "responses.db", ttl=10)
+    cache.put("k", CachedResponse([]))
+
+    now[0] += 5
+    assert cache.get("k") is not None
+    now[0] += 10
+    assert cache.get("k") is None
+    assert LlmResponseCache(path=tmp_path / "responses.db").get("k") is None
+
+
+def test_memory_tier_evicts_least_recently_used() -> None:
+    cache = LlmResponseCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, CachedResponse([]))
+    cache.get("a")
+    cache.put("c", CachedResponse([]))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_stream_is_not_recorded() -> None:
+    class BrokenModel(FakeListChatModel):
+        async def astream(self, *args: Any, **kwargs: Any):
+            yield AIMessage(content="partial")
+            raise RuntimeError("connection reset")
+
+    model = CachedChatModel(BrokenModel(responses=["x"]), LlmResponseCache())
+
+    with pytest.raises(RuntimeError):
+        async for _ in model.astream("hello"):
+            pass
+
+    assert len(model.cache) == 0
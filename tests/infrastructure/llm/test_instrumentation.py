@@ -0,0 +1,133 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.services.chat.langchain import LangChainChatService
+from src.domain.chat.types import ChatMode
+from src.domain.prompt.types import Prompt
+from src.infrastructure.llm.adapters.simulated import SimulatedModel
+from src.infrastructure.llm.instrumentation import (
+    InMemoryStreamMetrics,
+    StreamEvent,
+    StreamTimer,
+    llm_identity,
+)
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+def _service(llm, sink: InMemoryStreamMetrics) -> LangChainChatService:
+    repository = MagicMock()
+    repository.get_prompt.return_value = Prompt(content="hello")
+    return LangChainChatService(
+        llm=llm, repository=repository, mode=ChatMode.STREAM, sinks=[sink]
+    )
+
+
+def _event(**kwargs) -> StreamEvent:
+    values = dict(
+        provider="p",
+        model="m",
+        ttft=0.1,
+        duration=1.0,
+        output_tokens=10,
+        chunks=10,
+        inter_token_latency=0.1,
+        tokens_per_second=10.0,
+    )
+    values.update(kwargs)
+    return StreamEvent(**values)
+
+
+# ---- Happy path ---- #
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_latency_profile_in_final_message_and_sink() -> None:
+    llm = SimulatedModel(
+        ttft_seconds=0.05,
+        ttft_sigma=0.0,
+        tokens_per_second=200,
+        output_tokens=21,
+        output_tokens_jitter=0.0,
+        model="sim-a",
+    )
+    sink = InMemoryStreamMetrics()
+
+    messages = [message async for message in await _service(llm, sink).chat("p.txt", {})]
+
+    final = messages[-1]
+    metrics = final.metadata["stream_metrics"]
+    assert final.content == ""
+    assert metrics["output_tokens"] == 21
+    assert metrics["ttft"] == pytest.approx(0.05, abs=0.03)
+    assert metrics["inter_token_latency"] == pytest.approx(0.005, abs=0.004)
+    assert metrics["tokens_per_second"] > 100
+    assert metrics["duration"] >= metrics["ttft"]
+    assert final.metadata["usage"]["output_tokens"] == 21
+    snapshot = sink.snapshot()["simulated/sim-a"]
+    assert snapshot["streams"] == 1
+    assert snapshot["ttft_p50"] == pytest.approx(metrics["ttft"], rel=0.05)
+
+
+def test_timer_derives_rates_from_first_and_last_chunk(monkeypatch) -> None:
+    clock = iter([10.0, 10.5, 10.6, 10.7, 11.5, 12.0])
+    monkeypatch.setattr(
+        "src.infrastructure.llm.instrumentation.time.perf_counter", lambda: next(clock)
+    )
+    timer = StreamTimer()
+    for _ in range(4):
+        timer.tick()
+
+    event = timer.finish("p", "m", output_tokens=11)
+
+    assert event.ttft == pytest.approx(0.5)
+    assert event.duration == pytest.approx(2.0)
+    assert event.inter_token_latency == pytest.approx(0.1)
+    assert event.tokens_per_second == pytest.approx(10.0)
+    assert event.chunks == 4
+
+
+def test_in_memory_sink_aggregates_percentiles() -> None:
+    sink = InMemoryStreamMetrics()
+    for ttft in (0.1, 0.2, 0.3, 0.4):
+        sink.emit(_event(ttft=ttft))
+
+    snapshot = sink.snapshot()["p/m"]
+
+    assert snapshot["streams"] == 4
+    assert snapshot["output_tokens"] == 40
+    assert snapshot["ttft_p50"] == pytest.approx(0.2, rel=0.03)
+    assert snapshot["ttft_p99"] == pytest.approx(0.4, rel=0.03)
+    sink.reset()
+    assert sink.snapshot() == {}
+
+
+# ---- Failure modes/Edge cases ---- #
+
+
+@pytest.mark.asyncio
+async def test_failed_stream_is_still_emitted() -> None:
+    llm = SimulatedModel(ttft_seconds=0.0, error_rate=1.0)
+    sink = InMemoryStreamMetrics()
+
+    with pytest.raises(RuntimeError):
+        async for _ in await _service(llm, sink).chat("p.txt", {}):
+            pass
+
+    snapshot = sink.snapshot()["simulated/simulated-v1"]
+    assert (snapshot["streams"], snapshot["errors"]) == (1, 1)
+
+
+def test_timer_without_chunks_has_no_ttft() -> None:
+    event = StreamTimer().finish("p", "m")
+
+    assert event.ttft is None
+    assert (event.output_tokens, event.tokens_per_second) == (0, 0.0)
+
+
+def test_identity_falls_back_to_class_name() -> None:
+    class Custom:
+        client = None
+
+    assert llm_identity(Custom()) == ("Custom", "")
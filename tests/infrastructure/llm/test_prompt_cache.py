@@ -0,0 +1,103 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.application.services.chat.langchain import LangChainChatService
+from src.domain.prompt.types import Prompt
+from src.infrastructure.llm.adapters.anthropic import AnthropicModel
+from src.infrastructure.llm.adapters.bedrock import BedrockModel
+from src.infrastructure.llm.adapters.openai import OpenAIModel
+from src.infrastructure.llm.base import BaseLlm
+from src.infrastructure.llm.prompt_cache import cache_usage, prompt_cache_key
+
+# ---- Mocks, fixtures & helpers ---- #
+
+PROMPT = Prompt(content="Static rules.\nQuestion: hi", static_prefix="Static rules.\n")
+
+
+def _usage(cache_read: int = 0, cache_creation: int = 0) -> dict[str, Any]:
+    return {
+        "input_tokens": 1200,
+        "output_tokens": 20,
+        "total_tokens": 1220,
+        "input_token_details": {"cache_read": cache_read, "cache_creation": cache_creation},
+    }
+
+
+# ---- Happy path ---- #
+
+
+def test_anthropic_marks_static_prefix_with_cache_control() -> None:
+    model = AnthropicModel(model="claude-sonnet-4-5", api_key="k")
+
+    prompt_input, options = model.format_prompt(PROMPT)
+    payload = model.client._get_request_payload(prompt_input)
+
+    blocks = payload["messages"][0]["content"]
+    assert options == {}
+    assert blocks[0] == {
+        "type": "text",
+        "text": "Static rules.\n",
+        "cache_control": {"type": "ephemeral"},
+    }
+    assert blocks[1]["text"] == "Question: hi"
+
+
+def test_openai_sends_prompt_cache_key_for_static_prefix() -> None:
+    model = OpenAIModel(model="gpt-4o", api_key="k")
+
+    prompt_input, options = model.format_prompt(PROMPT)
+    payload = model.client._get_request_payload(prompt_input, **options)
+
+    assert prompt_input == PROMPT.content
+    assert payload["prompt_cache_key"] == prompt_cache_key(PROMPT)
+    other = Prompt(content="Static rules.\nQuestion: bye", static_prefix="Static rules.\n")
+    assert prompt_cache_key(other) == options["prompt_cache_key"]
+
+
+def test_bedrock_marks_prefix_only_for_anthropic_models() -> None:
+    claude = BedrockModel(model="anthropic.claude-3-haiku-20240307-v1:0", region_name="us-east-1")
+    titan = BedrockModel(model="amazon.titan-text-express-v1", region_name="us-east-1")
+
+    assert isinstance(claude.format_prompt(PROMPT)[0], list)
+    assert titan.format_prompt(PROMPT) == (PROMPT.content, {})
+
+
+@pytest.mark.asyncio
+async def test_chat_service_reports_cache_hit_tokens() -> None:
+    llm = MagicMock()
+    llm.format_prompt.side_effect = BaseLlm().format_prompt
+    llm.client.ainvoke = AsyncMock(
+        return_value=AIMessage(content="answer", usage_metadata=_usage(cache_read=1024))
+    )
+    repository = MagicMock()
+    repository.get_prompt.return_value = PROMPT
+    service = LangChainChatService(llm=llm, repository=repository)
+
+    message = await service.chat("support.txt", {})
+
+    llm.client.ainvoke.assert_awaited_once_with(PROMPT.content)
+    assert message.metadata["usage"] == {
+        "input_tokens": 1200,
+        "output_tokens": 20,
+        "cache_read_tokens": 1024,
+        "cache_creation_tokens": 0,
+    }
+
+
+# ---- Failure modes/Edge cases ---- #
+
+
+def test_prompt_without_prefix_is_sent_as_plain_text() -> None:
+    plain = Prompt(content="Question: hi")
+    model = AnthropicModel(model="claude-sonnet-4-5", api_key="k")
+
+    assert model.format_prompt(plain) == ("Question: hi", {})
+    assert OpenAIModel(model="gpt-4o", api_key="k").format_prompt(plain) == ("Question: hi", {})
+
+
+def test_cache_usage_without_provider_usage_is_empty() -> None:
+    assert cache_usage(AIMessage(content="x")) == {}
+    assert cache_usage(object()) == {}
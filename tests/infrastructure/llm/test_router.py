@@ -0,0 +1,213 @@
+import asyncio
+from typing import Any, Optional
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from src.domain.prompt.types import Prompt
+from src.infrastructure.llm.base import BaseLlm
+from src.infrastructure.llm.router import LlmRouter
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code: Optional[int]) -> None:
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class FakeClient:
+    """Chat client answering ``text`` after ``delay`` seconds, or failing."""
+
+    def __init__(self, text: str, delay: float = 0.0, error: Optional[Exception] = None) -> None:
+        self.text = text
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+        self.closed = 0
+
+    def invoke(self, input: Any, config: Any = None, **kwargs: Any) -> AIMessage:
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return AIMessage(content=self.text)
+
+    def stream(self, input: Any, config: Any = None, **kwargs: Any):
+        yield self.invoke(input, config, **kwargs)
+
+    async def ainvoke(self, input: Any, config: Any = None, **kwargs: Any) -> AIMessage:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return AIMessage(content=self.text)
+
+    async def astream(self, input: Any, config: Any = None, **kwargs: Any):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+            if self.error:
+                raise self.error
+            for char in self.text:
+                yield AIMessageChunk(content=char)
+        finally:
+            self.closed += 1
+
+
+class FakeLlm:
+    def __init__(self, client: FakeClient) -> None:
+        self.client = client
+
+
+def _router(*clients: FakeClient, **kwargs: Any) -> LlmRouter:
+    kwargs.setdefault("initial_hedge_delay", 0.05)
+    kwargs.setdefault("min_hedge_delay", 0.01)
+    return LlmRouter([FakeLlm(c) for c in clients], names=[c.text for c in clients], **kwargs)
+
+
+# ---- Happy path ---- #
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged() -> None:
+    primary, secondary = FakeClient("a"), FakeClient("b")
+    router = _router(primary, secondary)
+
+    result = await router.ainvoke("hi")
+
+    assert result.content == "a"
+    assert (primary.calls, secondary.calls) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_loser_cancelled() -> None:
+    primary, secondary = FakeClient("a", delay=1.0), FakeClient("b", delay=0.01)
+    router = _router(primary, secondary)
+
+    result = await router.ainvoke("hi")
+
+    assert result.content == "b"
+    assert primary.cancelled == 1
+    snapshot = router.snapshot()
+    assert snapshot["b"]["hedges"] == 1
+    assert snapshot["b"]["wins"] == 1
+    assert snapshot["a"]["losses"] == 1
+    assert not router.backends[0].ttft
+
+
+@pytest.mark.asyncio
+async def test_astream_hedges_on_first_chunk_and_closes_loser() -> None:
+    primary, secondary = FakeClient("slow", delay=1.0), FakeClient("fast", delay=0.01)
+    router = _router(primary, secondary)
+
+    chunks = [chunk.content async for chunk in router.client.astream("hi")]
+
+    assert "".join(chunks) == "fast"
+    assert primary.closed == 1
+    assert secondary.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_retryable_error_fails_over() -> None:
+    primary = FakeClient("a", error=ProviderError(503))
+    secondary = FakeClient("b")
+    router = _router(primary, secondary)
+
+    assert (await router.ainvoke("hi")).content == "b"
+    assert router.invoke("hi").content == "b"
+    assert [c.content for c in router.stream("hi")] == ["b"]
+    assert router.snapshot()["a"]["errors"] == 3
+
+
+@pytest.mark.asyncio
+async def test_each_backend_formats_the_prompt() -> None:
+    class RecordingClient(FakeClient):
+        async def ainvoke(self, input: Any, config: Any = None, **kwargs: Any) -> AIMessage:
+            self.received = (input, kwargs)
+            return await super().ainvoke(input, config, **kwargs)
+
+    class CachingLlm(BaseLlm):
+        def __init__(self, client: FakeClient) -> None:
+            self.client = client
+
+        def format_prompt(self, prompt: Prompt) -> tuple[Any, dict[str, Any]]:
+            return [prompt.static_prefix, prompt.dynamic_suffix], {"prompt_cache_key": "k"}
+
+    client = RecordingClient("a")
+    router = LlmRouter([CachingLlm(client)])
+    prompt = Prompt(content="rules\nq", static_prefix="rules\n")
+
+    prompt_input, options = router.format_prompt(prompt)
+    await router.client.ainvoke(prompt_input, **options)
+
+    assert client.received == (["rules\n", "q"], {"prompt_cache_key": "k"})
+
+
+def test_hedge_delay_tracks_latency_percentile() -> None:
+    router = _router(FakeClient("a"), min_samples=10, hedge_percentile=90, max_hedge_delay=5)
+    assert router.hedge_delay(0) == 0.05
+
+    for latency in range(1, 11):
+        router._succeeded(0, latency / 10)
+
+    assert router.hedge_delay(0) == pytest.approx(0.9)
+    assert _router(FakeClient("a"), hedge_percentile=None).hedge_delay(0) is None
+
+
+# ---- Failure modes/Edge cases ---- #
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_threshold_and_recovers() -> None:
+    primary = FakeClient("a", error=ConnectionError("reset"))
+    secondary = FakeClient("b")
+    router = _router(primary, secondary, failure_threshold=2, open_seconds=60)
+
+    for _ in range(3):
+        await router.ainvoke("hi")
+
+    assert primary.calls == 2
+    assert router.snapshot()["a"]["open"] is True
+
+    router.backends[0].open_until = 0.0
+    primary.error = None
+    assert (await router.ainvoke("hi")).content == "a"
+    assert router.backends[0].failures == 0
+
+
+@pytest.mark.asyncio
+async def test_client_error_is_raised_without_failover() -> None:
+    primary = FakeClient("a", error=ProviderError(400))
+    secondary = FakeClient("b")
+    router = _router(primary, secondary)
+
+    with pytest.raises(ProviderError):
+        await router.ainvoke("hi")
+
+    assert secondary.calls == 0
+    assert router.backends[0].failures == 0
+
+
+@pytest.mark.asyncio
+async def test_all_backends_failing_raises_last_error() -> None:
+    router = _router(
+        FakeClient("a", error=ProviderError(500)), FakeClient("b", error=ProviderError(429))
+    )
+
+    with pytest.raises(ProviderError) as info:
+        await router.ainvoke("hi")
+
+    assert info.value.status_code == 429
+    with pytest.raises(ProviderError):
+        router.invoke("hi")
+
+
+def test_router_requires_backends() -> None:
+    with pytest.raises(ValueError):
+        LlmRouter([])
@@ -2,6 +2,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from src.domain.prompt.constants import CACHE_BOUNDARY
 from src.domain.prompt.types import Prompt, PromptTemplate
 from src.infrastructure.prompt.repositories.base import BasePromptRepository
 
@@ -113,3 +114,39 @@ def test_build_prompt_storage_error_propagates_exception(
     # Act & Assert
     with pytest.raises(FileNotFoundError):
         repository.build(template_path, {})
+
+
+def test_build_prompt_cache_boundary_sets_static_prefix(
+    repository: ConcretePromptRepository, mock_storage_adapter: Mock
+) -> None:
+    """
+    Test that text before the cache boundary becomes the static prefix and the
+    marker is removed from the content.
+    """
+    # Arrange
+    raw_content = f"You are ${{role}}.\n{CACHE_BOUNDARY}\nQuestion: ${{question}}"
+    mock_storage_adapter.load_template.return_value = PromptTemplate(
+        content=raw_content, path="prompts/support.txt"
+    )
+
+    # Act
+    result = repository.build("prompts/support.txt", {"role": "support", "question": "Hi?"})
+
+    # Assert
+    assert result.content == "You are support.\nQuestion: Hi?"
+    assert result.static_prefix == "You are support.\n"
+    assert result.dynamic_suffix == "Question: Hi?"
+
+
+def test_build_prompt_without_boundary_has_no_static_prefix(
+    repository: ConcretePromptRepository, mock_storage_adapter: Mock
+) -> None:
+    """Test that templates without a boundary keep an empty static prefix."""
+    mock_storage_adapter.load_template.return_value = PromptTemplate(
+        content="Hi ${name}.", path="prompts/simple.txt"
+    )
+
+    result = repository.build("prompts/simple.txt", {"name": "Dana"})
+
+    assert result.static_prefix == ""
+    assert result.dynamic_suffix == "Hi Dana."
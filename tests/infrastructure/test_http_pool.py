@@ -0,0 +1,206 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import httpx
+import pytest
+
+from src.domain.embedding.types import EmbeddingProvider
+from src.domain.llm.types import LLMProvider
+from src.infrastructure.embedding import EmbeddingFactory
+from src.infrastructure.embedding.adapters import OpenAIEmbeddingModel
+from src.infrastructure.http_pool import (
+    HttpClientPool,
+    PoolStats,
+    _TrackedTransport,
+    origin_of,
+    pooled_http_clients,
+)
+from src.infrastructure.llm import LlmFactory
+from src.infrastructure.llm.adapters import OpenAIModel
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    paths: list[str] = []
+
+    def do_GET(self) -> None:
+        type(self).paths.append(self.path)
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+# ---- Happy path ---- #
+
+
+def test_clients_are_shared_per_origin() -> None:
+    pool = HttpClientPool(http2=False)
+
+    first = pool.client("https://api.openai.com/v1")
+    second = pool.client("https://API.openai.com/v1/embeddings")
+    other = pool.client("https://api.x.ai/v1")
+
+    assert first is second
+    assert first is not other
+    assert pool.async_client("https://api.openai.com/v1") is pool.async_client(
+        "https://api.openai.com"
+    )
+    pool.close()
+
+
+def test_metrics_track_requests_until_response_closed(server_url: str) -> None:
+    pool = HttpClientPool(max_connections=4, http2=False)
+    client = pool.client(server_url)
+
+    with client.stream("GET", f"{server_url}/a"):
+        during = pool.metrics()[origin_of(server_url)]
+    client.get(f"{server_url}/b")
+    after = pool.metrics()[origin_of(server_url)]
+
+    assert during["in_flight"] == 1
+    assert during["saturation"] == 0.25
+    assert after == {
+        "requests": 2,
+        "in_flight": 0,
+        "peak_in_flight": 1,
+        "max_connections": 4,
+        "saturation": 0.0,
+        "http2": False,
+    }
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_reports_into_same_origin(server_url: str) -> None:
+    pool = HttpClientPool(http2=False)
+
+    response = await pool.async_client(server_url).get(f"{server_url}/a")
+
+    assert response.text == "ok"
+    assert pool.metrics()[origin_of(server_url)]["requests"] == 1
+    await pool.aclose()
+
+
+def test_async_client_survives_successive_event_loops(server_url: str) -> None:
+    pool = HttpClientPool(http2=False)
+    client = pool.async_client(server_url)
+
+    async def get() -> str:
+        return (await client.get(f"{server_url}/a")).text
+
+    assert asyncio.run(get()) == "ok"
+    assert asyncio.run(get()) == "ok"
+    assert pool.metrics()[origin_of(server_url)]["in_flight"] == 0
+
+
+def test_failing_listener_does_not_leak_in_flight(server_url: str) -> None:
+    pool = HttpClientPool(http2=False)
+
+    def listener(origin: str, request: httpx.Request, response: httpx.Response) -> None:
+        raise RuntimeError("listener failed")
+
+    pool.add_listener(listener)
+
+    with pytest.raises(RuntimeError):
+        pool.client(server_url).get(f"{server_url}/a")
+
+    assert pool.metrics()[origin_of(server_url)]["in_flight"] == 0
+    pool.close()
+
+
+def test_clients_honour_environment_proxies(
+    server_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("HTTP_PROXY", origin_of(server_url))
+    monkeypatch.setenv("NO_PROXY", "direct.example")
+    _Handler.paths = []
+    pool = HttpClientPool(http2=False)
+    client = pool.client("http://upstream.example")
+
+    response = client.get("http://upstream.example/v1/models")
+
+    assert response.text == "ok"
+    assert _Handler.paths == ["http://upstream.example/v1/models"]
+    assert {pattern.pattern: transport for pattern, transport in client._mounts.items()}[
+        "all://*direct.example"
+    ] is None
+    assert pool.metrics()[origin_of("http://upstream.example")]["requests"] == 1
+    assert pool.async_client("http://upstream.example")._mounts
+    assert HttpClientPool(trust_env=False).client("http://upstream.example")._mounts == {}
+    pool.close()
+
+
+def test_factories_share_pooled_clients_between_chat_and_embeddings() -> None:
+    pool = HttpClientPool(http2=False)
+
+    llm = LlmFactory.create(LLMProvider.OPENAI, api_key="k", model="gpt-4o", http_pool=pool)
+    embedding = EmbeddingFactory.create(
+        EmbeddingProvider.OPENAI, api_key="k", model="text-embedding-3-small", http_pool=pool
+    )
+
+    shared = pool.client("https://api.openai.com/v1")
+    assert isinstance(llm, OpenAIModel)
+    assert isinstance(embedding, OpenAIEmbeddingModel)
+    assert llm.client.http_client is shared
+    assert embedding.client.http_client is shared
+    assert llm.client.http_async_client is embedding.client.http_async_client
+    pool.close()
+
+
+# ---- Failure modes/Edge cases ---- #
+
+
+def test_explicit_client_and_unsupported_adapters_are_left_alone() -> None:
+    pool = HttpClientPool(http2=False)
+    explicit = httpx.Client()
+
+    class PlainModel:
+        pass
+
+    class PooledModel:
+        _SHARES_HTTP_CLIENT = True
+        _DEFAULT_BASE_URL = None
+
+    assert pooled_http_clients(PlainModel, None, {"base_url": "https://x"}, pool) == {}
+    assert pooled_http_clients(PooledModel, None, {"http_client": explicit}, pool) == {}
+    assert pooled_http_clients(PooledModel, None, {}, pool) == {}
+    assert pooled_http_clients(PooledModel, None, {"base_url": "https://x"}, False) == {}
+    assert set(pooled_http_clients(PooledModel, None, {"base_url": "https://x"}, pool)) == {
+        "http_client",
+        "http_async_client",
+    }
+    explicit.close()
+    pool.close()
+
+
+def test_failed_request_is_not_left_in_flight() -> None:
+    def _fail(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    stats = PoolStats(max_connections=1)
+    transport = _TrackedTransport(httpx.MockTransport(_fail), stats, lambda *_: None)
+    client = httpx.Client(transport=transport)
+
+    with pytest.raises(httpx.ConnectError):
+        client.get("http://example.invalid/")
+
+    assert (stats.requests, stats.in_flight) == (1, 0)
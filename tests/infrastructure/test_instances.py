@@ -0,0 +1,243 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import pytest
+
+from src.domain.embedding.types import EmbeddingProvider
+from src.domain.llm.types import LLMProvider
+from src.infrastructure.embedding.cache import CachedEmbedding, EmbeddingCache
+from src.infrastructure.embedding.factory import EmbeddingFactory
+from src.infrastructure.http_pool import HttpClientPool
+from src.infrastructure.instances import InstanceCache, fingerprint
+from src.infrastructure.llm.cache import CachedLlm, LlmResponseCache
+from src.infrastructure.llm.factory import LlmFactory
+from src.infrastructure.vector.factory import VectorDBFactory
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+@dataclass
+class FakeConfig:
+    model: str = "m"
+    api_key: Optional[str] = None
+
+
+class FakeAdapter:
+    built = 0
+
+    def __init__(self, config: Optional[Any] = None, **kwargs: Any) -> None:
+        type(self).built += 1
+        time.sleep(0.01)
+        self.config = config
+        self.kwargs = kwargs
+        self.closed = False
+        self.client = None
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeDatabase(FakeAdapter):
+    close = None  # type: ignore[assignment]
+
+    def disconnect(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def factories(monkeypatch):
+    for factory, adapter in (
+        (LlmFactory, FakeAdapter),
+        (EmbeddingFactory, FakeAdapter),
+        (VectorDBFactory, FakeDatabase),
+    ):
+        monkeypatch.setattr(factory, "_registry", {"fake": adapter})
+        monkeypatch.setattr(factory, "_instances", InstanceCache())
+    FakeAdapter.built = 0
+    return LlmFactory, EmbeddingFactory, VectorDBFactory
+
+
+class ReleaseHookLock:
+    """Lock that runs ``hook`` once, right after the next release once armed."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hook: Optional[Any] = None
+
+    def __enter__(self) -> "ReleaseHookLock":
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._lock.release()
+        hook, self.hook = self.hook, None
+        if hook is not None:
+            hook()
+
+
+# ---- Happy path ---- #
+
+
+@pytest.mark.parametrize("index", [0, 1, 2])
+def test_reuse_returns_same_instance_for_equal_arguments(factories, index: int) -> None:
+    factory = factories[index]
+
+    first = factory.create("fake", FakeConfig(api_key="k"), reuse=True, temperature=0)
+    second = factory.create("fake", FakeConfig(api_key="k"), reuse=True, temperature=0)
+    other = factory.create("fake", FakeConfig(api_key="other"), reuse=True, temperature=0)
+    fresh = factory.create("fake", FakeConfig(api_key="k"), temperature=0)
+
+    assert first is second
+    assert other is not first
+    assert fresh is not first
+    assert factory._instances.hits == 1
+
+
+def test_concurrent_creates_build_once(factories) -> None:
+    results: list[Any] = []
+
+    def _create() -> None:
+        results.append(LlmFactory.create("fake", reuse=True, model="m"))
+
+    threads = [threading.Thread(target=_create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert FakeAdapter.built == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_caller_arriving_right_after_build_reuses_the_instance() -> None:
+    cache = InstanceCache()
+    lock = ReleaseHookLock()
+    cache._lock = lock  # type: ignore[assignment]
+    builds: list[object] = []
+    late: list[Any] = []
+
+    def _late_caller() -> None:
+        thread = threading.Thread(target=lambda: late.append(cache.get_or_create("k", _build)))
+        thread.start()
+        thread.join(timeout=5)
+
+    def _build() -> object:
+        builds.append(object())
+        if len(builds) == 1:
+            # Let another caller in at the first lock release after the build.
+            lock.hook = _late_caller
+        return builds[-1]
+
+    first = cache.get_or_create("k", _build)
+
+    assert len(builds) == 1
+    assert late == [first]
+    assert cache._building == {}
+
+
+def test_close_all_releases_instances(factories) -> None:
+    llm = LlmFactory.create("fake", reuse=True)
+    db = VectorDBFactory.create("fake", reuse=True)
+
+    assert LlmFactory.close_all() == 1
+    assert VectorDBFactory.close_all() == 1
+
+    assert llm.closed and db.closed
+    assert LlmFactory.create("fake", reuse=True) is not llm
+
+
+def test_close_all_closes_real_adapters(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(EmbeddingFactory, "_instances", InstanceCache())
+    monkeypatch.setattr(LlmFactory, "_instances", InstanceCache())
+    hashing = EmbeddingFactory.create(EmbeddingProvider.HASHING, reuse=True)
+    openai = EmbeddingFactory.create(
+        EmbeddingProvider.OPENAI, api_key="k", model="m", reuse=True, http_pool=False
+    )
+    simulated = LlmFactory.create(LLMProvider.SIMULATED, api_key="k", reuse=True)
+    own_client = openai.client.client._client._client
+
+    assert EmbeddingFactory.close_all() == 2
+    assert LlmFactory.close_all() == 1
+
+    assert own_client.is_closed
+    assert hashing.embed_query("still usable")
+    assert simulated.client.invoke("hi").content
+
+
+@pytest.mark.asyncio
+async def test_aclose_leaves_pooled_clients_open_and_cached_wrapper_forwards(tmp_path) -> None:
+    pool = HttpClientPool(http2=False)
+    pooled = EmbeddingFactory.create(
+        EmbeddingProvider.OPENAI, api_key="k", model="m", http_pool=pool
+    )
+    own = EmbeddingFactory.create(
+        EmbeddingProvider.OPENAI, api_key="k", model="m", http_pool=False
+    )
+    cached = CachedEmbedding(own, EmbeddingCache(tmp_path / "vectors.db"))
+
+    await pooled.aclose()
+    await cached.aclose()
+
+    assert not pool.client("https://api.openai.com/v1").is_closed
+    assert not pool.async_client("https://api.openai.com/v1").is_closed
+    assert own.client.client._client._client.is_closed
+    assert own.client.async_client._client._client.is_closed
+    await pool.aclose()
+
+
+def test_cached_llm_forwards_close_to_the_wrapped_model() -> None:
+    llm = LlmFactory.create(LLMProvider.SIMULATED, api_key="k")
+    closed: list[str] = []
+    llm.close = lambda: closed.append("close")  # type: ignore[method-assign]
+
+    CachedLlm(llm, LlmResponseCache()).close()
+
+    assert closed == ["close"]
+
+
+# ---- Failure modes/Edge cases ---- #
+
+
+def test_fingerprint_uses_identity_for_opaque_objects() -> None:
+    shared = object()
+
+    assert fingerprint("p", None, {"pool": shared}) == fingerprint("p", None, {"pool": shared})
+    assert fingerprint("p", None, {"pool": shared}) != fingerprint("p", None, {"pool": object()})
+    assert fingerprint("p", {"a": 1, "b": [1]}, {}) == fingerprint("p", {"b": [1], "a": 1}, {})
+
+
+def test_failed_build_is_not_cached() -> None:
+    cache = InstanceCache()
+
+    def _fail() -> Any:
+        raise RuntimeError("auth failed")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_create("k", _fail)
+
+    assert cache.get_or_create("k", lambda: "ok") == "ok"
+    assert len(cache) == 1
+
+
+def test_close_all_attempts_every_instance_before_raising() -> None:
+    class Broken:
+        def close(self) -> None:
+            raise RuntimeError("boom")
+
+    cache = InstanceCache()
+    healthy = FakeAdapter()
+    cache.get_or_create("a", Broken)
+    cache.get_or_create("b", lambda: healthy)
+
+    with pytest.raises(RuntimeError):
+        cache.close_all()
+
+    assert healthy.closed
+    assert len(cache) == 0
+
+
+def test_unregistered_provider_still_raises_with_reuse(factories) -> None:
+    with pytest.raises(ValueError):
+        EmbeddingFactory.create("missing", reuse=True)
@@ -0,0 +1,192 @@
+import asyncio
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from src.domain.llm.types import LLMProvider
+from src.infrastructure.embedding.base import BaseEmbedding
+from src.infrastructure.llm import LlmFactory
+from src.infrastructure.llm.adapters import OpenAIModel
+from src.infrastructure.rate_limit import (
+    ChatModelRateLimiter,
+    Priority,
+    RateLimiter,
+    _parse_duration,
+    rate_priority,
+)
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+@pytest.fixture
+def limiter(monkeypatch) -> RateLimiter:
+    """Replace the process-wide limiter with a fresh, fast-polling one."""
+    fresh = RateLimiter(poll_interval=0.005)
+    monkeypatch.setattr(RateLimiter, "_shared", fresh)
+    return fresh
+
+
+class FakeEmbedding(BaseEmbedding):
+    def __init__(self) -> None:
+        self.client = MagicMock()
+        self.client.model = "embed-model"
+        self.client.embed_documents.side_effect = lambda texts: [[1.0] for _ in texts]
+
+
+# ---- Happy path ---- #
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_admitted_by_priority_then_arrival(limiter: RateLimiter) -> None:
+    limiter.configure("p", "m", tokens_per_minute=600)
+    await limiter.aacquire("p", "m", tokens=600)
+    order: list[str] = []
+
+    async def _request(name: str, priority: Priority) -> None:
+        await limiter.aacquire("p", "m", tokens=1, priority=priority)
+        order.append(name)
+
+    tasks = []
+    for name, priority in [
+        ("low", Priority.LOW),
+        ("normal-1", Priority.NORMAL),
+        ("high", Priority.HIGH),
+        ("normal-2", Priority.NORMAL),
+    ]:
+        tasks.append(asyncio.create_task(_request(name, priority)))
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+    assert order == ["high", "normal-1", "normal-2", "low"]
+
+
+def test_request_budget_paces_calls(limiter: RateLimiter) -> None:
+    limiter.configure("p", "m", requests_per_minute=1200)
+    for _ in range(1200):
+        limiter.acquire("p", "m")
+
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.acquire("p", "m")
+
+    assert time.monotonic() - start >= 0.15
+    assert limiter.snapshot()["p/m"]["waits"] == 4
+
+
+def test_headers_learn_limits_and_pull_budget_down(limiter: RateLimiter) -> None:
+    limiter.acquire("openai", "gpt-4o")
+    limiter.observe_headers(
+        "gpt-4o",
+        {
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "120ms",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-tokens": "29000",
+        },
+    )
+
+    snapshot = limiter.snapshot()["openai/gpt-4o"]
+    assert snapshot["requests_available"] < 1
+    assert snapshot["tokens_available"] == pytest.approx(29000, abs=10)
+    assert snapshot["paused_for"] == pytest.approx(0.12, abs=0.02)
+    limiter.configure("azure", "other")
+    assert limiter.snapshot()["azure/other"]["requests_available"] is None
+    limiter.acquire("xai", "gpt-4o")
+    assert limiter.snapshot()["xai/gpt-4o"]["tokens_available"] == 30000
+
+
+def test_retry_after_on_429_pauses_key(limiter: RateLimiter) -> None:
+    limiter.acquire("claude", "sonnet")
+    limiter.observe_headers("sonnet", {"Retry-After": "0.1"}, status=429)
+
+    start = time.monotonic()
+    limiter.acquire("claude", "sonnet")
+
+    assert time.monotonic() - start >= 0.08
+
+
+def test_observe_response_reads_model_from_body_or_deployment(limiter: RateLimiter) -> None:
+    limiter.acquire("openai", "gpt-4o")
+    limiter.acquire("azure-openai", "prod-gpt")
+    headers = {"x-ratelimit-limit-requests": "60", "x-ratelimit-remaining-requests": "3"}
+
+    limiter.observe_response(
+        "https://api.openai.com",
+        httpx.Request("POST", "https://api.openai.com/v1/chat", json={"model": "gpt-4o"}),
+        httpx.Response(200, headers=headers),
+    )
+    limiter.observe_response(
+        "https://x.openai.azure.com",
+        httpx.Request("POST", "https://x.openai.azure.com/openai/deployments/prod-gpt/chat"),
+        httpx.Response(200, headers=headers),
+    )
+
+    snapshot = limiter.snapshot()
+    assert snapshot["openai/gpt-4o"]["requests_available"] == pytest.approx(3, abs=0.1)
+    assert snapshot["azure-openai/prod-gpt"]["requests_available"] == pytest.approx(3, abs=0.1)
+
+
+def test_embedding_batches_draw_from_shared_budget(limiter: RateLimiter) -> None:
+    model = FakeEmbedding()
+    model.max_batch_items = 1
+
+    with rate_priority(Priority.LOW):
+        model._embed_texts(["abcdefgh", "abcd"])
+
+    snapshot = limiter.snapshot()["FakeEmbedding/embed-model"]
+    assert snapshot["waits"] == 0
+    limiter.configure("FakeEmbedding", "embed-model", tokens_per_minute=100)
+    model._embed_texts(["x" * 396])
+    assert limiter.snapshot()["FakeEmbedding/embed-model"]["tokens_available"] < 1
+
+
+def test_llm_factory_installs_langchain_rate_limiter_hook(limiter: RateLimiter) -> None:
+    llm = LlmFactory.create(
+        LLMProvider.OPENAI, api_key="k", model="gpt-4o", max_tokens=256, http_pool=False
+    )
+
+    hook = llm.client.rate_limiter
+    assert isinstance(llm, OpenAIModel)
+    assert isinstance(hook, ChatModelRateLimiter)
+    assert (hook.provider, hook.model, hook.tokens) == (LLMProvider.OPENAI, "gpt-4o", 256)
+    assert hook.limiter is limiter
+
+
+# ---- Failure modes/Edge cases ---- #
+
+
+def test_timeout_raises_and_leaves_queue_clean(limiter: RateLimiter) -> None:
+    limiter.configure("p", "m", requests_per_minute=1)
+    limiter.acquire("p", "m")
+
+    with pytest.raises(TimeoutError):
+        limiter.acquire("p", "m", timeout=0.01)
+
+    assert limiter.snapshot()["p/m"]["queued"] == 0
+
+
+def test_non_blocking_hook_reports_unavailable_budget(limiter: RateLimiter) -> None:
+    limiter.configure("p", "m", requests_per_minute=1)
+    hook = ChatModelRateLimiter(limiter, "p", "m")
+
+    assert hook.acquire(blocking=False) is True
+    assert hook.acquire(blocking=False) is False
+
+
+def test_oversized_request_is_admitted_from_full_bucket(limiter: RateLimiter) -> None:
+    limiter.configure("p", "m", tokens_per_minute=100)
+
+    assert limiter.acquire("p", "m", tokens=1000, timeout=0.01) == 0.0
+    assert limiter.snapshot()["p/m"]["tokens_available"] < -800
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("1.5", 1.5), ("6m0s", 360.0), ("20ms", 0.02), ("1h2m", 3720.0), ("soon", None)],
+)
+def test_parse_duration_formats(value: str, expected: Any) -> None:
+    assert _parse_duration(value, time.time()) == expected
@@ -0,0 +1,123 @@
+import subprocess
+import sys
+import textwrap
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+import pytest
+
+from src.domain.llm.types import LLMProvider
+from src.infrastructure.embedding.factory import EmbeddingFactory
+from src.infrastructure.llm.factory import LlmFactory
+from src.infrastructure.vector.factory import VectorDBFactory
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+@pytest.fixture
+def plugin(tmp_path: Path, monkeypatch) -> str:
+    """Write an importable third-party adapter module and return its name."""
+    (tmp_path / "fake_llm_plugin.py").write_text(
+        textwrap.dedent(
+            """
+            class PluginModel:
+                def __init__(self, config=None, **kwargs):
+                    self.config = config
+                    self.kwargs = kwargs
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(LlmFactory, "_registry", dict(LlmFactory._registry))
+    monkeypatch.setattr(LlmFactory, "_modules", dict(LlmFactory._modules))
+    yield "fake_llm_plugin"
+    sys.modules.pop("fake_llm_plugin", None)
+
+
+def _imported_after(statement: str, prefixes: tuple[str, ...]) -> list[str]:
+    code = (
+        "import sys\n"
+        f"{statement}\n"
+        f"print(sorted({{m.split('.')[0] for m in sys.modules if m.startswith({prefixes!r})}}))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[2],
+    )
+    return eval(result.stdout.strip().splitlines()[-1])
+
+
+# ---- Happy path ---- #
+
+
+def test_importing_packages_does_not_load_provider_sdks() -> None:
+    loaded = _imported_after(
+        "import src.infrastructure.vector, src.infrastructure.llm.adapters, "
+        "src.infrastructure.embedding.adapters",
+        ("langchain_anthropic", "langchain_openai", "qdrant_client", "pymilvus"),
+    )
+
+    assert loaded == []
+
+
+def test_create_imports_only_the_requested_adapter() -> None:
+    loaded = _imported_after(
+        "from src.infrastructure.llm import LlmFactory\n"
+        "LlmFactory.create('openai', api_key='k', model='gpt-4o', http_pool=False)",
+        ("langchain_anthropic", "langchain_openai", "langchain_aws"),
+    )
+
+    assert loaded == ["langchain_openai"]
+
+
+def test_lazy_module_target_is_imported_on_create(plugin: str) -> None:
+    LlmFactory.register_lazy("plugin", f"{plugin}:PluginModel")
+
+    assert plugin not in sys.modules
+    model = LlmFactory.create("plugin", rate_limiter=False, temperature=0)
+
+    assert type(model).__name__ == "PluginModel"
+    assert LlmFactory._registry["plugin"] is type(model)
+
+
+def test_entry_point_providers_are_discovered(plugin: str, monkeypatch) -> None:
+    group = LlmFactory._ENTRY_POINT_GROUP
+    points = [EntryPoint(name="ext", value=f"{plugin}:PluginModel", group=group)]
+    monkeypatch.setattr(
+        "src.infrastructure.registry.entry_points",
+        lambda group: points if group == LlmFactory._ENTRY_POINT_GROUP else [],
+    )
+
+    assert "ext" in LlmFactory.providers()
+    assert type(LlmFactory.create("ext", rate_limiter=False)).__name__ == "PluginModel"
+
+
+def test_providers_lists_builtins_without_importing() -> None:
+    assert LLMProvider.ANTHROPIC.value in LlmFactory.providers()
+    assert "hashing" in EmbeddingFactory.providers()
+    assert "qdrant" in VectorDBFactory.providers()
+
+
+# ---- Failure modes/Edge cases ---- #
+
+
+def test_unknown_provider_still_raises(plugin: str) -> None:
+    with pytest.raises(ValueError):
+        LlmFactory.create("does-not-exist")
+
+
+def test_missing_attribute_in_lazy_target_surfaces(plugin: str) -> None:
+    LlmFactory.register_lazy("broken", f"{plugin}:Missing")
+
+    with pytest.raises(AttributeError):
+        LlmFactory.create("broken")
+
+
+def test_unknown_package_attribute_raises_attribute_error() -> None:
+    import src.infrastructure.vector as vector
+
+    with pytest.raises(AttributeError):
+        vector.NotAnAdapter  # noqa: B018
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+import pytest
+
 import src.infrastructure.vector.adapters.cosmos_db as cosmos_module
 import src.infrastructure.vector.adapters.milvus_db as milvus_module
 import src.infrastructure.vector.adapters.mongo_db as mongo_module
@@ -9,7 +12,7 @@ import src.infrastructure.vector.adapters.opensearch_db as opensearch_module
 import src.infrastructure.vector.adapters.pinecone_db as pinecone_module
 import src.infrastructure.vector.adapters.qdrant_db as qdrant_module
 import src.infrastructure.vector.adapters.vertex_db as vertex_module
-from src.domain.vector import VectorRecordDTO
+from src.domain.vector import CollectionConfigDTO, QuantizationType, VectorRecordDTO
 
 
 # ---- Mocks, fixtures & helpers ---- #
@@ -245,5 +248,271 @@ def test_vertexdbvectordatabase_upsert_search_delete_valid_payload_uses_memory_c
     assert adapter.search("docs", [0.1, 0.2]) == []
 
 
+def test_qdrantvectordatabase_scroll_and_count_page_through_collection(
+    monkeypatch,
+) -> None:
+    class Point:
+        def __init__(self, point_id: str) -> None:
+            self.id = point_id
+            self.vector = None
+            self.payload = {"chunk": point_id}
+
+    class DummyClient:
+        def __init__(self, **kwargs: Any) -> None:
+            self.pages = {None: ([Point("r1"), Point("r2")], "next"), "next": ([Point("r3")], None)}
+
+        def scroll(self, **kwargs: Any) -> tuple[list[Any], Any]:
+            return self.pages[kwargs["offset"]]
+
+        def count(self, **kwargs: Any) -> Any:
+            return type("Count", (), {"count": 3})()
+
+    monkeypatch.setattr(qdrant_module, "QdrantClient", DummyClient)
+    adapter = qdrant_module.QdrantVectorDatabase(host="localhost", port=6333)
+
+    batches = list(adapter.scroll("docs", batch_size=2))
+
+    assert [[r.id for r in batch] for batch in batches] == [["r1", "r2"], ["r3"]]
+    assert batches[1][0].payload == {"chunk": "r3"}
+    assert adapter.count("docs") == 3
+
+
+def test_milvusvectordatabase_scroll_splits_vector_and_payload(monkeypatch) -> None:
+    class DummyIterator:
+        def __init__(self) -> None:
+            self.pages = [[{"id": "r1", "vector": [0.1], "chunk": "a"}], []]
+            self.closed = False
+
+        def next(self) -> list[dict[str, Any]]:
+            return self.pages.pop(0)
+
+        def close(self) -> None:
+            self.closed = True
+
+    class DummyClient:
+        def __init__(self, **kwargs: Any) -> None:
+            self.iterator = DummyIterator()
+
+        def query_iterator(self, **kwargs: Any) -> DummyIterator:
+            return self.iterator
+
+    monkeypatch.setattr(milvus_module, "MilvusClient", DummyClient)
+    adapter = milvus_module.MilvusVectorDatabase(host="localhost", port=19530)
+
+    batches = list(adapter.scroll("docs"))
+
+    assert batches[0][0].vector == [0.1]
+    assert batches[0][0].payload == {"chunk": "a"}
+    assert adapter.client.iterator.closed is True
+
+
+def test_qdrantvectordatabase_upsert_matrix_passes_array_to_uploader(monkeypatch) -> None:
+    class DummyClient:
+        def __init__(self, **kwargs: Any) -> None:
+            pass
+
+        def upload_collection(self, **kwargs: Any) -> None:
+            self.upload_kwargs = kwargs
+
+    monkeypatch.setattr(qdrant_module, "QdrantClient", DummyClient)
+    adapter = qdrant_module.QdrantVectorDatabase(host="localhost", port=6333)
+    matrix = np.ones((2, 3), dtype=np.float32)
+
+    adapter.upsert_matrix("docs", ["1", "r2"], matrix, [{"chunk": "a"}, {"chunk": "b"}])
+
+    kwargs = adapter.client.upload_kwargs
+    assert kwargs["vectors"] is matrix
+    assert kwargs["ids"][0] == 1
+    assert isinstance(kwargs["ids"][1], str)
+    assert kwargs["wait"] is True
+
+
+def test_milvusvectordatabase_upsert_matrix_rows_are_views(monkeypatch) -> None:
+    class DummyClient:
+        def __init__(self, **kwargs: Any) -> None:
+            pass
+
+        def upsert(self, **kwargs: Any) -> None:
+            self.upsert_kwargs = kwargs
+
+    monkeypatch.setattr(milvus_module, "MilvusClient", DummyClient)
+    adapter = milvus_module.MilvusVectorDatabase(host="localhost", port=19530)
+    matrix = np.zeros((2, 4), dtype=np.float32)
+
+    adapter.upsert_matrix("docs", ["r1", "r2"], matrix, [{"chunk": "a"}, {"chunk": "b"}])
+
+    rows = adapter.client.upsert_kwargs["data"]
+    assert np.shares_memory(rows[1]["vector"], matrix)
+    assert rows[0]["chunk"] == "a"
+
+
+def test_mongodbvectordatabase_upsert_matrix_falls_back_to_lists(monkeypatch) -> None:
+    adapter = object.__new__(mongo_module.MongoDBVectorDatabase)
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr(
+        adapter, "upsert", lambda name, records, **kwargs: captured.update(records=records)
+    )
+
+    adapter.upsert_matrix("docs", ["r1"], np.array([[0.5, 1.0]], dtype=np.float32), [{}])
+
+    assert captured["records"][0].vector == [0.5, 1.0]
+    assert isinstance(captured["records"][0].vector[0], float)
+
+
+def test_qdrantvectordatabase_quantized_collection_configures_rescoring(monkeypatch) -> None:
+    class DummyClient:
+        def __init__(self, **kwargs: Any) -> None:
+            pass
+
+        def create_collection(self, **kwargs: Any) -> None:
+            self.create_kwargs = kwargs
+
+        def search(self, **kwargs: Any) -> list[Any]:
+            self.search_kwargs = kwargs
+            return []
+
+    monkeypatch.setattr(qdrant_module, "QdrantClient", DummyClient)
+    adapter = qdrant_module.QdrantVectorDatabase(host="localhost", port=6333)
+
+    adapter.create_collection(
+        CollectionConfigDTO(
+            name="docs", dimension=4, quantization=QuantizationType.SCALAR, quantile=0.95
+        )
+    )
+    adapter.search("docs", [0.1] * 4, limit=2)
+
+    scalar = adapter.client.create_kwargs["quantization_config"].scalar
+    assert scalar.quantile == 0.95
+    assert scalar.always_ram is True
+    params = adapter.client.search_kwargs["search_params"].quantization
+    assert params.rescore is True
+    assert params.oversampling == 2.0
+
+
+def test_milvusvectordatabase_quantized_collection_uses_refined_index(monkeypatch) -> None:
+    class DummyIndexParams:
+        def add_index(self, **kwargs: Any) -> None:
+            self.index = kwargs
+
+    class DummySchema:
+        def __init__(self) -> None:
+            self.fields: list[tuple[Any, ...]] = []
+
+        def add_field(self, *args: Any, **kwargs: Any) -> None:
+            self.fields.append((args, kwargs))
+
+    class DummyClient:
+        def __init__(self, **kwargs: Any) -> None:
+            pass
+
+        def create_schema(self, **kwargs: Any) -> DummySchema:
+            return DummySchema()
+
+        def prepare_index_params(self) -> DummyIndexParams:
+            return DummyIndexParams()
+
+        def create_collection(self, **kwargs: Any) -> None:
+            self.create_kwargs = kwargs
+
+        def search(self, **kwargs: Any) -> list[Any]:
+            self.search_kwargs = kwargs
+            return [[]]
+
+    monkeypatch.setattr(milvus_module, "MilvusClient", DummyClient)
+    adapter = milvus_module.MilvusVectorDatabase(host="localhost", port=19530)
+
+    adapter.create_collection(
+        CollectionConfigDTO(
+            name="docs", dimension=8, quantization=QuantizationType.BINARY, oversampling=6.0
+        )
+    )
+    adapter.search("docs", [0.1] * 8, limit=2)
+
+    kwargs = adapter.client.create_kwargs
+    assert kwargs["index_params"].index["index_type"] == "IVF_RABITQ"
+    assert kwargs["index_params"].index["params"]["refine"] is True
+    assert kwargs["schema"].fields[1][1] == {"dim": 8}
+    assert adapter.client.search_kwargs["search_params"] == {"params": {"refine_k": 6.0}}
+
+
+def test_opensearchvectordatabase_quantized_index_stores_bytes_and_rescores(
+    monkeypatch,
+) -> None:
+    class DummyIndices:
+        def create(self, **kwargs: Any) -> None:
+            self.create_kwargs = kwargs
+
+        def put_mapping(self, **kwargs: Any) -> None:
+            self.meta = kwargs["body"]["_meta"]
+
+    class DummyClient:
+        def __init__(self, **kwargs: Any) -> None:
+            self.indices = DummyIndices()
+            self.docs: dict[str, dict[str, Any]] = {}
+
+        def index(self, **kwargs: Any) -> None:
+            self.docs[kwargs["id"]] = kwargs["body"]
+
+        def update(self, **kwargs: Any) -> None:
+            self.docs[kwargs["id"]].update(kwargs["body"]["doc"])
+
+        def count(self, **kwargs: Any) -> dict[str, int]:
+            return {"count": sum("vector" not in body for body in self.docs.values())}
+
+        def search(self, **kwargs: Any) -> dict[str, Any]:
+            self.search_body = kwargs["body"]
+            return {
+                "hits": {
+                    "hits": [
+                        {"_id": doc_id, "_score": 1.0, "_source": dict(body)}
+                        for doc_id, body in self.docs.items()
+                    ]
+                }
+            }
+
+        def scroll(self, **kwargs: Any) -> dict[str, Any]:
+            return {"hits": {"hits": []}}
+
+    monkeypatch.setattr(opensearch_module, "OpenSearch", DummyClient)
+    adapter = opensearch_module.OpenSearchVectorDatabase(host="localhost", port=9200)
+
+    adapter.create_collection(
+        CollectionConfigDTO(
+            name="docs",
+            dimension=2,
+            quantization=QuantizationType.SCALAR,
+            calibration_size=2,
+        )
+    )
+    adapter.upsert("docs", [VectorRecordDTO(id="r1", vector=[1.0, 0.0], payload={"chunk": "a"})])
+    assert "vector" not in adapter.client.docs["r1"]
+    assert adapter.search("docs", [1.0, 0.0], limit=1)[0].id == "r1"
+    adapter.upsert(
+        "docs",
+        [
+            VectorRecordDTO(id="r1", vector=[1.0, 0.0], payload={"chunk": "a"}),
+            VectorRecordDTO(id="r2", vector=[0.0, 1.0], payload={"chunk": "b"}),
+        ],
+    )
+    results = adapter.search("docs", [0.1, 0.9], limit=1)
+
+    mappings = adapter.client.indices.create_kwargs["body"]["mappings"]
+    assert mappings["properties"]["vector"]["data_type"] == "byte"
+    assert "calibration" in adapter.client.indices.meta["quantization"]
+    assert all(isinstance(v, int) for v in adapter.client.docs["r1"]["vector"])
+    assert adapter.client.docs["r1"]["source_vector"] == [1.0, 0.0]
+    assert adapter.client.search_body["query"]["knn"]["vector"]["k"] == 2
+    assert [(r.id, r.payload) for r in results] == [("r2", {"chunk": "b"})]
+    assert results[0].score == pytest.approx(0.9 / np.linalg.norm([0.1, 0.9]))
+
+
 # ---- Error paths ---- #
+def test_vertexdbvectordatabase_scroll_not_supported_raises(monkeypatch) -> None:
+    monkeypatch.setattr(vertex_module.aiplatform, "init", lambda **kwargs: None)
+    adapter = vertex_module.VertexDBVectorDatabase(project_id="p", region="us-central1")
+
+    with pytest.raises(NotImplementedError):
+        next(adapter.scroll("docs"))
+
+
 # ---- Edge cases ---- #
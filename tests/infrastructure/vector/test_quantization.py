@@ -0,0 +1,313 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from src.domain.vector import (
+    CollectionConfigDTO,
+    DistanceMetric,
+    QuantizationType,
+    VectorRecordDTO,
+)
+from src.infrastructure.vector.base import BaseVectorDatabase
+from src.infrastructure.vector.quantization import (
+    QuantizedIndex,
+    QuantizedVectorDatabase,
+    ScalarQuantizer,
+    binarize,
+    exact_scores,
+    hamming,
+    rank,
+)
+
+# ---- Mocks, fixtures & helpers ---- #
+
+
+class InMemoryVectorDatabase(BaseVectorDatabase):
+    """Full-precision store with exact search and point lookups."""
+
+    def __init__(self, native: frozenset[str] = frozenset()) -> None:
+        super().__init__()
+        self._NATIVE_QUANTIZATION = native
+        self.collections: dict[str, dict[str, VectorRecordDTO]] = {}
+        self.configs: dict[str, Any] = {}
+        self.searches = 0
+        self.fetched: list[list[str]] = []
+
+    def connect(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+    def health(self) -> bool:
+        return True
+
+    def create_collection(self, config: Any) -> None:
+        self.configs[config.name] = config
+        self.collections[config.name] = {}
+
+    def delete_collection(self, name: str) -> None:
+        self.collections.pop(name, None)
+
+    def list_collections(self) -> list[str]:
+        return sorted(self.collections)
+
+    def has_collection(self, name: str) -> bool:
+        return name in self.collections
+
+    def upsert(self, collection_name: str, records: list[Any], **kwargs: Any) -> None:
+        for record in records:
+            self.collections[collection_name][record.id] = record
+
+    def search(
+        self, collection_name: str, query_vector: list[float], limit: int = 5, **kwargs: Any
+    ) -> list[Any]:
+        self.searches += 1
+        records = list(self.collections[collection_name].values())
+        scores = exact_scores(query_vector, [r.vector for r in records], None)
+        return [records[i] for i in rank(scores, limit, None)]
+
+    def delete(self, collection_name: str, ids: list[str], **kwargs: Any) -> None:
+        for record_id in ids:
+            self.collections[collection_name].pop(record_id, None)
+
+    def fetch(self, collection_name: str, ids: list[str], **kwargs: Any) -> list[Any]:
+        self.fetched.append(list(ids))
+        store = self.collections[collection_name]
+        return [store[i] for i in ids if i in store]
+
+    def scroll(self, collection_name: str, batch_size: int = 100, **kwargs: Any):
+        records = list(self.collections[collection_name].values())
+        for start in range(0, len(records), batch_size):
+            yield records[start : start + batch_size]
+
+
+def _corpus(count: int = 4000, dims: int = 256, seed: int = 7) -> np.ndarray:
+    """Clustered unit vectors resembling sentence embeddings."""
+    centers = np.random.default_rng(dims).normal(size=(32, dims))
+    rng = np.random.default_rng(seed)
+    matrix = centers[rng.integers(0, 32, count)] + 0.8 * rng.normal(size=(count, dims))
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix.astype(np.float32)
+
+
+def _records(matrix: np.ndarray) -> list[VectorRecordDTO]:
+    return [
+        VectorRecordDTO(id=f"r{i}", vector=row.tolist(), payload={"row": i})
+        for i, row in enumerate(matrix)
+    ]
+
+
+# ---- Happy path ---- #
+
+
+def test_scalar_quantizer_round_trip_and_dot_are_close() -> None:
+    matrix = _corpus(500, 64)
+    quantizer = ScalarQuantizer.fit(matrix, quantile=1.0)
+
+    codes = quantizer.encode(matrix)
+    restored = quantizer.decode(codes)
+
+    assert codes.dtype == np.int8
+    assert np.abs(restored - matrix).max() <= quantizer.scale.max()
+    query = matrix[0]
+    np.testing.assert_allclose(quantizer.dot(query, codes), restored @ query, rtol=1e-4, atol=1e-4)
+    assert ScalarQuantizer.from_dict(quantizer.to_dict()).encode(matrix).tolist() == codes.tolist()
+
+
+def test_binarize_packs_sign_bits_and_hamming_counts_them() -> None:
+    matrix = np.array([[1.0, -1.0] * 8, [-1.0, 1.0] * 8], dtype=np.float32)
+
+    codes = binarize(matrix)
+
+    assert codes.shape == (2, 2)
+    assert hamming(codes[0], codes).tolist() == [0, 16]
+
+
+def test_quantized_index_replaces_and_removes_ids() -> None:
+    index = QuantizedIndex(QuantizationType.SCALAR)
+    matrix = _corpus(10, 16)
+    index.add([f"r{i}" for i in range(10)], matrix)
+
+    index.add(["r3", "r3"], matrix[[0, 1]])
+    index.remove(["r0", "missing"])
+
+    assert len(index) == 9
+    assert "r0" not in index.ids
+    assert sorted(index.ids) == sorted(f"r{i}" for i in range(1, 10))
+    assert set(index.candidates(matrix[1], 2)) == {"r1", "r3"}
+
+
+@pytest.mark.parametrize(
+    ("quantization", "oversampling", "min_ratio", "min_recall"),
+    [(QuantizationType.SCALAR, 2.0, 3.5, 0.95), (QuantizationType.BINARY, 10.0, 20.0, 0.9)],
+)
+def test_quantized_search_memory_and_recall_benchmark(
+    quantization: str, oversampling: float, min_ratio: float, min_recall: float
+) -> None:
+    """Footprint reduction and recall@10 against exact search meet their floors."""
+    matrix = _corpus()
+    queries = _corpus(50, seed=11)
+    database = QuantizedVectorDatabase(InMemoryVectorDatabase())
+    database.create_collection(
+        CollectionConfigDTO(
+            name="docs", dimension=256, quantization=quantization, oversampling=oversampling
+        )
+    )
+    ids = [f"r{i}" for i in range(len(matrix))]
+    database.upsert_matrix("docs", ids, matrix, [{}] * len(matrix))
+
+    hits = 0
+    for query in queries:
+        exact = {f"r{i}" for i in rank(exact_scores(query, matrix, None), 10, None)}
+        found = {hit.id for hit in database.search("docs", query.tolist(), limit=10)}
+        hits += len(exact & found)
+    recall = hits / (10 * len(queries))
+    ratio = matrix.nbytes / database.indexes["docs"].nbytes
+
+    assert ratio >= min_ratio
+    assert recall >= min_recall
+
+
+def test_incremental_upserts_calibrate_on_a_full_sample() -> None:
+    """Documents ingested one to three chunks at a time keep full recall."""
+    matrix = _corpus(1500, 64)
+    queries = _corpus(30, 64, seed=11)
+    database = QuantizedVectorDatabase(InMemoryVectorDatabase())
+    database.create_collection(
+        CollectionConfigDTO(name="docs", dimension=64, quantization=QuantizationType.SCALAR)
+    )
+    records = _records(matrix)
+    start = 0
+    while start < len(records):
+        size = 1 + start % 3
+        database.upsert("docs", records[start : start + size])
+        start += size
+
+    hits = 0
+    for query in queries:
+        exact = {f"r{i}" for i in rank(exact_scores(query, matrix, None), 10, None)}
+        found = {hit.id for hit in database.search("docs", query.tolist(), limit=10)}
+        hits += len(exact & found)
+
+    index = database.indexes["docs"]
+    assert index.calibrated
+    assert index._codes.dtype == np.int8
+    assert hits / (10 * len(queries)) >= 0.95
+
+
+def test_uncalibrated_index_buffers_and_scores_exactly() -> None:
+    index = QuantizedIndex(QuantizationType.SCALAR, calibration_size=4)
+    matrix = _corpus(4, 16)
+
+    index.add(["r0"], matrix[:1])
+
+    assert not index.calibrated
+    assert index.candidates(matrix[0], 1) == ["r0"]
+    index.add(["r1", "r2", "r3"], matrix[1:])
+    assert index.calibrated
+    assert index._codes.dtype == np.int8
+    assert index.candidates(matrix[2], 1) == ["r2"]
+
+
+def test_quantized_database_rescores_candidates_exactly() -> None:
+    inner = InMemoryVectorDatabase()
+    database = QuantizedVectorDatabase(inner)
+    matrix = _corpus(200, 32)
+    database.create_collection(
+        CollectionConfigDTO(
+            name="docs",
+            dimension=32,
+            metric=DistanceMetric.DOT_PRODUCT,
+            quantization=QuantizationType.SCALAR,
+            oversampling=3.0,
+        )
+    )
+    database.upsert("docs", _records(matrix))
+
+    results = database.search("docs", matrix[5].tolist(), limit=4)
+
+    assert results[0].id == "r5"
+    assert results[0].score == pytest.approx(float(matrix[5] @ matrix[5]), rel=1e-5)
+    assert results[0].payload == {"row": 5}
+    assert len(inner.fetched[0]) == 12
+    assert inner.searches == 0
+    assert inner.configs["docs"].quantization is None
+
+
+def test_quantized_database_attach_rebuilds_index_from_scroll() -> None:
+    inner = InMemoryVectorDatabase()
+    config = CollectionConfigDTO(name="docs", dimension=32, quantization=QuantizationType.BINARY)
+    inner.create_collection(config)
+    inner.upsert("docs", _records(_corpus(40, 32)))
+
+    index = QuantizedVectorDatabase(inner).attach(config)
+
+    assert len(index) == 40
+
+
+def test_quantized_database_delegates_native_quantization() -> None:
+    inner = InMemoryVectorDatabase(native=frozenset(QuantizationType))
+    database = QuantizedVectorDatabase(inner)
+    config = CollectionConfigDTO(name="docs", dimension=8, quantization=QuantizationType.SCALAR)
+
+    database.create_collection(config)
+    database.upsert("docs", _records(_corpus(5, 8)))
+    database.search("docs", [0.1] * 8, limit=2)
+
+    assert inner.configs["docs"] is config
+    assert database.indexes == {}
+    assert inner.searches == 1
+
+
+# ---- Edge cases ---- #
+
+
+def test_quantized_database_search_with_options_uses_database() -> None:
+    inner = InMemoryVectorDatabase()
+    database = QuantizedVectorDatabase(inner)
+    database.create_collection(
+        CollectionConfigDTO(name="docs", dimension=8, quantization=QuantizationType.SCALAR)
+    )
+    database.upsert("docs", _records(_corpus(5, 8)))
+
+    database.search("docs", [0.1] * 8, limit=2, filter={"row": 1})
+    database.delete("docs", ["r0"])
+
+    assert inner.searches == 1
+    assert "r0" not in database.indexes["docs"].ids
+
+
+def test_attach_without_readable_vectors_raises() -> None:
+    inner = InMemoryVectorDatabase()
+    config = CollectionConfigDTO(name="docs", dimension=8, quantization=QuantizationType.SCALAR)
+    inner.create_collection(config)
+    inner.upsert("docs", [VectorRecordDTO(id="r0", vector=[], payload={})])
+    database = QuantizedVectorDatabase(inner)
+
+    with pytest.raises(RuntimeError, match="1 records"):
+        database.attach(config)
+
+    assert "docs" not in database.indexes
+
+
+def test_attach_without_scroll_raises_when_count_shows_records(monkeypatch) -> None:
+    inner = InMemoryVectorDatabase()
+    config = CollectionConfigDTO(name="docs", dimension=8, quantization=QuantizationType.SCALAR)
+    inner.create_collection(config)
+
+    def _no_scroll(*args: Any, **kwargs: Any):
+        raise NotImplementedError
+
+    monkeypatch.setattr(inner, "scroll", _no_scroll)
+    assert len(QuantizedVectorDatabase(inner).attach(config)) == 0
+    monkeypatch.setattr(inner, "count", lambda name: 3, raising=False)
+
+    with pytest.raises(RuntimeError):
+        QuantizedVectorDatabase(inner).attach(config)
+
+
+def test_quantized_index_unknown_type_raises() -> None:
+    with pytest.raises(ValueError):
+        QuantizedIndex("pq")